@@ -12,17 +12,19 @@ from pathlib import Path
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-from app.config import settings
+from app.config import get_settings
 from app.database import Base
+from app.migrations import CHECKPOINT_TABLE
 # 모델 임포트 (autogenerate가 모델을 인식하도록)
-from app.models import Memo  # noqa: F401
+from app.models import Memo, MemoSlotSequence, MemoTombstone  # noqa: F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
 
-# 환경 변수에서 데이터베이스 URL 설정
-config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+# 환경 변수에서 데이터베이스 URL 설정 (alembic.ini 또는 -x로 지정된 경우 그대로 사용)
+if not config.get_main_option("sqlalchemy.url"):
+    config.set_main_option("sqlalchemy.url", get_settings().DATABASE_URL)
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
@@ -35,6 +37,12 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+
+def include_name(name, type_, parent_names) -> bool:
+    """backfill 체크포인트 테이블은 autogenerate 비교에서 제외"""
+    return not (type_ == "table" and name == CHECKPOINT_TABLE)
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -59,6 +67,8 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_name=include_name,
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
@@ -79,8 +89,13 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
+        # autocommit 블록(CREATE INDEX CONCURRENTLY, 배치 backfill)이 앞선 revision까지
+        # 커밋하므로 revision마다 트랜잭션을 나눔
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            include_name=include_name,
+            transaction_per_migration=True,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,27 @@
+"""Add memo event id sequence
+
+Revision ID: 7d3f9a1c2b44
+Revises: 2ca1535bede9
+Create Date: 2026-01-12 10:04:31.512870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d3f9a1c2b44'
+down_revision: Union[str, None] = '2ca1535bede9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # SSE 변경 피드 이벤트 ID (LISTEN/NOTIFY 브로커가 모든 프로세스에서 같은 ID를 사용)
+    op.execute(sa.schema.CreateSequence(sa.Sequence('memo_event_id_seq')))
+
+
+def downgrade() -> None:
+    op.execute(sa.schema.DropSequence(sa.Sequence('memo_event_id_seq')))
@@ -0,0 +1,37 @@
+"""Add memo tombstones and updated_at index
+
+Revision ID: b8e41c7f0d93
+Revises: 7d3f9a1c2b44
+Create Date: 2026-01-19 14:22:08.137402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.migrations import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e41c7f0d93'
+down_revision: Union[str, None] = '7d3f9a1c2b44'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('memo_tombstones',
+    sa.Column('memo_id', sa.Integer(), autoincrement=False, nullable=False, comment='삭제된 메모 ID'),
+    sa.Column('deleted_at', sa.DateTime(), nullable=False, comment='삭제 일시'),
+    sa.PrimaryKeyConstraint('memo_id')
+    )
+    op.create_index('ix_memo_tombstones_deleted_at_memo_id', 'memo_tombstones', ['deleted_at', 'memo_id'], unique=False)
+    # 기존 memos 테이블의 쓰기를 막지 않도록 트랜잭션 밖에서 생성
+    create_index_concurrently('ix_memos_updated_at_id', 'memos', ['updated_at', 'id'], lock_timeout='5s')
+
+
+def downgrade() -> None:
+    drop_index_concurrently('ix_memos_updated_at_id', 'memos')
+    op.drop_index('ix_memo_tombstones_deleted_at_memo_id', table_name='memo_tombstones')
+    op.drop_table('memo_tombstones')
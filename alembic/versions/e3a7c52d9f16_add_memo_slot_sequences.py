@@ -0,0 +1,30 @@
+"""Add memo slot sequences for sharding
+
+Revision ID: e3a7c52d9f16
+Revises: b8e41c7f0d93
+Create Date: 2026-02-03 10:41:27.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a7c52d9f16'
+down_revision: Union[str, None] = 'b8e41c7f0d93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('memo_slot_sequences',
+    sa.Column('slot', sa.Integer(), autoincrement=False, nullable=False, comment='샤드 슬롯 번호'),
+    sa.Column('next_local', sa.BigInteger(), nullable=False, comment='마지막으로 발급한 슬롯 내 번호'),
+    sa.PrimaryKeyConstraint('slot')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('memo_slot_sequences')
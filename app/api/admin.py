@@ -0,0 +1,61 @@
+"""
+관리자 API
+프로파일링 결과 조회/다운로드 (PROFILER_ENABLED일 때만 등록)
+"""
+from typing import Any, Dict, List, Literal, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+
+from app.profiling import ProfileStore, to_collapsed, to_speedscope, verify_token
+
+
+def require_admin_token(
+    request: Request,
+    x_profile_token: Optional[str] = Header(None, description="app.profiling.sign_token()으로 만든 토큰")
+) -> None:
+    """
+    관리자 토큰 검증 의존성
+    
+    Raises:
+        HTTPException: 토큰이 없거나 올바르지 않은 경우 (403)
+    """
+    if not verify_token(request.app.state.settings.PROFILER_SECRET, x_profile_token or ""):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid profile token")
+
+
+def get_profile_store(request: Request) -> ProfileStore:
+    """프로파일 저장소 의존성"""
+    return request.app.state.profile_store
+
+
+router = APIRouter(prefix="/admin/profiles", tags=["admin"], dependencies=[Depends(require_admin_token)])
+
+
+@router.get("")
+def list_profiles(store: ProfileStore = Depends(get_profile_store)) -> List[Dict[str, Any]]:
+    """저장된 프로파일 목록 (최근 것이 먼저)"""
+    return store.list()
+
+
+@router.get("/{profile_id}")
+def download_profile(
+    profile_id: str,
+    format: Literal["speedscope", "collapsed"] = "speedscope",
+    store: ProfileStore = Depends(get_profile_store)
+) -> Response:
+    """
+    프로파일 다운로드
+    
+    - **speedscope**: https://www.speedscope.app 에서 열 수 있는 JSON
+    - **collapsed**: flamegraph.pl 등에서 사용하는 collapsed stack 텍스트
+    """
+    record = store.load(profile_id)
+    if record is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    meta = record["meta"]
+    headers = {"Content-Disposition": f'attachment; filename="{profile_id}.{"txt" if format == "collapsed" else "json"}"'}
+    if format == "collapsed":
+        return PlainTextResponse(to_collapsed(record["stacks"]), headers=headers)
+    name = f"{meta['method']} {meta['route'] or meta['path']} ({meta['duration_ms']}ms)"
+    return JSONResponse(to_speedscope(name, record["stacks"], meta["interval_ms"]), headers=headers)
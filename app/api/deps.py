@@ -2,10 +2,13 @@
 API 의존성
 FastAPI 엔드포인트에서 사용할 공통 의존성
 """
-from typing import Generator
+from typing import Any, Callable, Generator, TypeVar
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, session_lock
+
+
+T = TypeVar("T")
 
 
 def get_db_session() -> Generator[Session, None, None]:
@@ -17,3 +20,52 @@ def get_db_session() -> Generator[Session, None, None]:
         Session: SQLAlchemy 데이터베이스 세션
     """
     yield from get_db()
+
+
+def run_with_session(db: Session, func: Callable[..., T], *args: Any) -> T:
+    """
+    서비스 함수를 실행한 직후 세션을 닫아 커넥션을 풀에 반납
+    
+    의존성의 정리 코드는 응답 전송이 끝난 뒤 실행되므로, 그대로 두면 응답 직렬화와
+    전송 동안에도 커넥션을 점유합니다. 서비스가 반환하는 응답 스키마는 세션과 무관하므로
+    반환 즉시 세션을 닫아 같은 DB_POOL_SIZE로 더 많은 요청을 처리합니다.
+    세션은 첫 쿼리 시점에 커넥션을 가져오므로 DB를 사용하지 않는 호출은 풀을 거치지 않습니다.
+    
+    deadline으로 요청이 먼저 끝나도 스레드는 세션 잠금을 잡은 채 작업을 마치고 세션을 닫으므로,
+    요청의 정리 코드(release_session)와 같은 세션을 동시에 사용하지 않습니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        func: db를 첫 번째 인자로 받는 서비스 함수
+        *args: 서비스 함수에 전달할 나머지 인자
+        
+    Returns:
+        T: 서비스 함수의 반환값
+    """
+    with session_lock(db):
+        try:
+            return func(db, *args)
+        finally:
+            db.close()
+
+
+def run_with_new_session(factory: Callable[[], Session], func: Callable[..., T], *args: Any) -> T:
+    """
+    새 세션으로 서비스 함수를 실행하고 세션을 닫음
+    
+    여러 요청이 함께 기다리는 조회(single-flight)는 먼저 들어온 요청의 세션을 빌려 쓰지 않고
+    자신의 세션을 사용하므로, 그 요청이 먼저 끝나(deadline, 연결 종료) 세션을 정리해도 영향을 받지 않습니다.
+    
+    Args:
+        factory: 세션 생성 함수 (session_factory_of())
+        func: db를 첫 번째 인자로 받는 서비스 함수
+        *args: 서비스 함수에 전달할 나머지 인자
+        
+    Returns:
+        T: 서비스 함수의 반환값
+    """
+    db = factory()
+    try:
+        return func(db, *args)
+    finally:
+        db.close()
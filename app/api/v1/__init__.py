@@ -2,7 +2,7 @@
 API v1 패키지
 """
 from fastapi import APIRouter
-from app.api.v1.endpoints import memos
+from app.api.v1.endpoints import batch, memos
 
 api_router = APIRouter()
 
@@ -12,3 +12,10 @@ api_router.include_router(
     prefix="/memos",
     tags=["memos"]
 )
+
+# 배치 엔드포인트 등록
+api_router.include_router(
+    batch.router,
+    prefix="/batch",
+    tags=["batch"]
+)
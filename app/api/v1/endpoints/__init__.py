@@ -1,6 +1,6 @@
 """
 API v1 엔드포인트 패키지
 """
-from app.api.v1.endpoints import memos
+from app.api.v1.endpoints import batch, memos
 
-__all__ = ["memos"]
+__all__ = ["batch", "memos"]
@@ -0,0 +1,35 @@
+"""
+배치 API 엔드포인트
+여러 메모 작업을 한 번의 요청과 하나의 DB 세션으로 실행
+"""
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db_session, run_with_session
+from app.concurrency import run_in_db_threadpool
+from app.schemas.batch import BatchRequest, BatchResponse
+from app.services.batch_service import batch_service
+
+
+router = APIRouter()
+
+
+@router.post(
+    "",
+    response_model=BatchResponse,
+    summary="배치 실행",
+    description="메모 작업 목록을 순서대로 하나의 트랜잭션에서 실행합니다."
+)
+async def execute_batch(
+    batch_request: BatchRequest,
+    db: Session = Depends(get_db_session)
+) -> BatchResponse:
+    """
+    배치 실행
+    
+    - **operations**: `{"op": "create|get|update|delete", "memo_id": ..., "data": {...}}` 목록 (최대 100개)
+    - **atomic**: true이면 하나라도 실패 시 전체 롤백 (기본값: false, 실패한 작업만 롤백)
+    
+    작업별 결과는 `status`(HTTP 상태 코드)와 `body`로 반환되며, 커밋은 배치당 한 번만 수행됩니다.
+    """
+    return await run_in_db_threadpool(run_with_session, db, batch_service.execute, batch_request)
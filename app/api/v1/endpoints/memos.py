@@ -2,17 +2,92 @@
 메모 API 엔드포인트
 메모 CRUD 기능을 제공하는 REST API
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import Callable, Hashable, List, Optional, Union
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status, Query
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db_session
-from app.schemas.memo import MemoCreate, MemoUpdate, MemoResponse, MemoListResponse
+from app.api.deps import get_db_session, run_with_new_session, run_with_session
+from app.cache import list_page_cache, memo_fragments
+from app.concurrency import memo_reads, run_in_db_threadpool
+from app.database import session_factory_of
+from app.events import event_stream, get_broker, parse_last_event_id
+from app.schemas.memo import (
+    MemoChangesResponse,
+    MemoCreate,
+    MemoListResponse,
+    MemoLookupRequest,
+    MemoLookupResponse,
+    MemoResponse,
+    MemoUpdate,
+)
 from app.services.memo_service import memo_service
-from app.exceptions.memo_exceptions import MemoNotFoundException
+from app.exceptions.memo_exceptions import (
+    InvalidSyncTokenException,
+    MemoNotFoundException,
+    SyncTokenExpiredException,
+)
 
 
 router = APIRouter()
 
+# 쿼리 문자열로 받을 수 있는 최대 ID 수 (더 많으면 POST /memos/lookup 사용)
+MAX_QUERY_IDS = 100
+
+
+def memo_json_response(content: bytes) -> Response:
+    """
+    메모 JSON 조각 캐시로 직렬화한 응답 (response_model 직렬화를 거치지 않음)
+    
+    Args:
+        content: memo_fragments로 만든 JSON 바이트
+    """
+    return Response(content=content, media_type="application/json")
+
+
+def parse_ids(ids: str) -> List[int]:
+    """
+    쉼표로 구분한 ID 목록 파싱
+    
+    Raises:
+        HTTPException: 정수가 아닌 값이 있거나 MAX_QUERY_IDS를 넘는 경우 (422)
+    """
+    try:
+        memo_ids = [int(value) for value in ids.split(",") if value.strip()]
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="ids must be a comma-separated list of integers"
+        )
+    if not memo_ids or len(memo_ids) > MAX_QUERY_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"ids must contain between 1 and {MAX_QUERY_IDS} ids"
+        )
+    return memo_ids
+
+
+async def load_memo_page(
+    key: Hashable,
+    session_factory: Callable[[], Session],
+    skip: int,
+    limit: int
+) -> MemoListResponse:
+    """
+    목록 페이지를 DB에서 조회하여 캐시에 저장
+    
+    조회 전 세대를 기록해 두어 조회 도중 쓰기가 끝나면 결과를 캐시하지 않습니다.
+    single-flight로 합쳐진 요청은 이 함수를 실행한 요청의 세대를 공유하며, 조회는 특정 요청의
+    세션이 아닌 새 세션으로 실행합니다.
+    """
+    generation = list_page_cache.generation
+    response = await run_in_db_threadpool(
+        run_with_new_session, session_factory, memo_service.get_memos, skip, limit
+    )
+    list_page_cache.put(key, response, generation)
+    return response
+
 
 @router.post(
     "",
@@ -21,7 +96,7 @@ router = APIRouter()
     summary="메모 생성",
     description="새로운 메모를 생성합니다."
 )
-def create_memo(
+async def create_memo(
     memo_data: MemoCreate,
     db: Session = Depends(get_db_session)
 ) -> MemoResponse:
@@ -31,27 +106,130 @@ def create_memo(
     - **title**: 메모 제목 (필수, 최대 200자)
     - **content**: 메모 내용 (선택, 최대 5000자)
     """
-    return memo_service.create_memo(db, memo_data)
+    return await run_in_db_threadpool(run_with_session, db, memo_service.create_memo, memo_data)
 
 
 @router.get(
     "",
-    response_model=MemoListResponse,
+    response_model=Union[MemoListResponse, MemoLookupResponse],
     summary="메모 목록 조회",
-    description="메모 목록을 페이징하여 조회합니다."
+    description="메모 목록을 페이징하여 조회합니다. ids를 지정하면 해당 메모만 조회합니다."
 )
-def get_memos(
+async def get_memos(
     skip: int = Query(0, ge=0, description="건너뛸 레코드 수"),
     limit: int = Query(100, ge=1, le=1000, description="조회할 최대 레코드 수"),
+    ids: Optional[str] = Query(None, description="쉼표로 구분한 메모 ID 목록 (예: 1,2,3)"),
     db: Session = Depends(get_db_session)
-) -> MemoListResponse:
+) -> Response:
     """
     메모 목록 조회 (페이징)
     
     - **skip**: 건너뛸 레코드 수 (기본값: 0)
     - **limit**: 조회할 최대 레코드 수 (기본값: 100, 최대: 1000)
+    - **ids**: 지정 시 해당 메모만 요청 순서대로 조회 (최대 100개, 응답에 missing_ids 포함)
+    """
+    if ids is not None:
+        memo_ids = parse_ids(ids)
+        response = await run_in_db_threadpool(
+            run_with_session, db, memo_service.get_memos_by_ids, memo_ids
+        )
+        return memo_json_response(memo_fragments.encode_response(response))
+    key = ("get_memos", skip, limit)
+    response = list_page_cache.get(key)
+    if response is None:
+        # 동시에 들어온 같은 페이지 조회는 하나의 DB 호출 결과를 함께 사용
+        response = await memo_reads.do_async(
+            key, load_memo_page, key, session_factory_of(db), skip, limit
+        )
+    return memo_json_response(memo_fragments.encode_response(response))
+
+
+@router.post(
+    "/lookup",
+    response_model=MemoLookupResponse,
+    summary="메모 다건 조회",
+    description="ID 목록의 메모를 한 번에 조회합니다. 쿼리 문자열에 담기 긴 목록에 사용합니다."
+)
+async def lookup_memos(
+    lookup: MemoLookupRequest,
+    db: Session = Depends(get_db_session)
+) -> Response:
+    """
+    메모 다건 조회
+    
+    - **ids**: 조회할 메모 ID 목록 (최대 1000개)
+    
+    요청한 순서대로 반환하며, 존재하지 않는 ID는 missing_ids로 반환합니다.
+    """
+    response = await run_in_db_threadpool(
+        run_with_session, db, memo_service.get_memos_by_ids, lookup.ids
+    )
+    return memo_json_response(memo_fragments.encode_response(response))
+
+
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    summary="메모 변경 스트림",
+    description="메모 생성/수정/삭제 이벤트를 Server-Sent Events로 전달합니다."
+)
+async def stream_memo_changes(
+    request: Request,
+    last_event_id: Optional[str] = Header(None, description="마지막으로 받은 이벤트 ID (재접속 시)")
+) -> StreamingResponse:
+    """
+    메모 변경 스트림 (SSE)
+    
+    - **event**: created, updated, deleted (재전송 불가 시 reset)
+    - **data**: `{"memo_id": ..., "data": 메모 응답 또는 null}`
+    
+    재접속 시 Last-Event-ID 이후의 이벤트를 먼저 전달합니다.
+    """
+    config = request.app.state.settings
+    return StreamingResponse(
+        event_stream(
+            get_broker(),
+            parse_last_event_id(last_event_id),
+            config.SSE_HEARTBEAT_INTERVAL
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get(
+    "/changes",
+    response_model=MemoChangesResponse,
+    summary="메모 변경분 조회",
+    description="동기화 토큰 이후 생성/수정된 메모와 삭제된 메모 ID를 조회합니다."
+)
+async def get_memo_changes(
+    since: Optional[str] = Query(None, description="이전 응답의 next_token (없으면 처음부터)"),
+    limit: int = Query(100, ge=1, le=1000, description="조회할 최대 변경 수"),
+    db: Session = Depends(get_db_session)
+) -> MemoChangesResponse:
+    """
+    메모 변경분 조회 (오프라인 동기화)
+    
+    - **since**: 이전 응답의 next_token
+    - **limit**: 조회할 최대 변경 수 (기본값: 100, 최대: 1000)
+    
+    has_more가 true이면 next_token으로 이어서 조회합니다. 토큰이 삭제 기록 보관 기간보다
+    오래되었으면 410을 반환하며, 클라이언트는 since 없이 처음부터 다시 동기화합니다.
     """
-    return memo_service.get_memos(db, skip, limit)
+    try:
+        return await run_in_db_threadpool(run_with_session, db, memo_service.get_changes, since, limit)
+    except InvalidSyncTokenException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except SyncTokenExpiredException as e:
+        # 삭제 기록이 정리되어 이어서 동기화할 수 없음 (클라이언트는 토큰 없이 전체 동기화)
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail=str(e)
+        )
 
 
 @router.get(
@@ -60,22 +238,27 @@ def get_memos(
     summary="메모 조회",
     description="특정 메모를 ID로 조회합니다."
 )
-def get_memo(
+async def get_memo(
     memo_id: int,
     db: Session = Depends(get_db_session)
-) -> MemoResponse:
+) -> Response:
     """
     특정 메모 조회
     
     - **memo_id**: 조회할 메모 ID
     """
     try:
-        return memo_service.get_memo(db, memo_id)
+        memo = await memo_reads.do_async(
+            ("get_memo", memo_id),
+            run_in_db_threadpool,
+            run_with_new_session, session_factory_of(db), memo_service.get_memo, memo_id
+        )
     except MemoNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
+    return memo_json_response(memo_fragments.encode(memo))
 
 
 @router.put(
@@ -84,7 +267,7 @@ def get_memo(
     summary="메모 수정",
     description="기존 메모를 수정합니다."
 )
-def update_memo(
+async def update_memo(
     memo_id: int,
     memo_data: MemoUpdate,
     db: Session = Depends(get_db_session)
@@ -99,7 +282,9 @@ def update_memo(
     제공된 필드만 업데이트됩니다.
     """
     try:
-        return memo_service.update_memo(db, memo_id, memo_data)
+        return await run_in_db_threadpool(
+            run_with_session, db, memo_service.update_memo, memo_id, memo_data
+        )
     except MemoNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -113,7 +298,7 @@ def update_memo(
     summary="메모 삭제",
     description="메모를 영구적으로 삭제합니다."
 )
-def delete_memo(
+async def delete_memo(
     memo_id: int,
     db: Session = Depends(get_db_session)
 ) -> None:
@@ -123,7 +308,7 @@ def delete_memo(
     - **memo_id**: 삭제할 메모 ID
     """
     try:
-        memo_service.delete_memo(db, memo_id)
+        await run_in_db_threadpool(run_with_session, db, memo_service.delete_memo, memo_id)
     except MemoNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -0,0 +1,23 @@
+"""
+캐시 패키지
+프로세스 내 응답 캐시
+"""
+from app.cache.fragment_cache import (
+    PENDING_FRAGMENTS,
+    MemoFragmentCache,
+    cache_fragment,
+    init_fragment_cache,
+    memo_fragments,
+)
+from app.cache.list_cache import ListPageCache, init_list_cache, list_page_cache
+
+__all__ = [
+    "PENDING_FRAGMENTS",
+    "ListPageCache",
+    "MemoFragmentCache",
+    "cache_fragment",
+    "init_fragment_cache",
+    "init_list_cache",
+    "list_page_cache",
+    "memo_fragments",
+]
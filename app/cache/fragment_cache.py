@@ -0,0 +1,185 @@
+"""
+메모 JSON 조각 캐시
+메모별로 직렬화한 JSON 바이트를 (id, updated_at) 기준으로 보관
+
+목록 응답은 캐시된 조각을 이어 붙여 만들므로, 자주 조회되는 메모는 다시 직렬화하지 않습니다.
+조각은 updated_at이 같을 때만 사용하므로, 롤백된 수정이나 다른 프로세스의 수정으로 내용이
+달라진 메모는 자연히 캐시 미스가 됩니다.
+"""
+import collections
+import threading
+from datetime import datetime
+from typing import Iterable, List, Optional, OrderedDict, Tuple
+
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.config import Settings, get_settings
+from app.metrics import metrics, ratio
+from app.schemas.memo import MemoResponse
+
+
+class MemoFragmentCache:
+    """
+    메모 JSON 조각 캐시 (스레드 안전, LRU)
+    
+    Args:
+        max_entries: 보관할 최대 메모 수 (0이면 캐시 비활성화)
+    """
+    
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._fragments: OrderedDict[int, Tuple[datetime, bytes]] = collections.OrderedDict()
+        self._bytes = 0
+    
+    @property
+    def size(self) -> int:
+        """보관 중인 조각 수"""
+        return len(self._fragments)
+    
+    @property
+    def bytes(self) -> int:
+        """보관 중인 조각의 크기 합계"""
+        return self._bytes
+    
+    def encode(self, memo: MemoResponse) -> bytes:
+        """
+        메모를 JSON 바이트로 변환 (캐시된 조각이 있으면 재사용)
+        
+        Args:
+            memo: 메모 응답
+            
+        Returns:
+            bytes: MemoResponse의 JSON 직렬화 결과
+        """
+        with self._lock:
+            entry = self._fragments.get(memo.id)
+            if entry is not None and entry[0] == memo.updated_at:
+                self._fragments.move_to_end(memo.id)
+                metrics.increment("memo_fragment_cache_hits")
+                return entry[1]
+        metrics.increment("memo_fragment_cache_misses")
+        return self.put(memo)
+    
+    def encode_many(self, memos: Iterable[MemoResponse]) -> bytes:
+        """메모 목록을 JSON 배열 바이트로 변환 (잠금은 한 번만 잡고 조각을 이어 붙임)"""
+        memos = list(memos)
+        fragments: List[Optional[bytes]] = []
+        with self._lock:
+            for memo in memos:
+                entry = self._fragments.get(memo.id)
+                if entry is not None and entry[0] == memo.updated_at:
+                    self._fragments.move_to_end(memo.id)
+                    fragments.append(entry[1])
+                else:
+                    fragments.append(None)
+        misses = 0
+        for index, fragment in enumerate(fragments):
+            if fragment is None:
+                fragments[index] = self.put(memos[index])
+                misses += 1
+        metrics.increment("memo_fragment_cache_hits", len(memos) - misses)
+        metrics.increment("memo_fragment_cache_misses", misses)
+        return b"[" + b",".join(fragments) + b"]"
+    
+    def encode_response(self, response: BaseModel, field: str = "items") -> bytes:
+        """
+        메모 목록 필드를 가진 응답을 JSON 바이트로 변환
+        목록은 조각을 이어 붙이고 나머지 필드만 직렬화 (목록이 첫 번째 필드여야 함)
+        
+        Args:
+            response: 목록 응답 (MemoListResponse, MemoLookupResponse 등)
+            field: 메모 목록 필드 이름
+            
+        Returns:
+            bytes: 응답 모델의 JSON 직렬화와 같은 결과
+        """
+        items = self.encode_many(getattr(response, field))
+        rest = response.model_dump_json(exclude={field}).encode()
+        separator = b"," if rest != b"{}" else b""
+        return b'{"' + field.encode() + b'":' + items + separator + rest[1:]
+    
+    def put(self, memo: MemoResponse) -> bytes:
+        """
+        메모 조각 저장 (메모 생성/수정 시 호출)
+        
+        Args:
+            memo: 메모 응답
+            
+        Returns:
+            bytes: 저장한 JSON 조각
+        """
+        fragment = memo.model_dump_json().encode()
+        if not self.max_entries:
+            return fragment
+        with self._lock:
+            previous = self._fragments.pop(memo.id, None)
+            if previous is not None:
+                self._bytes -= len(previous[1])
+            self._fragments[memo.id] = (memo.updated_at, fragment)
+            self._bytes += len(fragment)
+            while len(self._fragments) > self.max_entries:
+                _, (_, evicted) = self._fragments.popitem(last=False)
+                self._bytes -= len(evicted)
+        return fragment
+    
+    def discard(self, memo_id: int) -> None:
+        """메모 조각 제거 (메모 삭제 시 호출)"""
+        with self._lock:
+            previous = self._fragments.pop(memo_id, None)
+            if previous is not None:
+                self._bytes -= len(previous[1])
+    
+    def clear(self) -> None:
+        """모든 조각 제거"""
+        with self._lock:
+            self._fragments.clear()
+            self._bytes = 0
+
+
+def init_fragment_cache(config: Optional[Settings] = None) -> MemoFragmentCache:
+    """
+    설정에 맞게 메모 JSON 조각 캐시 크기 설정 (lifespan 시작 시 호출)
+    
+    Args:
+        config: 애플리케이션 설정 (미지정 시 전역 설정)
+        
+    Returns:
+        MemoFragmentCache: 메모 JSON 조각 캐시
+    """
+    config = config or get_settings()
+    memo_fragments.max_entries = config.MEMO_FRAGMENT_CACHE_SIZE
+    memo_fragments.clear()
+    return memo_fragments
+
+
+# 메모 JSON 조각 캐시 인스턴스 (싱글톤 패턴)
+memo_fragments = MemoFragmentCache()
+
+# 세션 info 키: 이 목록이 있으면 조각을 바로 저장하지 않고 모아 둠 (배치 트랜잭션 커밋 후 저장)
+PENDING_FRAGMENTS = "pending_fragments"
+
+
+def cache_fragment(db: Session, memo: MemoResponse) -> None:
+    """
+    생성/수정한 메모의 조각 저장
+    호출자가 트랜잭션을 관리하는 세션(배치)이면 커밋될 때까지 저장을 미뤄, 롤백된 행의 조각이
+    캐시 자리를 차지하거나 유효한 조각을 밀어내지 않도록 함
+    
+    Args:
+        db: 변경을 수행한 데이터베이스 세션
+        memo: 메모 응답
+    """
+    pending = db.info.get(PENDING_FRAGMENTS)
+    if pending is None:
+        memo_fragments.put(memo)
+    else:
+        pending.append(memo)
+
+metrics.register_gauge("memo_fragment_cache_entries", lambda: memo_fragments.size)
+metrics.register_gauge("memo_fragment_cache_bytes", lambda: memo_fragments.bytes)
+metrics.register_gauge(
+    "memo_fragment_cache_hit_ratio",
+    ratio("memo_fragment_cache_hits", "memo_fragment_cache_hits", "memo_fragment_cache_misses")
+)
@@ -0,0 +1,171 @@
+"""
+메모 목록 페이지 캐시
+(skip, limit) 등 페이지 키와 전역 세대(generation)로 목록 응답을 캐시
+
+목록 페이지는 어느 메모가 바뀌어도 내용이 달라지므로 키별 TTL로는 오래된 응답을 피할 수
+없습니다. 대신 쓰기가 일어날 때마다 세대를 올려 이전 세대의 항목을 한 번에 조회 불가능하게
+만들고, 남은 항목은 LRU 제거로 회수합니다. 조회자는 DB 조회 전에 세대를 읽어 두고 그 세대로
+저장하므로, 조회 도중 쓰기가 끝나면 결과는 이미 지난 세대로 저장되어 사용되지 않습니다.
+"""
+import collections
+import threading
+from typing import Hashable, Optional, OrderedDict, Tuple
+
+from app.config import Settings, get_settings
+from app.metrics import metrics, ratio
+from app.schemas.memo import MemoListResponse
+
+
+# 항목별 고정 추정 크기 (객체 헤더, 정수/일시 필드 등, 바이트)
+ITEM_OVERHEAD_BYTES = 400
+
+# 저장할 때마다 회수할 지난 세대 페이지 최대 수
+STALE_EVICTIONS_PER_PUT = 16
+
+
+def estimate_size(response: MemoListResponse) -> int:
+    """
+    목록 응답의 대략적인 메모리 크기 (바이트)
+    직렬화 비용 없이 문자열 길이와 항목별 고정 크기로 추정
+    """
+    return ITEM_OVERHEAD_BYTES + sum(
+        ITEM_OVERHEAD_BYTES + len(item.title) + len(item.content or "")
+        for item in response.items
+    )
+
+
+class ListPageCache:
+    """
+    세대 기반 목록 페이지 캐시 (스레드 안전, LRU)
+    
+    Args:
+        max_entries: 보관할 최대 페이지 수 (0이면 캐시 비활성화)
+        max_bytes: 보관할 페이지의 최대 추정 크기 합계
+    """
+    
+    def __init__(self, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Tuple[int, Hashable], Tuple[MemoListResponse, int]] = (
+            collections.OrderedDict()
+        )
+        self._generation = 0
+        self._bytes = 0
+    
+    @property
+    def generation(self) -> int:
+        """현재 세대 (DB 조회 전에 읽어 put()에 전달)"""
+        return self._generation
+    
+    @property
+    def size(self) -> int:
+        """보관 중인 페이지 수"""
+        return len(self._entries)
+    
+    @property
+    def bytes(self) -> int:
+        """보관 중인 페이지의 추정 크기 합계"""
+        return self._bytes
+    
+    def get(self, key: Hashable) -> Optional[MemoListResponse]:
+        """
+        현재 세대의 페이지 조회
+        
+        Args:
+            key: 페이지 키 (예: ("page", skip, limit))
+            
+        Returns:
+            Optional[MemoListResponse]: 캐시된 응답 (없으면 None)
+        """
+        if not self.max_entries:
+            return None
+        with self._lock:
+            entry = self._entries.get((self._generation, key))
+            if entry is None:
+                metrics.increment("list_cache_misses")
+                return None
+            self._entries.move_to_end((self._generation, key))
+        metrics.increment("list_cache_hits")
+        return entry[0]
+    
+    def put(self, key: Hashable, response: MemoListResponse, generation: int) -> None:
+        """
+        페이지 저장
+        
+        Args:
+            key: 페이지 키
+            response: 목록 응답
+            generation: DB 조회 전에 읽은 세대 (그 사이 쓰기가 있었으면 저장하지 않음)
+        """
+        if not self.max_entries:
+            return
+        size = estimate_size(response)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            previous = self._entries.pop((generation, key), None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[(generation, key)] = (response, size)
+            self._bytes += size
+            self._evict()
+    
+    def invalidate(self) -> None:
+        """세대를 올려 저장된 모든 페이지를 한 번에 조회 불가능하게 만듦 (메모 쓰기 후 호출)"""
+        with self._lock:
+            self._generation += 1
+        metrics.increment("list_cache_invalidations")
+    
+    def clear(self) -> None:
+        """모든 페이지 제거"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+    
+    def _evict(self) -> None:
+        """
+        지난 세대 페이지와 한도를 넘는 페이지 제거 (잠금 안에서 호출)
+        
+        지난 세대 페이지는 다시 조회되지 않으므로 LRU 순서의 앞쪽에 모이며, 쓰기 경로가
+        밀리지 않도록 invalidate()가 아닌 저장 시점에 STALE_EVICTIONS_PER_PUT개씩 회수합니다.
+        """
+        for _ in range(STALE_EVICTIONS_PER_PUT):
+            (generation, _), (_, size) = next(iter(self._entries.items()))
+            if generation == self._generation:
+                break
+            self._entries.popitem(last=False)
+            self._bytes -= size
+            metrics.increment("list_cache_evictions")
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            metrics.increment("list_cache_evictions")
+
+
+def init_list_cache(config: Optional[Settings] = None) -> ListPageCache:
+    """
+    설정에 맞게 목록 페이지 캐시 크기 설정 (lifespan 시작 시 호출)
+    
+    Args:
+        config: 애플리케이션 설정 (미지정 시 전역 설정)
+        
+    Returns:
+        ListPageCache: 목록 페이지 캐시
+    """
+    config = config or get_settings()
+    list_page_cache.max_entries = config.LIST_CACHE_MAX_ENTRIES
+    list_page_cache.max_bytes = config.LIST_CACHE_MAX_BYTES
+    list_page_cache.clear()
+    return list_page_cache
+
+
+# 목록 페이지 캐시 인스턴스 (싱글톤 패턴)
+list_page_cache = ListPageCache()
+
+metrics.register_gauge("list_cache_entries", lambda: list_page_cache.size)
+metrics.register_gauge("list_cache_bytes", lambda: list_page_cache.bytes)
+metrics.register_gauge("list_cache_generation", lambda: list_page_cache.generation)
+metrics.register_gauge("list_cache_hit_ratio", ratio("list_cache_hits", "list_cache_hits", "list_cache_misses"))
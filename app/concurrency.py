@@ -0,0 +1,217 @@
+"""
+스레드풀 동시성 관리
+DB를 사용하는 동기 작업과 그 외 작업을 별도 스레드 limiter로 분리하고,
+동시에 들어온 같은 조회를 하나의 DB 호출로 합침 (single-flight)
+
+DB 작업용 limiter는 기본적으로 커넥션 풀 크기(DB_POOL_SIZE + DB_MAX_OVERFLOW)만큼의
+스레드만 허용합니다. 커넥션을 얻지 못할 스레드는 pool_timeout 동안 대기하지 않고 limiter
+대기열에서 순서를 기다리며, 헬스 체크 등 DB와 무관한 작업은 기본 limiter를 사용하므로
+DB 부하에 영향을 받지 않습니다.
+"""
+import asyncio
+import contextvars
+import threading
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+import anyio
+from anyio import CapacityLimiter
+
+from app.config import Settings, get_settings
+from app.database import current_query_stats, track_queries
+from app.deadline import check_deadline, deadline_context
+from app.exceptions.request_exceptions import DeadlineExceededException
+from app.metrics import metrics
+from app.profiling import current_profile
+
+
+T = TypeVar("T")
+
+# DB 작업용 limiter (init_limiters()에서 생성, 이벤트 루프 안에서만 생성 가능)
+_db_limiter: Optional[CapacityLimiter] = None
+
+
+def db_threadpool_size(config: Settings) -> int:
+    """
+    DB 작업용 스레드 수 결정
+    
+    Args:
+        config: 애플리케이션 설정
+        
+    Returns:
+        int: DB_THREADPOOL_SIZE 또는 커넥션 풀 최대 크기
+    """
+    if config.DB_THREADPOOL_SIZE:
+        return config.DB_THREADPOOL_SIZE
+    return config.DB_POOL_SIZE + config.DB_MAX_OVERFLOW
+
+
+def init_limiters(config: Optional[Settings] = None) -> CapacityLimiter:
+    """
+    DB 작업용 limiter 생성 및 기본 limiter 크기 설정 (lifespan 시작 시 호출)
+    
+    Args:
+        config: 애플리케이션 설정 (미지정 시 전역 설정)
+        
+    Returns:
+        CapacityLimiter: DB 작업용 limiter
+    """
+    global _db_limiter
+    config = config or get_settings()
+    _db_limiter = CapacityLimiter(db_threadpool_size(config))
+    anyio.to_thread.current_default_thread_limiter().total_tokens = config.DEFAULT_THREADPOOL_SIZE
+    memo_reads.max_keys = config.SINGLEFLIGHT_MAX_KEYS
+    return _db_limiter
+
+
+def get_db_limiter() -> CapacityLimiter:
+    """DB 작업용 limiter 조회 (초기화 전이면 전역 설정으로 생성)"""
+    if _db_limiter is None:
+        return init_limiters()
+    return _db_limiter
+
+
+async def run_in_db_threadpool(func: Callable[..., T], *args: Any) -> T:
+    """
+    DB를 사용하는 동기 함수를 DB 작업용 스레드에서 실행
+    
+    기다리는 쪽은 취소할 수 있어 요청 deadline이 지나면 스레드 작업을 기다리지 않고 바로 504로
+    응답합니다. 스레드는 작업을 끝까지 실행한 뒤 세션을 닫으며(run_with_session), 남은 쿼리는
+    statement_timeout과 커넥션 대기 제한(DeadlineQueuePool)이 deadline 안으로 끊습니다.
+    
+    Args:
+        func: 실행할 동기 함수
+        *args: 함수 인자
+        
+    Returns:
+        T: 함수 반환값
+    """
+    profile = current_profile()
+    if profile is not None:
+        # 프로파일 대상 요청이면 스레드에서 실행하는 동안 샘플링
+        func = profile.wrap(func)
+    return await anyio.to_thread.run_sync(func, *args, cancellable=True, limiter=get_db_limiter())
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 호출을 하나로 합침
+    
+    먼저 들어온 호출(leader)만 실제로 실행하고, 실행 중에 들어온 같은 키의 호출은 그 결과
+    (또는 예외)를 함께 받습니다. 결과는 캐시하지 않으므로 실행이 끝난 뒤의 호출은 다시 실행됩니다.
+    쓰기가 커밋되면 invalidate()로 진행 중인 호출을 잊어, 커밋 뒤에 들어온 조회가 커밋 전에 시작한
+    조회 결과를 받지 않도록 합니다.
+    진행 중인 키가 max_keys개에 이르면 새 키는 합치지 않고 바로 실행합니다 (0이면 비활성화).
+    
+    Args:
+        name: 메트릭 이름 접두사
+        max_keys: 동시에 추적할 최대 키 수
+    """
+    
+    def __init__(self, name: str, max_keys: int = 1024):
+        self.name = name
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._tasks: Dict[Hashable, "asyncio.Future[Any]"] = {}
+    
+    async def do_async(self, key: Hashable, func: Callable[..., Awaitable[T]], *args: Any) -> T:
+        """
+        비동기 호출 합치기 (이벤트 루프에서 호출)
+        
+        실행은 별도 태스크에서 진행되므로 먼저 들어온 요청이 취소되어도(클라이언트 연결 종료, deadline)
+        함께 기다리는 요청은 결과를 받습니다. 태스크는 요청의 컨텍스트(추적 span, 프로파일)를 물려받지
+        않고 시작한 요청의 deadline과 SQL 집계만 이어받으므로, func는 요청 세션 대신 자신의 세션을 사용해야 합니다.
+        그 deadline을 넘겨 실패한 경우 시간이 남은 요청은 예외를 받지 않고 다시 실행합니다.
+        
+        Args:
+            key: 같은 호출을 식별하는 키
+            func: 실행할 코루틴 함수
+            *args: 함수 인자
+            
+        Returns:
+            T: 함수 반환값
+        """
+        while True:
+            task = self._tasks.get(key)
+            leader = task is None
+            if leader:
+                with self._lock:
+                    if len(self._tasks) >= self.max_keys:
+                        self._count("bypassed")
+                        task = None
+                    else:
+                        task = self._tasks[key] = _shared_context().run(asyncio.ensure_future, func(*args))
+                        task.add_done_callback(partial(self._forget, key))
+                        self._count("calls")
+                if task is None:
+                    return await func(*args)
+            else:
+                self._count("coalesced")
+            try:
+                return await asyncio.shield(task)
+            except DeadlineExceededException:
+                if leader:
+                    raise
+                # 먼저 들어온 요청의 deadline으로 실패한 경우 자신의 예산이 남아 있으면 다시 실행
+                check_deadline()
+    
+    def invalidate(self) -> None:
+        """
+        진행 중인 호출을 모두 잊음 (쓰기 커밋 후 호출, 스레드에서 호출 가능)
+        이미 기다리는 호출은 그대로 결과를 받고, 이후 호출은 새로 실행됨
+        """
+        with self._lock:
+            self._tasks.clear()
+    
+    def _forget(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        with self._lock:
+            # invalidate() 뒤에 같은 키로 새로 시작한 호출은 남겨 둠
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+    
+    @property
+    def in_flight(self) -> int:
+        """진행 중인 키 수"""
+        return len(self._tasks)
+    
+    def _count(self, outcome: str) -> None:
+        metrics.increment(f"singleflight_{self.name}_{outcome}")
+
+
+def _shared_context() -> contextvars.Context:
+    """공유 호출용 컨텍스트 (시작한 요청의 deadline과 SQL 집계만 옮김)"""
+    context = deadline_context()
+    stats = current_query_stats()
+    if stats is not None:
+        context.run(track_queries, stats)
+    return context
+
+
+# 메모 조회 합치기 (MemoService.get_memo / get_memos)
+memo_reads = SingleFlight("memo_reads")
+
+
+def _default_limiter() -> Optional[CapacityLimiter]:
+    """기본 limiter 조회 (이벤트 루프 밖에서는 None)"""
+    try:
+        return anyio.to_thread.current_default_thread_limiter()
+    except RuntimeError:
+        return None
+
+
+def _queue_depth(limiter: Optional[CapacityLimiter]) -> float:
+    """limiter 대기 중인 작업 수"""
+    return limiter.statistics().tasks_waiting if limiter is not None else 0
+
+
+def _in_use(limiter: Optional[CapacityLimiter]) -> float:
+    """limiter에서 실행 중인 작업 수"""
+    return limiter.borrowed_tokens if limiter is not None else 0
+
+
+metrics.register_gauge("db_threadpool_queue_depth", lambda: _queue_depth(_db_limiter))
+metrics.register_gauge("db_threadpool_in_use", lambda: _in_use(_db_limiter))
+metrics.register_gauge("db_threadpool_size", lambda: _db_limiter.total_tokens if _db_limiter else 0)
+metrics.register_gauge("default_threadpool_queue_depth", lambda: _queue_depth(_default_limiter()))
+metrics.register_gauge("default_threadpool_in_use", lambda: _in_use(_default_limiter()))
+metrics.register_gauge("singleflight_memo_reads_in_flight", lambda: memo_reads.in_flight)
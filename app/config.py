@@ -4,7 +4,8 @@
 """
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import field_validator
-from typing import List, Union
+from functools import lru_cache
+from typing import List, Optional, Union
 
 
 class Settings(BaseSettings):
@@ -14,6 +15,7 @@ class Settings(BaseSettings):
     APP_NAME: str = "Memo API"
     APP_VERSION: str = "1.0.0"
     DEBUG: bool = True
+    DOCS_ENABLED: bool = True  # False이면 /docs, /redoc, /openapi.json 비활성화
     
     # Database Configuration
     DATABASE_URL: str
@@ -24,8 +26,80 @@ class Settings(BaseSettings):
     # Database Connection Pool Settings
     DB_POOL_SIZE: int = 5
     DB_MAX_OVERFLOW: int = 10
-    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_TIMEOUT: float = 30  # 커넥션 대기 시간 (초, 초과하면 503 응답)
     DB_POOL_RECYCLE: int = 3600
+    DB_FAULTS: str = ""  # 장애 주입 (테스트/벤치마크용, 예: "latency=0.05,jitter=0.02,error_rate=0.01,checkout_delay=0.1")
+    
+    # Sharding (메모를 ID 슬롯 기준으로 여러 데이터베이스에 분산)
+    SHARD_DATABASE_URLS: str = ""  # 쉼표로 구분한 샤드 URL (비어 있으면 DATABASE_URL 하나만 사용)
+    SHARD_SLOTS: int = 256  # 메모 ID에 포함되는 슬롯 수 (운영 중 변경 불가)
+    SHARD_MAP: str = ""  # 슬롯 범위별 샤드 번호 (예: "0-127=0,128-255=1", 미지정 슬롯은 slot % 샤드 수)
+    
+    # Threadpool Settings (DB 작업과 그 외 동기 작업을 별도 limiter로 실행)
+    DB_THREADPOOL_SIZE: Optional[int] = None  # None이면 DB_POOL_SIZE + DB_MAX_OVERFLOW
+    DEFAULT_THREADPOOL_SIZE: int = 40
+    SINGLEFLIGHT_MAX_KEYS: int = 1024  # 동시에 합칠 수 있는 조회 키 수 (0이면 합치지 않음)
+    
+    # List Cache Settings (목록 페이지 캐시, 메모 쓰기 시 무효화)
+    LIST_CACHE_MAX_ENTRIES: int = 256  # 0이면 캐시 비활성화
+    LIST_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    MEMO_FRAGMENT_CACHE_SIZE: int = 10000  # 직렬화한 메모 JSON을 보관할 메모 수 (0이면 비활성화)
+    
+    # Request Deadline Settings (응답 시작까지의 시간 예산, PostgreSQL statement_timeout으로 전파)
+    REQUEST_TIMEOUT: float = 30.0  # 기본 시간 예산 (초, 0이면 deadline 없음)
+    ROUTE_TIMEOUTS: str = ""  # 라우트별 시간 예산 (예: "GET /api/v1/memos=2,POST /api/v1/batch=10")
+    
+    # Database Lifecycle Settings (시작 시 풀 워밍업, 종료 시 드레인)
+    DB_WARMUP_ENABLED: bool = True
+    DB_WARMUP_TIMEOUT: float = 30.0
+    DB_SHUTDOWN_DRAIN_TIMEOUT: float = 10.0
+    
+    # Server Settings (프로덕션 실행기: python -m app.server)
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    WEB_CONCURRENCY: Optional[int] = None  # None이면 사용 가능한 CPU 수만큼 워커 실행
+    SERVER_KEEPALIVE_TIMEOUT: int = 5
+    SERVER_BACKLOG: int = 2048
+    SERVER_GRACEFUL_SHUTDOWN_TIMEOUT: int = 30
+    
+    # Change Feed Settings (SSE /api/v1/memos/stream)
+    EVENT_BROKER: str = "auto"  # auto: PostgreSQL이면 LISTEN/NOTIFY, 그 외에는 프로세스 내 pub/sub
+    SSE_HEARTBEAT_INTERVAL: float = 15.0
+    SSE_QUEUE_SIZE: int = 100
+    SSE_REPLAY_BUFFER_SIZE: int = 1000
+    
+    # Logging Settings (큐 기반 비동기 로깅, SQL 로그는 echo 대신 app.sql 채널 사용)
+    LOG_LEVEL: str = "INFO"  # 애플리케이션(app.*) 로거 레벨
+    THIRD_PARTY_LOG_LEVEL: str = "WARNING"  # 그 외 라이브러리 로거(httpx, sqlalchemy 등) 레벨
+    LOG_FORMAT: str = "json"  # json 또는 text
+    LOG_QUEUE_SIZE: int = 10000  # 가득 차면 레코드를 버림 (요청 스레드를 블로킹하지 않음)
+    LOG_SAMPLING: str = ""  # 로거별 INFO 이하 통과 비율 (예: "app.access=0.1")
+    ACCESS_LOG_ENABLED: bool = True
+    SQL_LOG_ENABLED: bool = False
+    SQL_LOG_RATE_LIMIT: float = 50.0  # 초당 최대 SQL 로그 수
+    
+    # Profiling (서명된 X-Profile-Token 헤더 또는 샘플링으로 요청 프로파일링)
+    PROFILER_ENABLED: bool = False  # False이면 미들웨어와 /admin/profiles를 등록하지 않음
+    PROFILER_SECRET: str = ""  # 토큰 서명 키 (비어 있으면 헤더 요청과 관리자 API 사용 불가)
+    PROFILER_SAMPLE_RATE: float = 0.0  # 토큰 없이 프로파일링할 요청 비율
+    PROFILER_INTERVAL_MS: float = 5.0
+    PROFILER_DIR: str = "profiles"  # 워커가 공유하는 저장 디렉터리
+    PROFILER_MAX_PROFILES: int = 100
+    
+    # Tracing (OTLP/HTTP로 span 전송, W3C traceparent 전파)
+    TRACING_ENABLED: bool = False
+    TRACE_SAMPLE_RATE: float = 0.1  # 상위 서비스의 샘플링 결정이 없을 때 추적할 요청 비율
+    TRACE_EXPORTER: str = "otlp"  # otlp 또는 memory (테스트용)
+    TRACE_EXPORTER_ENDPOINT: str = "http://localhost:4318"
+    TRACE_SERVICE_NAME: str = "memo-api"
+    TRACE_BATCH_SIZE: int = 512
+    TRACE_QUEUE_SIZE: int = 2048  # 가득 차면 span을 버림 (요청을 블로킹하지 않음)
+    TRACE_EXPORT_INTERVAL: float = 5.0
+    
+    # Traffic Capture Settings (운영 트래픽 샘플링 기록)
+    TRAFFIC_CAPTURE_ENABLED: bool = False
+    TRAFFIC_CAPTURE_PATH: str = "traffic.jsonl"
+    TRAFFIC_CAPTURE_SAMPLE_RATE: float = 0.01
     
     @field_validator("CORS_ORIGINS", mode="before")
     @classmethod
@@ -43,5 +117,21 @@ class Settings(BaseSettings):
     )
 
 
-# 전역 설정 인스턴스
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """
+    전역 설정 인스턴스
+    최초 호출 시 환경 변수를 읽어 생성하므로, import만 하는 도구(Alembic, CLI, 테스트)는
+    DATABASE_URL 없이도 동작합니다.
+    
+    Returns:
+        Settings: 애플리케이션 설정
+    """
+    return Settings()
+
+
+def __getattr__(name: str):
+    """하위 호환: `from app.config import settings`는 접근 시점에 설정 생성"""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,49 +1,488 @@
 """
 데이터베이스 연결 및 세션 관리
 SQLAlchemy 엔진 및 세션 설정
+
+엔진은 import 시점이 아니라 최초 사용 시(또는 애플리케이션 lifespan 시작 시) 생성됩니다.
 """
-from sqlalchemy import create_engine
+import logging
+import os
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import create_engine, event, exc, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.engine.interfaces import CacheStats
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from sqlalchemy.pool import QueuePool, StaticPool
+from typing import Any, Callable, Dict, Generator, Optional
 
-from app.config import settings
+from app.config import Settings, get_settings
+from app.deadline import check_deadline, current_budget, remaining, reset_deadline, set_deadline
+from app.exceptions.request_exceptions import DeadlineExceededException
+from app.faults import install_faults
+from app.metrics import metrics, ratio
+from app.tracing import start_sql_span
 
 
-# SQLAlchemy 엔진 생성
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_size=settings.DB_POOL_SIZE,
-    max_overflow=settings.DB_MAX_OVERFLOW,
-    pool_timeout=settings.DB_POOL_TIMEOUT,
-    pool_recycle=settings.DB_POOL_RECYCLE,
-    echo=settings.DEBUG,  # SQL 쿼리 로깅 (DEBUG 모드에서만)
-)
+logger = logging.getLogger(__name__)
+
 
-# 세션 팩토리 생성
+# 현재 프로세스의 SQLAlchemy 엔진 (init_engine()에서 생성)
+_engine: Optional[Engine] = None
+
+# 세션 팩토리 생성 (엔진은 init_engine()에서 바인딩)
+# 요청 단위 세션이므로 commit 후 객체를 만료시키지 않아 응답 변환 시 재조회(SELECT)를 생략
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
-    bind=engine
+    expire_on_commit=False
 )
 
+# 요청 세션 팩토리 (샤딩 사용 시 use_session_factory()로 ShardedSession 팩토리로 교체)
+_session_factory: sessionmaker = SessionLocal
+
 # Base 클래스 생성 (모든 ORM 모델의 부모 클래스)
 Base = declarative_base()
 
 
+# 컴파일된 statement 캐시 적중 여부별 메트릭 이름
+_CACHE_METRIC_NAMES = {
+    stat: f"sql_compiled_cache_{stat.name.lower()}" for stat in CacheStats
+}
+metrics.register_gauge(
+    "sql_compiled_cache_hit_ratio",
+    ratio(
+        _CACHE_METRIC_NAMES[CacheStats.CACHE_HIT],
+        _CACHE_METRIC_NAMES[CacheStats.CACHE_HIT],
+        _CACHE_METRIC_NAMES[CacheStats.CACHE_MISS],
+    )
+)
+
+
+# SQL 로그 채널 (SQL_LOG_ENABLED일 때만 INFO 레벨이 활성화되며 속도 제한 적용)
+sql_logger = logging.getLogger("app.sql")
+
+
+@dataclass
+class QueryStats:
+    """요청 하나에서 실행한 SQL 수와 누적 실행 시간 (초)"""
+    count: int = 0
+    duration: float = 0.0
+
+
+# 현재 요청의 SQL 집계 (track_queries()로 설정, DB 스레드풀로 컨텍스트가 복사되어도 같은 객체를 공유)
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def track_queries(stats: Optional[QueryStats] = None) -> QueryStats:
+    """
+    현재 컨텍스트(요청)에서 실행되는 SQL 집계 시작
+    
+    Args:
+        stats: 이어서 집계할 객체 (다른 컨텍스트에서 요청 대신 실행하는 작업, 미지정 시 새로 생성)
+        
+    Returns:
+        QueryStats: 요청이 끝난 뒤 읽을 집계 객체
+    """
+    stats = stats if stats is not None else QueryStats()
+    _query_stats.set(stats)
+    return stats
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """현재 요청의 SQL 집계 객체 (집계 중이 아니면 None)"""
+    return _query_stats.get()
+
+
+def _start_statement_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    """요청 deadline이 지났으면 실행하지 않고, 실행 시작 시각 기록 및 SQL span 시작"""
+    check_deadline()
+    context._trace_span = start_sql_span(statement, conn.dialect.name)
+    context._query_started = time.perf_counter()
+
+
+# PostgreSQL 쿼리 취소 SQLSTATE (statement_timeout 초과 포함)
+QUERY_CANCELED = "57014"
+
+
+def _apply_statement_timeout(session, transaction, connection) -> None:
+    """
+    트랜잭션 시작 시 요청의 남은 시간을 statement_timeout으로 설정 (PostgreSQL)
+    SET LOCAL이므로 트랜잭션이 끝나면 해제되어 풀에 반납된 커넥션에 남지 않음
+    """
+    left = remaining()
+    if left is None:
+        return
+    if left <= 0:
+        raise DeadlineExceededException(current_budget())
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {max(1, int(left * 1000))}")
+
+
+def _end_failed_statement_span(context) -> None:
+    """실패한 statement의 SQL span을 오류로 종료"""
+    span = getattr(context.execution_context, "_trace_span", None)
+    if span is not None:
+        span.set_error(context.original_exception)
+        span.end()
+
+
+def _translate_statement_timeout(context) -> None:
+    """deadline으로 취소된 쿼리 오류를 DeadlineExceededException으로 변환"""
+    budget = current_budget()
+    if budget is None:
+        return
+    if getattr(context.original_exception, "pgcode", None) == QUERY_CANCELED:
+        metrics.increment("db_statement_timeouts")
+        raise DeadlineExceededException(budget) from context.original_exception
+
+
+event.listen(Session, "after_begin", _apply_statement_timeout)
+
+
+def _record_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    """실행된 statement의 컴파일 캐시 적중 여부, 요청별 DB 시간 집계, SQL span 종료 및 SQL 로그 기록"""
+    metrics.increment(_CACHE_METRIC_NAMES[context.cache_hit])
+    span = getattr(context, "_trace_span", None)
+    if span is not None:
+        span.end()
+    duration = time.perf_counter() - getattr(context, "_query_started", time.perf_counter())
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration += duration
+    if sql_logger.isEnabledFor(logging.INFO):
+        sql_logger.info(
+            "%s",
+            statement,
+            extra={"fields": {"duration_ms": round(duration * 1000, 3), "executemany": executemany}}
+        )
+
+
+class DeadlineQueuePool(QueuePool):
+    """
+    요청 deadline 안에서만 커넥션을 기다리는 QueuePool
+    
+    커넥션 대기 시간은 pool_timeout과 요청의 남은 시간 중 짧은 쪽이며, deadline이 이미 지났거나
+    대기 중에 지나면 TimeoutError(503) 대신 DeadlineExceededException(504)을 발생시킵니다.
+    """
+    
+    @property
+    def _timeout(self) -> float:
+        left = remaining()
+        if left is None:
+            return self._pool_timeout
+        return max(0.0, min(self._pool_timeout, left))
+    
+    @_timeout.setter
+    def _timeout(self, value: float) -> None:
+        self._pool_timeout = value
+    
+    def _do_get(self):
+        check_deadline()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            check_deadline()
+            raise
+    
+    def recreate(self) -> "DeadlineQueuePool":
+        pool = super().recreate()
+        # 요청 컨텍스트에서 재생성되어도 줄어든 대기 시간이 아니라 설정값을 유지
+        pool._timeout = self._pool_timeout
+        return pool
+
+
+def create_db_engine(config: Settings) -> Engine:
+    """
+    설정으로 SQLAlchemy 엔진 생성
+    
+    Args:
+        config: 애플리케이션 설정
+        
+    Returns:
+        Engine: SQLAlchemy 엔진
+    """
+    url = make_url(config.DATABASE_URL)
+    # SQL 로그는 echo(요청 스레드에서 동기 출력) 대신 app.sql 채널로 기록 (SQL_LOG_ENABLED)
+    options: Dict[str, Any] = {}
+    
+    if url.get_backend_name() == "sqlite":
+        # SQLite는 스레드풀에서 커넥션을 공유하므로 스레드 검사 비활성화
+        options["connect_args"] = {"check_same_thread": False}
+        if url.database in (None, "", ":memory:"):
+            # 인메모리 DB는 커넥션마다 별도 DB이므로 단일 커넥션 공유
+            options["poolclass"] = StaticPool
+    
+    if "poolclass" not in options:
+        options.update(
+            poolclass=DeadlineQueuePool,
+            pool_size=config.DB_POOL_SIZE,
+            max_overflow=config.DB_MAX_OVERFLOW,
+            pool_timeout=config.DB_POOL_TIMEOUT,
+            pool_recycle=config.DB_POOL_RECYCLE,
+        )
+    
+    engine = create_engine(url, **options)
+    event.listen(engine, "before_cursor_execute", _start_statement_timer)
+    event.listen(engine, "after_cursor_execute", _record_statement)
+    event.listen(engine, "handle_error", _end_failed_statement_span)
+    event.listen(engine, "handle_error", _translate_statement_timeout)
+    # 장애 주입은 실행 시간 측정/SQL span 시작 이후에 등록하여 주입한 지연이 집계에 포함되도록 함
+    install_faults(engine, config.DB_FAULTS)
+    return engine
+
+
+def init_engine(config: Optional[Settings] = None) -> Engine:
+    """
+    엔진 생성 및 세션 팩토리 바인딩
+    이미 생성된 엔진이 있으면 정리 후 교체
+    
+    Args:
+        config: 애플리케이션 설정 (미지정 시 전역 설정)
+        
+    Returns:
+        Engine: 새로 생성된 엔진
+    """
+    global _engine
+    if _engine is not None:
+        _engine.dispose()
+    _engine = create_db_engine(config or get_settings())
+    SessionLocal.configure(bind=_engine)
+    return _engine
+
+
+def get_engine() -> Engine:
+    """
+    현재 엔진 반환 (없으면 전역 설정으로 생성)
+    
+    Returns:
+        Engine: SQLAlchemy 엔진
+    """
+    if _engine is None:
+        return init_engine()
+    return _engine
+
+
+def is_engine_initialized() -> bool:
+    """엔진 생성 여부"""
+    return _engine is not None
+
+
+def dispose_engine(drain_timeout: float = 0.0) -> None:
+    """
+    엔진의 모든 풀 커넥션을 닫고 엔진 해제
+    
+    Args:
+        drain_timeout: 사용 중인 커넥션 반납을 기다릴 최대 시간 (초)
+    """
+    global _engine
+    if _engine is not None:
+        if drain_timeout > 0:
+            drain_pool(_engine, drain_timeout)
+        _engine.dispose()
+        _engine = None
+
+
+def use_session_factory(factory: sessionmaker) -> None:
+    """
+    get_db()가 사용할 세션 팩토리 교체
+    
+    Args:
+        factory: 요청 세션 팩토리 (SessionLocal과 같은 설정이어야 함)
+    """
+    global _session_factory
+    _session_factory = factory
+
+
+def warm_up_pool(
+    engine: Engine,
+    size: int,
+    prepare: Optional[Callable[[Session], None]] = None,
+    timeout: Optional[float] = None
+) -> int:
+    """
+    커넥션 풀 워밍업
+    size개의 커넥션을 동시에 체크아웃하여 연결을 미리 수립하고 확인 쿼리를 실행한 뒤
+    풀에 반납합니다. prepare가 주어지면 자주 쓰는 쿼리를 한 번 실행하여
+    컴파일된 statement 캐시를 채웁니다.
+    
+    timeout은 요청 deadline과 같은 방식으로 적용되므로 커넥션 대기(DeadlineQueuePool), statement 실행 전
+    검사와 PostgreSQL statement_timeout이 남은 시간 안으로 제한하며, 시간을 넘기면 열어 둔 커넥션을
+    반납하고 DeadlineExceededException을 발생시킵니다.
+    
+    Args:
+        engine: 워밍업할 엔진
+        size: 미리 열어 둘 커넥션 수 (보통 DB_POOL_SIZE)
+        prepare: 세션을 받아 hot statement를 실행하는 함수
+        timeout: 워밍업 최대 시간 (초, 미지정 시 제한 없음)
+        
+    Returns:
+        int: 워밍업된 커넥션 수
+        
+    Raises:
+        DeadlineExceededException: timeout을 넘긴 경우
+    """
+    token = set_deadline(timeout) if timeout is not None else None
+    try:
+        connections = []
+        try:
+            for _ in range(size):
+                connection = engine.connect()
+                connections.append(connection)
+                connection.execute(text("SELECT 1"))
+        finally:
+            for connection in connections:
+                connection.close()  # 풀에 반납 (연결은 유지)
+        
+        if prepare is not None:
+            with Session(bind=engine) as session:
+                try:
+                    prepare(session)
+                except DeadlineExceededException:
+                    raise
+                except Exception:
+                    # 마이그레이션 전 등 테이블이 없어도 워밍업 자체는 성공으로 처리
+                    logger.warning("Hot statement preparation failed", exc_info=True)
+        return len(connections)
+    finally:
+        if token is not None:
+            reset_deadline(token)
+
+
+def drain_pool(engine: Engine, timeout: float) -> bool:
+    """
+    체크아웃된 커넥션이 모두 반납될 때까지 대기
+    
+    Args:
+        engine: 대상 엔진
+        timeout: 최대 대기 시간 (초)
+        
+    Returns:
+        bool: 제한 시간 안에 모두 반납되었는지 여부
+    """
+    checkedout = getattr(engine.pool, "checkedout", None)
+    if checkedout is None:
+        return True
+    deadline = time.monotonic() + timeout
+    while checkedout() > 0:
+        if time.monotonic() >= deadline:
+            logger.warning("Pool drain timed out with %d connections in use", checkedout())
+            return False
+        time.sleep(0.05)
+    return True
+
+
+# 세션 info 키: 세션을 사용하는 쪽(DB 스레드 작업 또는 요청 정리)이 잡는 잠금
+SESSION_LOCK = "session_lock"
+
+# 세션 info 키: 세션을 만든 팩토리 (같은 DB에 연결하는 새 세션을 만들 때 사용)
+SESSION_FACTORY = "session_factory"
+
+
+def session_lock(db: Session) -> threading.Lock:
+    """
+    세션 사용 잠금 조회
+    DB 스레드 작업(run_with_session)이 실행하는 동안 잡고 있어, deadline으로 먼저 끝난 요청의
+    정리 코드가 사용 중인 세션을 다른 스레드에서 닫지 않도록 함
+    
+    Args:
+        db: 데이터베이스 세션
+        
+    Returns:
+        threading.Lock: 세션별 잠금
+    """
+    return db.info.setdefault(SESSION_LOCK, threading.Lock())
+
+
+def session_factory_of(db: Session) -> Callable[[], Session]:
+    """
+    db와 같은 DB(샤드)에 연결하는 새 세션을 만드는 함수 조회
+    여러 요청이 함께 기다리는 조회(single-flight)는 특정 요청의 세션 대신 이 함수로 만든 세션을 사용
+    
+    Args:
+        db: 데이터베이스 세션
+        
+    Returns:
+        Callable[[], Session]: get_db()가 만든 세션이면 그 팩토리, 아니면 같은 bind의 세션 생성 함수
+    """
+    factory = db.info.get(SESSION_FACTORY)
+    if factory is not None:
+        return factory
+    bind = db.get_bind()
+    return lambda: Session(bind=bind, autoflush=False, expire_on_commit=False)
+
+
+def release_session(db: Session) -> None:
+    """
+    요청이 끝난 세션 정리
+    DB 스레드가 아직 세션을 사용 중이면(deadline으로 요청이 먼저 끝난 경우) 기다리지 않고
+    그 스레드가 작업을 마친 뒤 세션을 닫도록 둠
+    
+    Args:
+        db: 데이터베이스 세션
+    """
+    lock = session_lock(db)
+    if not lock.acquire(blocking=False):
+        return
+    try:
+        db.close()
+    finally:
+        lock.release()
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     데이터베이스 세션 의존성
     FastAPI 엔드포인트에서 사용할 DB 세션 제공
+    (세션 생성만으로는 커넥션을 가져오지 않으며 첫 쿼리 시점에 풀에서 체크아웃)
     
     Yields:
         Session: SQLAlchemy 데이터베이스 세션
     """
-    db = SessionLocal()
+    if _engine is None:
+        init_engine()
+    db = _session_factory(info={SESSION_FACTORY: _session_factory})
     try:
         yield db
     finally:
-        db.close()
+        release_session(db)
+
+
+# 세션 info 키: True이면 commit()이 flush만 수행 (배치 실행처럼 호출자가 트랜잭션을 관리하는 경우)
+DEFER_COMMIT = "defer_commit"
+
+
+def commit(db: Session) -> None:
+    """
+    Repository 쓰기 작업 확정
+    호출자가 트랜잭션을 관리하는 세션(DEFER_COMMIT)이면 flush만 하여 하나의 트랜잭션으로 묶음
+    
+    Args:
+        db: 데이터베이스 세션
+    """
+    if db.info.get(DEFER_COMMIT):
+        db.flush()
+    else:
+        db.commit()
+
+
+def dispose_engine_after_fork() -> None:
+    """
+    fork된 자식 프로세스에서 커넥션 풀 재생성
+    부모 프로세스가 열어 둔 커넥션(소켓)을 자식이 공유하지 않도록
+    기존 커넥션은 닫지 않고 버린 뒤 새 풀을 사용
+    """
+    if _engine is not None:
+        _engine.dispose(close=False)
+
+
+# pre-fork 서버(gunicorn --preload 등)에서 워커가 부모의 풀을 물려받지 않도록 등록
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=dispose_engine_after_fork)
 
 
 def init_db() -> None:
@@ -51,4 +490,11 @@ def init_db() -> None:
     데이터베이스 초기화
     모든 테이블 생성 (개발 환경용, 프로덕션에서는 Alembic 사용)
     """
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
+
+
+def __getattr__(name: str):
+    """하위 호환: `from app.database import engine`은 접근 시점에 엔진 생성"""
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,105 @@
+"""
+요청 시간 예산(deadline) 관리
+요청별 deadline을 컨텍스트 변수로 전달하여 DB 계층에서 statement_timeout으로 적용
+
+deadline은 DeadlineMiddleware가 요청마다 설정하며, DB 작업용 스레드풀로 컨텍스트가
+복사되므로 세션은 트랜잭션 시작 시 남은 시간을 PostgreSQL `SET LOCAL statement_timeout`으로
+설정합니다. 쿼리가 deadline을 넘기면 서버에서 취소되어 커넥션이 곧바로 풀에 반납됩니다.
+"""
+import time
+from contextvars import Context, ContextVar, Token
+from typing import Dict, Optional, Tuple
+
+from app.exceptions.request_exceptions import DeadlineExceededException
+
+
+# 현재 요청의 (deadline 시각(time.monotonic 기준), 예산(초))
+_deadline: ContextVar[Optional[Tuple[float, float]]] = ContextVar("request_deadline", default=None)
+
+
+def set_deadline(budget: float) -> Token:
+    """
+    현재 컨텍스트(요청)의 deadline 설정
+    
+    Args:
+        budget: 시간 예산 (초)
+        
+    Returns:
+        Token: reset_deadline()에 전달할 토큰
+    """
+    return _deadline.set((time.monotonic() + budget, budget))
+
+
+def reset_deadline(token: Token) -> None:
+    """set_deadline() 이전 상태로 복원"""
+    _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """
+    현재 요청의 남은 시간 (초)
+    
+    Returns:
+        Optional[float]: 남은 시간 (deadline이 없으면 None, 지났으면 0 이하)
+    """
+    current = _deadline.get()
+    if current is None:
+        return None
+    return current[0] - time.monotonic()
+
+
+def check_deadline() -> None:
+    """
+    deadline이 지났으면 예외 발생
+    
+    Raises:
+        DeadlineExceededException: 남은 시간이 없는 경우
+    """
+    current = _deadline.get()
+    if current is not None and current[0] <= time.monotonic():
+        raise DeadlineExceededException(current[1])
+
+
+def current_budget() -> Optional[float]:
+    """현재 요청의 전체 시간 예산 (초, 없으면 None)"""
+    current = _deadline.get()
+    return current[1] if current is not None else None
+
+
+def deadline_context() -> Context:
+    """
+    현재 요청의 deadline만 옮긴 새 컨텍스트
+    여러 요청이 함께 기다리는 작업은 이 컨텍스트에서 실행하여, 요청의 추적 span이나 프로파일 등
+    다른 컨텍스트 변수를 물려받지 않고 시작한 요청의 시간 예산으로만 제한
+    
+    Returns:
+        Context: deadline 외에는 비어 있는 컨텍스트
+    """
+    context = Context()
+    current = _deadline.get()
+    if current is not None:
+        context.run(_deadline.set, current)
+    return context
+
+
+def parse_route_timeouts(value: str) -> Dict[str, float]:
+    """
+    ROUTE_TIMEOUTS 설정 파싱
+    
+    Args:
+        value: "메서드 라우트=초" 목록 (예: "GET /api/v1/memos=2,POST /api/v1/batch=10")
+        
+    Returns:
+        Dict[str, float]: "메서드 라우트"별 시간 예산 (0이면 deadline 없음)
+        
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    timeouts: Dict[str, float] = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        route, _, seconds = item.rpartition("=")
+        method, _, path = route.strip().partition(" ")
+        timeouts[f"{method.upper()} {path.strip()}"] = float(seconds)
+    return timeouts
@@ -0,0 +1,28 @@
+"""
+이벤트 패키지
+메모 변경 이벤트 발행 및 구독 (SSE 변경 피드)
+"""
+from app.events.broker import (
+    PENDING_EVENTS,
+    InMemoryBroker,
+    MemoEvent,
+    Subscription,
+    get_broker,
+    init_broker,
+    publish_event,
+    write_transaction,
+)
+from app.events.sse import event_stream, parse_last_event_id
+
+__all__ = [
+    "PENDING_EVENTS",
+    "InMemoryBroker",
+    "MemoEvent",
+    "Subscription",
+    "event_stream",
+    "get_broker",
+    "init_broker",
+    "parse_last_event_id",
+    "publish_event",
+    "write_transaction",
+]
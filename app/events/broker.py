@@ -0,0 +1,316 @@
+"""
+메모 변경 이벤트 브로커
+생성/수정/삭제 이벤트를 SSE 구독자에게 전달
+
+이벤트는 요청 처리 스레드(DB 작업용 스레드풀)에서 발행되고, 구독자 큐는 이벤트 루프에서
+소비됩니다. 발행은 잠금 아래에서 재전송 버퍼에 기록한 뒤 call_soon_threadsafe로 루프에
+전달하므로 어느 스레드에서 호출해도 안전합니다.
+"""
+import asyncio
+import collections
+import json
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.config import Settings, get_settings
+from app.database import DEFER_COMMIT, get_engine
+from app.metrics import metrics
+
+
+@dataclass(frozen=True)
+class MemoEvent:
+    """메모 변경 이벤트"""
+    id: int
+    type: str
+    memo_id: int
+    data: Optional[Dict[str, Any]] = None
+    
+    def to_sse(self) -> str:
+        """SSE 메시지 형식으로 직렬화"""
+        payload = json.dumps(
+            {"memo_id": self.memo_id, "data": self.data},
+            ensure_ascii=False,
+            separators=(",", ":")
+        )
+        return f"id: {self.id}\nevent: {self.type}\ndata: {payload}\n\n"
+
+
+class Subscription:
+    """
+    SSE 연결 하나의 이벤트 큐
+    
+    큐가 가득 차면(클라이언트가 느려 이벤트를 소비하지 못하면) 이벤트를 더 쌓지 않고
+    overflowed로 표시합니다. 스트림은 종료되고, 클라이언트는 Last-Event-ID로 재접속하여
+    재전송 버퍼에서 놓친 이벤트를 받습니다.
+    """
+    
+    def __init__(self, max_queue_size: int):
+        self.queue: "asyncio.Queue[MemoEvent]" = asyncio.Queue(maxsize=max_queue_size)
+        self.overflowed = False
+        self._seen: Set[int] = set()
+    
+    def replay(self, missed: List[MemoEvent], buffered: List[MemoEvent]) -> None:
+        """
+        놓친 이벤트 추가 후, 구독 시점에 이미 버퍼에 있던 이벤트는 이후 전달되어도 무시
+        (구독 직전에 발행되어 아직 루프에 전달되지 않은 이벤트의 중복 전송 방지)
+        """
+        for event in missed:
+            self.offer(event)
+        self._seen = {event.id for event in buffered}
+    
+    def offer(self, event: MemoEvent) -> None:
+        """이벤트 추가 (큐가 가득 차면 overflowed 표시)"""
+        if self.overflowed or event.id in self._seen:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            metrics.increment("sse_subscriptions_overflowed")
+
+
+class InMemoryBroker:
+    """
+    프로세스 내 pub/sub 브로커 (로컬 개발 및 테스트용)
+    
+    Args:
+        replay_buffer_size: Last-Event-ID 재전송을 위해 보관할 최근 이벤트 수
+        subscriber_queue_size: 구독자별 큐 크기
+    """
+    
+    def __init__(self, replay_buffer_size: int = 1000, subscriber_queue_size: int = 100):
+        self.subscriber_queue_size = subscriber_queue_size
+        self._lock = threading.Lock()
+        self._buffer: Deque[MemoEvent] = collections.deque(maxlen=replay_buffer_size)
+        self._subscribers: Set[Subscription] = set()
+        self._listeners: List[Callable[[MemoEvent], None]] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._last_id = 0
+    
+    async def start(self) -> None:
+        """이벤트를 전달할 이벤트 루프 등록 (lifespan 시작 시 호출)"""
+        self._loop = asyncio.get_running_loop()
+    
+    async def stop(self) -> None:
+        """구독자 정리 (lifespan 종료 시 호출)"""
+        self._loop = None
+        self._subscribers.clear()
+    
+    @property
+    def subscriber_count(self) -> int:
+        """현재 구독자 수"""
+        return len(self._subscribers)
+    
+    def add_listener(self, listener: Callable[[MemoEvent], None]) -> None:
+        """
+        이벤트 수신 콜백 등록 (다른 프로세스에서 발행한 이벤트 포함, 전달 스레드에서 호출)
+        
+        Args:
+            listener: 이벤트를 받을 함수 (빠르게 반환해야 함)
+        """
+        self._listeners.append(listener)
+    
+    def publish(self, event_type: str, memo_id: int, data: Optional[Dict[str, Any]] = None) -> None:
+        """
+        이벤트 발행 (어느 스레드에서나 호출 가능)
+        
+        Args:
+            event_type: 이벤트 종류 (created, updated, deleted)
+            memo_id: 메모 ID
+            data: 이벤트 데이터 (메모 응답 JSON)
+        """
+        with self._lock:
+            self._last_id += 1
+            event = MemoEvent(self._last_id, event_type, memo_id, data)
+        self._deliver(event)
+    
+    def publish_in_transaction(
+        self,
+        db: Session,
+        event_type: str,
+        memo_id: int,
+        data: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        쓰기 트랜잭션 안에서 이벤트 발행
+        프로세스 내 브로커는 트랜잭션에 참여할 수 없으므로 발행하지 않으며, 호출자가 커밋 후 publish() 호출
+        
+        Args:
+            db: 변경을 수행 중인 데이터베이스 세션
+            event_type: 이벤트 종류 (created, updated, deleted)
+            memo_id: 메모 ID
+            data: 이벤트 데이터 (메모 응답 JSON)
+            
+        Returns:
+            bool: 트랜잭션과 함께 발행되었는지 여부
+        """
+        return False
+    
+    def _deliver(self, event: MemoEvent) -> None:
+        """재전송 버퍼에 기록하고 이벤트 루프에서 구독자에게 전달"""
+        with self._lock:
+            self._buffer.append(event)
+            self._last_id = max(self._last_id, event.id)
+        metrics.increment("events_published")
+        for listener in self._listeners:
+            listener(event)
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self._dispatch, event)
+        except RuntimeError:
+            # 종료 중인 루프
+            pass
+    
+    def _dispatch(self, event: MemoEvent) -> None:
+        for subscription in list(self._subscribers):
+            subscription.offer(event)
+    
+    def subscribe(self, last_event_id: Optional[int] = None) -> Tuple[Subscription, bool]:
+        """
+        구독 등록 (이벤트 루프에서 호출)
+        
+        Args:
+            last_event_id: 클라이언트가 마지막으로 받은 이벤트 ID (재접속 시)
+            
+        Returns:
+            Tuple[Subscription, bool]: (구독, 재전송 버퍼로 놓친 이벤트를 모두 복구했는지 여부)
+        """
+        subscription = Subscription(self.subscriber_queue_size)
+        complete = True
+        missed: List[MemoEvent] = []
+        with self._lock:
+            buffered = list(self._buffer)
+            if last_event_id is not None:
+                missed = [event for event in buffered if event.id > last_event_id]
+                # 버퍼가 클라이언트의 마지막 이벤트 바로 다음부터 담고 있거나, 마지막으로 본 이벤트가
+                # 클라이언트와 같을 때만 놓친 이벤트가 없다고 판단 (새로 시작한 워커는 버퍼가 비어 있어도
+                # 그 전에 발행된 이벤트를 알 수 없음)
+                if buffered:
+                    complete = buffered[0].id <= last_event_id + 1
+                else:
+                    complete = self._last_id == last_event_id
+            subscription.replay(missed, buffered)
+            self._subscribers.add(subscription)
+        return subscription, complete
+    
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """구독 해제"""
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+
+# 이벤트 브로커 (init_broker()에서 생성)
+_broker: Optional[InMemoryBroker] = None
+
+
+def init_broker(config: Optional[Settings] = None, engine: Optional[Engine] = None) -> InMemoryBroker:
+    """
+    설정에 맞는 이벤트 브로커 생성
+    
+    EVENT_BROKER가 "postgres"이거나, "auto"이면서 브로커 엔진(미지정 시 DATABASE_URL)이 PostgreSQL이면
+    LISTEN/NOTIFY 브로커를, 그 외에는 프로세스 내 브로커를 사용합니다.
+    
+    Args:
+        config: 애플리케이션 설정 (미지정 시 전역 설정)
+        engine: PostgreSQL 브로커가 사용할 엔진 (미지정 시 전역 엔진, 샤딩 중이면 첫 번째 샤드)
+        
+    Returns:
+        InMemoryBroker: 생성된 브로커
+    """
+    global _broker
+    config = config or get_settings()
+    options = {
+        "replay_buffer_size": config.SSE_REPLAY_BUFFER_SIZE,
+        "subscriber_queue_size": config.SSE_QUEUE_SIZE,
+    }
+    backend = config.EVENT_BROKER
+    if backend == "auto":
+        url = engine.url.drivername if engine is not None else config.DATABASE_URL
+        backend = "postgres" if url.startswith("postgresql") else "memory"
+    
+    if backend == "postgres":
+        from app.events.postgres import PostgresBroker
+        _broker = PostgresBroker(engine or get_engine(), **options)
+    elif backend == "memory":
+        _broker = InMemoryBroker(**options)
+    else:
+        raise ValueError(f"Unknown EVENT_BROKER: {config.EVENT_BROKER}")
+    return _broker
+
+
+def get_broker() -> InMemoryBroker:
+    """이벤트 브로커 조회 (초기화 전이면 프로세스 내 브로커 생성)"""
+    global _broker
+    if _broker is None:
+        _broker = InMemoryBroker()
+    return _broker
+
+
+# 세션 info 키: 이 목록이 있으면 이벤트를 바로 발행하지 않고 모아 둠 (트랜잭션 커밋 후 발행)
+PENDING_EVENTS = "pending_events"
+
+
+def publish_event(
+    db: Session,
+    event_type: str,
+    memo_id: int,
+    data: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    변경 이벤트 발행
+    호출자가 트랜잭션을 관리하는 세션(write_transaction, 배치)이면 트랜잭션에 참여하는 브로커는
+    같은 트랜잭션에서 발행하고, 그 외 브로커는 커밋될 때까지 발행을 미룸
+    
+    Args:
+        db: 변경을 수행한 데이터베이스 세션
+        event_type: 이벤트 종류 (created, updated, deleted)
+        memo_id: 메모 ID
+        data: 이벤트 데이터 (메모 응답 JSON)
+    """
+    broker = get_broker()
+    pending = db.info.get(PENDING_EVENTS)
+    if pending is None:
+        broker.publish(event_type, memo_id, data)
+    elif not broker.publish_in_transaction(db, event_type, memo_id, data):
+        pending.append((event_type, memo_id, data))
+
+
+@contextmanager
+def write_transaction(db: Session) -> Iterator[None]:
+    """
+    서비스 쓰기 하나를 트랜잭션으로 묶고 변경 이벤트를 커밋과 함께 발행
+    
+    블록 안의 Repository commit()은 flush만 하고 블록이 끝나면 한 번 커밋합니다. PostgreSQL 브로커는
+    같은 트랜잭션에서 pg_notify를 실행하므로 추가 커넥션 없이 쓰기와 함께 확정되고, 프로세스 내
+    브로커는 커밋 후 발행합니다. 호출자가 이미 트랜잭션을 관리하는 세션(배치)이면 그대로 실행합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+    """
+    if db.info.get(DEFER_COMMIT):
+        yield
+        return
+    db.info[DEFER_COMMIT] = True
+    pending = db.info[PENDING_EVENTS] = []
+    try:
+        yield
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.info.pop(DEFER_COMMIT, None)
+        db.info.pop(PENDING_EVENTS, None)
+    broker = get_broker()
+    for event_type, memo_id, data in pending:
+        broker.publish(event_type, memo_id, data)
+
+
+metrics.register_gauge("sse_subscribers", lambda: _broker.subscriber_count if _broker else 0)
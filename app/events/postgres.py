@@ -0,0 +1,158 @@
+"""
+PostgreSQL LISTEN/NOTIFY 이벤트 브로커
+여러 워커 프로세스와 인스턴스가 같은 변경 이벤트를 구독
+
+발행은 쓰기 트랜잭션 안에서 pg_notify로 이벤트를 보내고(커밋될 때 전달), 각 프로세스의
+수신 스레드가 전용 커넥션에서 LISTEN하여 받은 이벤트를 프로세스 내 구독자에게 전달합니다. 이벤트 ID는
+memo_event_id_seq 시퀀스에서 발급하므로 모든 프로세스에서 같은 ID를 사용하며,
+재접속한 클라이언트가 다른 워커에 연결되어도 Last-Event-ID로 이어서 받을 수 있습니다.
+"""
+import json
+import logging
+import select
+import threading
+from typing import Any, Dict, Optional
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.events.broker import InMemoryBroker, MemoEvent
+from app.metrics import metrics
+
+
+logger = logging.getLogger(__name__)
+
+# NOTIFY 채널 이름
+CHANNEL = "memo_events"
+
+# NOTIFY 페이로드 최대 크기는 8000바이트이므로 이보다 큰 데이터는 생략 (클라이언트가 ID로 조회)
+MAX_DATA_BYTES = 7000
+
+NOTIFY_EVENT = text(
+    "SELECT pg_notify(:channel, json_build_object("
+    "'id', nextval('memo_event_id_seq'), "
+    "'type', CAST(:event_type AS text), "
+    "'memo_id', CAST(:memo_id AS integer), "
+    "'data', CAST(:data AS json))::text)"
+).bindparams(bindparam("channel", CHANNEL))
+
+
+class PostgresBroker(InMemoryBroker):
+    """
+    LISTEN/NOTIFY 기반 브로커
+    
+    Args:
+        engine: 데이터베이스 엔진
+        poll_interval: 수신 스레드의 종료 확인 주기 (초)
+        **options: InMemoryBroker 옵션
+    """
+    
+    def __init__(self, engine: Engine, poll_interval: float = 1.0, **options: Any):
+        super().__init__(**options)
+        self.engine = engine
+        self.poll_interval = poll_interval
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    async def start(self) -> None:
+        """이벤트 루프 등록 및 수신 스레드 시작"""
+        await super().start()
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._listen, name="memo-event-listener", daemon=True)
+        self._thread.start()
+    
+    async def stop(self) -> None:
+        """수신 스레드 종료"""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(self.poll_interval * 2)
+            self._thread = None
+        await super().stop()
+    
+    def publish(self, event_type: str, memo_id: int, data: Optional[Dict[str, Any]] = None) -> None:
+        """
+        커밋된 쓰기의 이벤트를 별도 트랜잭션의 pg_notify로 발행 (자신을 포함한 모든 프로세스의 수신 스레드가 전달)
+        발행에 실패해도 예외를 전달하지 않고 기록만 합니다.
+        
+        Args:
+            event_type: 이벤트 종류 (created, updated, deleted)
+            memo_id: 메모 ID
+            data: 이벤트 데이터 (메모 응답 JSON)
+        """
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(NOTIFY_EVENT, self._params(event_type, memo_id, data))
+        except Exception:
+            # 쓰기는 이미 커밋되었으므로 요청을 실패시키지 않음 (구독자는 변경분 동기화로 복구)
+            metrics.increment("events_publish_failed")
+            logger.warning("Failed to publish %s event for memo %d", event_type, memo_id, exc_info=True)
+    
+    def publish_in_transaction(
+        self,
+        db: Session,
+        event_type: str,
+        memo_id: int,
+        data: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        쓰기 세션의 트랜잭션에서 pg_notify 실행
+        NOTIFY는 트랜잭션이 커밋될 때 전달되고 롤백되면 버려지므로 추가 커넥션 없이 쓰기와 함께 확정됩니다.
+        브로커 엔진에 연결되지 않은 세션(샤드 세션 등)은 발행하지 않습니다.
+        
+        Args:
+            db: 변경을 수행 중인 데이터베이스 세션
+            event_type: 이벤트 종류 (created, updated, deleted)
+            memo_id: 메모 ID
+            data: 이벤트 데이터 (메모 응답 JSON)
+            
+        Returns:
+            bool: 트랜잭션과 함께 발행되었는지 여부
+        """
+        if db.bind is not self.engine:
+            return False
+        db.execute(NOTIFY_EVENT, self._params(event_type, memo_id, data))
+        return True
+    
+    @staticmethod
+    def _params(event_type: str, memo_id: int, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        encoded = json.dumps(data, ensure_ascii=False) if data is not None else None
+        if encoded is not None and len(encoded.encode("utf-8")) > MAX_DATA_BYTES:
+            encoded = None
+        return {"event_type": event_type, "memo_id": memo_id, "data": encoded}
+    
+    def _listen(self) -> None:
+        """전용 커넥션에서 LISTEN하며 수신한 이벤트 전달 (연결이 끊기면 재연결)"""
+        backoff = self.poll_interval
+        while not self._stopped.is_set():
+            try:
+                self._listen_once()
+                backoff = self.poll_interval
+            except Exception:
+                logger.warning("Event listener connection lost, reconnecting", exc_info=True)
+                self._stopped.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+    
+    def _listen_once(self) -> None:
+        # 풀에서 분리한 커넥션을 autocommit으로 사용 (풀 용량을 차지하지 않음)
+        fairy = self.engine.raw_connection()
+        fairy.detach()
+        connection = fairy.driver_connection
+        try:
+            connection.autocommit = True
+            with connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {CHANNEL}")
+            while not self._stopped.is_set():
+                if select.select([connection], [], [], self.poll_interval) == ([], [], []):
+                    continue
+                connection.poll()
+                while connection.notifies:
+                    notify = connection.notifies.pop(0)
+                    self._deliver(self._parse(notify.payload))
+        finally:
+            fairy.close()
+    
+    @staticmethod
+    def _parse(payload: str) -> MemoEvent:
+        message = json.loads(payload)
+        return MemoEvent(message["id"], message["type"], message["memo_id"], message.get("data"))
@@ -0,0 +1,61 @@
+"""
+Server-Sent Events 스트림
+구독한 메모 변경 이벤트를 SSE 메시지로 변환
+"""
+import asyncio
+from typing import AsyncIterator, Optional
+
+from app.events.broker import InMemoryBroker
+
+
+# 연결이 끊겼을 때 클라이언트(EventSource)가 재접속까지 기다릴 시간 (밀리초)
+RETRY_MS = 3000
+
+
+def parse_last_event_id(value: Optional[str]) -> Optional[int]:
+    """Last-Event-ID 헤더 파싱 (형식이 잘못되면 None)"""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+async def event_stream(
+    broker: InMemoryBroker,
+    last_event_id: Optional[int],
+    heartbeat_interval: float
+) -> AsyncIterator[str]:
+    """
+    SSE 메시지 스트림 생성
+    
+    재접속한 클라이언트에는 놓친 이벤트를 먼저 보내고, 재전송 버퍼가 부족하면 reset 이벤트로
+    목록을 다시 조회하도록 알립니다. 이벤트가 없으면 heartbeat 주석을 보내 프록시가 연결을
+    끊지 않도록 하며, 구독 큐가 넘치면 남은 이벤트를 보낸 뒤 스트림을 종료합니다
+    (클라이언트는 Last-Event-ID로 재접속).
+    
+    Args:
+        broker: 이벤트 브로커
+        last_event_id: 클라이언트가 마지막으로 받은 이벤트 ID
+        heartbeat_interval: heartbeat 전송 주기 (초)
+        
+    Yields:
+        str: SSE 메시지
+    """
+    subscription, complete = broker.subscribe(last_event_id)
+    try:
+        yield f"retry: {RETRY_MS}\n\n"
+        if not complete:
+            yield "event: reset\ndata: {}\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), heartbeat_interval)
+            except asyncio.TimeoutError:
+                yield ": heartbeat\n\n"
+                continue
+            yield event.to_sse()
+            if subscription.overflowed and subscription.queue.empty():
+                break
+    finally:
+        broker.unsubscribe(subscription)
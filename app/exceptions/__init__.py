@@ -3,11 +3,17 @@
 커스텀 예외 정의
 """
 from app.exceptions.memo_exceptions import (
+    InvalidSyncTokenException,
     MemoNotFoundException,
-    MemoValidationException
+    MemoValidationException,
+    SyncTokenExpiredException
 )
+from app.exceptions.request_exceptions import DeadlineExceededException
 
 __all__ = [
+    "DeadlineExceededException",
+    "InvalidSyncTokenException",
     "MemoNotFoundException",
-    "MemoValidationException"
+    "MemoValidationException",
+    "SyncTokenExpiredException"
 ]
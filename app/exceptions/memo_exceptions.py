@@ -16,3 +16,19 @@ class MemoValidationException(Exception):
     
     def __init__(self, message: str):
         super().__init__(message)
+
+
+class InvalidSyncTokenException(Exception):
+    """변경분 동기화 토큰이 올바르지 않을 때 발생하는 예외"""
+    
+    def __init__(self, token: str):
+        self.token = token
+        super().__init__(f"Invalid sync token: {token}")
+
+
+class SyncTokenExpiredException(Exception):
+    """변경분 동기화 토큰이 삭제 기록 보관 기간보다 오래되어 전체 동기화가 필요할 때 발생하는 예외"""
+    
+    def __init__(self, token: str):
+        self.token = token
+        super().__init__("Sync token has expired; resync from the beginning without since")
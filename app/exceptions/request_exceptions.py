@@ -0,0 +1,11 @@
+"""
+요청 처리 관련 커스텀 예외
+"""
+
+
+class DeadlineExceededException(Exception):
+    """요청 시간 예산(deadline)을 넘겼을 때 발생하는 예외"""
+    
+    def __init__(self, budget: float):
+        self.budget = budget
+        super().__init__(f"Request deadline of {budget:g}s exceeded")
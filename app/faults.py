@@ -0,0 +1,127 @@
+"""
+DB 장애 주입
+SQLAlchemy 이벤트로 쿼리 지연, 지터, 연결 오류 및 커넥션 체크아웃 지연을 주입
+
+DB_FAULTS 설정(예: "latency=0.05,jitter=0.02,error_rate=0.01,checkout_delay=0.1")이 있으면
+create_db_engine()이 엔진에 설치합니다. 느린 DB나 풀 고갈 상황에서 지연 시간 꼬리(p99),
+deadline(504), 부하 차단(503)이 어떻게 변하는지 테스트와 benchmarks/faults.py로 확인하는 용도이며
+운영 환경에서는 설정하지 않습니다.
+"""
+import random
+import time
+from dataclasses import dataclass, fields
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+
+from app.metrics import metrics
+
+
+class InjectedFaultError(Exception):
+    """주입된 연결 오류 (OperationalError의 원본 DBAPI 예외 역할)"""
+
+
+@dataclass(frozen=True)
+class FaultSpec:
+    """
+    주입할 장애 설정
+    
+    Attributes:
+        latency: statement마다 추가할 지연 (초)
+        jitter: latency에 더할 0~jitter 사이 임의 지연 (초)
+        error_rate: statement가 연결 오류로 실패할 확률 (0~1)
+        checkout_delay: 풀에서 커넥션을 꺼낼 때마다 추가할 지연 (초, 연결 수립/인증 지연)
+    """
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    checkout_delay: float = 0.0
+
+
+def parse_faults(value: str) -> Optional[FaultSpec]:
+    """
+    DB_FAULTS 설정 파싱
+    
+    Args:
+        value: "이름=값" 쉼표 구분 목록 (비어 있으면 장애 주입 안 함)
+        
+    Returns:
+        Optional[FaultSpec]: 장애 설정 (비어 있으면 None)
+        
+    Raises:
+        ValueError: 알 수 없는 이름이거나 값이 음수 또는 숫자가 아닌 경우
+    """
+    names = {field.name for field in fields(FaultSpec)}
+    options = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        name, _, raw = item.partition("=")
+        name = name.strip()
+        if name not in names:
+            raise ValueError(f"Unknown fault: {name}")
+        number = float(raw)
+        if number < 0 or (name == "error_rate" and number > 1):
+            raise ValueError(f"Invalid fault value: {item}")
+        options[name] = number
+    return FaultSpec(**options) if options else None
+
+
+class FaultInjector:
+    """
+    엔진에 장애를 주입하는 이벤트 리스너 묶음
+    
+    지연은 DB 작업용 스레드에서 커넥션을 점유한 채로 sleep하므로 실제 느린 쿼리처럼
+    커넥션 풀과 스레드 limiter를 소모합니다.
+    
+    Args:
+        spec: 주입할 장애 설정
+        seed: 지터/오류 발생용 난수 시드 (재현 가능한 측정용)
+    """
+    
+    def __init__(self, spec: FaultSpec, seed: Optional[int] = None):
+        self.spec = spec
+        self._random = random.Random(seed)
+    
+    def install(self, engine: Engine) -> None:
+        """엔진과 커넥션 풀에 리스너 등록"""
+        event.listen(engine, "before_cursor_execute", self._before_execute)
+        event.listen(engine.pool, "checkout", self._on_checkout)
+    
+    def remove(self, engine: Engine) -> None:
+        """등록한 리스너 제거"""
+        event.remove(engine, "before_cursor_execute", self._before_execute)
+        event.remove(engine.pool, "checkout", self._on_checkout)
+    
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        spec = self.spec
+        delay = spec.latency + (self._random.uniform(0, spec.jitter) if spec.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        if spec.error_rate and self._random.random() < spec.error_rate:
+            metrics.increment("db_faults_injected")
+            raise OperationalError(statement, parameters, InjectedFaultError("injected connection error"))
+    
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        if self.spec.checkout_delay > 0:
+            time.sleep(self.spec.checkout_delay)
+
+
+def install_faults(engine: Engine, value: str, seed: Optional[int] = None) -> Optional[FaultInjector]:
+    """
+    DB_FAULTS 설정대로 엔진에 장애 주입
+    
+    Args:
+        engine: 대상 엔진
+        value: DB_FAULTS 설정 값
+        seed: 난수 시드
+        
+    Returns:
+        Optional[FaultInjector]: 설치된 주입기 (설정이 비어 있으면 None)
+    """
+    spec = parse_faults(value)
+    if spec is None:
+        return None
+    injector = FaultInjector(spec, seed)
+    injector.install(engine)
+    return injector
@@ -0,0 +1,231 @@
+"""
+로깅 설정
+큐 기반 비동기 로깅 파이프라인, JSON 포맷, 로거별 샘플링 및 SQL 로그 속도 제한
+
+요청 처리 스레드는 로그 레코드를 큐에 넣기만 하고, 포맷과 출력은 백그라운드
+QueueListener 스레드가 담당합니다. 큐가 가득 차면 레코드를 버리고 log_records_dropped로
+집계하므로, 출력이 느려져도 요청 처리 스레드는 블로킹되지 않습니다.
+
+채널:
+    app.access: 요청별 접근 로그 (라우트, 상태 코드, 지연 시간, DB 시간)
+    app.sql: 실행된 SQL (SQL_LOG_ENABLED, 초당 SQL_LOG_RATE_LIMIT건까지)
+"""
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from app.config import Settings, get_settings
+from app.metrics import metrics
+
+
+APP_LOGGER = "app"
+ACCESS_LOGGER = "app.access"
+SQL_LOGGER = "app.sql"
+
+# 레코드의 이 속성에 담긴 dict는 JSON 로그의 필드로 출력 (logger.info(..., extra={"fields": {...}}))
+FIELDS_ATTR = "fields"
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드를 한 줄 JSON으로 변환"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        fields = getattr(record, FIELDS_ATTR, None)
+        if fields:
+            entry.update(fields)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            # 큐를 거친 레코드는 traceback을 문자열(exc_text)로만 가짐 (NonBlockingQueueHandler.prepare)
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """큐가 가득 차면 블로킹하거나 예외를 내지 않고 레코드를 버리는 QueueHandler"""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        큐에 넣을 레코드 준비
+        기본 구현은 traceback을 메시지 문자열에 합친 뒤 exc_info를 지우므로, 메시지 인자만 합치고
+        traceback은 exc_text로 남겨 출력 포맷(JSON의 exc_info 필드 등)이 따로 다루도록 함
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _traceback_formatter.formatException(record.exc_info)
+            # traceback 객체(프레임의 지역 변수 포함)는 출력 스레드로 넘기지 않음
+            record.exc_info = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            metrics.increment("log_records_dropped")
+
+
+# 큐에 넣기 전 traceback 문자열 변환용 (출력 포맷과 무관한 기본 형식)
+_traceback_formatter = logging.Formatter()
+
+
+class SamplingFilter(logging.Filter):
+    """
+    로거별 샘플링 필터
+    WARNING 이상은 항상 통과하고, 그 아래 레벨은 로거 이름(접두사)별 비율만큼만 통과
+    
+    Args:
+        rates: 로거 이름별 통과 비율 (예: {"app.access": 0.1})
+    """
+    
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates = rates
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+        rate = self._rate(record.name)
+        if rate >= 1.0 or random.random() < rate:
+            return True
+        metrics.increment("log_records_sampled_out")
+        return False
+    
+    def _rate(self, name: str) -> float:
+        # 가장 긴 접두사 일치 (app.sql.slow → app.sql → app)
+        while name:
+            if name in self.rates:
+                return self.rates[name]
+            name = name.rpartition(".")[0]
+        return 1.0
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    초당 레코드 수 제한 필터 (토큰 버킷)
+    
+    Args:
+        per_second: 초당 허용 레코드 수 (버스트도 같은 크기까지 허용)
+    """
+    
+    def __init__(self, per_second: float):
+        super().__init__()
+        self.per_second = per_second
+        self._tokens = per_second
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.per_second, self._tokens + (now - self._updated) * self.per_second)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+        metrics.increment("log_records_rate_limited")
+        return False
+
+
+def parse_sampling(value: str) -> Dict[str, float]:
+    """
+    LOG_SAMPLING 설정 파싱
+    
+    Args:
+        value: "로거=비율" 목록 (예: "app.access=0.1,app.sql=0.5")
+        
+    Returns:
+        Dict[str, float]: 로거 이름별 통과 비율
+        
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    rates: Dict[str, float] = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        name, _, rate = item.partition("=")
+        rates[name.strip()] = float(rate)
+    return rates
+
+
+# 현재 실행 중인 로그 출력 스레드와 루트 로거에 설치한 핸들러 (configure_logging()에서 생성)
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.Handler] = None
+
+
+def configure_logging(config: Optional[Settings] = None) -> logging.handlers.QueueListener:
+    """
+    큐 기반 로깅 설정 (lifespan 시작 시 호출, 다시 호출하면 이전 설정을 교체)
+    
+    Args:
+        config: 애플리케이션 설정 (미지정 시 전역 설정)
+        
+    Returns:
+        QueueListener: 로그를 출력하는 백그라운드 리스너
+    """
+    global _listener, _queue_handler
+    config = config or get_settings()
+    shutdown_logging()
+    
+    output = logging.StreamHandler(sys.stdout)
+    if config.LOG_FORMAT == "json":
+        output.setFormatter(JsonFormatter())
+    else:
+        output.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+    
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=config.LOG_QUEUE_SIZE)
+    _queue_handler = NonBlockingQueueHandler(log_queue)
+    _queue_handler.addFilter(SamplingFilter(parse_sampling(config.LOG_SAMPLING)))
+    
+    root = logging.getLogger()
+    root.addHandler(_queue_handler)
+    # 애플리케이션(app.*) 로거만 LOG_LEVEL을 따르고, 라이브러리(httpx 등)의 INFO 로그는 기본적으로 출력하지 않음
+    root.setLevel(config.THIRD_PARTY_LOG_LEVEL)
+    logging.getLogger(APP_LOGGER).setLevel(config.LOG_LEVEL)
+    
+    logging.getLogger(ACCESS_LOGGER).setLevel(logging.INFO if config.ACCESS_LOG_ENABLED else logging.WARNING)
+    sql_logger = logging.getLogger(SQL_LOGGER)
+    sql_logger.setLevel(logging.INFO if config.SQL_LOG_ENABLED else logging.WARNING)
+    for existing in list(sql_logger.filters):
+        if isinstance(existing, RateLimitFilter):
+            sql_logger.removeFilter(existing)
+    sql_logger.addFilter(RateLimitFilter(config.SQL_LOG_RATE_LIMIT))
+    
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging() -> None:
+    """남은 로그를 출력하고 백그라운드 리스너 종료 (lifespan 종료 시 호출)"""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+metrics.register_gauge(
+    "log_queue_depth",
+    lambda: _queue_handler.queue.qsize() if _queue_handler is not None else 0
+)
@@ -1,39 +1,128 @@
 """
 FastAPI 메인 애플리케이션
 메모장 CRUD API 서버
+
+애플리케이션은 create_app() 팩토리로 생성합니다. `app.main:app`은 최초 접근 시
+전역 설정으로 한 번 생성되며, DB 엔진은 lifespan 시작 시점에 만들어집니다.
 """
-from fastapi import FastAPI, Request, status
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import anyio
+from fastapi import APIRouter, FastAPI, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import OperationalError, TimeoutError as PoolTimeoutError
 
-from app.config import settings
+from app.config import Settings, get_settings
+from app.api import admin
 from app.api.v1 import api_router
+from app.cache import init_fragment_cache, init_list_cache, list_page_cache
+from app.concurrency import init_limiters, memo_reads
+from app.events import init_broker
+from app.database import (
+    dispose_engine,
+    init_engine,
+    is_engine_initialized,
+    warm_up_pool,
+)
+from app.deadline import parse_route_timeouts
 from app.exceptions.memo_exceptions import MemoNotFoundException
+from app.exceptions.request_exceptions import DeadlineExceededException
+from app.faults import InjectedFaultError
+from app.metrics import metrics
+from app.logging_config import configure_logging, shutdown_logging
+from app.middleware import (
+    AccessLogMiddleware,
+    DeadlineMiddleware,
+    ProfilingMiddleware,
+    TracingMiddleware,
+    TrafficCaptureMiddleware,
+    TrafficCaptureWriter,
+)
+from app.profiling import ProfileStore, Sampler
+from app.repositories.memo_repository import memo_repository
+from app.sharding import dispose_shards, init_sharding, primary_engine, request_engines
+from app.tracing import init_tracing, shutdown_tracing
 
 
-# FastAPI 애플리케이션 생성
-app = FastAPI(
-    title=settings.APP_NAME,
-    version=settings.APP_VERSION,
-    description="FastAPI와 PostgreSQL을 활용한 메모장 CRUD API",
-    debug=settings.DEBUG
-)
+logger = logging.getLogger(__name__)
 
 
-# CORS 설정
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Health check 라우터
+health_router = APIRouter(tags=["health"])
+
+
+@health_router.get("/")
+async def root(request: Request):
+    """서버 상태 확인"""
+    config: Settings = request.app.state.settings
+    return {
+        "status": "ok",
+        "app_name": config.APP_NAME,
+        "version": config.APP_VERSION
+    }
+
+
+@health_router.get("/health")
+async def health_check():
+    """헬스 체크 엔드포인트 (liveness)"""
+    return {"status": "healthy"}
+
+
+@health_router.get("/health/ready")
+async def readiness_check(request: Request):
+    """
+    준비 상태 확인 엔드포인트 (readiness)
+    커넥션 풀 워밍업이 끝나기 전에는 503을 반환하여 트래픽 유입을 막음
+    """
+    if not request.app.state.ready:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "warming_up"}
+        )
+    return {"status": "ready"}
+
+
+@health_router.get("/metrics")
+async def read_metrics():
+    """프로세스 메트릭 조회 (SQL 컴파일 캐시 적중률 등)"""
+    return metrics.snapshot()
+
+
+async def warm_up_database(app: FastAPI, config: Settings, cancel_scope: anyio.CancelScope) -> None:
+    """
+    커넥션 풀 워밍업 후 준비 상태로 전환
+    요청이 사용하는 풀(샤딩 중이면 샤드별 풀)마다 DB_POOL_SIZE개의 커넥션을 미리 열고 hot statement를 실행
+    (cancel_scope를 취소하면 진행 중인 워밍업 스레드가 끝난 뒤 종료)
+    
+    스레드에서 실행 중인 워밍업은 취소할 수 없으므로 DB_WARMUP_TIMEOUT은 바깥의 타이머가 아니라
+    warm_up_pool()의 deadline(커넥션 대기, statement 실행)으로 적용합니다. 여러 풀을 워밍업하면 전체 시간 중 남은 만큼만 사용합니다.
+    """
+    try:
+        with cancel_scope:
+            deadline = anyio.current_time() + config.DB_WARMUP_TIMEOUT
+            size = 0
+            for engine in request_engines():
+                size += await anyio.to_thread.run_sync(
+                    warm_up_pool,
+                    engine,
+                    config.DB_POOL_SIZE,
+                    memo_repository.prepare_statements,
+                    deadline - anyio.current_time()
+                )
+        logger.info("Connection pool warmed up with %d connections", size)
+    except Exception:
+        # 워밍업 실패 시에도 서비스는 시작 (첫 요청이 연결 비용을 부담)
+        logger.warning("Connection pool warm-up failed", exc_info=True)
+    app.state.ready = True
 
 
 # 전역 예외 핸들러
-@app.exception_handler(MemoNotFoundException)
 async def memo_not_found_exception_handler(
-    request: Request, 
+    request: Request,
     exc: MemoNotFoundException
 ) -> JSONResponse:
     """메모를 찾을 수 없을 때 예외 핸들러"""
@@ -46,35 +135,197 @@ async def memo_not_found_exception_handler(
     )
 
 
-# API 라우터 등록
-app.include_router(
-    api_router,
-    prefix="/api/v1"
-)
+async def deadline_exceeded_exception_handler(
+    request: Request,
+    exc: DeadlineExceededException
+) -> JSONResponse:
+    """요청 시간 예산 초과 예외 핸들러 (DB 쿼리가 statement_timeout으로 취소된 경우 등)"""
+    metrics.increment("request_deadline_exceeded")
+    return JSONResponse(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        content={"detail": str(exc)}
+    )
 
 
-# Health check 엔드포인트
-@app.get("/", tags=["health"])
-async def root():
-    """서버 상태 확인"""
-    return {
-        "status": "ok",
-        "app_name": settings.APP_NAME,
-        "version": settings.APP_VERSION
-    }
+async def pool_timeout_exception_handler(
+    request: Request,
+    exc: PoolTimeoutError
+) -> JSONResponse:
+    """커넥션 풀 대기 시간(DB_POOL_TIMEOUT) 초과 예외 핸들러 (과부하 시 요청 차단)"""
+    metrics.increment("db_pool_timeouts")
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Database connection pool exhausted"},
+        headers={"Retry-After": "1"}
+    )
 
 
-@app.get("/health", tags=["health"])
-async def health_check():
-    """헬스 체크 엔드포인트"""
-    return {"status": "healthy"}
+async def database_unavailable_exception_handler(
+    request: Request,
+    exc: OperationalError
+) -> JSONResponse:
+    """
+    DB 연결 오류 예외 핸들러 (연결 끊김, 서버 재시작 등)
+    재시도로 해결될 수 있는 연결 끊김과 주입된 장애만 503으로 응답하고, 그 외 OperationalError
+    (테이블 없음, 잠금 등)는 다시 발생시켜 500으로 처리합니다.
+    """
+    if not (exc.connection_invalidated or isinstance(exc.orig, InjectedFaultError)):
+        raise exc
+    metrics.increment("db_operational_errors")
+    logger.warning("Database operation failed: %s", exc.orig)
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Database unavailable"},
+        headers={"Retry-After": "1"}
+    )
+
+
+def create_app(config: Optional[Settings] = None) -> FastAPI:
+    """
+    FastAPI 애플리케이션 생성
+    
+    Args:
+        config: 애플리케이션 설정 (미지정 시 환경 변수 기반 전역 설정)
+        
+    Returns:
+        FastAPI: 설정이 적용된 애플리케이션
+    """
+    config = config or get_settings()
+    capture_writer: Optional[TrafficCaptureWriter] = None
+    
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        """로깅/추적/엔진/샤드/스레드 limiter/캐시/이벤트 브로커 생성 및 풀 워밍업 (시작), 커넥션 드레인 및 풀 정리 (종료)"""
+        configure_logging(config)
+        init_tracing(config)
+        if not is_engine_initialized():
+            init_engine(config)
+        init_sharding(config)
+        init_limiters(config)
+        init_list_cache(config)
+        init_fragment_cache(config)
+        broker = init_broker(config, primary_engine())
+        # 다른 워커 프로세스의 메모 쓰기도 목록 캐시와 진행 중인 조회를 무효화 (PostgreSQL 브로커)
+        def invalidate_reads(event) -> None:
+            list_page_cache.invalidate()
+            memo_reads.invalidate()
+        
+        broker.add_listener(invalidate_reads)
+        await broker.start()
+        
+        warm_up_task = None
+        warm_up_scope = anyio.CancelScope()
+        if config.DB_WARMUP_ENABLED:
+            app.state.ready = False
+            warm_up_task = asyncio.create_task(warm_up_database(app, config, warm_up_scope))
+        else:
+            app.state.ready = True
+        
+        yield
+        
+        if warm_up_task is not None and not warm_up_task.done():
+            # 태스크 취소는 워밍업 스레드를 멈추지 않으므로 anyio 취소로 스레드가 커넥션을 반납할 때까지 대기
+            warm_up_scope.cancel()
+            await warm_up_task
+        app.state.ready = False
+        await broker.stop()
+        await anyio.to_thread.run_sync(dispose_engine, config.DB_SHUTDOWN_DRAIN_TIMEOUT)
+        dispose_shards()
+        if capture_writer is not None:
+            capture_writer.close()
+        await anyio.to_thread.run_sync(shutdown_tracing)
+        shutdown_logging()
+    
+    # OpenAPI 스키마는 최초 /openapi.json 요청 시 한 번 생성되어 캐시됨
+    docs_enabled = config.DOCS_ENABLED
+    app = FastAPI(
+        title=config.APP_NAME,
+        version=config.APP_VERSION,
+        description="FastAPI와 PostgreSQL을 활용한 메모장 CRUD API",
+        debug=config.DEBUG,
+        lifespan=lifespan,
+        openapi_url="/openapi.json" if docs_enabled else None,
+        docs_url="/docs" if docs_enabled else None,
+        redoc_url="/redoc" if docs_enabled else None
+    )
+    app.state.settings = config
+    app.state.ready = False
+    
+    # 요청 프로파일링 (비활성화 시 미들웨어를 등록하지 않음)
+    if config.PROFILER_ENABLED:
+        app.state.profile_store = ProfileStore(config.PROFILER_DIR, config.PROFILER_MAX_PROFILES)
+        app.add_middleware(
+            ProfilingMiddleware,
+            store=app.state.profile_store,
+            sampler=Sampler(config.PROFILER_INTERVAL_MS / 1000),
+            secret=config.PROFILER_SECRET,
+            sample_rate=config.PROFILER_SAMPLE_RATE
+        )
+    
+    # 요청 deadline (CORS보다 안쪽 미들웨어로 504 응답에도 CORS 헤더 적용)
+    app.add_middleware(
+        DeadlineMiddleware,
+        default_timeout=config.REQUEST_TIMEOUT,
+        route_timeouts=parse_route_timeouts(config.ROUTE_TIMEOUTS)
+    )
+    
+    # CORS 설정
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=config.CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    
+    # 트래픽 캡처 (샘플링된 요청을 JSONL로 기록)
+    if config.TRAFFIC_CAPTURE_ENABLED:
+        capture_writer = TrafficCaptureWriter(config.TRAFFIC_CAPTURE_PATH)
+        app.add_middleware(
+            TrafficCaptureMiddleware,
+            writer=capture_writer,
+            sample_rate=config.TRAFFIC_CAPTURE_SAMPLE_RATE
+        )
+    
+    # 접근 로그 (추적을 제외한 가장 바깥 미들웨어로 CORS/트래픽 캡처를 포함한 전체 처리 시간 기록)
+    app.add_middleware(AccessLogMiddleware)
+    
+    # 분산 추적 (접근 로그보다 바깥 미들웨어로 접근 로그에 trace_id 기록)
+    if config.TRACING_ENABLED:
+        app.add_middleware(TracingMiddleware)
+    
+    app.add_exception_handler(MemoNotFoundException, memo_not_found_exception_handler)
+    app.add_exception_handler(DeadlineExceededException, deadline_exceeded_exception_handler)
+    app.add_exception_handler(PoolTimeoutError, pool_timeout_exception_handler)
+    app.add_exception_handler(OperationalError, database_unavailable_exception_handler)
+    
+    # API 라우터 등록
+    app.include_router(
+        api_router,
+        prefix="/api/v1"
+    )
+    app.include_router(health_router)
+    if config.PROFILER_ENABLED:
+        app.include_router(admin.router)
+    
+    return app
+
+
+def __getattr__(name: str):
+    """`app.main:app` 접근 시 전역 설정으로 애플리케이션을 한 번 생성"""
+    if name == "app":
+        application = create_app()
+        globals()["app"] = application
+        return application
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
-        "app.main:app",
+        "app.main:create_app",
+        factory=True,
         host="0.0.0.0",
         port=8000,
-        reload=settings.DEBUG
+        reload=get_settings().DEBUG
     )
@@ -0,0 +1,73 @@
+"""
+애플리케이션 메트릭 레지스트리
+카운터 및 게이지를 프로세스 메모리에 집계하여 /metrics 엔드포인트로 노출
+"""
+import threading
+from typing import Callable, Dict
+
+
+class MetricsRegistry:
+    """스레드 안전한 카운터/게이지 레지스트리"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._gauges: Dict[str, Callable[[], float]] = {}
+    
+    def increment(self, name: str, value: float = 1) -> None:
+        """
+        카운터 증가
+        
+        Args:
+            name: 메트릭 이름
+            value: 증가량
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+    
+    def get(self, name: str) -> float:
+        """카운터 현재 값 (없으면 0)"""
+        return self._counters.get(name, 0)
+    
+    def register_gauge(self, name: str, func: Callable[[], float]) -> None:
+        """
+        게이지 등록 (스냅샷 시점에 func를 호출하여 값 계산)
+        
+        Args:
+            name: 메트릭 이름
+            func: 현재 값을 반환하는 함수
+        """
+        with self._lock:
+            self._gauges[name] = func
+    
+    def snapshot(self) -> Dict[str, float]:
+        """모든 카운터와 게이지의 현재 값"""
+        with self._lock:
+            values = dict(self._counters)
+            gauges = dict(self._gauges)
+        for name, func in gauges.items():
+            values[name] = func()
+        return dict(sorted(values.items()))
+    
+    def reset(self) -> None:
+        """카운터 초기화 (게이지 등록은 유지)"""
+        with self._lock:
+            self._counters.clear()
+
+
+def ratio(numerator: str, *denominator: str) -> Callable[[], float]:
+    """
+    카운터 비율 게이지 함수 생성 (예: 캐시 적중률)
+    
+    Args:
+        numerator: 분자 카운터 이름
+        denominator: 분모에 합산할 카운터 이름 목록
+    """
+    def compute() -> float:
+        total = sum(metrics.get(name) for name in denominator)
+        return metrics.get(numerator) / total if total else 0.0
+    return compute
+
+
+# 전역 메트릭 레지스트리 인스턴스
+metrics = MetricsRegistry()
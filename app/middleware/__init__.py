@@ -0,0 +1,18 @@
+"""
+미들웨어 패키지
+요청/응답 처리 파이프라인 공통 기능
+"""
+from app.middleware.access_log import AccessLogMiddleware
+from app.middleware.deadline import DeadlineMiddleware
+from app.middleware.profiling import ProfilingMiddleware
+from app.middleware.tracing import TracingMiddleware
+from app.middleware.traffic_capture import TrafficCaptureMiddleware, TrafficCaptureWriter
+
+__all__ = [
+    "AccessLogMiddleware",
+    "DeadlineMiddleware",
+    "ProfilingMiddleware",
+    "TracingMiddleware",
+    "TrafficCaptureMiddleware",
+    "TrafficCaptureWriter",
+]
@@ -0,0 +1,66 @@
+"""
+접근 로그 미들웨어
+요청마다 라우트, 상태 코드, 지연 시간 및 DB 시간을 app.access 채널에 구조화 로그로 기록
+"""
+import logging
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.database import track_queries
+from app.logging_config import ACCESS_LOGGER
+from app.tracing import current_span
+
+
+logger = logging.getLogger(ACCESS_LOGGER)
+
+
+class AccessLogMiddleware:
+    """
+    접근 로그 ASGI 미들웨어
+    
+    기록은 큐 기반 로깅 파이프라인으로 넘기기만 하므로 응답을 지연시키지 않습니다.
+    5xx 응답은 WARNING으로 기록하여 샘플링 대상에서 제외됩니다.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not logger.isEnabledFor(logging.INFO):
+            await self.app(scope, receive, send)
+            return
+        
+        started = time.perf_counter()
+        queries = track_queries()
+        status_code = 500
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            span = current_span()
+            logger.log(
+                logging.WARNING if status_code >= 500 else logging.INFO,
+                "%s %s %d",
+                scope["method"],
+                scope["path"],
+                status_code,
+                extra={"fields": {
+                    "method": scope["method"],
+                    "route": getattr(route, "path_format", None),
+                    "path": scope["path"],
+                    "status": status_code,
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+                    "db_ms": round(queries.duration * 1000, 3),
+                    "db_queries": queries.count,
+                    "client": scope["client"][0] if scope.get("client") else None,
+                    "trace_id": span.trace_id if span is not None else None,
+                }}
+            )
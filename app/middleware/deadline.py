@@ -0,0 +1,107 @@
+"""
+요청 deadline 미들웨어
+라우트별 시간 예산 안에 응답을 시작하지 못하면 처리를 취소하고 504 응답
+"""
+import json
+import math
+from typing import Dict, Optional
+
+import anyio
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.deadline import reset_deadline, set_deadline
+from app.metrics import metrics
+
+
+# 클라이언트가 시간 예산을 줄일 때 사용하는 요청 헤더 (초)
+TIMEOUT_HEADER = b"x-request-timeout"
+
+
+class DeadlineMiddleware:
+    """
+    요청 deadline ASGI 미들웨어
+    
+    시간 예산은 ROUTE_TIMEOUTS의 라우트별 값, 없으면 기본값을 사용하며 클라이언트는
+    X-Request-Timeout 헤더로 더 짧게만 지정할 수 있습니다. deadline은 응답 시작까지만
+    적용되므로 SSE처럼 본문을 오래 보내는 응답은 끊지 않습니다. DB 작업용 스레드를 기다리는
+    요청도 바로 취소되며, 스레드에서 실행 중인 쿼리는 세션의 statement_timeout이 서버에서 중단시킵니다.
+    
+    Args:
+        app: ASGI 애플리케이션
+        default_timeout: 기본 시간 예산 (초, 0이면 deadline 없음)
+        route_timeouts: "메서드 라우트"별 시간 예산 (0이면 해당 라우트는 deadline 없음)
+    """
+    
+    def __init__(self, app: ASGIApp, default_timeout: float, route_timeouts: Dict[str, float]):
+        self.app = app
+        self.default_timeout = default_timeout
+        self.route_timeouts = route_timeouts
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        budget = self._budget(scope) if scope["type"] == "http" else None
+        if not budget:
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                # 응답을 시작한 뒤에는 본문 전송을 끊지 않음
+                cancel_scope.deadline = math.inf
+            await send(message)
+        
+        token = set_deadline(budget)
+        try:
+            with anyio.CancelScope(deadline=anyio.current_time() + budget) as cancel_scope:
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            reset_deadline(token)
+        
+        if cancel_scope.cancel_called and not response_started:
+            metrics.increment("request_deadline_exceeded")
+            await send_timeout_response(send, budget)
+    
+    def _budget(self, scope: Scope) -> Optional[float]:
+        budget = self.default_timeout
+        if self.route_timeouts:
+            route = self._route_template(scope)
+            budget = self.route_timeouts.get(f"{scope['method']} {route}", budget)
+        if not budget:
+            return None
+        for name, value in scope["headers"]:
+            if name == TIMEOUT_HEADER:
+                try:
+                    requested = float(value)
+                except ValueError:
+                    break
+                if requested > 0:
+                    budget = min(budget, requested)
+                break
+        return budget
+    
+    @staticmethod
+    def _route_template(scope: Scope) -> Optional[str]:
+        # 라우팅 전이므로 라우터의 경로 템플릿과 직접 매칭
+        for route in scope["app"].router.routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return getattr(route, "path_format", None)
+        return None
+
+
+async def send_timeout_response(send: Send, budget: float) -> None:
+    """504 Gateway Timeout 응답 전송"""
+    body = json.dumps({"detail": f"Request deadline of {budget:g}s exceeded"}).encode()
+    await send({
+        "type": "http.response.start",
+        "status": 504,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
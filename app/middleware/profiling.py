@@ -0,0 +1,87 @@
+"""
+프로파일링 미들웨어
+서명된 헤더를 보냈거나 샘플링된 요청의 처리 과정을 통계적으로 프로파일링하여 저장
+"""
+import asyncio
+import random
+import threading
+import time
+
+import anyio
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.profiling import Profile, ProfileStore, Sampler, reset_profile, set_profile, verify_token
+
+
+# 프로파일링을 요청하는 헤더 (값은 app.profiling.sign_token()으로 생성)
+TOKEN_HEADER = b"x-profile-token"
+# 프로파일링된 응답에 프로파일 ID를 알려 주는 헤더
+PROFILE_ID_HEADER = b"x-profile-id"
+# 프로파일 다운로드 요청은 프로파일링하지 않음
+ADMIN_PATH = "/admin/"
+
+
+class ProfilingMiddleware:
+    """
+    요청 프로파일링 ASGI 미들웨어
+    
+    PROFILER_ENABLED일 때만 등록되므로 비활성화 시 요청 경로에 추가 비용이 없습니다.
+    프로파일된 응답에는 X-Profile-Id 헤더가 붙으며 /admin/profiles/{id}에서 내려받습니다.
+    
+    Args:
+        app: ASGI 애플리케이션
+        store: 프로파일 저장소
+        sampler: 샘플링 스레드
+        secret: 프로파일 요청 토큰 서명 키 (비어 있으면 샘플링으로만 프로파일링)
+        sample_rate: 토큰 없이 프로파일링할 요청 비율
+    """
+    
+    def __init__(self, app: ASGIApp, store: ProfileStore, sampler: Sampler, secret: str, sample_rate: float):
+        self.app = app
+        self.store = store
+        self.sampler = sampler
+        self.secret = secret
+        self.sample_rate = sample_rate
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._selected(scope):
+            await self.app(scope, receive, send)
+            return
+        
+        profile = Profile(asyncio.get_running_loop(), asyncio.current_task(), threading.get_ident())
+        status_code = 500
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [*message.get("headers", []), (PROFILE_ID_HEADER, profile.id.encode())]
+            await send(message)
+        
+        token = set_profile(profile)
+        self.sampler.start(profile)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.sampler.stop(profile)
+            reset_profile(token)
+            route = scope.get("route")
+            meta = {
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": getattr(route, "path_format", None),
+                "status": status_code,
+                "duration_ms": round((time.perf_counter() - profile.started) * 1000, 3),
+                "interval_ms": self.sampler.interval * 1000,
+                "created_at": time.time(),
+            }
+            await anyio.to_thread.run_sync(self.store.save, profile, meta)
+    
+    def _selected(self, scope: Scope) -> bool:
+        if scope["path"].startswith(ADMIN_PATH):
+            return False
+        if self.secret:
+            for name, value in scope["headers"]:
+                if name == TOKEN_HEADER:
+                    return verify_token(self.secret, value.decode("latin-1"))
+        return self.sample_rate > 0 and random.random() < self.sample_rate
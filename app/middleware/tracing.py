@@ -0,0 +1,66 @@
+"""
+분산 추적 미들웨어
+요청마다 W3C traceparent 헤더를 이어받아 SERVER span을 만들고 하위 계층 span의 부모로 설정
+"""
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.tracing import STATUS_ERROR, activate, deactivate, start_trace
+
+
+# W3C Trace Context 요청 헤더
+TRACEPARENT_HEADER = b"traceparent"
+
+
+class TracingMiddleware:
+    """
+    분산 추적 ASGI 미들웨어
+    
+    TRACING_ENABLED일 때만 등록되며 가장 바깥 미들웨어로 접근 로그에도 trace_id가 기록됩니다.
+    샘플링되지 않은 요청도 trace ID는 만들어 접근 로그와 로그 연계에 사용합니다.
+    
+    Args:
+        app: ASGI 애플리케이션
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        traceparent = None
+        for name, value in scope["headers"]:
+            if name == TRACEPARENT_HEADER:
+                traceparent = value.decode("latin-1")
+                break
+        
+        method = scope["method"]
+        root = start_trace(f"{method} {scope['path']}", traceparent, {
+            "http.method": method,
+            "http.target": scope["path"],
+            "http.scheme": scope.get("scheme", "http"),
+        })
+        
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                root.attributes["http.status_code"] = message["status"]
+            await send(message)
+        
+        token = activate(root)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except BaseException as exc:
+            root.set_error(exc)
+            raise
+        finally:
+            deactivate(token)
+            if root.sampled:
+                route = getattr(scope.get("route"), "path_format", None)
+                if route is not None:
+                    root.name = f"{method} {route}"
+                    root.attributes["http.route"] = route
+                if root.attributes.get("http.status_code", 500) >= 500 and not root.status:
+                    root.status = STATUS_ERROR
+                root.end()
@@ -0,0 +1,114 @@
+"""
+트래픽 캡처 미들웨어
+운영 요청을 샘플링하여 JSONL 파일로 기록 (benchmarks/replay.py로 재현)
+"""
+import json
+import queue
+import random
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class TrafficCaptureWriter:
+    """
+    캡처 레코드를 백그라운드 스레드에서 JSONL 파일에 기록
+    요청 처리 스레드는 큐에 넣기만 하므로 파일 I/O로 블로킹되지 않음
+    """
+    
+    def __init__(self, path: str, max_queue_size: int = 10000):
+        self.path = path
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=max_queue_size)
+        self._thread = threading.Thread(
+            target=self._run,
+            name="traffic-capture-writer",
+            daemon=True
+        )
+        self._thread.start()
+    
+    def write(self, record: Dict[str, Any]) -> None:
+        """레코드 기록 요청 (큐가 가득 차면 버림)"""
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+    
+    def close(self, timeout: float = 5.0) -> None:
+        """남은 레코드를 모두 기록한 뒤 스레드 종료"""
+        self._queue.put(None)
+        self._thread.join(timeout)
+    
+    def _run(self) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            while True:
+                record = self._queue.get()
+                if record is None:
+                    break
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                if self._queue.empty():
+                    f.flush()
+
+
+class TrafficCaptureMiddleware:
+    """
+    요청 샘플링 캡처 ASGI 미들웨어
+    
+    샘플링된 요청마다 메서드, 라우트 템플릿, 경로/쿼리 파라미터,
+    요청 본문 크기, 응답 상태 코드 및 처리 시간을 기록합니다.
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        writer: TrafficCaptureWriter,
+        sample_rate: float = 1.0
+    ):
+        self.app = app
+        self.writer = writer
+        self.sample_rate = sample_rate
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or random.random() >= self.sample_rate:
+            await self.app(scope, receive, send)
+            return
+        
+        started_at = time.time()
+        started = time.perf_counter()
+        body_size = 0
+        status_code = 500
+        
+        async def receive_wrapper() -> Message:
+            nonlocal body_size
+            message = await receive()
+            if message["type"] == "http.request":
+                body_size += len(message.get("body", b""))
+            return message
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            route = scope.get("route")
+            self.writer.write({
+                "ts": started_at,
+                "method": scope["method"],
+                "route": getattr(route, "path_format", None),
+                "path": scope["path"],
+                "path_params": scope.get("path_params", {}),
+                "query": {
+                    key: values if len(values) > 1 else values[0]
+                    for key, values in parse_qs(scope.get("query_string", b"").decode("latin-1")).items()
+                },
+                "body_size": body_size,
+                "status": status_code,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+            })
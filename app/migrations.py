@@ -0,0 +1,249 @@
+"""
+무중단 마이그레이션 도우미
+Alembic 마이그레이션에서 쓰기를 막지 않는 인덱스 생성/삭제와 재개 가능한 배치 backfill 수행
+
+대용량 memos 테이블에서 `op.create_index`는 인덱스를 만드는 동안 테이블 쓰기를 막고, 단일 UPDATE는
+모든 행을 잠근 채 긴 트랜잭션(WAL 증가, 복제 지연)을 만듭니다. 마이그레이션 스크립트에서는 대신
+아래 함수를 사용합니다. backfill은 스키마 변경과 별도 revision으로 두어, 중간에 실패해도
+`alembic upgrade head`를 다시 실행하면 체크포인트부터 이어서 진행되도록 합니다.
+
+    from app.migrations import create_index_concurrently, run_backfill
+    
+    def upgrade() -> None:
+        run_backfill("memos_title_length", "memos", "title_length = length(title)",
+                     where="title_length IS NULL")
+        create_index_concurrently("ix_memos_title_length", "memos", ["title_length"])
+"""
+import logging
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from alembic import op
+from sqlalchemy import BigInteger, Column, DateTime, MetaData, String, Table, select, text
+from sqlalchemy.engine import Connection
+
+
+logger = logging.getLogger(__name__)
+
+# backfill 진행 상황 체크포인트 테이블 (autogenerate 대상에서 제외)
+CHECKPOINT_TABLE = "migration_checkpoints"
+
+checkpoint_metadata = MetaData()
+migration_checkpoints = Table(
+    CHECKPOINT_TABLE,
+    checkpoint_metadata,
+    Column("name", String(200), primary_key=True, comment="backfill 이름"),
+    Column("last_id", BigInteger, nullable=False, comment="처리를 마친 마지막 키"),
+    Column("end_id", BigInteger, nullable=False, comment="시작 시점의 최대 키 (이후 행은 애플리케이션이 채움)"),
+    Column("rows_updated", BigInteger, nullable=False, comment="갱신한 행 수"),
+    Column("updated_at", DateTime, nullable=False, comment="마지막 배치 일시"),
+    Column("completed_at", DateTime, nullable=True, comment="완료 일시"),
+)
+
+
+def _is_postgresql() -> bool:
+    return op.get_context().dialect.name == "postgresql"
+
+
+def create_index_concurrently(
+    name: str,
+    table: str,
+    columns: List[str],
+    unique: bool = False,
+    lock_timeout: Optional[str] = None,
+    **kw: Any
+) -> None:
+    """
+    테이블 쓰기를 막지 않고 인덱스 생성
+    
+    PostgreSQL에서는 마이그레이션 트랜잭션을 커밋한 뒤 트랜잭션 밖에서 `CREATE INDEX CONCURRENTLY`를
+    실행합니다. 이전 시도가 실패해 INVALID 인덱스가 남아 있으면 먼저 삭제하고 다시 만듭니다.
+    다른 DB(SQLite 등)에서는 일반 인덱스를 생성합니다.
+    
+    Args:
+        name: 인덱스 이름
+        table: 테이블 이름
+        columns: 인덱스 컬럼 목록
+        unique: 유니크 인덱스 여부
+        lock_timeout: 잠금 대기 제한 (예: "5s", 긴 트랜잭션 뒤에서 무한정 기다리지 않도록)
+        **kw: op.create_index()에 전달할 추가 인자 (postgresql_where 등)
+    """
+    if not _is_postgresql():
+        op.create_index(name, table, columns, unique=unique, **kw)
+        return
+    with op.get_context().autocommit_block():
+        if lock_timeout:
+            op.execute(f"SET lock_timeout = '{lock_timeout}'")
+        try:
+            if not op.get_context().as_sql and _is_invalid_index(name):
+                logger.warning("Dropping invalid index %s left by a failed concurrent build", name)
+                op.drop_index(name, table_name=table, postgresql_concurrently=True)
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=unique,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+                **kw
+            )
+        finally:
+            if lock_timeout:
+                op.execute("RESET lock_timeout")
+
+
+def drop_index_concurrently(name: str, table: str) -> None:
+    """
+    테이블 쓰기를 막지 않고 인덱스 삭제 (PostgreSQL 외에는 일반 삭제)
+    
+    Args:
+        name: 인덱스 이름
+        table: 테이블 이름
+    """
+    if not _is_postgresql():
+        op.drop_index(name, table_name=table)
+        return
+    with op.get_context().autocommit_block():
+        op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def _is_invalid_index(name: str) -> bool:
+    """CREATE INDEX CONCURRENTLY 실패로 남은 INVALID 인덱스인지 확인"""
+    return bool(op.get_bind().execute(
+        text(
+            "SELECT NOT i.indisvalid FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name AND pg_table_is_visible(c.oid)"
+        ),
+        {"name": name}
+    ).scalar())
+
+
+def backfill_in_batches(
+    connection: Connection,
+    name: str,
+    table: str,
+    assignments: str,
+    where: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+    key: str = "id",
+    batch_size: int = 1000,
+    pause: float = 0.1,
+    max_batch_seconds: Optional[float] = None,
+    min_batch_size: int = 100,
+    progress: Optional[Callable[[int, int], None]] = None
+) -> int:
+    """
+    키 범위 단위로 나눠 커밋하는 재개 가능한 UPDATE
+    
+    시작 시점의 최대 키까지 `key > 하한 AND key <= 상한` 범위를 batch_size행씩 갱신하고,
+    배치마다 migration_checkpoints에 마지막 키를 기록한 뒤 커밋합니다. 배치의 UPDATE와 체크포인트는
+    한 트랜잭션으로 커밋되므로 connection은 autocommit이 아니어야 합니다. 같은 name으로 다시 실행하면
+    체크포인트 다음 범위부터 이어서 진행하고, 완료된 backfill은 건너뜁니다. 배치가 다시 실행될 수
+    있으므로 갱신은 멱등이어야 합니다(where로 이미 채운 행 제외 등). 시작 이후 추가되는 행은
+    애플리케이션이 새 컬럼을 채운다고 가정합니다.
+    
+    Args:
+        connection: DB 커넥션
+        name: backfill 이름 (체크포인트 키)
+        table: 대상 테이블
+        assignments: SET 절 (예: "title_length = length(title)")
+        where: 추가 조건 (예: "title_length IS NULL")
+        params: assignments/where의 바인드 파라미터
+        key: 범위를 나눌 정수 키 컬럼 (인덱스가 있어야 함)
+        batch_size: 배치당 최대 행 수
+        pause: 배치 사이 대기 시간 (초, 복제본과 운영 트래픽이 따라올 시간)
+        max_batch_seconds: 배치가 이 시간보다 오래 걸리면 배치 크기를 절반으로 줄임
+        min_batch_size: 줄일 수 있는 최소 배치 크기
+        progress: 배치마다 (마지막 키, 끝 키)로 호출되는 함수
+        
+    Returns:
+        int: 이번 실행에서 갱신한 행 수
+    """
+    migration_checkpoints.create(connection, checkfirst=True)
+    checkpoint = connection.execute(
+        select(migration_checkpoints).where(migration_checkpoints.c.name == name)
+    ).first()
+    if checkpoint is None:
+        bounds = connection.execute(text(f"SELECT min({key}), max({key}) FROM {table}")).first()
+        last_id = (bounds[0] - 1) if bounds[0] is not None else 0
+        end_id = bounds[1] if bounds[1] is not None else 0
+        connection.execute(migration_checkpoints.insert().values(
+            name=name, last_id=last_id, end_id=end_id, rows_updated=0, updated_at=datetime.utcnow()
+        ))
+        connection.commit()
+    elif checkpoint.completed_at is not None:
+        logger.info("Backfill %s already completed", name)
+        return 0
+    else:
+        last_id, end_id = checkpoint.last_id, checkpoint.end_id
+        logger.info("Resuming backfill %s after %s %d", name, key, last_id)
+    
+    condition = f" AND ({where})" if where else ""
+    update = text(f"UPDATE {table} SET {assignments} WHERE {key} > :_lower AND {key} <= :_upper{condition}")
+    # 키가 듬성듬성해도 배치마다 batch_size행을 넘지 않도록 인덱스로 상한을 찾음
+    next_upper = text(f"SELECT {key} FROM {table} WHERE {key} > :_lower ORDER BY {key} LIMIT 1 OFFSET :_offset")
+    total = 0
+    size = batch_size
+    while last_id < end_id:
+        started = time.perf_counter()
+        upper = connection.execute(next_upper, {"_lower": last_id, "_offset": size - 1}).scalar()
+        upper = end_id if upper is None else min(upper, end_id)
+        count = connection.execute(update, {**(params or {}), "_lower": last_id, "_upper": upper}).rowcount
+        connection.execute(
+            migration_checkpoints.update()
+            .where(migration_checkpoints.c.name == name)
+            .values(
+                last_id=upper,
+                rows_updated=migration_checkpoints.c.rows_updated + count,
+                updated_at=datetime.utcnow()
+            )
+        )
+        connection.commit()
+        elapsed = time.perf_counter() - started
+        last_id = upper
+        total += count
+        if progress is not None:
+            progress(last_id, end_id)
+        if max_batch_seconds is not None and elapsed > max_batch_seconds and size > min_batch_size:
+            size = max(min_batch_size, size // 2)
+            logger.info("Backfill %s batch took %.2fs, reducing batch size to %d", name, elapsed, size)
+        if pause > 0 and last_id < end_id:
+            time.sleep(pause)
+    
+    connection.execute(
+        migration_checkpoints.update()
+        .where(migration_checkpoints.c.name == name)
+        .values(completed_at=datetime.utcnow())
+    )
+    connection.commit()
+    logger.info("Backfill %s completed (%d rows)", name, total)
+    return total
+
+
+def run_backfill(name: str, table: str, assignments: str, **kw: Any) -> int:
+    """
+    마이그레이션 안에서 배치 backfill 실행
+    
+    마이그레이션 트랜잭션을 커밋한 뒤(autocommit 블록) 같은 엔진의 별도 커넥션에서 backfill_in_batches()를
+    실행합니다. 배치마다 UPDATE와 체크포인트가 한 트랜잭션으로 커밋되어 잠금과 트랜잭션이 짧게 유지되고,
+    중간에 실패해도 체크포인트와 실제 갱신 내용이 어긋나지 않습니다.
+    
+    Args:
+        name: backfill 이름 (체크포인트 키)
+        table: 대상 테이블
+        assignments: SET 절
+        **kw: backfill_in_batches()의 나머지 인자
+        
+    Returns:
+        int: 이번 실행에서 갱신한 행 수
+        
+    Raises:
+        RuntimeError: offline(--sql) 모드인 경우 (키 범위를 조회해야 하므로 SQL 스크립트로 만들 수 없음)
+    """
+    context = op.get_context()
+    if context.as_sql:
+        raise RuntimeError(f"Backfill {name} cannot run in offline (--sql) mode")
+    with context.autocommit_block(), op.get_bind().engine.connect() as connection:
+        return backfill_in_batches(connection, name, table, assignments, **kw)
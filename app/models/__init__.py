@@ -2,6 +2,6 @@
 모델 패키지
 SQLAlchemy ORM 모델 모음
 """
-from app.models.memo import Memo
+from app.models.memo import Memo, MemoSlotSequence, MemoTombstone
 
-__all__ = ["Memo"]
+__all__ = ["Memo", "MemoSlotSequence", "MemoTombstone"]
@@ -3,14 +3,22 @@
 SQLAlchemy를 사용한 데이터베이스 테이블 정의
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import BigInteger, Column, Integer, Sequence, String, Text, DateTime, Index
 from app.database import Base
 
 
+# SSE 변경 피드 이벤트 ID (PostgreSQL 브로커, 시퀀스를 지원하지 않는 DB에서는 create_all이 건너뜀)
+memo_event_id_seq = Sequence("memo_event_id_seq", metadata=Base.metadata)
+
+
 class Memo(Base):
     """메모 테이블 모델"""
     
     __tablename__ = "memos"
+    __table_args__ = (
+        # 변경분 동기화의 keyset 페이지네이션 (updated_at, id) 순서
+        Index("ix_memos_updated_at_id", "updated_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     title = Column(String(200), nullable=False, comment="메모 제목")
@@ -31,3 +39,38 @@ class Memo(Base):
     
     def __repr__(self) -> str:
         return f"<Memo(id={self.id}, title='{self.title}')>"
+
+
+class MemoTombstone(Base):
+    """삭제된 메모 기록 테이블 (변경분 동기화 시 삭제 전달용)"""
+    
+    __tablename__ = "memo_tombstones"
+    __table_args__ = (
+        Index("ix_memo_tombstones_deleted_at_memo_id", "deleted_at", "memo_id"),
+    )
+    
+    memo_id = Column(Integer, primary_key=True, autoincrement=False, comment="삭제된 메모 ID")
+    deleted_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False,
+        comment="삭제 일시"
+    )
+    
+    def __repr__(self) -> str:
+        return f"<MemoTombstone(memo_id={self.memo_id}, deleted_at='{self.deleted_at}')>"
+
+
+class MemoSlotSequence(Base):
+    """
+    샤드 슬롯별 메모 ID 발급 테이블 (샤딩 사용 시)
+    메모 ID는 next_local * SHARD_SLOTS + slot으로 발급되며, 슬롯을 다른 샤드로 옮길 때 함께 이동
+    """
+    
+    __tablename__ = "memo_slot_sequences"
+    
+    slot = Column(Integer, primary_key=True, autoincrement=False, comment="샤드 슬롯 번호")
+    next_local = Column(BigInteger, nullable=False, default=0, comment="마지막으로 발급한 슬롯 내 번호")
+    
+    def __repr__(self) -> str:
+        return f"<MemoSlotSequence(slot={self.slot}, next_local={self.next_local})>"
@@ -0,0 +1,321 @@
+"""
+요청 샘플링 프로파일러
+선택된 요청의 호출 스택을 주기적으로 샘플링하여 collapsed stack / speedscope 형식으로 저장
+
+프로파일 대상 요청은 ProfilingMiddleware가 컨텍스트 변수로 표시합니다. 샘플러 스레드는
+이벤트 루프 스레드에서 해당 요청의 태스크가 실행 중일 때와, 요청이 DB 작업용 스레드
+(run_in_db_threadpool)에서 실행 중일 때의 스택만 수집하므로 동시에 처리 중인 다른 요청의
+스택은 섞이지 않습니다. 프로파일 중인 요청이 없으면 샘플러 스레드도 멈춥니다.
+"""
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextvars import ContextVar, Token
+from functools import wraps
+from types import FrameType
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar
+
+from app.metrics import metrics
+
+
+T = TypeVar("T")
+
+# 현재 요청의 프로파일 (프로파일 대상이 아니면 None)
+_current_profile: ContextVar[Optional["Profile"]] = ContextVar("current_profile", default=None)
+
+# 스택 프레임 이름 캐시 (코드 객체별)
+_frame_names: Dict[Any, str] = {}
+
+
+def sign_token(secret: str, ttl: float = 300.0) -> str:
+    """
+    프로파일 요청 토큰 생성 (X-Profile-Token 헤더 값)
+    
+    Args:
+        secret: PROFILER_SECRET
+        ttl: 토큰 유효 시간 (초)
+        
+    Returns:
+        str: "만료 시각.서명" 형식의 토큰
+    """
+    expires = str(int(time.time() + ttl))
+    signature = hmac.new(secret.encode(), expires.encode(), hashlib.sha256).hexdigest()
+    return f"{expires}.{signature}"
+
+
+def verify_token(secret: str, token: str) -> bool:
+    """
+    프로파일 요청 토큰 검증
+    
+    Args:
+        secret: PROFILER_SECRET (비어 있으면 항상 실패)
+        token: sign_token()으로 만든 토큰
+        
+    Returns:
+        bool: 서명이 올바르고 만료되지 않았는지 여부
+    """
+    expires, _, signature = token.partition(".")
+    if not secret or not expires.isdigit() or int(expires) < time.time():
+        return False
+    expected = hmac.new(secret.encode(), expires.encode(), hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature)
+
+
+def _frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+    name = _frame_names.get(code)
+    if name is None:
+        filename = code.co_filename
+        for path in sys.path:
+            if path and filename.startswith(path):
+                filename = filename[len(path):].lstrip(os.sep)
+                break
+        name = f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ":")
+        _frame_names[code] = name
+    return name
+
+
+def _stack(frame: Optional[FrameType]) -> Tuple[str, ...]:
+    """프레임부터 바깥쪽 호출까지의 스택 (바깥쪽이 먼저)"""
+    names: List[str] = []
+    while frame is not None:
+        names.append(_frame_name(frame))
+        frame = frame.f_back
+    names.reverse()
+    return tuple(names)
+
+
+class Profile:
+    """
+    요청 하나의 샘플링 결과
+    
+    Args:
+        loop: 요청을 처리하는 이벤트 루프
+        task: 요청을 처리하는 태스크
+        loop_thread: 이벤트 루프 스레드 ID
+    """
+    
+    def __init__(self, loop: asyncio.AbstractEventLoop, task: Optional[asyncio.Task], loop_thread: int):
+        self.id = uuid.uuid4().hex[:16]
+        self.loop = loop
+        self.task = task
+        self.loop_thread = loop_thread
+        self.threads: Set[int] = set()
+        self.stacks: Counter = Counter()
+        self.started = time.perf_counter()
+    
+    def wrap(self, func: Callable[..., T]) -> Callable[..., T]:
+        """스레드에서 실행하는 동안 이 요청의 샘플링 대상으로 등록하는 함수로 감쌈"""
+        @wraps(func)
+        def run(*args: Any) -> T:
+            thread = threading.get_ident()
+            self.threads.add(thread)
+            try:
+                return func(*args)
+            finally:
+                self.threads.discard(thread)
+        return run
+    
+    def sample(self, frames: Dict[int, FrameType]) -> None:
+        """현재 스레드별 프레임에서 이 요청이 실행 중인 스택 기록"""
+        if self.task is not None and asyncio.current_task(self.loop) is self.task:
+            frame = frames.get(self.loop_thread)
+            if frame is not None:
+                self.stacks[_stack(frame)] += 1
+        for thread in list(self.threads):
+            frame = frames.get(thread)
+            if frame is not None:
+                self.stacks[_stack(frame)] += 1
+
+
+class Sampler:
+    """
+    프로파일 중인 요청이 있는 동안에만 동작하는 샘플링 스레드
+    
+    Args:
+        interval: 샘플링 간격 (초)
+    """
+    
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self._profiles: Set[Profile] = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self, profile: Profile) -> None:
+        """요청 샘플링 시작"""
+        with self._lock:
+            self._profiles.add(profile)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="profiler-sampler", daemon=True)
+                self._thread.start()
+    
+    def stop(self, profile: Profile) -> None:
+        """요청 샘플링 종료"""
+        with self._lock:
+            self._profiles.discard(profile)
+    
+    def _run(self) -> None:
+        sampler_thread = threading.get_ident()
+        while True:
+            with self._lock:
+                profiles = list(self._profiles)
+                if not profiles:
+                    self._thread = None
+                    return
+            frames = sys._current_frames()
+            frames.pop(sampler_thread, None)
+            for profile in profiles:
+                profile.sample(frames)
+            del frames
+            time.sleep(self.interval)
+
+
+def set_profile(profile: Profile) -> Token:
+    """
+    현재 컨텍스트(요청)를 프로파일 대상으로 표시
+    
+    Args:
+        profile: 요청의 프로파일
+        
+    Returns:
+        Token: reset_profile()에 전달할 토큰
+    """
+    return _current_profile.set(profile)
+
+
+def reset_profile(token: Token) -> None:
+    """set_profile() 이전 상태로 복원"""
+    _current_profile.reset(token)
+
+
+def current_profile() -> Optional[Profile]:
+    """현재 요청의 프로파일 (프로파일 대상이 아니면 None)"""
+    return _current_profile.get()
+
+
+def to_collapsed(stacks: Dict[str, int]) -> str:
+    """collapsed stack 형식 (flamegraph.pl, speedscope 등에서 사용)"""
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.items())
+
+
+def to_speedscope(name: str, stacks: Dict[str, int], interval_ms: float) -> Dict[str, Any]:
+    """
+    speedscope 파일 형식으로 변환
+    
+    Args:
+        name: 프로파일 이름
+        stacks: collapsed stack별 샘플 수
+        interval_ms: 샘플링 간격 (밀리초, 샘플 가중치)
+        
+    Returns:
+        Dict[str, Any]: speedscope JSON
+    """
+    frames: List[Dict[str, str]] = []
+    index: Dict[str, int] = {}
+    samples: List[List[int]] = []
+    weights: List[float] = []
+    for stack, count in stacks.items():
+        sample = []
+        for frame in stack.split(";"):
+            if frame not in index:
+                index[frame] = len(frames)
+                frames.append({"name": frame})
+            sample.append(index[frame])
+        samples.append(sample)
+        weights.append(count * interval_ms)
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "memo-api",
+        "shared": {"frames": frames},
+        "profiles": [{
+            "type": "sampled",
+            "name": name,
+            "unit": "milliseconds",
+            "startValue": 0,
+            "endValue": sum(weights),
+            "samples": samples,
+            "weights": weights,
+        }],
+    }
+
+
+def _mtime(path: str) -> float:
+    # 다른 워커가 동시에 삭제한 파일은 가장 오래된 것으로 취급
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
+
+
+class ProfileStore:
+    """
+    프로파일 파일 저장소 (워커 프로세스가 같은 디렉터리를 공유)
+    
+    Args:
+        directory: 저장 디렉터리
+        max_profiles: 보관할 최대 프로파일 수 (오래된 것부터 삭제)
+    """
+    
+    def __init__(self, directory: str, max_profiles: int = 100):
+        self.directory = directory
+        self.max_profiles = max_profiles
+    
+    def _path(self, profile_id: str) -> str:
+        return os.path.join(self.directory, f"{profile_id}.json")
+    
+    def save(self, profile: Profile, meta: Dict[str, Any]) -> None:
+        """프로파일 저장 후 보관 한도를 넘는 오래된 프로파일 삭제"""
+        os.makedirs(self.directory, exist_ok=True)
+        record = {
+            "meta": {"id": profile.id, "samples": sum(profile.stacks.values()), **meta},
+            "stacks": {";".join(stack): count for stack, count in profile.stacks.most_common()},
+        }
+        with open(self._path(profile.id), "w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False)
+        metrics.increment("profiles_captured")
+        self._prune()
+    
+    def load(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        """저장된 프로파일 (없으면 None)"""
+        if not profile_id.isalnum():
+            return None
+        try:
+            with open(self._path(profile_id), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+    
+    def list(self) -> List[Dict[str, Any]]:
+        """저장된 프로파일 메타데이터 목록 (최근 것이 먼저)"""
+        profiles = []
+        for path in self._files():
+            try:
+                with open(path, encoding="utf-8") as f:
+                    profiles.append(json.load(f)["meta"])
+            except (OSError, ValueError, KeyError):
+                continue
+        return profiles
+    
+    def _files(self) -> List[str]:
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        paths = [os.path.join(self.directory, name) for name in names if name.endswith(".json")]
+        return sorted(paths, key=_mtime, reverse=True)
+    
+    def _prune(self) -> None:
+        for path in self._files()[self.max_profiles:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
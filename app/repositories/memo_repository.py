@@ -1,15 +1,107 @@
 """
 메모 Repository 레이어
 데이터베이스 CRUD 연산 담당
+
+쿼리는 모듈 수준에서 한 번 구성한 SQLAlchemy 2.0 statement를 재사용합니다.
+값은 bindparam으로 전달하므로 호출마다 쿼리 객체를 새로 만들지 않고,
+엔진의 컴파일된 statement 캐시에 적중합니다.
 """
-from typing import Optional, List
+from datetime import datetime
+from typing import NamedTuple, Optional, List
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import and_, bindparam, delete, func, insert, or_, select
 
-from app.models.memo import Memo
+from app.database import commit
+from app.models.memo import Memo, MemoTombstone
 from app.schemas.memo import MemoCreate, MemoUpdate
+from app.tracing import trace_methods
+
+
+class MemoRow(NamedTuple):
+    """
+    읽기 전용 메모 행 (tuple 기반 DTO)
+    ORM 객체와 달리 identity map 등록이나 변경 추적 상태를 갖지 않음
+    """
+    id: int
+    title: str
+    content: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+
+class TombstoneRow(NamedTuple):
+    """삭제된 메모 기록 행"""
+    memo_id: int
+    deleted_at: datetime
+
+
+memo_table = Memo.__table__
+tombstone_table = MemoTombstone.__table__
 
+# 미리 구성한 statement (캐시 키가 항상 같으므로 컴파일은 최초 1회만 수행)
+SELECT_MEMO_BY_ID = select(Memo).where(Memo.id == bindparam("memo_id"))
+COUNT_MEMOS = select(func.count(Memo.id))
+SELECT_MEMO_PAGE = (
+    select(Memo)
+    .order_by(Memo.updated_at.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+# Core 컬럼만 조회하는 읽기 전용 statement (ORM 객체를 만들지 않음)
+SELECT_MEMO_ROW_BY_ID = select(*(memo_table.c[name] for name in MemoRow._fields)).where(
+    memo_table.c.id == bindparam("memo_id")
+)
+# IN 목록은 expanding bindparam으로 전달하여 ID 개수와 관계없이 같은 캐시 키 사용
+SELECT_MEMO_ROWS_BY_IDS = select(*(memo_table.c[name] for name in MemoRow._fields)).where(
+    memo_table.c.id.in_(bindparam("memo_ids", expanding=True))
+)
+SELECT_MEMO_ROW_PAGE = (
+    select(*(memo_table.c[name] for name in MemoRow._fields))
+    .order_by(memo_table.c.updated_at.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+# 변경분 동기화: (변경 시각, ID)가 커서보다 큰 행을 keyset 순서로 조회
+SELECT_CHANGED_MEMO_ROWS = (
+    select(*(memo_table.c[name] for name in MemoRow._fields))
+    .where(or_(
+        memo_table.c.updated_at > bindparam("since_at"),
+        and_(
+            memo_table.c.updated_at == bindparam("since_at"),
+            memo_table.c.id > bindparam("since_memo_id")
+        )
+    ))
+    .order_by(memo_table.c.updated_at, memo_table.c.id)
+    .limit(bindparam("limit"))
+)
+SELECT_TOMBSTONE_ROWS = (
+    select(tombstone_table.c.memo_id, tombstone_table.c.deleted_at)
+    .where(or_(
+        tombstone_table.c.deleted_at > bindparam("since_at"),
+        and_(
+            tombstone_table.c.deleted_at == bindparam("since_at"),
+            tombstone_table.c.memo_id > bindparam("since_tombstone_id")
+        )
+    ))
+    .order_by(tombstone_table.c.deleted_at, tombstone_table.c.memo_id)
+    .limit(bindparam("limit"))
+)
+INSERT_MEMO = insert(Memo).returning(Memo)
+DELETE_MEMO = delete(Memo).where(Memo.id == bindparam("memo_id"))
+DELETE_TOMBSTONE = delete(tombstone_table).where(tombstone_table.c.memo_id == bindparam("memo_id"))
+INSERT_TOMBSTONE = insert(tombstone_table)
+# 보관 기간이 지난 삭제 기록 정리 (삭제마다 오래된 순서로 최대 PRUNE_TOMBSTONES_BATCH개)
+PRUNE_TOMBSTONES_BATCH = 100
+PRUNE_TOMBSTONES = delete(tombstone_table).where(tombstone_table.c.memo_id.in_(
+    select(tombstone_table.c.memo_id)
+    .where(tombstone_table.c.deleted_at < bindparam("prune_before"))
+    .order_by(tombstone_table.c.deleted_at)
+    .limit(PRUNE_TOMBSTONES_BATCH)
+    .scalar_subquery()
+))
 
+
+@trace_methods
 class MemoRepository:
     """메모 데이터베이스 접근 레이어"""
     
@@ -24,13 +116,11 @@ class MemoRepository:
         Returns:
             Memo: 생성된 메모 객체
         """
-        db_memo = Memo(
-            title=memo_data.title,
-            content=memo_data.content
-        )
-        db.add(db_memo)
-        db.commit()
-        db.refresh(db_memo)
+        db_memo = db.scalars(
+            INSERT_MEMO,
+            [{"title": memo_data.title, "content": memo_data.content}]
+        ).one()
+        commit(db)
         return db_memo
     
     def get_memo_by_id(self, db: Session, memo_id: int) -> Optional[Memo]:
@@ -44,12 +134,12 @@ class MemoRepository:
         Returns:
             Optional[Memo]: 메모 객체 또는 None
         """
-        return db.query(Memo).filter(Memo.id == memo_id).first()
+        return db.scalar(SELECT_MEMO_BY_ID, {"memo_id": memo_id})
     
     def get_memos(
-        self, 
-        db: Session, 
-        skip: int = 0, 
+        self,
+        db: Session,
+        skip: int = 0,
         limit: int = 100
     ) -> tuple[List[Memo], int]:
         """
@@ -63,20 +153,64 @@ class MemoRepository:
         Returns:
             tuple[List[Memo], int]: (메모 목록, 전체 메모 수)
         """
-        total = db.query(func.count(Memo.id)).scalar()
-        memos = (
-            db.query(Memo)
-            .order_by(Memo.updated_at.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
-        return memos, total
+        total = db.scalar(COUNT_MEMOS)
+        memos = db.scalars(SELECT_MEMO_PAGE, {"skip": skip, "limit": limit}).all()
+        return list(memos), total
+    
+    def get_memo_row_by_id(self, db: Session, memo_id: int) -> Optional[MemoRow]:
+        """
+        ID로 특정 메모 조회 (읽기 전용 빠른 경로)
+        
+        Args:
+            db: 데이터베이스 세션
+            memo_id: 메모 ID
+            
+        Returns:
+            Optional[MemoRow]: 메모 행 또는 None
+        """
+        row = db.execute(SELECT_MEMO_ROW_BY_ID, {"memo_id": memo_id}).first()
+        return MemoRow._make(row) if row is not None else None
+    
+    def get_memo_rows_by_ids(self, db: Session, memo_ids: List[int]) -> List[MemoRow]:
+        """
+        여러 ID의 메모를 한 번의 쿼리로 조회 (읽기 전용 빠른 경로, 순서는 보장하지 않음)
+        
+        Args:
+            db: 데이터베이스 세션
+            memo_ids: 메모 ID 목록
+            
+        Returns:
+            List[MemoRow]: 존재하는 메모 행 목록
+        """
+        result = db.execute(SELECT_MEMO_ROWS_BY_IDS, {"memo_ids": memo_ids})
+        return [MemoRow._make(row) for row in result]
+    
+    def get_memo_rows(
+        self,
+        db: Session,
+        skip: int = 0,
+        limit: int = 100
+    ) -> tuple[List[MemoRow], int]:
+        """
+        메모 목록 조회 (읽기 전용 빠른 경로)
+        ORM 객체 생성과 identity map 등록을 건너뛰고 Core 행을 MemoRow로 변환
+        
+        Args:
+            db: 데이터베이스 세션
+            skip: 건너뛸 레코드 수
+            limit: 조회할 최대 레코드 수
+            
+        Returns:
+            tuple[List[MemoRow], int]: (메모 행 목록, 전체 메모 수)
+        """
+        total = db.scalar(COUNT_MEMOS)
+        result = db.execute(SELECT_MEMO_ROW_PAGE, {"skip": skip, "limit": limit})
+        return [MemoRow._make(row) for row in result], total
     
     def update_memo(
-        self, 
-        db: Session, 
-        memo_id: int, 
+        self,
+        db: Session,
+        memo_id: int,
         memo_data: MemoUpdate
     ) -> Optional[Memo]:
         """
@@ -94,33 +228,75 @@ class MemoRepository:
         if not db_memo:
             return None
         
-        # 제공된 필드만 업데이트
+        # 제공된 필드만 업데이트 (UPDATE 문은 flush 시 unit of work가 캐시된 statement로 실행)
         update_data = memo_data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_memo, field, value)
         
-        db.commit()
-        db.refresh(db_memo)
+        commit(db)
         return db_memo
     
-    def delete_memo(self, db: Session, memo_id: int) -> bool:
+    def delete_memo(self, db: Session, memo_id: int, prune_before: Optional[datetime] = None) -> bool:
         """
         메모 삭제
         
         Args:
             db: 데이터베이스 세션
             memo_id: 메모 ID
+            prune_before: 지정 시 이 시각 이전의 삭제 기록을 함께 정리
             
         Returns:
             bool: 삭제 성공 여부
         """
-        db_memo = self.get_memo_by_id(db, memo_id)
-        if not db_memo:
-            return False
+        result = db.execute(DELETE_MEMO, {"memo_id": memo_id})
+        deleted = result.rowcount > 0
+        if deleted:
+            # 같은 트랜잭션에서 삭제 기록 (ID가 재사용된 경우 이전 기록을 대체)
+            params = {"memo_id": memo_id}
+            db.execute(DELETE_TOMBSTONE, params)
+            db.execute(INSERT_TOMBSTONE, {**params, "deleted_at": datetime.utcnow()})
+            if prune_before is not None:
+                db.execute(PRUNE_TOMBSTONES, {"prune_before": prune_before})
+        commit(db)
+        return deleted
+    
+    def get_changes(
+        self,
+        db: Session,
+        since_at: datetime,
+        since_memo_id: int,
+        since_tombstone_id: int,
+        limit: int
+    ) -> tuple[List[MemoRow], List[TombstoneRow]]:
+        """
+        커서 이후 생성/수정된 메모와 삭제 기록 조회
+        (updated_at / deleted_at 인덱스를 keyset으로 탐색하므로 비용은 변경 수에 비례)
         
-        db.delete(db_memo)
-        db.commit()
-        return True
+        Args:
+            db: 데이터베이스 세션
+            since_at: 커서 시각
+            since_memo_id: 커서 시각과 같은 메모 중 이 ID 이하는 제외
+            since_tombstone_id: 커서 시각과 같은 삭제 기록 중 이 ID 이하는 제외
+            limit: 각 테이블에서 조회할 최대 행 수
+            
+        Returns:
+            tuple[List[MemoRow], List[TombstoneRow]]: (변경된 메모 행, 삭제 기록 행)
+        """
+        params = {"since_at": since_at, "limit": limit}
+        memos = db.execute(SELECT_CHANGED_MEMO_ROWS, {**params, "since_memo_id": since_memo_id})
+        tombstones = db.execute(SELECT_TOMBSTONE_ROWS, {**params, "since_tombstone_id": since_tombstone_id})
+        return [MemoRow._make(row) for row in memos], [TombstoneRow._make(row) for row in tombstones]
+    
+    def prepare_statements(self, db: Session) -> None:
+        """
+        자주 사용하는 조회 쿼리를 한 번 실행하여 statement 캐시 워밍업
+        (애플리케이션 시작 시 커넥션 풀 워밍업과 함께 호출)
+        
+        Args:
+            db: 데이터베이스 세션
+        """
+        self.get_memo_row_by_id(db, 0)
+        self.get_memo_rows(db, skip=0, limit=1)
 
 
 # Repository 인스턴스 (싱글톤 패턴)
@@ -0,0 +1,212 @@
+"""
+샤딩된 메모 Repository
+메모를 ID 슬롯으로 여러 데이터베이스(샤드)에 나누어 저장
+
+단건 연산은 ID로 샤드를 골라 한 곳에서만 실행하고, 목록/변경분 조회는 모든 샤드에서
+같은 정렬로 조회한 뒤 병합합니다(scatter-gather). statement는 MemoRepository와 같은
+미리 구성한 statement를 샤드 엔진마다 재사용합니다.
+"""
+import heapq
+from datetime import datetime
+from itertools import islice
+from typing import Dict, List, Optional
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import Session
+
+from app.database import commit
+from app.models.memo import Memo, MemoSlotSequence
+from app.repositories.memo_repository import (
+    COUNT_MEMOS,
+    DELETE_MEMO,
+    DELETE_TOMBSTONE,
+    INSERT_TOMBSTONE,
+    PRUNE_TOMBSTONES,
+    SELECT_CHANGED_MEMO_ROWS,
+    SELECT_MEMO_BY_ID,
+    SELECT_MEMO_ROW_BY_ID,
+    SELECT_MEMO_ROW_PAGE,
+    SELECT_MEMO_ROWS_BY_IDS,
+    SELECT_TOMBSTONE_ROWS,
+    MemoRepository,
+    MemoRow,
+    TombstoneRow,
+)
+from app.schemas.memo import MemoCreate
+from app.sharding.shard_map import ShardMap
+from app.tracing import trace_methods
+
+
+slot_sequence_table = MemoSlotSequence.__table__
+
+# 슬롯의 다음 번호 발급 (행 잠금으로 같은 슬롯의 동시 발급을 직렬화)
+ALLOCATE_SLOT_LOCAL = (
+    update(slot_sequence_table)
+    .where(slot_sequence_table.c.slot == bindparam("target_slot"))
+    .values(next_local=slot_sequence_table.c.next_local + 1)
+    .returning(slot_sequence_table.c.next_local)
+)
+
+
+@trace_methods
+class ShardedMemoRepository(MemoRepository):
+    """
+    샤딩된 메모 데이터베이스 접근 레이어
+    (세션은 app.sharding의 ShardedSession이어야 함)
+    
+    Args:
+        shard_map: 샤드 맵
+    """
+    
+    def __init__(self, shard_map: ShardMap):
+        self.shard_map = shard_map
+    
+    @staticmethod
+    def _on(shard_id: str) -> dict:
+        return {"shard_id": shard_id}
+    
+    def allocate_id(self, db: Session, slot: int) -> int:
+        """
+        슬롯의 샤드에서 새 메모 ID 발급
+        
+        Args:
+            db: 데이터베이스 세션
+            slot: 메모를 저장할 슬롯
+            
+        Returns:
+            int: 메모 ID
+            
+        Raises:
+            LookupError: 슬롯의 ID 발급 행이 없는 경우 (init_sharding() 이전)
+        """
+        slot_local = db.scalar(
+            ALLOCATE_SLOT_LOCAL,
+            {"target_slot": slot},
+            bind_arguments=self._on(self.shard_map.shard_for_slot(slot))
+        )
+        if slot_local is None:
+            raise LookupError(f"Slot sequence {slot} is not initialized")
+        return self.shard_map.make_id(slot_local, slot)
+    
+    def create_memo(self, db: Session, memo_data: MemoCreate) -> Memo:
+        """
+        새로운 메모 생성 (임의의 슬롯에 저장)
+        ORM bulk INSERT는 샤드 라우팅을 지원하지 않으므로 flush 시 ID로 샤드를 고름
+        """
+        memo_id = self.allocate_id(db, self.shard_map.choose_slot())
+        db_memo = Memo(id=memo_id, title=memo_data.title, content=memo_data.content)
+        db.add(db_memo)
+        commit(db)
+        return db_memo
+    
+    def get_memo_by_id(self, db: Session, memo_id: int) -> Optional[Memo]:
+        """ID로 특정 메모 조회 (ID의 샤드만 조회)"""
+        return db.scalar(
+            SELECT_MEMO_BY_ID,
+            {"memo_id": memo_id},
+            bind_arguments=self._on(self.shard_map.shard_for_id(memo_id))
+        )
+    
+    def get_memos(self, db: Session, skip: int = 0, limit: int = 100) -> tuple[List[Memo], int]:
+        """메모 목록 조회 (ORM 객체, 병합된 행의 ID로 샤드별 조회)"""
+        rows, total = self.get_memo_rows(db, skip, limit)
+        memos = [self.get_memo_by_id(db, row.id) for row in rows]
+        return [memo for memo in memos if memo is not None], total
+    
+    def get_memo_row_by_id(self, db: Session, memo_id: int) -> Optional[MemoRow]:
+        """ID로 특정 메모 조회 (읽기 전용 빠른 경로, ID의 샤드만 조회)"""
+        row = db.execute(
+            SELECT_MEMO_ROW_BY_ID,
+            {"memo_id": memo_id},
+            bind_arguments=self._on(self.shard_map.shard_for_id(memo_id))
+        ).first()
+        return MemoRow._make(row) if row is not None else None
+    
+    def get_memo_rows_by_ids(self, db: Session, memo_ids: List[int]) -> List[MemoRow]:
+        """여러 ID의 메모 조회 (샤드별로 묶어 샤드당 한 번의 쿼리, 순서는 보장하지 않음)"""
+        by_shard: Dict[str, List[int]] = {}
+        for memo_id in memo_ids:
+            by_shard.setdefault(self.shard_map.shard_for_id(memo_id), []).append(memo_id)
+        rows: List[MemoRow] = []
+        for shard_id, ids in by_shard.items():
+            result = db.execute(SELECT_MEMO_ROWS_BY_IDS, {"memo_ids": ids}, bind_arguments=self._on(shard_id))
+            rows.extend(MemoRow._make(row) for row in result)
+        return rows
+    
+    def get_memo_rows(self, db: Session, skip: int = 0, limit: int = 100) -> tuple[List[MemoRow], int]:
+        """
+        메모 목록 조회 (읽기 전용 빠른 경로, scatter-gather)
+        각 샤드에서 앞쪽 skip + limit개를 같은 정렬로 조회한 뒤 병합하므로 샤드당 조회량은
+        skip에 비례합니다. 깊은 페이지는 변경분 동기화(keyset)를 사용하는 편이 효율적입니다.
+        """
+        total = 0
+        pages = []
+        for shard_id in self.shard_map.shard_ids:
+            bind_arguments = self._on(shard_id)
+            total += db.scalar(COUNT_MEMOS, bind_arguments=bind_arguments)
+            result = db.execute(
+                SELECT_MEMO_ROW_PAGE,
+                {"skip": 0, "limit": skip + limit},
+                bind_arguments=bind_arguments
+            )
+            pages.append([MemoRow._make(row) for row in result])
+        merged = heapq.merge(*pages, key=lambda row: row.updated_at, reverse=True)
+        return list(islice(merged, skip, skip + limit)), total
+    
+    def delete_memo(self, db: Session, memo_id: int, prune_before: Optional[datetime] = None) -> bool:
+        """메모 삭제 (삭제 기록은 메모와 같은 샤드에 저장하고, 오래된 기록 정리도 그 샤드에서 수행)"""
+        bind_arguments = self._on(self.shard_map.shard_for_id(memo_id))
+        result = db.execute(DELETE_MEMO, {"memo_id": memo_id}, bind_arguments=bind_arguments)
+        deleted = result.rowcount > 0
+        if deleted:
+            params = {"memo_id": memo_id}
+            db.execute(DELETE_TOMBSTONE, params, bind_arguments=bind_arguments)
+            db.execute(
+                INSERT_TOMBSTONE,
+                {**params, "deleted_at": datetime.utcnow()},
+                bind_arguments=bind_arguments
+            )
+            if prune_before is not None:
+                db.execute(PRUNE_TOMBSTONES, {"prune_before": prune_before}, bind_arguments=bind_arguments)
+        commit(db)
+        return deleted
+    
+    def get_changes(
+        self,
+        db: Session,
+        since_at: datetime,
+        since_memo_id: int,
+        since_tombstone_id: int,
+        limit: int
+    ) -> tuple[List[MemoRow], List[TombstoneRow]]:
+        """
+        커서 이후 변경분 조회 (샤드별 keyset 조회 결과를 (시각, ID) 순서로 병합)
+        각 샤드가 커서 이후 limit개를 반환하므로 병합 후 앞쪽 limit개는 전체 순서와 같습니다.
+        """
+        params = {"since_at": since_at, "limit": limit}
+        memo_pages = []
+        tombstone_pages = []
+        for shard_id in self.shard_map.shard_ids:
+            bind_arguments = self._on(shard_id)
+            memos = db.execute(
+                SELECT_CHANGED_MEMO_ROWS,
+                {**params, "since_memo_id": since_memo_id},
+                bind_arguments=bind_arguments
+            )
+            tombstones = db.execute(
+                SELECT_TOMBSTONE_ROWS,
+                {**params, "since_tombstone_id": since_tombstone_id},
+                bind_arguments=bind_arguments
+            )
+            memo_pages.append([MemoRow._make(row) for row in memos])
+            tombstone_pages.append([TombstoneRow._make(row) for row in tombstones])
+        memo_rows = heapq.merge(*memo_pages, key=lambda row: (row.updated_at, row.id))
+        tombstone_rows = heapq.merge(*tombstone_pages, key=lambda row: (row.deleted_at, row.memo_id))
+        return list(islice(memo_rows, limit)), list(islice(tombstone_rows, limit))
+    
+    def prepare_statements(self, db: Session) -> None:
+        """샤드마다 자주 사용하는 조회 쿼리를 실행하여 statement 캐시 워밍업"""
+        for shard_id in self.shard_map.shard_ids:
+            bind_arguments = self._on(shard_id)
+            db.execute(SELECT_MEMO_ROW_BY_ID, {"memo_id": 0}, bind_arguments=bind_arguments)
+            db.execute(SELECT_MEMO_ROW_PAGE, {"skip": 0, "limit": 1}, bind_arguments=bind_arguments)
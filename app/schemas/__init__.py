@@ -6,12 +6,30 @@ from app.schemas.memo import (
     MemoCreate,
     MemoUpdate,
     MemoResponse,
-    MemoListResponse
+    MemoListResponse,
+    MemoLookupRequest,
+    MemoLookupResponse,
+    MemoChange,
+    MemoChangesResponse
+)
+from app.schemas.batch import (
+    BatchOperation,
+    BatchRequest,
+    BatchOperationResult,
+    BatchResponse
 )
 
 __all__ = [
     "MemoCreate",
     "MemoUpdate",
     "MemoResponse",
-    "MemoListResponse"
+    "MemoListResponse",
+    "MemoLookupRequest",
+    "MemoLookupResponse",
+    "MemoChange",
+    "MemoChangesResponse",
+    "BatchOperation",
+    "BatchRequest",
+    "BatchOperationResult",
+    "BatchResponse"
 ]
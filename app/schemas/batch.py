@@ -0,0 +1,49 @@
+"""
+배치 Pydantic 스키마
+여러 메모 작업을 한 번의 요청으로 실행
+"""
+from typing import Any, Dict, Literal, Optional, Union
+from pydantic import BaseModel, Field, model_validator
+
+from app.schemas.memo import MemoResponse
+
+
+class BatchOperation(BaseModel):
+    """배치 작업 하나"""
+    op: Literal["create", "get", "update", "delete"] = Field(..., description="작업 종류")
+    memo_id: Optional[int] = Field(None, description="대상 메모 ID (create 제외 필수)")
+    data: Optional[Dict[str, Any]] = Field(None, description="생성/수정 데이터 (MemoCreate/MemoUpdate 형식)")
+    
+    @model_validator(mode="after")
+    def check_arguments(self) -> "BatchOperation":
+        """작업 종류별 필수 값 확인"""
+        if self.op != "create" and self.memo_id is None:
+            raise ValueError(f"'{self.op}' operation requires memo_id")
+        if self.op in ("create", "update") and self.data is None:
+            raise ValueError(f"'{self.op}' operation requires data")
+        return self
+
+
+class BatchRequest(BaseModel):
+    """배치 요청 스키마"""
+    operations: list[BatchOperation] = Field(
+        ..., min_length=1, max_length=100, description="순서대로 실행할 작업 목록"
+    )
+    atomic: bool = Field(
+        False,
+        description="true이면 하나라도 실패 시 전체 롤백, false이면 실패한 작업만 롤백"
+    )
+
+
+class BatchOperationResult(BaseModel):
+    """배치 작업 결과"""
+    status: int = Field(..., description="작업별 HTTP 상태 코드")
+    body: Optional[Union[MemoResponse, Dict[str, Any]]] = Field(
+        None, description="작업 응답 (메모 또는 오류 내용)"
+    )
+
+
+class BatchResponse(BaseModel):
+    """배치 응답 스키마"""
+    results: list[BatchOperationResult] = Field(..., description="작업 순서대로의 결과")
+    committed: bool = Field(..., description="변경 사항이 커밋되었는지 여부")
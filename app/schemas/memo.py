@@ -4,7 +4,7 @@ API 요청/응답 데이터 검증 및 직렬화
 """
 from datetime import datetime
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional
+from typing import Literal, Optional
 
 
 class MemoBase(BaseModel):
@@ -39,3 +39,29 @@ class MemoListResponse(BaseModel):
     total: int = Field(..., description="전체 메모 수")
     skip: int = Field(..., description="건너뛴 메모 수")
     limit: int = Field(..., description="조회한 메모 수")
+
+
+class MemoLookupRequest(BaseModel):
+    """메모 다건 조회 요청 스키마"""
+    ids: list[int] = Field(..., min_length=1, max_length=1000, description="조회할 메모 ID 목록")
+
+
+class MemoLookupResponse(BaseModel):
+    """메모 다건 조회 응답 스키마"""
+    items: list[MemoResponse] = Field(..., description="요청한 순서대로의 메모 목록")
+    missing_ids: list[int] = Field(..., description="존재하지 않는 메모 ID 목록")
+
+
+class MemoChange(BaseModel):
+    """메모 변경 항목 스키마 (변경분 동기화)"""
+    type: Literal["upsert", "delete"] = Field(..., description="변경 종류 (생성/수정은 upsert)")
+    memo_id: int = Field(..., description="메모 ID")
+    changed_at: datetime = Field(..., description="변경 일시")
+    memo: Optional[MemoResponse] = Field(None, description="변경된 메모 (삭제 시 null)")
+
+
+class MemoChangesResponse(BaseModel):
+    """메모 변경분 응답 스키마"""
+    changes: list[MemoChange] = Field(..., description="변경 시각 순 변경 목록")
+    next_token: str = Field(..., description="다음 동기화에 사용할 토큰")
+    has_more: bool = Field(..., description="이어서 조회할 변경이 남아 있는지 여부")
@@ -0,0 +1,102 @@
+"""
+프로덕션 서버 실행기
+CPU 수 기반 멀티 워커 uvicorn 실행 (uvloop/httptools 사용 가능 시 자동 적용)
+
+사용 예:
+    python -m app.server
+    WEB_CONCURRENCY=8 SERVER_PORT=8080 python -m app.server
+"""
+import importlib.util
+import logging
+import os
+from typing import Any, Dict
+
+from app.config import Settings, get_settings
+from app.logging_config import configure_logging, shutdown_logging
+
+
+logger = logging.getLogger(__name__)
+
+
+def available_cpus() -> int:
+    """
+    현재 프로세스가 사용할 수 있는 CPU 수
+    컨테이너 cpuset 제한을 반영하기 위해 sched_getaffinity 우선 사용
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def worker_count(config: Settings) -> int:
+    """
+    실행할 워커 수 결정
+    
+    Args:
+        config: 애플리케이션 설정
+        
+    Returns:
+        int: WEB_CONCURRENCY 설정값, 미설정 시 사용 가능한 CPU 수
+    """
+    if config.WEB_CONCURRENCY:
+        return max(1, config.WEB_CONCURRENCY)
+    return available_cpus()
+
+
+def _installed(module: str) -> bool:
+    """모듈 설치 여부 확인 (import 하지 않음)"""
+    return importlib.util.find_spec(module) is not None
+
+
+def server_options(config: Settings) -> Dict[str, Any]:
+    """
+    uvicorn 실행 옵션 생성
+    
+    워커는 spawn 방식으로 시작되어 각자 엔진을 새로 만들며,
+    fork 방식 서버에서는 app.database의 fork 훅이 풀을 재생성합니다.
+    워커 수 x (DB_POOL_SIZE + DB_MAX_OVERFLOW)가 PostgreSQL max_connections를
+    넘지 않도록 주의하세요.
+    
+    Args:
+        config: 애플리케이션 설정
+        
+    Returns:
+        Dict[str, Any]: uvicorn.run 키워드 인자
+    """
+    return {
+        "host": config.SERVER_HOST,
+        "port": config.SERVER_PORT,
+        "workers": worker_count(config),
+        "loop": "uvloop" if _installed("uvloop") else "asyncio",
+        "http": "httptools" if _installed("httptools") else "h11",
+        "timeout_keep_alive": config.SERVER_KEEPALIVE_TIMEOUT,
+        "backlog": config.SERVER_BACKLOG,
+        "timeout_graceful_shutdown": config.SERVER_GRACEFUL_SHUTDOWN_TIMEOUT,
+        "proxy_headers": True,
+        # 접근 로그는 AccessLogMiddleware가 큐 기반 파이프라인으로 기록 (uvicorn 동기 출력 중복 방지)
+        "access_log": not config.ACCESS_LOG_ENABLED,
+        "reload": False,
+    }
+
+
+def run() -> None:
+    """프로덕션 서버 실행 (시작 로그는 워커와 같은 로깅 설정으로 출력)"""
+    import uvicorn
+    
+    config = get_settings()
+    options = server_options(config)
+    configure_logging(config)
+    logger.info(
+        "Starting %d workers (loop=%s, http=%s)",
+        options["workers"],
+        options["loop"],
+        options["http"]
+    )
+    try:
+        uvicorn.run("app.main:create_app", factory=True, **options)
+    finally:
+        shutdown_logging()
+
+
+if __name__ == "__main__":
+    run()
@@ -3,5 +3,6 @@ Service 패키지
 비즈니스 로직 레이어
 """
 from app.services.memo_service import memo_service, MemoService
+from app.services.batch_service import batch_service, BatchService
 
-__all__ = ["memo_service", "MemoService"]
+__all__ = ["memo_service", "MemoService", "batch_service", "BatchService"]
@@ -0,0 +1,126 @@
+"""
+배치 Service 레이어
+여러 메모 작업을 하나의 세션과 트랜잭션에서 실행
+"""
+from typing import List
+
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from app.cache import PENDING_FRAGMENTS, list_page_cache, memo_fragments
+from app.concurrency import memo_reads
+from app.database import DEFER_COMMIT
+from app.events import PENDING_EVENTS, get_broker
+from app.exceptions.memo_exceptions import MemoNotFoundException
+from app.schemas.batch import BatchOperation, BatchOperationResult, BatchRequest, BatchResponse
+from app.schemas.memo import MemoCreate, MemoUpdate
+from app.services.memo_service import memo_service
+
+
+# atomic 배치에서 앞선 작업이 실패하여 실행하지 않은 작업의 상태 코드 (Failed Dependency)
+NOT_EXECUTED_STATUS = 424
+
+
+class BatchService:
+    """배치 실행 레이어 (작업별 처리는 MemoService에 위임)"""
+    
+    def __init__(self):
+        self.memo_service = memo_service
+    
+    def execute(self, db: Session, request: BatchRequest) -> BatchResponse:
+        """
+        배치 작업을 순서대로 실행하고 마지막에 한 번만 커밋
+        
+        atomic이면 작업 하나라도 실패할 때 전체를 롤백하고 남은 작업은 실행하지 않습니다.
+        atomic이 아니면 쓰기 작업마다 SAVEPOINT를 두어 실패한 작업만 롤백합니다.
+        변경 이벤트 발행과 메모 JSON 조각 저장은 커밋이 끝난 뒤에 수행합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            request: 배치 요청
+            
+        Returns:
+            BatchResponse: 작업별 결과와 커밋 여부
+        """
+        db.info[DEFER_COMMIT] = True
+        pending_events = db.info[PENDING_EVENTS] = []
+        pending_fragments = db.info[PENDING_FRAGMENTS] = []
+        results: List[BatchOperationResult] = []
+        committed = True
+        try:
+            for index, operation in enumerate(request.operations):
+                if request.atomic:
+                    result = self._run(db, operation)
+                elif operation.op == "get":
+                    # 조회는 되돌릴 변경이 없으므로 SAVEPOINT 생략
+                    result = self._run(db, operation)
+                else:
+                    savepoint = db.begin_nested()
+                    result = self._run(db, operation)
+                    if result.status >= 400:
+                        savepoint.rollback()
+                    else:
+                        savepoint.commit()
+                results.append(result)
+                
+                if request.atomic and result.status >= 400:
+                    committed = False
+                    results.extend(
+                        BatchOperationResult(
+                            status=NOT_EXECUTED_STATUS,
+                            body={"detail": "Not executed because an earlier operation failed"}
+                        )
+                        for _ in request.operations[index + 1:]
+                    )
+                    break
+            
+            if committed:
+                db.commit()
+            else:
+                db.rollback()
+                pending_events.clear()
+                pending_fragments.clear()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.info.pop(DEFER_COMMIT, None)
+            db.info.pop(PENDING_EVENTS, None)
+            db.info.pop(PENDING_FRAGMENTS, None)
+        
+        if pending_events:
+            # 커밋 전에 올린 세대로 그 사이 캐시된 목록이 남지 않도록 커밋 후 한 번 더 무효화하고,
+            # 커밋 전에 시작한 조회에 이후 요청이 합쳐지지 않도록 함
+            list_page_cache.invalidate()
+            memo_reads.invalidate()
+        for memo in pending_fragments:
+            memo_fragments.put(memo)
+        broker = get_broker()
+        for event_type, memo_id, data in pending_events:
+            broker.publish(event_type, memo_id, data)
+        return BatchResponse(results=results, committed=committed)
+    
+    def _run(self, db: Session, operation: BatchOperation) -> BatchOperationResult:
+        """작업 하나 실행 (서비스 예외를 작업별 상태 코드로 변환)"""
+        try:
+            if operation.op == "create":
+                memo_data = MemoCreate.model_validate(operation.data)
+                return BatchOperationResult(status=201, body=self.memo_service.create_memo(db, memo_data))
+            if operation.op == "get":
+                return BatchOperationResult(status=200, body=self.memo_service.get_memo(db, operation.memo_id))
+            if operation.op == "update":
+                memo_data = MemoUpdate.model_validate(operation.data)
+                return BatchOperationResult(
+                    status=200,
+                    body=self.memo_service.update_memo(db, operation.memo_id, memo_data)
+                )
+            self.memo_service.delete_memo(db, operation.memo_id)
+            return BatchOperationResult(status=204)
+        except MemoNotFoundException as e:
+            return BatchOperationResult(status=404, body={"detail": str(e), "memo_id": e.memo_id})
+        except ValidationError as e:
+            return BatchOperationResult(status=422, body={"detail": e.errors(include_url=False)})
+
+
+# Service 인스턴스 (싱글톤 패턴)
+batch_service = BatchService()
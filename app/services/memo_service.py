@@ -2,15 +2,45 @@
 메모 Service 레이어
 비즈니스 로직 및 예외 처리
 """
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import List, Optional
 from sqlalchemy.orm import Session
 
+from app.cache import cache_fragment, list_page_cache, memo_fragments
+from app.concurrency import memo_reads
 from app.models.memo import Memo
-from app.schemas.memo import MemoCreate, MemoUpdate, MemoResponse, MemoListResponse
+from app.schemas.memo import (
+    MemoChange,
+    MemoChangesResponse,
+    MemoCreate,
+    MemoListResponse,
+    MemoLookupResponse,
+    MemoResponse,
+    MemoUpdate,
+)
 from app.repositories.memo_repository import memo_repository
-from app.exceptions.memo_exceptions import MemoNotFoundException
+from app.exceptions.memo_exceptions import MemoNotFoundException, SyncTokenExpiredException
+from app.events import publish_event, write_transaction
+from app.tracing import trace_methods
+from app.services.sync_token import (
+    DELETE,
+    INITIAL_CURSOR,
+    UPSERT,
+    SyncCursor,
+    decode_sync_token,
+    encode_sync_token,
+)
 
 
+# updated_at은 커밋 전에 기록되므로, 커밋이 늦은 트랜잭션의 변경이 토큰 뒤로 밀리지 않도록
+# 다음 동기화는 이 시간만큼 이전 시점부터 다시 시작 (해당 구간은 다음 동기화에서 다시 전달)
+SYNC_SAFETY_WINDOW = timedelta(seconds=5)
+
+# 삭제 기록 보관 기간 (이보다 오래된 토큰은 삭제를 놓칠 수 있으므로 전체 동기화 필요)
+SYNC_TOMBSTONE_RETENTION = timedelta(days=30)
+
+
+@trace_methods
 class MemoService:
     """메모 비즈니스 로직 레이어"""
     
@@ -28,8 +58,14 @@ class MemoService:
         Returns:
             MemoResponse: 생성된 메모 응답
         """
-        db_memo = self.repository.create_memo(db, memo_data)
-        return MemoResponse.model_validate(db_memo)
+        with write_transaction(db):
+            db_memo = self.repository.create_memo(db, memo_data)
+            response = MemoResponse.model_validate(db_memo)
+            publish_event(db, "created", response.id, response.model_dump(mode="json"))
+        list_page_cache.invalidate()
+        memo_reads.invalidate()
+        cache_fragment(db, response)
+        return response
     
     def get_memo(self, db: Session, memo_id: int) -> MemoResponse:
         """
@@ -45,10 +81,10 @@ class MemoService:
         Raises:
             MemoNotFoundException: 메모를 찾을 수 없는 경우
         """
-        db_memo = self.repository.get_memo_by_id(db, memo_id)
-        if not db_memo:
+        memo_row = self.repository.get_memo_row_by_id(db, memo_id)
+        if not memo_row:
             raise MemoNotFoundException(memo_id)
-        return MemoResponse.model_validate(db_memo)
+        return MemoResponse.model_validate(memo_row)
     
     def get_memos(
         self, 
@@ -67,8 +103,9 @@ class MemoService:
         Returns:
             MemoListResponse: 메모 목록 응답
         """
-        memos, total = self.repository.get_memos(db, skip, limit)
-        items = [MemoResponse.model_validate(memo) for memo in memos]
+        # 조회 전용이므로 ORM 객체 대신 MemoRow로 응답 생성
+        memo_rows, total = self.repository.get_memo_rows(db, skip, limit)
+        items = [MemoResponse.model_validate(row) for row in memo_rows]
         return MemoListResponse(
             items=items,
             total=total,
@@ -76,6 +113,93 @@ class MemoService:
             limit=limit
         )
     
+    def get_memos_by_ids(self, db: Session, memo_ids: List[int]) -> MemoLookupResponse:
+        """
+        여러 메모를 한 번에 조회
+        
+        Args:
+            db: 데이터베이스 세션
+            memo_ids: 메모 ID 목록 (중복은 첫 번째만 사용)
+            
+        Returns:
+            MemoLookupResponse: 요청한 순서대로의 메모 목록과 존재하지 않는 ID 목록
+        """
+        requested = list(dict.fromkeys(memo_ids))
+        rows = {row.id: row for row in self.repository.get_memo_rows_by_ids(db, requested)}
+        return MemoLookupResponse(
+            items=[MemoResponse.model_validate(rows[memo_id]) for memo_id in requested if memo_id in rows],
+            missing_ids=[memo_id for memo_id in requested if memo_id not in rows]
+        )
+    
+    def get_changes(
+        self,
+        db: Session,
+        since: Optional[str] = None,
+        limit: int = 100
+    ) -> MemoChangesResponse:
+        """
+        동기화 토큰 이후의 변경분 조회
+        
+        Args:
+            db: 데이터베이스 세션
+            since: 이전 응답의 next_token (없으면 처음부터)
+            limit: 조회할 최대 변경 수
+            
+        Returns:
+            MemoChangesResponse: 변경 시각 순 변경 목록과 다음 토큰
+            
+        Raises:
+            InvalidSyncTokenException: 토큰 형식이 올바르지 않은 경우
+            SyncTokenExpiredException: 토큰이 삭제 기록 보관 기간보다 오래된 경우
+        """
+        now = datetime.utcnow()
+        cursor, restart = decode_sync_token(since) if since else (INITIAL_CURSOR, None)
+        if since and min(cursor, restart or cursor).changed_at < now - SYNC_TOMBSTONE_RETENTION:
+            raise SyncTokenExpiredException(since)
+        # 커서가 upsert이면 같은 시각/ID의 삭제 기록은 아직 전달되지 않은 것
+        since_tombstone_id = cursor.memo_id - 1 if cursor.kind == UPSERT else cursor.memo_id
+        memo_rows, tombstones = self.repository.get_changes(
+            db, cursor.changed_at, cursor.memo_id, since_tombstone_id, limit + 1
+        )
+        
+        changes = [
+            (SyncCursor(row.updated_at, row.id, UPSERT), MemoChange(
+                type="upsert",
+                memo_id=row.id,
+                changed_at=row.updated_at,
+                memo=MemoResponse.model_validate(row)
+            ))
+            for row in memo_rows
+        ] + [
+            (SyncCursor(row.deleted_at, row.memo_id, DELETE), MemoChange(
+                type="delete",
+                memo_id=row.memo_id,
+                changed_at=row.deleted_at
+            ))
+            for row in tombstones
+        ]
+        changes.sort(key=lambda change: change[0])
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+        
+        next_cursor = changes[-1][0] if changes else cursor
+        # 안전 구간 안의 변경도 전달하되, 모든 페이지에서 다음 동기화의 재시작 지점은 horizon을 넘지 않음
+        horizon = SyncCursor(now - SYNC_SAFETY_WINDOW, 0, UPSERT)
+        settled = min(next_cursor, horizon)
+        restart = max(cursor, settled) if restart is None else min(restart, settled)
+        if not has_more:
+            next_token = encode_sync_token(restart)
+        elif restart < next_cursor:
+            next_token = encode_sync_token(next_cursor, restart)
+        else:
+            next_token = encode_sync_token(next_cursor)
+        
+        return MemoChangesResponse(
+            changes=[change for _, change in changes],
+            next_token=next_token,
+            has_more=has_more
+        )
+    
     def update_memo(
         self, 
         db: Session, 
@@ -96,10 +220,16 @@ class MemoService:
         Raises:
             MemoNotFoundException: 메모를 찾을 수 없는 경우
         """
-        db_memo = self.repository.update_memo(db, memo_id, memo_data)
-        if not db_memo:
-            raise MemoNotFoundException(memo_id)
-        return MemoResponse.model_validate(db_memo)
+        with write_transaction(db):
+            db_memo = self.repository.update_memo(db, memo_id, memo_data)
+            if not db_memo:
+                raise MemoNotFoundException(memo_id)
+            response = MemoResponse.model_validate(db_memo)
+            publish_event(db, "updated", memo_id, response.model_dump(mode="json"))
+        list_page_cache.invalidate()
+        memo_reads.invalidate()
+        cache_fragment(db, response)
+        return response
     
     def delete_memo(self, db: Session, memo_id: int) -> None:
         """
@@ -112,9 +242,16 @@ class MemoService:
         Raises:
             MemoNotFoundException: 메모를 찾을 수 없는 경우
         """
-        success = self.repository.delete_memo(db, memo_id)
-        if not success:
-            raise MemoNotFoundException(memo_id)
+        # 보관 기간이 지난 삭제 기록은 삭제할 때마다 조금씩 정리
+        prune_before = datetime.utcnow() - SYNC_TOMBSTONE_RETENTION
+        with write_transaction(db):
+            success = self.repository.delete_memo(db, memo_id, prune_before)
+            if not success:
+                raise MemoNotFoundException(memo_id)
+            publish_event(db, "deleted", memo_id)
+        list_page_cache.invalidate()
+        memo_reads.invalidate()
+        memo_fragments.discard(memo_id)
 
 
 # Service 인스턴스 (싱글톤 패턴)
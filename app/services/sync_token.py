@@ -0,0 +1,75 @@
+"""
+변경분 동기화 토큰
+keyset 커서 (변경 시각, 메모 ID, 변경 종류)를 URL에 안전한 문자열로 변환
+
+페이지를 이어서 조회하는 토큰에는 다음 동기화를 다시 시작할 커서(재시작 지점)가 함께 들어갈 수 있습니다.
+"""
+import base64
+import binascii
+from datetime import datetime
+from typing import NamedTuple, Optional, Tuple
+
+from app.exceptions.memo_exceptions import InvalidSyncTokenException
+
+
+# 변경 종류 (같은 시각과 ID에서는 upsert가 delete보다 먼저 정렬)
+UPSERT = 0
+DELETE = 1
+
+# 토큰 없이 요청하면 처음부터 동기화
+SYNC_EPOCH = datetime(1970, 1, 1)
+
+
+class SyncCursor(NamedTuple):
+    """변경분 동기화 keyset 커서"""
+    changed_at: datetime
+    memo_id: int
+    kind: int
+
+
+INITIAL_CURSOR = SyncCursor(SYNC_EPOCH, 0, UPSERT)
+
+
+def encode_sync_token(cursor: SyncCursor, restart: Optional[SyncCursor] = None) -> str:
+    """
+    커서를 토큰 문자열로 변환
+    
+    Args:
+        cursor: 이어서 조회할 커서
+        restart: 이어서 조회를 마친 뒤 다음 동기화를 시작할 커서 (cursor와 같으면 생략)
+        
+    Returns:
+        str: 토큰 문자열
+    """
+    cursors = [cursor] if restart is None else [cursor, restart]
+    raw = "|".join(f"{item.changed_at.isoformat()}|{item.memo_id}|{item.kind}" for item in cursors)
+    return base64.urlsafe_b64encode(raw.encode("ascii")).decode("ascii").rstrip("=")
+
+
+def decode_sync_token(token: str) -> Tuple[SyncCursor, Optional[SyncCursor]]:
+    """
+    토큰 문자열을 커서로 변환
+    
+    Args:
+        token: encode_sync_token()으로 만든 토큰
+        
+    Returns:
+        Tuple[SyncCursor, Optional[SyncCursor]]: (이어서 조회할 커서, 재시작 지점 또는 None)
+        
+    Raises:
+        InvalidSyncTokenException: 토큰 형식이 올바르지 않은 경우
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode("ascii")
+        parts = raw.split("|")
+        if len(parts) not in (3, 6):
+            raise ValueError(raw)
+        cursors = [
+            SyncCursor(datetime.fromisoformat(parts[index]), int(parts[index + 1]), int(parts[index + 2]))
+            for index in range(0, len(parts), 3)
+        ]
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise InvalidSyncTokenException(token)
+    if any(cursor.kind not in (UPSERT, DELETE) for cursor in cursors):
+        raise InvalidSyncTokenException(token)
+    return cursors[0], cursors[1] if len(cursors) > 1 else None
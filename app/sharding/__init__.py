@@ -0,0 +1,22 @@
+"""
+샤딩 패키지
+메모를 ID 슬롯 기준으로 여러 데이터베이스에 나누어 저장
+"""
+from app.sharding.shard_map import ShardMap, load_shard_map
+from app.sharding.session import (
+    dispose_shards,
+    init_sharding,
+    primary_engine,
+    request_engines,
+    sharded_sessionmaker,
+)
+
+__all__ = [
+    "ShardMap",
+    "load_shard_map",
+    "dispose_shards",
+    "init_sharding",
+    "primary_engine",
+    "request_engines",
+    "sharded_sessionmaker",
+]
@@ -0,0 +1,185 @@
+"""
+샤드 재분배 도구
+슬롯 단위로 메모, 삭제 기록, ID 발급 행을 다른 샤드로 복사하고 새 SHARD_MAP을 출력
+
+    python -m app.sharding.rebalance --slots 128-255 --to 2
+    python -m app.sharding.rebalance --slots 128-255 --to 2 --delete-source
+
+복사는 ID 순서로 batch 단위 커밋하며 대상 샤드에서 같은 ID를 지운 뒤 다시 넣으므로
+여러 번 실행해도 결과가 같습니다. 옮기는 동안 원본 슬롯에 들어온 쓰기를 놓치지 않으려면
+1) 복사를 한 번 실행해 대부분을 옮기고, 2) 쓰기를 멈춘 상태에서 다시 실행한 뒤,
+3) 출력된 SHARD_MAP으로 배포하고, 4) --delete-source로 원본을 정리합니다.
+"""
+import argparse
+import logging
+import time
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import bindparam, delete, insert, select
+from sqlalchemy.engine import Engine
+
+from app.config import get_settings
+from app.models.memo import Memo, MemoSlotSequence, MemoTombstone
+from app.sharding.shard_map import ShardMap, load_shard_map, parse_slot_ranges
+from app.sharding.session import create_shard_engines
+
+
+logger = logging.getLogger(__name__)
+
+memo_table = Memo.__table__
+tombstone_table = MemoTombstone.__table__
+slot_sequence_table = MemoSlotSequence.__table__
+
+
+def _copy_table(
+    source: Engine,
+    target: Engine,
+    table,
+    key,
+    slot_count: int,
+    slots: Sequence[int],
+    batch_size: int,
+    delete_source: bool,
+    pause: float
+) -> int:
+    """슬롯에 속한 행을 키 순서로 batch 단위 복사 (대상의 같은 키는 교체)"""
+    page = (
+        select(table)
+        .where(key > bindparam("after"), (key % slot_count).in_(bindparam("slots", expanding=True)))
+        .order_by(key)
+        .limit(batch_size)
+    )
+    delete_keys = delete(table).where(key.in_(bindparam("keys", expanding=True)))
+    copied = 0
+    after = 0
+    while True:
+        with source.connect() as connection:
+            rows = [row._asdict() for row in connection.execute(page, {"after": after, "slots": list(slots)})]
+        if not rows:
+            return copied
+        keys = [row[key.name] for row in rows]
+        with target.begin() as connection:
+            connection.execute(delete_keys, {"keys": keys})
+            connection.execute(insert(table), rows)
+        if delete_source:
+            with source.begin() as connection:
+                connection.execute(delete_keys, {"keys": keys})
+        copied += len(rows)
+        after = keys[-1]
+        if pause:
+            # 운영 중인 샤드의 부하를 줄이기 위해 batch 사이에 쉼
+            time.sleep(pause)
+
+
+def _copy_slot_sequences(source: Engine, target: Engine, slots: Sequence[int], delete_source: bool) -> None:
+    """슬롯의 ID 발급 행 복사 (대상에 이미 있으면 더 큰 번호 유지)"""
+    by_slot = select(slot_sequence_table).where(
+        slot_sequence_table.c.slot.in_(bindparam("slots", expanding=True))
+    )
+    delete_slots = delete(slot_sequence_table).where(
+        slot_sequence_table.c.slot.in_(bindparam("slots", expanding=True))
+    )
+    params = {"slots": list(slots)}
+    with source.connect() as connection:
+        next_local = {row.slot: row.next_local for row in connection.execute(by_slot, params)}
+    with target.begin() as connection:
+        for row in connection.execute(by_slot, params):
+            next_local[row.slot] = max(next_local.get(row.slot, 0), row.next_local)
+        connection.execute(delete_slots, params)
+        if next_local:
+            connection.execute(insert(slot_sequence_table), [
+                {"slot": slot, "next_local": value} for slot, value in next_local.items()
+            ])
+    if delete_source:
+        with source.begin() as connection:
+            connection.execute(delete_slots, params)
+
+
+def move_slots(
+    shard_map: ShardMap,
+    engines: Dict[str, Engine],
+    slots: Sequence[int],
+    target: int,
+    batch_size: int = 1000,
+    delete_source: bool = False,
+    pause: float = 0.0
+) -> ShardMap:
+    """
+    슬롯을 대상 샤드로 복사
+    
+    Args:
+        shard_map: 현재 샤드 맵
+        engines: 샤드 ID별 엔진
+        slots: 옮길 슬롯 목록
+        target: 대상 샤드 번호
+        batch_size: 한 번에 복사할 행 수
+        delete_source: 복사한 행을 원본 샤드에서 삭제할지 여부
+        pause: batch 사이 대기 시간 (초)
+        
+    Returns:
+        ShardMap: 슬롯을 옮긴 새 샤드 맵
+        
+    Raises:
+        ValueError: 대상 샤드 번호가 범위를 벗어난 경우
+    """
+    new_map = shard_map.move(slots, target)
+    target_id = str(target)
+    by_source: Dict[str, List[int]] = {}
+    for slot in slots:
+        shard_id = shard_map.shard_for_slot(slot)
+        if shard_id != target_id:
+            by_source.setdefault(shard_id, []).append(slot)
+    
+    for source_id, source_slots in by_source.items():
+        source, destination = engines[source_id], engines[target_id]
+        # ID 발급 행을 먼저 옮겨, 메모 복사 중 실패해도 대상 샤드가 이전 번호를 재사용하지 않음
+        _copy_slot_sequences(source, destination, source_slots, delete_source)
+        memos = _copy_table(
+            source, destination, memo_table, memo_table.c.id, shard_map.slot_count,
+            source_slots, batch_size, delete_source, pause
+        )
+        tombstones = _copy_table(
+            source, destination, tombstone_table, tombstone_table.c.memo_id, shard_map.slot_count,
+            source_slots, batch_size, delete_source, pause
+        )
+        logger.info(
+            "Copied %d slots (%d memos, %d tombstones) from shard %s to shard %s",
+            len(source_slots), memos, tombstones, source_id, target_id
+        )
+    return new_map
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """CLI 인자 파싱"""
+    parser = argparse.ArgumentParser(description="메모 샤드 슬롯 재분배 도구")
+    parser.add_argument("--slots", required=True, help="옮길 슬롯 범위 (예: 128-255 또는 0-3,8)")
+    parser.add_argument("--to", type=int, required=True, help="대상 샤드 번호 (SHARD_DATABASE_URLS 순서)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="한 번에 복사할 행 수")
+    parser.add_argument("--pause", type=float, default=0.0, help="batch 사이 대기 시간 (초)")
+    parser.add_argument("--delete-source", action="store_true", help="복사한 행을 원본 샤드에서 삭제")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    logging.basicConfig(level=logging.INFO)
+    args = parse_args(argv)
+    config = get_settings()
+    shard_map = load_shard_map(config)
+    if shard_map is None:
+        raise SystemExit("SHARD_DATABASE_URLS is not configured")
+    
+    slots = sorted(parse_slot_ranges(",".join(f"{item}=0" for item in args.slots.split(",")), shard_map.slot_count))
+    engines = create_shard_engines(config, shard_map)
+    try:
+        new_map = move_slots(
+            shard_map, engines, slots, args.to,
+            batch_size=args.batch_size, delete_source=args.delete_source, pause=args.pause
+        )
+    finally:
+        for engine in engines.values():
+            engine.dispose()
+    print(f"SHARD_MAP={new_map.to_setting()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+샤드 세션
+샤드별 엔진(커넥션 풀)과 SQLAlchemy ShardedSession 팩토리 생성
+
+요청 세션은 샤드마다 별도의 트랜잭션을 가지며, Repository는 statement마다
+bind_arguments의 shard_id로 실행할 샤드를 지정합니다. 샤드를 지정하지 않은 statement는
+모든 샤드에서 실행됩니다.
+"""
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import bindparam, func, insert, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.horizontal_shard import ShardedSession
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.config import Settings, get_settings
+from app.database import SessionLocal, create_db_engine, get_engine, use_session_factory
+from app.models.memo import Memo, MemoSlotSequence, MemoTombstone
+from app.sharding.shard_map import ShardMap, load_shard_map
+
+
+logger = logging.getLogger(__name__)
+
+memo_table = Memo.__table__
+slot_sequence_table = MemoSlotSequence.__table__
+
+# 현재 프로세스의 샤드 엔진 (init_sharding()에서 생성)
+_engines: Dict[str, Engine] = {}
+
+
+def create_shard_engines(config: Settings, shard_map: ShardMap) -> Dict[str, Engine]:
+    """
+    샤드별 엔진 생성 (각 샤드는 DB_POOL_SIZE 크기의 별도 커넥션 풀 사용)
+    
+    Args:
+        config: 애플리케이션 설정
+        shard_map: 샤드 맵
+        
+    Returns:
+        Dict[str, Engine]: 샤드 ID별 엔진
+    """
+    return {
+        shard_id: create_db_engine(config.model_copy(update={"DATABASE_URL": url}))
+        for shard_id, url in zip(shard_map.shard_ids, shard_map.urls)
+    }
+
+
+def sharded_sessionmaker(shard_map: ShardMap, engines: Dict[str, Engine]) -> sessionmaker:
+    """
+    샤드 맵으로 라우팅하는 ShardedSession 팩토리 생성
+    
+    Args:
+        shard_map: 샤드 맵
+        engines: 샤드 ID별 엔진
+        
+    Returns:
+        sessionmaker: 요청 세션 팩토리 (SessionLocal과 같은 설정)
+    """
+    def shard_chooser(mapper, instance, clause=None, **kw: Any) -> str:
+        # ORM flush 시 객체의 키로 샤드 결정 (조회된 객체는 조회한 샤드를 그대로 사용)
+        if isinstance(instance, MemoSlotSequence):
+            return shard_map.shard_for_slot(instance.slot)
+        if isinstance(instance, MemoTombstone):
+            return shard_map.shard_for_id(instance.memo_id)
+        if isinstance(instance, Memo) and instance.id is not None:
+            return shard_map.shard_for_id(instance.id)
+        raise ValueError(f"Cannot choose a shard for {instance!r}")
+    
+    def identity_chooser(mapper, primary_key, **kw: Any) -> List[str]:
+        if mapper.class_ is MemoSlotSequence:
+            return [shard_map.shard_for_slot(primary_key[0])]
+        return [shard_map.shard_for_id(primary_key[0])]
+    
+    def execute_chooser(orm_context) -> Iterable[str]:
+        return shard_map.shard_ids
+    
+    return sessionmaker(
+        class_=ShardedSession,
+        shard_chooser=shard_chooser,
+        identity_chooser=identity_chooser,
+        execute_chooser=execute_chooser,
+        shards=engines,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False
+    )
+
+
+def ensure_slot_sequences(shard_map: ShardMap, engines: Dict[str, Engine]) -> None:
+    """
+    샤드마다 자신이 가진 슬롯의 ID 발급 행을 생성하고 저장된 메모 ID 뒤로 맞춤
+    
+    슬롯별 최대 번호부터 발급하므로 샤딩 전 단일 DB를 샤드 0으로 그대로 사용할 수 있고,
+    allocate_id()를 거치지 않고 추가된 행(샤딩 없이 실행한 기간, 수동 INSERT 등)이 있으면
+    이미 있는 발급 행도 그 번호 뒤로 올려 ID가 겹치지 않도록 합니다.
+    
+    Args:
+        shard_map: 샤드 맵
+        engines: 샤드 ID별 엔진
+    """
+    slot_count = shard_map.slot_count
+    for shard_id, engine in engines.items():
+        with Session(bind=engine) as session, session.begin():
+            existing = dict(session.execute(
+                select(slot_sequence_table.c.slot, slot_sequence_table.c.next_local)
+            ).all())
+            slot_expr = memo_table.c.id % slot_count
+            max_local = dict(session.execute(
+                select(slot_expr, func.max(memo_table.c.id / slot_count)).group_by(slot_expr)
+            ).all())
+            owned = shard_map.slots_of(shard_id)
+            missing = [slot for slot in owned if slot not in existing]
+            if missing:
+                session.execute(insert(slot_sequence_table), [
+                    {"slot": slot, "next_local": int(max_local.get(slot) or 0)} for slot in missing
+                ])
+                logger.info("Created %d slot sequences on shard %s", len(missing), shard_id)
+            behind = [
+                {"target_slot": slot, "new_local": int(max_local[slot])}
+                for slot in owned
+                if slot in existing and max_local.get(slot) is not None and existing[slot] < max_local[slot]
+            ]
+            if behind:
+                session.execute(
+                    update(slot_sequence_table)
+                    .where(slot_sequence_table.c.slot == bindparam("target_slot"))
+                    .values(next_local=bindparam("new_local")),
+                    behind
+                )
+                logger.warning(
+                    "Advanced %d slot sequences past existing memo ids on shard %s", len(behind), shard_id
+                )
+
+
+def init_sharding(config: Optional[Settings] = None) -> Optional[ShardMap]:
+    """
+    샤딩 설정 적용 (lifespan 시작 시 호출)
+    SHARD_DATABASE_URLS가 있으면 요청 세션을 ShardedSession으로, 메모 Repository를
+    ShardedMemoRepository로 교체
+    
+    Args:
+        config: 애플리케이션 설정 (미지정 시 전역 설정)
+        
+    Returns:
+        Optional[ShardMap]: 샤드 맵 (샤딩하지 않으면 None)
+    """
+    from app.repositories.sharded_memo_repository import ShardedMemoRepository
+    from app.services.memo_service import memo_service
+    
+    global _engines
+    config = config or get_settings()
+    shard_map = load_shard_map(config)
+    if shard_map is None:
+        return None
+    dispose_shards()
+    _engines = create_shard_engines(config, shard_map)
+    ensure_slot_sequences(shard_map, _engines)
+    use_session_factory(sharded_sessionmaker(shard_map, _engines))
+    memo_service.repository = ShardedMemoRepository(shard_map)
+    return shard_map
+
+
+def request_engines() -> List[Engine]:
+    """
+    요청 세션이 사용하는 엔진 목록 (풀 워밍업 대상)
+    
+    Returns:
+        List[Engine]: 샤딩 중이면 샤드 엔진, 아니면 전역 엔진
+    """
+    if _engines:
+        return list(_engines.values())
+    return [get_engine()]
+
+
+def primary_engine() -> Engine:
+    """
+    샤드와 무관한 작업(이벤트 브로커 등)에 사용할 엔진
+    
+    Returns:
+        Engine: 샤딩 중이면 첫 번째 샤드(샤딩 전 단일 DB), 아니면 전역 엔진
+    """
+    if _engines:
+        return next(iter(_engines.values()))
+    return get_engine()
+
+
+def dispose_shards() -> None:
+    """
+    샤드 엔진의 커넥션 풀 정리 (lifespan 종료 시 호출)
+    init_sharding()이 교체한 요청 세션 팩토리와 메모 Repository도 단일 DB용으로 되돌림
+    """
+    from app.repositories.memo_repository import memo_repository
+    from app.services.memo_service import memo_service
+    
+    global _engines
+    if not _engines:
+        return
+    for engine in _engines.values():
+        engine.dispose()
+    _engines = {}
+    use_session_factory(SessionLocal)
+    memo_service.repository = memo_repository
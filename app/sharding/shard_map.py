@@ -0,0 +1,140 @@
+"""
+샤드 맵
+메모 ID → 슬롯 → 샤드(데이터베이스) 매핑
+
+메모 ID는 `slot_local * SHARD_SLOTS + slot`으로 발급되므로 ID만으로 슬롯을 알 수 있고,
+슬롯이 어느 샤드에 있는지는 SHARD_MAP으로 정합니다. 슬롯 수는 샤드 수보다 충분히 크게
+고정해 두고, 샤드를 늘릴 때는 일부 슬롯을 새 샤드로 옮긴 뒤(app.sharding.rebalance)
+SHARD_MAP만 바꾸므로 메모 ID는 바뀌지 않습니다.
+"""
+import random
+from typing import Dict, List, Optional, Sequence
+
+from app.config import Settings
+
+
+def parse_slot_ranges(value: str, slot_count: int) -> Dict[int, int]:
+    """
+    SHARD_MAP 설정 파싱
+    
+    Args:
+        value: "슬롯 범위=샤드 번호" 목록 (예: "0-127=0,128-255=1")
+        slot_count: 전체 슬롯 수
+        
+    Returns:
+        Dict[int, int]: 슬롯별 샤드 번호 (지정하지 않은 슬롯은 포함하지 않음)
+        
+    Raises:
+        ValueError: 형식이 잘못되었거나 슬롯 번호가 범위를 벗어난 경우
+    """
+    assignments: Dict[int, int] = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        slots, _, shard = item.partition("=")
+        start, _, end = slots.strip().partition("-")
+        first, last = int(start), int(end or start)
+        if not 0 <= first <= last < slot_count:
+            raise ValueError(f"Invalid slot range: {slots.strip()}")
+        for slot in range(first, last + 1):
+            assignments[slot] = int(shard)
+    return assignments
+
+
+def format_slot_ranges(assignments: Sequence[int]) -> str:
+    """슬롯별 샤드 번호를 SHARD_MAP 형식으로 변환 (연속된 슬롯은 범위로 묶음)"""
+    ranges: List[str] = []
+    start = 0
+    for slot in range(1, len(assignments) + 1):
+        if slot == len(assignments) or assignments[slot] != assignments[start]:
+            span = f"{start}-{slot - 1}" if slot - 1 > start else f"{start}"
+            ranges.append(f"{span}={assignments[start]}")
+            start = slot
+    return ",".join(ranges)
+
+
+class ShardMap:
+    """
+    메모 ID/슬롯과 샤드의 매핑
+    
+    Args:
+        urls: 샤드별 데이터베이스 URL (샤드 ID는 "0", "1", ... 순서)
+        slot_count: ID에 포함되는 슬롯 수 (운영 중에는 바꾸지 않음)
+        assignments: 슬롯별 샤드 번호 (미지정 시 slot % 샤드 수)
+        
+    Raises:
+        ValueError: 샤드 번호가 범위를 벗어난 경우
+    """
+    
+    def __init__(self, urls: List[str], slot_count: int, assignments: Optional[Dict[int, int]] = None):
+        self.urls = urls
+        self.slot_count = slot_count
+        self.assignments = [slot % len(urls) for slot in range(slot_count)]
+        for slot, shard in (assignments or {}).items():
+            if not 0 <= shard < len(urls):
+                raise ValueError(f"Slot {slot} is assigned to unknown shard {shard}")
+            self.assignments[slot] = shard
+    
+    @property
+    def shard_ids(self) -> List[str]:
+        """샤드 ID 목록"""
+        return [str(index) for index in range(len(self.urls))]
+    
+    def slot_for_id(self, memo_id: int) -> int:
+        """메모 ID의 슬롯"""
+        return memo_id % self.slot_count
+    
+    def shard_for_slot(self, slot: int) -> str:
+        """슬롯이 있는 샤드 ID"""
+        return str(self.assignments[slot])
+    
+    def shard_for_id(self, memo_id: int) -> str:
+        """메모가 있는 샤드 ID"""
+        return self.shard_for_slot(self.slot_for_id(memo_id))
+    
+    def slots_of(self, shard_id: str) -> List[int]:
+        """샤드에 있는 슬롯 목록"""
+        return [slot for slot, shard in enumerate(self.assignments) if str(shard) == shard_id]
+    
+    def choose_slot(self) -> int:
+        """새 메모를 저장할 슬롯 (슬롯 전체에 고르게 분산)"""
+        return random.randrange(self.slot_count)
+    
+    def make_id(self, slot_local: int, slot: int) -> int:
+        """슬롯 내 번호와 슬롯으로 메모 ID 생성"""
+        return slot_local * self.slot_count + slot
+    
+    def move(self, slots: Sequence[int], shard: int) -> "ShardMap":
+        """
+        일부 슬롯을 다른 샤드로 옮긴 새 샤드 맵
+        
+        Args:
+            slots: 옮길 슬롯 목록
+            shard: 대상 샤드 번호
+            
+        Returns:
+            ShardMap: 변경된 샤드 맵
+        """
+        assignments = dict(enumerate(self.assignments))
+        assignments.update({slot: shard for slot in slots})
+        return ShardMap(self.urls, self.slot_count, assignments)
+    
+    def to_setting(self) -> str:
+        """SHARD_MAP 설정 값"""
+        return format_slot_ranges(self.assignments)
+
+
+def load_shard_map(config: Settings) -> Optional[ShardMap]:
+    """
+    설정으로 샤드 맵 생성
+    
+    Args:
+        config: 애플리케이션 설정
+        
+    Returns:
+        Optional[ShardMap]: 샤드 맵 (SHARD_DATABASE_URLS가 비어 있으면 None, 샤딩하지 않음)
+    """
+    urls = [url.strip() for url in config.SHARD_DATABASE_URLS.split(",") if url.strip()]
+    if not urls:
+        return None
+    return ShardMap(urls, config.SHARD_SLOTS, parse_slot_ranges(config.SHARD_MAP, config.SHARD_SLOTS))
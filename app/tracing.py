@@ -0,0 +1,480 @@
+"""
+분산 추적 (OpenTelemetry 호환)
+API, 서비스, Repository 계층과 SQL statement마다 span을 만들어 OTLP/HTTP(JSON)로 내보냄
+
+요청의 trace는 TracingMiddleware가 W3C `traceparent` 헤더를 읽어 이어 가거나 새로 시작하며,
+샘플링 여부는 trace 시작 시 한 번 결정합니다(head sampling: 상위 서비스의 결정을 따르고,
+없으면 trace ID 기준 TRACE_SAMPLE_RATE 비율). 샘플링되지 않은 요청은 span을 만들지 않고
+trace ID만 전파하므로 계층별 계측 비용은 컨텍스트 변수 조회 한 번입니다.
+
+종료된 span은 큐에 넣기만 하고 백그라운드 스레드가 batch로 묶어 내보내므로 수집기가
+느리거나 응답하지 않아도 요청은 지연되지 않습니다(큐가 가득 차면 trace_spans_dropped).
+"""
+import inspect
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import urllib.request
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from app.config import Settings, get_settings
+from app.metrics import metrics
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# span 종류 (OTLP SpanKind)
+INTERNAL = 1
+SERVER = 2
+CLIENT = 3
+
+# span 상태 (OTLP StatusCode)
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+# SQL span에 기록할 statement 최대 길이
+MAX_STATEMENT_LENGTH = 1000
+
+
+class Span:
+    """
+    추적 구간 하나
+    
+    Args:
+        name: span 이름
+        trace_id: trace ID (32자리 16진수)
+        parent_id: 상위 span ID (없으면 None)
+        sampled: 샘플링 여부 (False이면 기록하지 않고 trace ID 전파에만 사용)
+        kind: span 종류
+        attributes: span 속성
+    """
+    
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "sampled", "kind",
+        "attributes", "status", "status_message", "start_ns", "end_ns",
+    )
+    
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str],
+        sampled: bool,
+        kind: int = INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.sampled = sampled
+        self.kind = kind
+        self.attributes = attributes or {}
+        self.status = STATUS_UNSET
+        self.status_message = ""
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+    
+    @property
+    def traceparent(self) -> str:
+        """W3C traceparent 헤더 값"""
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+    
+    def set_error(self, exc: BaseException) -> None:
+        """예외로 실패한 span으로 표시"""
+        self.status = STATUS_ERROR
+        self.status_message = f"{type(exc).__name__}: {exc}"
+    
+    def end(self) -> None:
+        """span 종료 후 내보내기 대기열에 추가"""
+        self.end_ns = time.time_ns()
+        if _processor is not None:
+            _processor.on_end(self)
+
+
+# 현재 컨텍스트(요청)의 span (DB 작업용 스레드로도 복사되어 하위 span의 부모가 됨)
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def parse_traceparent(value: str) -> Optional[tuple]:
+    """
+    W3C traceparent 헤더 파싱
+    
+    Args:
+        value: "00-<trace-id>-<parent-id>-<flags>"
+        
+    Returns:
+        Optional[tuple]: (trace ID, 상위 span ID, 샘플링 여부), 형식이 잘못되었으면 None
+    """
+    parts = value.strip().split("-")
+    if len(parts) < 4 or len(parts[0]) != 2 or parts[0] == "ff":
+        return None
+    _, trace_id, parent_id, flags = parts[:4]
+    try:
+        if len(trace_id) != 32 or len(parent_id) != 16 or len(flags) != 2:
+            return None
+        if int(trace_id, 16) == 0 or int(parent_id, 16) == 0:
+            return None
+        sampled = bool(int(flags, 16) & 1)
+    except ValueError:
+        return None
+    return trace_id.lower(), parent_id.lower(), sampled
+
+
+def start_trace(name: str, traceparent: Optional[str], attributes: Dict[str, Any]) -> Span:
+    """
+    요청의 루트(SERVER) span 생성 및 샘플링 결정
+    상위 서비스가 보낸 traceparent가 있으면 같은 trace와 샘플링 결정을 이어 감
+    
+    Args:
+        name: span 이름
+        traceparent: 요청의 traceparent 헤더 값
+        attributes: span 속성
+        
+    Returns:
+        Span: 루트 span (activate()로 현재 컨텍스트에 설정)
+    """
+    parent = parse_traceparent(traceparent) if traceparent else None
+    if parent is not None:
+        trace_id, parent_id, sampled = parent
+    else:
+        trace_id, parent_id = os.urandom(16).hex(), None
+        # trace ID 하위 64비트 기준 비율 샘플링 (같은 trace는 어느 서비스에서든 같은 결정)
+        sampled = _processor is not None and int(trace_id[16:], 16) < _sample_bound
+    return Span(name, trace_id, parent_id, sampled, SERVER, attributes)
+
+
+def activate(span: Span) -> Token:
+    """span을 현재 컨텍스트의 span으로 설정 (deactivate()에 토큰 전달)"""
+    return _current_span.set(span)
+
+
+def deactivate(token: Token) -> None:
+    """activate() 이전 상태로 복원"""
+    _current_span.reset(token)
+
+
+def current_span() -> Optional[Span]:
+    """현재 컨텍스트의 span (요청 밖이면 None)"""
+    return _current_span.get()
+
+
+def start_child_span(name: str, kind: int = INTERNAL, attributes: Optional[Dict[str, Any]] = None) -> Optional[Span]:
+    """
+    현재 span의 하위 span 생성 (현재 컨텍스트는 바꾸지 않음)
+    
+    Returns:
+        Optional[Span]: 하위 span (샘플링되지 않은 요청이면 None)
+    """
+    parent = _current_span.get()
+    if parent is None or not parent.sampled:
+        return None
+    return Span(name, parent.trace_id, parent.span_id, True, kind, attributes)
+
+
+@contextmanager
+def span(name: str, kind: int = INTERNAL, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Optional[Span]]:
+    """
+    하위 span 구간 (샘플링되지 않은 요청이면 아무것도 기록하지 않음)
+    
+    Yields:
+        Optional[Span]: 생성된 span 또는 None
+    """
+    child = start_child_span(name, kind, attributes)
+    if child is None:
+        yield None
+        return
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as exc:
+        child.set_error(exc)
+        raise
+    finally:
+        _current_span.reset(token)
+        child.end()
+
+
+def traced(name: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    함수 호출을 span으로 기록하는 데코레이터
+    
+    Args:
+        name: span 이름
+    """
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            parent = _current_span.get()
+            if parent is None or not parent.sampled:
+                return func(*args, **kwargs)
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def trace_methods(cls: type) -> type:
+    """
+    클래스의 공개 메서드를 "클래스명.메서드명" span으로 기록하는 클래스 데코레이터
+    (서비스/Repository 계층 계측에 사용)
+    """
+    for attr, value in list(vars(cls).items()):
+        if inspect.isfunction(value) and not attr.startswith("_"):
+            setattr(cls, attr, traced(f"{cls.__name__}.{attr}")(value))
+    return cls
+
+
+def start_sql_span(statement: str, dialect: str) -> Optional[Span]:
+    """
+    SQL statement span 생성 (엔진 이벤트에서 호출, 종료는 호출자가 end())
+    
+    Returns:
+        Optional[Span]: SQL span (샘플링되지 않은 요청이면 None)
+    """
+    parent = _current_span.get()
+    if parent is None or not parent.sampled:
+        return None
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+    return Span(operation, parent.trace_id, parent.span_id, True, CLIENT, {
+        "db.system": dialect,
+        "db.operation": operation,
+        "db.statement": statement[:MAX_STATEMENT_LENGTH],
+    })
+
+
+class SpanExporter(ABC):
+    """span 내보내기 인터페이스"""
+    
+    @abstractmethod
+    def export(self, spans: List[Span]) -> None:
+        """span batch 내보내기 (내보내기 스레드에서 호출)"""
+    
+    def shutdown(self) -> None:
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    """내보낸 span을 메모리에 보관 (테스트용, TRACE_EXPORTER=memory)"""
+    
+    def __init__(self):
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+    
+    def export(self, spans: List[Span]) -> None:
+        with self._lock:
+            self._spans.extend(spans)
+    
+    def get_finished_spans(self) -> List[Span]:
+        """내보낸 span 목록"""
+        with self._lock:
+            return list(self._spans)
+    
+    def clear(self) -> None:
+        """보관한 span 삭제"""
+        with self._lock:
+            self._spans.clear()
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(spans: List[Span], service_name: str) -> Dict[str, Any]:
+    """span 목록을 OTLP/JSON ExportTraceServiceRequest로 변환"""
+    return {"resourceSpans": [{
+        "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]},
+        "scopeSpans": [{
+            "scope": {"name": __name__},
+            "spans": [{
+                "traceId": item.trace_id,
+                "spanId": item.span_id,
+                "parentSpanId": item.parent_id or "",
+                "name": item.name,
+                "kind": item.kind,
+                "startTimeUnixNano": str(item.start_ns),
+                "endTimeUnixNano": str(item.end_ns),
+                "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in item.attributes.items()],
+                "status": {"code": item.status, "message": item.status_message},
+            } for item in spans],
+        }],
+    }]}
+
+
+class OTLPHttpExporter(SpanExporter):
+    """
+    OTLP/HTTP(JSON)로 수집기(OpenTelemetry Collector, Jaeger, Tempo 등)에 전송
+    
+    Args:
+        endpoint: 수집기 주소 (예: http://localhost:4318, /v1/traces는 자동으로 붙임)
+        service_name: resource의 service.name
+        timeout: 전송 타임아웃 (초)
+    """
+    
+    def __init__(self, endpoint: str, service_name: str, timeout: float = 10.0):
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.service_name = service_name
+        self.timeout = timeout
+    
+    def export(self, spans: List[Span]) -> None:
+        body = json.dumps(to_otlp(spans, self.service_name)).encode()
+        request = urllib.request.Request(
+            self.url, data=body, headers={"Content-Type": "application/json"}, method="POST"
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+
+class BatchSpanProcessor:
+    """
+    종료된 span을 큐에 모아 백그라운드 스레드에서 batch로 내보냄
+    
+    Args:
+        exporter: span 내보내기 구현
+        max_queue_size: 큐 크기 (가득 차면 span을 버림)
+        batch_size: 한 번에 내보낼 최대 span 수
+        interval: batch가 차지 않아도 내보내는 주기 (초)
+    """
+    
+    def __init__(self, exporter: SpanExporter, max_queue_size: int = 2048, batch_size: int = 512, interval: float = 5.0):
+        self.exporter = exporter
+        self.batch_size = batch_size
+        self.interval = interval
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+        self._thread.start()
+    
+    def on_end(self, span: Span) -> None:
+        """종료된 span을 내보내기 대기열에 추가 (블로킹하지 않음)"""
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            metrics.increment("trace_spans_dropped")
+    
+    def force_flush(self, timeout: float = 5.0) -> bool:
+        """
+        대기 중인 span을 모두 내보낼 때까지 대기
+        큐가 가득 차 요청을 넣지 못하는 시간도 timeout에 포함됩니다.
+        
+        Returns:
+            bool: 제한 시간 안에 내보냈는지 여부
+        """
+        deadline = time.monotonic() + timeout
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(max(0.0, deadline - time.monotonic()))
+    
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """남은 span을 내보낸 뒤 스레드 종료 (timeout 안에 끝나지 않으면 스레드를 기다리지 않음)"""
+        deadline = time.monotonic() + timeout
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            logger.warning("Span queue stayed full for %.1fs, pending spans were not exported", timeout)
+        else:
+            self._thread.join(max(0.0, deadline - time.monotonic()))
+        self.exporter.shutdown()
+    
+    def _run(self) -> None:
+        batch: List[Span] = []
+        deadline = time.monotonic() + self.interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = False
+            if isinstance(item, Span):
+                batch.append(item)
+                if len(batch) < self.batch_size:
+                    continue
+            # batch가 찼거나, 주기가 되었거나, flush/종료 요청
+            self._export(batch)
+            batch = []
+            deadline = time.monotonic() + self.interval
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is None:
+                return
+    
+    def _export(self, batch: List[Span]) -> None:
+        if not batch:
+            return
+        try:
+            self.exporter.export(batch)
+            metrics.increment("trace_spans_exported", len(batch))
+        except Exception:
+            metrics.increment("trace_export_failures")
+            logger.warning("Span export failed", exc_info=True)
+
+
+# 현재 프로세스의 span 처리기 (init_tracing()에서 생성, None이면 추적 비활성화)
+_processor: Optional[BatchSpanProcessor] = None
+# trace ID 하위 64비트가 이 값보다 작으면 샘플링
+_sample_bound = 0
+
+# TRACE_EXPORTER=memory일 때 사용하는 exporter (테스트에서 span 확인)
+memory_exporter = InMemorySpanExporter()
+
+
+def init_tracing(config: Optional[Settings] = None) -> Optional[BatchSpanProcessor]:
+    """
+    추적 설정 적용 (lifespan 시작 시 호출)
+    
+    Args:
+        config: 애플리케이션 설정 (미지정 시 전역 설정)
+        
+    Returns:
+        Optional[BatchSpanProcessor]: span 처리기 (TRACING_ENABLED가 아니면 None)
+    """
+    global _processor, _sample_bound
+    config = config or get_settings()
+    shutdown_tracing()
+    if not config.TRACING_ENABLED:
+        return None
+    if config.TRACE_EXPORTER == "memory":
+        exporter: SpanExporter = memory_exporter
+    else:
+        exporter = OTLPHttpExporter(config.TRACE_EXPORTER_ENDPOINT, config.TRACE_SERVICE_NAME)
+    _sample_bound = int(min(max(config.TRACE_SAMPLE_RATE, 0.0), 1.0) * (1 << 64))
+    _processor = BatchSpanProcessor(
+        exporter,
+        max_queue_size=config.TRACE_QUEUE_SIZE,
+        batch_size=config.TRACE_BATCH_SIZE,
+        interval=config.TRACE_EXPORT_INTERVAL
+    )
+    return _processor
+
+
+def force_flush(timeout: float = 5.0) -> bool:
+    """대기 중인 span을 즉시 내보냄 (추적 비활성화 시 True)"""
+    return _processor.force_flush(timeout) if _processor is not None else True
+
+
+def shutdown_tracing() -> None:
+    """남은 span을 내보내고 span 처리기 종료 (lifespan 종료 시 호출)"""
+    global _processor
+    if _processor is not None:
+        _processor.shutdown()
+        _processor = None
+
+
+metrics.register_gauge("trace_queue_depth", lambda: _processor._queue.qsize() if _processor else 0)
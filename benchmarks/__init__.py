@@ -0,0 +1,4 @@
+"""
+벤치마크 패키지
+네트워크 없이 애플리케이션 자체 성능을 측정하는 도구 모음
+"""
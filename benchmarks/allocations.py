@@ -0,0 +1,204 @@
+"""
+요청당 메모리 할당 측정 도구
+엔드포인트와 limit별로 요청 하나가 할당하는 최대 메모리와 요청 후 남는 메모리를 측정
+
+tracemalloc으로 ASGI 애플리케이션을 직접 호출하는 동안의 최대 메모리(ORM/Core 행,
+MemoResponse 모델, JSON 본문 포함)와 응답을 버리고 GC를 실행한 뒤에도 유지되는 메모리를
+측정합니다. 목록/조각 캐시는 끄고 측정하므로 매 요청이 DB 조회부터 직렬화까지 모두 거칩니다.
+tests/integration/allocation_budgets.json의 예산을 넘으면 테스트가 실패하며,
+의도한 변경으로 할당이 늘었다면 --write-budgets로 예산을 갱신합니다.
+
+사용 예:
+    python -m benchmarks.allocations
+    python -m benchmarks.allocations --limits 10,100 --endpoints list,lookup
+    python -m benchmarks.allocations --write-budgets tests/integration/allocation_budgets.json
+"""
+import argparse
+import asyncio
+import gc
+import json
+import math
+import tracemalloc
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
+
+import httpx
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.deps import get_db_session
+from app.config import Settings
+from app.database import Base, create_db_engine
+from app.main import create_app
+from benchmarks.seed import generate_rows, load_sqlite, parse_distribution
+
+
+# 측정 대상 요청: limit과 메모 ID 목록을 받아 (메서드, 경로, JSON 본문) 반환
+Request = Tuple[str, str, Optional[Dict[str, Any]]]
+ENDPOINTS: Dict[str, Callable[[int, List[int]], Request]] = {
+    "list": lambda limit, ids: ("GET", f"/api/v1/memos?limit={limit}", None),
+    "lookup": lambda limit, ids: ("POST", "/api/v1/memos/lookup", {"ids": ids[:limit]}),
+    "changes": lambda limit, ids: ("GET", f"/api/v1/memos/changes?limit={limit}", None),
+}
+LIMITS = (10, 100, 1000)
+
+# 측정 전 같은 요청을 반복하는 횟수 (statement 컴파일, 지연 import 등 첫 요청 비용 제외)
+WARMUP_REQUESTS = 3
+
+
+def measurement_settings() -> Settings:
+    """측정용 설정 (캐시, INFO 로그, 워밍업 비활성화)"""
+    return Settings(
+        DATABASE_URL="sqlite://",
+        DEBUG=False,
+        DB_WARMUP_ENABLED=False,
+        LIST_CACHE_MAX_ENTRIES=0,
+        MEMO_FRAGMENT_CACHE_SIZE=0,
+        ACCESS_LOG_ENABLED=False,
+        LOG_LEVEL="WARNING"
+    )
+
+
+async def measure_request(client: httpx.AsyncClient, request: Request) -> Dict[str, float]:
+    """
+    요청 하나의 메모리 할당 측정
+
+    Args:
+        client: 애플리케이션에 연결된 클라이언트
+        request: (메서드, 경로, JSON 본문)
+
+    Returns:
+        Dict[str, float]: 최대 할당(peak_kib)과 요청 후 유지된 메모리(retained_kib)
+    """
+    method, url, body = request
+    for _ in range(WARMUP_REQUESTS):
+        (await client.request(method, url, json=body)).raise_for_status()
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        response = await client.request(method, url, json=body)
+        _, peak = tracemalloc.get_traced_memory()
+        response.raise_for_status()
+        del response
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "peak_kib": (peak - before) / 1024,
+        "retained_kib": max(0, after - before) / 1024,
+    }
+
+
+async def measure_endpoints(
+    endpoints: List[str],
+    limits: List[int],
+    rows: int = 2000
+) -> Dict[str, Dict[str, float]]:
+    """
+    엔드포인트와 limit 조합별 메모리 할당 측정
+
+    Args:
+        endpoints: ENDPOINTS의 이름 목록
+        limits: 측정할 limit 목록
+        rows: 미리 적재할 메모 수 (가장 큰 limit 이상)
+
+    Returns:
+        Dict[str, Dict[str, float]]: "엔드포인트@limit"별 측정 결과
+    """
+    config = measurement_settings()
+    engine = create_db_engine(config)
+    Base.metadata.create_all(bind=engine)
+    # 행 크기가 일정해야 측정값이 안정적이므로 고정 길이로 생성
+    load_sqlite(engine, generate_rows(
+        rows, parse_distribution("fixed:40"), parse_distribution("fixed:300"), null_content=0.0
+    ), batch_size=rows, progress=lambda count: None)
+    session_factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    def get_session() -> Generator[Session, None, None]:
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = create_app(config)
+    app.dependency_overrides[get_db_session] = get_session
+    ids = list(range(1, rows + 1))
+    results: Dict[str, Dict[str, float]] = {}
+    try:
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                for name in endpoints:
+                    for limit in limits:
+                        results[f"{name}@{limit}"] = await measure_request(client, ENDPOINTS[name](limit, ids))
+    finally:
+        engine.dispose()
+    return results
+
+
+def to_budgets(results: Dict[str, Dict[str, float]], headroom: float, minimum_kib: float) -> Dict[str, Dict[str, float]]:
+    """측정 결과에 여유분을 더해 예산으로 변환 (KiB 단위로 올림)"""
+    return {
+        key: {metric: float(math.ceil(max(value * (1 + headroom), minimum_kib))) for metric, value in stats.items()}
+        for key, stats in results.items()
+    }
+
+
+def over_budget(results: Dict[str, Dict[str, float]], budgets: Dict[str, Dict[str, float]]) -> List[str]:
+    """예산을 넘은 측정값 설명 목록 (예산이 없는 조합은 건너뜀)"""
+    failures = []
+    for key, stats in results.items():
+        for metric, value in stats.items():
+            budget = budgets.get(key, {}).get(metric)
+            if budget is not None and value > budget:
+                failures.append(f"{key} {metric}: {value:.1f} KiB > budget {budget:.1f} KiB")
+    return failures
+
+
+def load_budgets(path: str) -> Dict[str, Dict[str, float]]:
+    """예산 JSON 파일 읽기"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """CLI 인자 파싱"""
+    parser = argparse.ArgumentParser(description="요청당 메모리 할당 측정")
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS), help="측정할 엔드포인트 (쉼표 구분)")
+    parser.add_argument("--limits", default=",".join(map(str, LIMITS)), help="측정할 limit (쉼표 구분)")
+    parser.add_argument("--rows", type=int, default=2000, help="적재할 메모 수")
+    parser.add_argument("--budgets", default=None, help="비교할 예산 JSON (초과 시 종료 코드 1)")
+    parser.add_argument("--write-budgets", default=None, help="측정 결과로 예산 JSON 저장")
+    parser.add_argument("--headroom", type=float, default=0.2, help="예산 저장 시 측정값에 더할 여유 비율")
+    parser.add_argument("--minimum-kib", type=float, default=16.0, help="예산 저장 시 최소 예산 (KiB)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    endpoints = [name.strip() for name in args.endpoints.split(",") if name.strip()]
+    limits = [int(limit) for limit in args.limits.split(",")]
+    results = asyncio.run(measure_endpoints(endpoints, limits, args.rows))
+
+    budgets = load_budgets(args.budgets) if args.budgets else {}
+    print(f"{'request':<16} {'peak KiB':>10} {'retained KiB':>13} {'budget':>17}")
+    for key, stats in results.items():
+        budget = budgets.get(key)
+        limit = f"{budget['peak_kib']:.0f} / {budget['retained_kib']:.0f}" if budget else "-"
+        print(f"{key:<16} {stats['peak_kib']:>10.1f} {stats['retained_kib']:>13.1f} {limit:>17}")
+
+    if args.write_budgets:
+        with open(args.write_budgets, "w", encoding="utf-8") as f:
+            json.dump(to_budgets(results, args.headroom, args.minimum_kib), f, indent=2)
+            f.write("\n")
+    failures = over_budget(results, budgets)
+    if failures:
+        print("\n".join(failures))
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,398 @@
+"""
+In-process ASGI 부하 생성기
+네트워크 없이 app.main.app을 ASGI transport로 직접 호출하여 서버 자체 처리량 측정
+
+locustfile.py의 MemoUser / HeavyLoadUser 작업 비율을 그대로 재현하되
+wait_time 없이 고정 동시성(closed-loop) 또는 고정 도착률(open-loop)로 실행합니다.
+
+사용 예:
+    python -m benchmarks.asgi_load --scenario memo --concurrency 32 --duration 30
+    python -m benchmarks.asgi_load --scenario heavy --rate 500 --duration 30
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from benchmarks.stats import format_table, summarize
+
+
+@dataclass
+class ScenarioState:
+    """시나리오 실행 중 공유되는 상태 (locustfile의 memo_ids 클래스 속성과 동일)"""
+    memo_ids: List[int] = field(default_factory=list)
+
+
+@dataclass
+class RunResult:
+    """부하 실행 결과"""
+    elapsed_seconds: float
+    latencies_ms: Dict[str, List[float]]
+    failures: Dict[str, int]
+    dropped: int = 0
+
+
+# 작업 함수: (client, state) -> (이름, 성공 여부)
+Task = Callable[[httpx.AsyncClient, ScenarioState], Awaitable[Tuple[str, bool]]]
+
+
+async def get_memos_list(client: httpx.AsyncClient, state: ScenarioState) -> Tuple[str, bool]:
+    """메모 목록 조회 (MemoUser, 가중치: 3)"""
+    skip = random.randint(0, 20)
+    limit = random.randint(5, 20)
+    response = await client.get(f"/api/v1/memos?skip={skip}&limit={limit}")
+    return "/api/v1/memos (목록 조회)", response.status_code == 200
+
+
+async def get_memo_detail(client: httpx.AsyncClient, state: ScenarioState) -> Tuple[str, bool]:
+    """특정 메모 조회 (MemoUser, 가중치: 2)"""
+    name = "/api/v1/memos/{id} (상세 조회)"
+    if not state.memo_ids:
+        return name, True
+    memo_id = random.choice(state.memo_ids)
+    response = await client.get(f"/api/v1/memos/{memo_id}")
+    if response.status_code == 404:
+        # 삭제된 메모일 수 있음
+        _discard(state, memo_id)
+        return name, True
+    return name, response.status_code == 200
+
+
+async def create_memo(client: httpx.AsyncClient, state: ScenarioState) -> Tuple[str, bool]:
+    """메모 생성 (MemoUser, 가중치: 2)"""
+    response = await client.post(
+        "/api/v1/memos",
+        json={
+            "title": f"부하테스트 메모 {random.randint(1, 10000)}",
+            "content": f"부하 테스트 중 생성된 메모입니다. {random.randint(1, 10000)}"
+        }
+    )
+    if response.status_code == 201:
+        state.memo_ids.append(response.json()["id"])
+        return "/api/v1/memos (생성)", True
+    return "/api/v1/memos (생성)", False
+
+
+async def update_memo(client: httpx.AsyncClient, state: ScenarioState) -> Tuple[str, bool]:
+    """메모 수정 (MemoUser, 가중치: 1)"""
+    name = "/api/v1/memos/{id} (수정)"
+    if not state.memo_ids:
+        return name, True
+    memo_id = random.choice(state.memo_ids)
+    response = await client.put(
+        f"/api/v1/memos/{memo_id}",
+        json={
+            "title": f"수정된 메모 {random.randint(1, 10000)}",
+            "content": f"부하 테스트 중 수정된 내용 {random.randint(1, 10000)}"
+        }
+    )
+    if response.status_code == 404:
+        _discard(state, memo_id)
+        return name, True
+    return name, response.status_code == 200
+
+
+async def delete_memo(client: httpx.AsyncClient, state: ScenarioState) -> Tuple[str, bool]:
+    """메모 삭제 (MemoUser, 가중치: 1)"""
+    name = "/api/v1/memos/{id} (삭제)"
+    if len(state.memo_ids) <= 3:  # 최소 3개는 유지
+        return name, True
+    memo_id = random.choice(state.memo_ids)
+    response = await client.delete(f"/api/v1/memos/{memo_id}")
+    _discard(state, memo_id)
+    return name, response.status_code in (204, 404)
+
+
+async def health_check(client: httpx.AsyncClient, state: ScenarioState) -> Tuple[str, bool]:
+    """헬스 체크 (MemoUser, 가중치: 1)"""
+    response = await client.get("/")
+    return "/ (헬스 체크)", response.status_code == 200
+
+
+async def create_multiple_memos(client: httpx.AsyncClient, state: ScenarioState) -> Tuple[str, bool]:
+    """연속으로 메모 생성 (HeavyLoadUser, 가중치: 5)"""
+    ok = True
+    for _ in range(3):
+        response = await client.post(
+            "/api/v1/memos",
+            json={
+                "title": f"대량 생성 메모 {random.randint(1, 100000)}",
+                "content": "대량 테스트 내용 " * 50  # 긴 내용
+            }
+        )
+        if response.status_code == 201:
+            state.memo_ids.append(response.json()["id"])
+        else:
+            ok = False
+    return "/api/v1/memos (대량 생성)", ok
+
+
+async def get_large_list(client: httpx.AsyncClient, state: ScenarioState) -> Tuple[str, bool]:
+    """큰 페이지 사이즈로 목록 조회 (HeavyLoadUser, 가중치: 3)"""
+    response = await client.get("/api/v1/memos?skip=0&limit=100")
+    return "/api/v1/memos (대량 조회)", response.status_code == 200
+
+
+# 시나리오별 (작업, 가중치) 목록 - locustfile.py와 동일한 비율
+SCENARIOS: Dict[str, List[Tuple[Task, int]]] = {
+    "memo": [
+        (get_memos_list, 3),
+        (get_memo_detail, 2),
+        (create_memo, 2),
+        (update_memo, 1),
+        (delete_memo, 1),
+        (health_check, 1),
+    ],
+    "heavy": [
+        (create_multiple_memos, 5),
+        (get_large_list, 3),
+    ],
+}
+SCENARIOS["mixed"] = SCENARIOS["memo"] + SCENARIOS["heavy"]
+
+
+def _discard(state: ScenarioState, memo_id: int) -> None:
+    """공유 상태에서 메모 ID 제거 (동시 실행 중 이미 제거된 경우 무시)"""
+    try:
+        state.memo_ids.remove(memo_id)
+    except ValueError:
+        pass
+
+
+class TaskPicker:
+    """가중치에 따라 작업을 무작위 선택"""
+
+    def __init__(self, tasks: List[Tuple[Task, int]]):
+        self.tasks = [task for task, _ in tasks]
+        self.weights = [weight for _, weight in tasks]
+
+    def pick(self) -> Task:
+        return random.choices(self.tasks, weights=self.weights, k=1)[0]
+
+
+class LoadRecorder:
+    """작업별 지연 시간 및 실패 횟수 기록"""
+
+    def __init__(self):
+        self.latencies_ms: Dict[str, List[float]] = {}
+        self.failures: Dict[str, int] = {}
+
+    def record(self, name: str, ok: bool, latency_ms: float) -> None:
+        self.latencies_ms.setdefault(name, []).append(latency_ms)
+        if not ok:
+            self.failures[name] = self.failures.get(name, 0) + 1
+
+
+async def _timed(
+    task: Task,
+    client: httpx.AsyncClient,
+    state: ScenarioState,
+    recorder: LoadRecorder,
+    started_at: float
+) -> None:
+    """작업 실행 후 started_at 기준 지연 시간 기록"""
+    try:
+        name, ok = await task(client, state)
+    except Exception:
+        name, ok = task.__name__, False
+    recorder.record(name, ok, (time.perf_counter() - started_at) * 1000)
+
+
+async def run_closed_loop(
+    client: httpx.AsyncClient,
+    tasks: List[Tuple[Task, int]],
+    concurrency: int,
+    duration: float,
+    state: Optional[ScenarioState] = None
+) -> RunResult:
+    """
+    고정 동시성(closed-loop) 부하 실행
+    각 가상 사용자가 대기 시간 없이 작업을 연속 실행
+
+    Args:
+        client: ASGI transport를 사용하는 HTTP 클라이언트
+        tasks: (작업, 가중치) 목록
+        concurrency: 동시 가상 사용자 수
+        duration: 실행 시간 (초)
+        state: 시나리오 공유 상태
+
+    Returns:
+        RunResult: 실행 결과
+    """
+    state = state or ScenarioState()
+    picker = TaskPicker(tasks)
+    recorder = LoadRecorder()
+    deadline = time.perf_counter() + duration
+
+    async def user() -> None:
+        while time.perf_counter() < deadline:
+            await _timed(picker.pick(), client, state, recorder, time.perf_counter())
+
+    started = time.perf_counter()
+    await asyncio.gather(*(user() for _ in range(concurrency)))
+    return RunResult(
+        elapsed_seconds=time.perf_counter() - started,
+        latencies_ms=recorder.latencies_ms,
+        failures=recorder.failures
+    )
+
+
+async def run_open_loop(
+    client: httpx.AsyncClient,
+    tasks: List[Tuple[Task, int]],
+    rate: float,
+    duration: float,
+    max_in_flight: int = 10000,
+    state: Optional[ScenarioState] = None
+) -> RunResult:
+    """
+    고정 도착률(open-loop) 부하 실행
+    포아송 도착 간격으로 요청을 발생시키며, 지연 시간은 예정된 도착 시각부터 측정
+    (서버가 느려져도 요청 발생이 늦춰지지 않으므로 coordinated omission이 없음)
+
+    Args:
+        client: ASGI transport를 사용하는 HTTP 클라이언트
+        tasks: (작업, 가중치) 목록
+        rate: 초당 도착 요청 수
+        duration: 실행 시간 (초)
+        max_in_flight: 동시에 처리 중인 요청 상한 (초과 시 요청 드롭)
+        state: 시나리오 공유 상태
+
+    Returns:
+        RunResult: 실행 결과 (dropped: 상한 초과로 버려진 요청 수)
+    """
+    state = state or ScenarioState()
+    picker = TaskPicker(tasks)
+    recorder = LoadRecorder()
+    in_flight: set = set()
+    dropped = 0
+
+    started = time.perf_counter()
+    next_arrival = started
+    deadline = started + duration
+    while next_arrival < deadline:
+        delay = next_arrival - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if len(in_flight) >= max_in_flight:
+            dropped += 1
+        else:
+            job = asyncio.ensure_future(
+                _timed(picker.pick(), client, state, recorder, next_arrival)
+            )
+            in_flight.add(job)
+            job.add_done_callback(in_flight.discard)
+        next_arrival += random.expovariate(rate)
+
+    if in_flight:
+        await asyncio.gather(*in_flight)
+    return RunResult(
+        elapsed_seconds=time.perf_counter() - started,
+        latencies_ms=recorder.latencies_ms,
+        failures=recorder.failures,
+        dropped=dropped
+    )
+
+
+async def seed_memos(client: httpx.AsyncClient, state: ScenarioState, count: int) -> None:
+    """부하 실행 전 초기 메모 생성 (locustfile의 on_start와 동일)"""
+    for i in range(count):
+        response = await client.post(
+            "/api/v1/memos",
+            json={
+                "title": f"초기 메모 {i+1}",
+                "content": f"부하 테스트를 위한 초기 메모 내용 {i+1}"
+            }
+        )
+        if response.status_code == 201:
+            state.memo_ids.append(response.json()["id"])
+
+
+def build_report(result: RunResult) -> Dict[str, Dict[str, float]]:
+    """
+    작업별 및 전체 요약 생성
+
+    Returns:
+        Dict[str, Dict[str, float]]: 이름별 요약 (전체는 'TOTAL')
+    """
+    report = {}
+    all_latencies: List[float] = []
+    for name, latencies in sorted(result.latencies_ms.items()):
+        report[name] = summarize(latencies, result.elapsed_seconds)
+        report[name]["failures"] = result.failures.get(name, 0)
+        all_latencies.extend(latencies)
+    report["TOTAL"] = summarize(all_latencies, result.elapsed_seconds)
+    report["TOTAL"]["failures"] = sum(result.failures.values())
+    report["TOTAL"]["dropped"] = result.dropped
+    return report
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    """CLI 인자에 따라 부하 실행"""
+    from app.main import app
+
+    tasks = SCENARIOS[args.scenario]
+    state = ScenarioState()
+    transport = httpx.ASGITransport(app=app)
+
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            await seed_memos(client, state, args.seed)
+
+            if args.warmup > 0:
+                await run_closed_loop(client, tasks, args.concurrency, args.warmup, state)
+
+            if args.rate:
+                result = await run_open_loop(
+                    client, tasks, args.rate, args.duration,
+                    max_in_flight=args.max_in_flight, state=state
+                )
+            else:
+                result = await run_closed_loop(
+                    client, tasks, args.concurrency, args.duration, state
+                )
+    return build_report(result)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """CLI 인자 파싱"""
+    parser = argparse.ArgumentParser(description="In-process ASGI 부하 생성기")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="memo",
+                        help="재현할 작업 비율 (memo: MemoUser, heavy: HeavyLoadUser)")
+    parser.add_argument("--concurrency", type=int, default=16,
+                        help="closed-loop 동시 가상 사용자 수")
+    parser.add_argument("--rate", type=float, default=None,
+                        help="open-loop 초당 도착 요청 수 (지정 시 open-loop 실행)")
+    parser.add_argument("--duration", type=float, default=10.0, help="측정 시간 (초)")
+    parser.add_argument("--warmup", type=float, default=2.0, help="측정 전 워밍업 시간 (초)")
+    parser.add_argument("--seed", type=int, default=3, help="초기 생성 메모 수")
+    parser.add_argument("--max-in-flight", type=int, default=10000,
+                        help="open-loop 동시 처리 요청 상한")
+    parser.add_argument("--create-tables", action="store_true",
+                        help="실행 전 테이블 생성 (SQLite 등 빈 DB용)")
+    parser.add_argument("--json", dest="json_path", default=None,
+                        help="결과를 JSON 파일로 저장")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    if args.create_tables:
+        from app.database import init_db
+        from app.models import Memo  # noqa: F401
+        init_db()
+
+    report = asyncio.run(run(args))
+    print(format_table(report))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+DB 장애 주입 부하 측정 도구
+DB 지연/지터/연결 오류/체크아웃 지연을 주입한 상태에서 고정 도착률 부하를 걸어
+엔드포인트별 지연 시간 꼬리(p99)와 deadline 초과(504), 부하 차단(503), 오류 응답 수를 측정
+
+테스트는 StaticPool을 쓰는 인메모리 SQLite라 풀 고갈이 재현되지 않으므로 임시 SQLite 파일과
+실제 커넥션 풀(QueuePool)을 사용합니다. 장애는 app.faults의 DB_FAULTS 형식으로 지정합니다.
+
+사용 예:
+    python -m benchmarks.faults --faults latency=0.02,jitter=0.03 --rate 200 --duration 10
+    python -m benchmarks.faults --faults latency=0.05 --pool-size 2 --pool-timeout 0.2 --threads 16
+    python -m benchmarks.faults --faults error_rate=0.05,checkout_delay=0.01 --request-timeout 0.5
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+from collections import Counter
+from typing import Dict, Generator, List, Optional, Tuple
+
+import httpx
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.deps import get_db_session
+from app.config import Settings
+from app.database import Base, create_db_engine, drain_pool, release_session
+from app.main import create_app
+from benchmarks.asgi_load import RunResult, ScenarioState, Task, run_open_loop
+from benchmarks.seed import generate_rows, load_sqlite, parse_distribution
+from benchmarks.stats import format_table, summarize
+
+
+def status_outcome(status_code: int) -> str:
+    """응답 상태 코드 분류 (ok, timeout: 504, shed: 503, error: 그 외 5xx)"""
+    if status_code == 504:
+        return "timeout"
+    if status_code == 503:
+        return "shed"
+    if status_code >= 500:
+        return "error"
+    return "ok"
+
+
+class OutcomeCounter:
+    """작업별 응답 분류 집계"""
+    
+    def __init__(self):
+        self.counts: Dict[str, Counter] = {}
+    
+    def record(self, name: str, status_code: int) -> bool:
+        """응답을 집계하고 성공 여부 반환"""
+        outcome = status_outcome(status_code)
+        self.counts.setdefault(name, Counter())[outcome] += 1
+        return outcome == "ok"
+
+
+def build_tasks(outcomes: OutcomeCounter, rows: int) -> List[Tuple[Task, int]]:
+    """목록/상세/생성 작업 (가중치 3:2:1, 응답 분류를 outcomes에 기록)"""
+    
+    async def list_memos(client: httpx.AsyncClient, state: ScenarioState) -> Tuple[str, bool]:
+        response = await client.get(f"/api/v1/memos?skip={random.randint(0, 100)}&limit=20")
+        return "list", outcomes.record("list", response.status_code)
+    
+    async def get_memo(client: httpx.AsyncClient, state: ScenarioState) -> Tuple[str, bool]:
+        response = await client.get(f"/api/v1/memos/{random.randint(1, rows)}")
+        return "detail", outcomes.record("detail", response.status_code)
+    
+    async def create_memo(client: httpx.AsyncClient, state: ScenarioState) -> Tuple[str, bool]:
+        response = await client.post("/api/v1/memos", json={"title": "장애 주입 메모", "content": "x" * 200})
+        return "create", outcomes.record("create", response.status_code)
+    
+    return [(list_memos, 3), (get_memo, 2), (create_memo, 1)]
+
+
+def build_report(result: RunResult, outcomes: OutcomeCounter) -> Dict[str, Dict[str, float]]:
+    """작업별 지연 시간 요약과 응답 분류 수"""
+    report: Dict[str, Dict[str, float]] = {}
+    total: Counter = Counter()
+    all_latencies: List[float] = []
+    for name, latencies in sorted(result.latencies_ms.items()):
+        counts = outcomes.counts.get(name, Counter())
+        report[name] = {**summarize(latencies, result.elapsed_seconds), **{
+            outcome: counts[outcome] for outcome in ("ok", "timeout", "shed", "error")
+        }}
+        total.update(counts)
+        all_latencies.extend(latencies)
+    report["TOTAL"] = {**summarize(all_latencies, result.elapsed_seconds), **{
+        outcome: total[outcome] for outcome in ("ok", "timeout", "shed", "error")
+    }}
+    report["TOTAL"]["dropped"] = result.dropped
+    return report
+
+
+async def run_with_faults(
+    faults: str,
+    rate: float,
+    duration: float,
+    rows: int = 1000,
+    pool_size: int = 5,
+    max_overflow: int = 0,
+    pool_timeout: float = 1.0,
+    threads: Optional[int] = None,
+    request_timeout: float = 0.0,
+    seed: int = 0
+) -> Dict[str, Dict[str, float]]:
+    """
+    장애를 주입한 애플리케이션에 고정 도착률 부하 실행
+    
+    Args:
+        faults: DB_FAULTS 형식의 장애 설정
+        rate: 초당 도착 요청 수
+        duration: 실행 시간 (초)
+        rows: 미리 적재할 메모 수
+        pool_size: 커넥션 풀 크기
+        max_overflow: 풀 초과 허용 커넥션 수
+        pool_timeout: 커넥션 대기 시간 (초과 시 503)
+        threads: DB 작업용 스레드 수 (None이면 풀 최대 크기, 크게 하면 풀 대기가 발생)
+        request_timeout: 요청 deadline (초, 0이면 없음, 초과 시 504)
+        seed: 요청 선택 및 장애 발생 난수 시드
+        
+    Returns:
+        Dict[str, Dict[str, float]]: 작업별 지연 시간 요약과 ok/timeout/shed/error 수
+    """
+    random.seed(seed)
+    with tempfile.TemporaryDirectory() as directory:
+        config = Settings(
+            DATABASE_URL=f"sqlite:///{os.path.join(directory, 'faults.db')}",
+            DEBUG=False,
+            DB_WARMUP_ENABLED=False,
+            DB_POOL_SIZE=pool_size,
+            DB_MAX_OVERFLOW=max_overflow,
+            DB_POOL_TIMEOUT=pool_timeout,
+            DB_THREADPOOL_SIZE=threads,
+            REQUEST_TIMEOUT=request_timeout,
+            LIST_CACHE_MAX_ENTRIES=0,
+            MEMO_FRAGMENT_CACHE_SIZE=0,
+            ACCESS_LOG_ENABLED=False,
+            LOG_LEVEL="WARNING"
+        )
+        # 데이터 적재는 장애 없이 수행
+        seed_engine = create_db_engine(config)
+        Base.metadata.create_all(bind=seed_engine)
+        load_sqlite(seed_engine, generate_rows(
+            rows, parse_distribution("fixed:40"), parse_distribution("fixed:300"), seed=seed
+        ), batch_size=rows, progress=lambda count: None)
+        seed_engine.dispose()
+        
+        config = config.model_copy(update={"DB_FAULTS": faults})
+        engine = create_db_engine(config)
+        session_factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+        
+        def get_session() -> Generator[Session, None, None]:
+            db = session_factory()
+            try:
+                yield db
+            finally:
+                release_session(db)
+        
+        app = create_app(config)
+        app.dependency_overrides[get_db_session] = get_session
+        outcomes = OutcomeCounter()
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        try:
+            async with app.router.lifespan_context(app):
+                async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+                    result = await run_open_loop(client, build_tasks(outcomes, rows), rate, duration)
+        finally:
+            # deadline 초과로 응답이 먼저 나간 요청의 DB 스레드가 커넥션을 반납할 때까지 대기
+            drain_pool(engine, 5.0)
+            engine.dispose()
+    return build_report(result, outcomes)
+
+
+def format_outcomes(report: Dict[str, Dict[str, float]]) -> str:
+    """작업별 응답 분류 표"""
+    lines = [f"{'name':<8}{'ok':>8}{'timeout':>10}{'shed':>8}{'error':>8}"]
+    for name, row in report.items():
+        lines.append(f"{name:<8}{row['ok']:>8.0f}{row['timeout']:>10.0f}{row['shed']:>8.0f}{row['error']:>8.0f}")
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """CLI 인자 파싱"""
+    parser = argparse.ArgumentParser(description="DB 장애 주입 부하 측정")
+    parser.add_argument("--faults", default="latency=0.01,jitter=0.02",
+                        help="주입할 장애 (DB_FAULTS 형식, 빈 문자열이면 장애 없음)")
+    parser.add_argument("--rate", type=float, default=200.0, help="초당 도착 요청 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="측정 시간 (초)")
+    parser.add_argument("--rows", type=int, default=1000, help="적재할 메모 수")
+    parser.add_argument("--pool-size", type=int, default=5, help="커넥션 풀 크기")
+    parser.add_argument("--max-overflow", type=int, default=0, help="풀 초과 허용 커넥션 수")
+    parser.add_argument("--pool-timeout", type=float, default=1.0, help="커넥션 대기 시간 (초)")
+    parser.add_argument("--threads", type=int, default=None,
+                        help="DB 작업용 스레드 수 (풀보다 크게 하면 풀 대기/503 발생)")
+    parser.add_argument("--request-timeout", type=float, default=0.0, help="요청 deadline (초, 0이면 없음)")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--json", dest="json_path", default=None, help="결과를 JSON 파일로 저장")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    report = asyncio.run(run_with_faults(
+        args.faults,
+        args.rate,
+        args.duration,
+        rows=args.rows,
+        pool_size=args.pool_size,
+        max_overflow=args.max_overflow,
+        pool_timeout=args.pool_timeout,
+        threads=args.threads,
+        request_timeout=args.request_timeout,
+        seed=args.seed
+    ))
+    print(f"faults: {args.faults or '(none)'}")
+    print(format_table(report))
+    print()
+    print(format_outcomes(report))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+목록 조회 메모리 측정 도구
+ORM 객체 경로(get_memos)와 읽기 전용 행 경로(get_memo_rows)의 페이지당 메모리 비교
+
+tracemalloc으로 한 페이지를 조회하여 MemoResponse 목록으로 변환하는 동안의
+최대 메모리, 조회 결과를 보관하는 동안 유지되는 메모리와 할당 블록 수를 측정합니다.
+
+사용 예:
+    python -m benchmarks.memory
+    python -m benchmarks.memory --rows 5000 --page-size 500
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.config import Settings
+from app.database import Base, create_db_engine
+from app.models.memo import Memo
+from app.repositories.memo_repository import memo_repository
+from app.schemas.memo import MemoResponse
+
+
+def orm_page(db: Session, limit: int) -> Tuple[list, List[MemoResponse]]:
+    """기존 경로: ORM 객체를 identity map에 적재한 뒤 응답으로 복사"""
+    memos, _ = memo_repository.get_memos(db, 0, limit)
+    return memos, [MemoResponse.model_validate(memo) for memo in memos]
+
+
+def row_page(db: Session, limit: int) -> Tuple[list, List[MemoResponse]]:
+    """빠른 경로: Core 행을 MemoRow로 변환한 뒤 응답 생성"""
+    rows, _ = memo_repository.get_memo_rows(db, 0, limit)
+    return rows, [MemoResponse.model_validate(row) for row in rows]
+
+
+def measure(
+    session_factory: Callable[[], Session],
+    page: Callable[[Session, int], Tuple[list, List[MemoResponse]]],
+    page_size: int,
+    runs: int
+) -> Dict[str, float]:
+    """
+    한 페이지 조회의 메모리와 시간 측정
+
+    Args:
+        session_factory: 측정마다 새 세션을 만드는 함수 (요청 단위 세션과 동일)
+        page: 페이지 조회 함수
+        page_size: 페이지 크기
+        runs: 시간 측정 반복 횟수
+
+    Returns:
+        Dict[str, float]: 페이지당 최대/유지 메모리(KiB), 행당 유지 블록 수, 페이지당 시간(ms)
+    """
+    # 첫 컴파일 및 지연 import 비용 제외
+    with session_factory() as db:
+        page(db, page_size)
+
+    gc.collect()
+    with session_factory() as db:
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        result = page(db, page_size)
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        retained = after.compare_to(before, "filename")
+        rows = len(result[1])
+        del result
+
+    retained_bytes = sum(stat.size_diff for stat in retained)
+    retained_blocks = sum(stat.count_diff for stat in retained)
+
+    started = time.perf_counter()
+    for _ in range(runs):
+        with session_factory() as db:
+            page(db, page_size)
+    elapsed_ms = (time.perf_counter() - started) / runs * 1000
+
+    return {
+        "peak_kib": peak / 1024,
+        "retained_kib": retained_bytes / 1024,
+        "blocks_per_row": retained_blocks / rows if rows else 0.0,
+        "page_ms": elapsed_ms,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="목록 조회 메모리 비교")
+    parser.add_argument("--rows", type=int, default=2000, help="적재할 메모 수")
+    parser.add_argument("--page-size", type=int, default=100, help="페이지 크기")
+    parser.add_argument("--runs", type=int, default=50, help="시간 측정 반복 횟수")
+    args = parser.parse_args(argv)
+
+    engine = create_db_engine(Settings(DATABASE_URL="sqlite://", DEBUG=False))
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    with session_factory() as db:
+        db.add_all(Memo(title=f"memo {i}", content="x" * 200) for i in range(args.rows))
+        db.commit()
+
+    results = {
+        "orm": measure(session_factory, orm_page, args.page_size, args.runs),
+        "row": measure(session_factory, row_page, args.page_size, args.runs),
+    }
+    engine.dispose()
+
+    print(f"page size {args.page_size}")
+    print(f"{'metric':<16} {'orm':>12} {'row':>12} {'change':>9}")
+    for metric in ("peak_kib", "retained_kib", "blocks_per_row", "page_ms"):
+        before, after = results["orm"][metric], results["row"][metric]
+        change = (after - before) / before * 100 if before else 0.0
+        print(f"{metric:<16} {before:>12.1f} {after:>12.1f} {change:>+8.1f}%")
+
+
+if __name__ == "__main__":
+    main()
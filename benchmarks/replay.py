@@ -0,0 +1,298 @@
+"""
+트래픽 재현 도구
+TrafficCaptureMiddleware가 기록한 JSONL 파일을 대상 서버에 다시 보내고
+라우트별 처리 시간 백분위수와 오류 수를 기준(baseline)과 비교
+
+사용 예:
+    # 원래 속도로 재현 후 캡처 당시 지연 시간과 비교
+    python -m benchmarks.replay traffic.jsonl --target http://localhost:8000
+
+    # 10배 속도로 in-process 재현, 결과를 기준으로 저장
+    python -m benchmarks.replay traffic.jsonl --in-process --speed 10 --save-baseline baseline.json
+
+    # 저장된 기준과 비교
+    python -m benchmarks.replay traffic.jsonl --in-process --baseline baseline.json
+"""
+import argparse
+import asyncio
+import json
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+from benchmarks.stats import PERCENTILES, percentile, percentile_label, summarize
+
+
+# 재현 대상 요청 본문을 만들 때 사용하는 메서드
+BODY_METHODS = {"POST", "PUT", "PATCH"}
+
+
+def load_capture(path: str) -> List[Dict[str, Any]]:
+    """
+    캡처 파일 로드 (시각 순 정렬)
+
+    Args:
+        path: JSONL 캡처 파일 경로
+
+    Returns:
+        List[Dict[str, Any]]: 캡처 레코드 목록
+    """
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                records.append(json.loads(line))
+    records.sort(key=lambda record: record["ts"])
+    return records
+
+
+def route_key(record: Dict[str, Any]) -> str:
+    """라우트별 집계 키 (예: 'GET /api/v1/memos/{memo_id}')"""
+    return f"{record['method']} {record.get('route') or record['path']}"
+
+
+def build_memo_body(body_size: int) -> Dict[str, str]:
+    """
+    캡처된 본문 크기와 비슷한 크기의 메모 생성/수정 본문
+    (캡처에는 개인정보 보호를 위해 본문 내용을 저장하지 않음)
+    """
+    title = "replay"
+    # {"title":"replay","content":""} 의 고정 오버헤드를 제외한 크기만큼 채움
+    content_size = max(0, min(body_size - 32, 5000))
+    return {"title": title, "content": "x" * content_size}
+
+
+def build_lookup_body(body_size: int) -> Dict[str, List[int]]:
+    """캡처된 본문 크기와 비슷한 수의 ID로 여러 메모 조회 본문 생성 (ID 하나에 약 7바이트)"""
+    count = max(1, min((body_size - 10) // 7, 1000))
+    return {"ids": list(range(1, count + 1))}
+
+
+def build_batch_body(body_size: int) -> Dict[str, Any]:
+    """
+    캡처된 본문 크기와 비슷한 수의 작업으로 배치 본문 생성 (작업 하나에 약 30바이트)
+    작업 종류는 캡처되지 않으므로 데이터를 바꾸지 않는 조회(get)만 사용
+    """
+    count = max(1, min((body_size - 30) // 30, 100))
+    return {"atomic": False, "operations": [{"op": "get", "memo_id": i} for i in range(1, count + 1)]}
+
+
+# 라우트별 요청 본문 생성 함수 (본문 형식을 모르는 라우트는 재현하지 않고 skipped로 집계)
+BODY_BUILDERS: Dict[str, Callable[[int], Any]] = {
+    "POST /api/v1/memos": build_memo_body,
+    "PUT /api/v1/memos/{memo_id}": build_memo_body,
+    "POST /api/v1/memos/lookup": build_lookup_body,
+    "POST /api/v1/batch": build_batch_body,
+}
+
+
+@dataclass
+class RouteResult:
+    """
+    라우트별 재현 결과
+
+    Attributes:
+        service_ms: 요청을 실제로 보낸 시점부터 응답까지의 시간 (밀리초, 응답을 받은 요청만)
+        lag_ms: 예정 시각보다 늦게 보낸 시간 (밀리초, 재현기 자체의 지연)
+        statuses: 응답 상태 코드별 수
+        exceptions: 응답을 받지 못한 요청 수 (연결 오류, 타임아웃 등)
+        skipped: 본문 형식을 몰라 재현하지 않은 요청 수
+    """
+    service_ms: List[float] = field(default_factory=list)
+    lag_ms: List[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    exceptions: int = 0
+    skipped: int = 0
+
+    @property
+    def errors(self) -> int:
+        """실패한 요청 수 (5xx 응답 + 응답을 받지 못한 요청)"""
+        return sum(count for status, count in self.statuses.items() if status >= 500) + self.exceptions
+
+
+async def replay(
+    client: httpx.AsyncClient,
+    records: List[Dict[str, Any]],
+    speed: float = 1.0
+) -> Dict[str, RouteResult]:
+    """
+    캡처 레코드를 원래 간격(speed 배속)으로 재현
+
+    Args:
+        client: 대상 서버 HTTP 클라이언트
+        records: 캡처 레코드 목록 (시각 순)
+        speed: 재현 배속 (2.0이면 원래보다 2배 빠르게 요청 발생)
+
+    Returns:
+        Dict[str, RouteResult]: 라우트별 처리 시간, 상태 코드 및 오류 수
+    """
+    results: Dict[str, RouteResult] = {}
+    if not records:
+        return results
+
+    first_ts = records[0]["ts"]
+    started = time.perf_counter()
+
+    async def send(record: Dict[str, Any], scheduled: float) -> None:
+        key = route_key(record)
+        result = results.setdefault(key, RouteResult())
+        body = None
+        body_size = record.get("body_size", 0)
+        if record["method"] in BODY_METHODS and body_size > 0:
+            builder = BODY_BUILDERS.get(key)
+            if builder is None:
+                result.skipped += 1
+                return
+            body = builder(body_size)
+        sent = time.perf_counter()
+        result.lag_ms.append(max(0.0, sent - scheduled) * 1000)
+        try:
+            response = await client.request(
+                record["method"],
+                record["path"],
+                params=record.get("query") or None,
+                json=body
+            )
+        except Exception:
+            result.exceptions += 1
+            return
+        result.service_ms.append((time.perf_counter() - sent) * 1000)
+        result.statuses[response.status_code] += 1
+
+    jobs = []
+    for record in records:
+        scheduled = started + (record["ts"] - first_ts) / speed
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        jobs.append(asyncio.ensure_future(send(record, scheduled)))
+    await asyncio.gather(*jobs)
+    return results
+
+
+def summarize_result(result: RouteResult, elapsed_seconds: float) -> Dict[str, float]:
+    """라우트 하나의 처리 시간 요약, 요청/오류 수 및 재현 지연 p99"""
+    summary = summarize(result.service_ms, elapsed_seconds)
+    requests = sum(result.statuses.values()) + result.exceptions
+    summary["requests"] = requests
+    summary["skipped"] = result.skipped
+    summary["errors"] = result.errors
+    summary["error_rate"] = result.errors / requests if requests else 0.0
+    summary["lag_p99_ms"] = percentile(sorted(result.lag_ms), 99.0)
+    return summary
+
+
+def summarize_routes(results: Dict[str, RouteResult], elapsed_seconds: float) -> Dict[str, Dict[str, float]]:
+    """라우트별 재현 결과 요약"""
+    return {
+        key: summarize_result(result, elapsed_seconds)
+        for key, result in sorted(results.items())
+    }
+
+
+def captured_baseline(records: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """캡처 당시 처리 시간과 응답 상태 코드를 기준으로 사용"""
+    results: Dict[str, RouteResult] = {}
+    for record in records:
+        result = results.setdefault(route_key(record), RouteResult())
+        result.service_ms.append(record["duration_ms"])
+        result.statuses[record.get("status", 200)] += 1
+    elapsed = records[-1]["ts"] - records[0]["ts"] if records else 0.0
+    return summarize_routes(results, elapsed)
+
+
+def compare(
+    current: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]]
+) -> str:
+    """
+    현재 결과와 기준의 백분위수 및 오류 수 비교표 생성
+
+    두 결과 모두 요청을 보낸(받은) 시점부터 응답까지의 처리 시간이므로 재현기가 요청을 늦게 보낸
+    시간(lag)은 비교에 포함하지 않고 따로 표시합니다. 원격 대상은 네트워크 왕복 시간만큼 더 깁니다.
+
+    Returns:
+        str: 라우트별 오류 수와 백분위수 (기준 -> 현재, 변화율)
+    """
+    labels = [f"{percentile_label(q)}_ms" for q in PERCENTILES]
+    lines = []
+    for key, summary in current.items():
+        lines.append(
+            f"{key} (n={summary['requests']:.0f}, errors={summary['errors']:.0f}, "
+            f"skipped={summary['skipped']:.0f}, lag_p99={summary['lag_p99_ms']:.2f}ms)"
+        )
+        base = baseline.get(key)
+        if base is not None:
+            lines.append(
+                f"    {'errors':<10} {base.get('errors', 0):>10.0f} -> {summary['errors']:>10.0f}  "
+                f"({base.get('error_rate', 0.0):.1%} -> {summary['error_rate']:.1%})"
+            )
+        if not summary["count"]:
+            lines.append("    (응답 없음)")
+            continue
+        for label in labels:
+            if base is None:
+                lines.append(f"    {label:<10} {summary[label]:>10.2f}  (기준 없음)")
+                continue
+            before, after = base[label], summary[label]
+            change = (after - before) / before * 100 if before else 0.0
+            lines.append(f"    {label:<10} {before:>10.2f} -> {after:>10.2f}  ({change:+.1f}%)")
+    return "\n".join(lines)
+
+
+async def run(args: argparse.Namespace, records: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """CLI 인자에 따라 재현 실행"""
+    if args.in_process:
+        from app.main import app
+        transport = httpx.ASGITransport(app=app)
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(transport=transport, base_url="http://replay") as client:
+                started = time.perf_counter()
+                results = await replay(client, records, args.speed)
+    else:
+        async with httpx.AsyncClient(base_url=args.target, timeout=args.timeout) as client:
+            started = time.perf_counter()
+            results = await replay(client, records, args.speed)
+    return summarize_routes(results, time.perf_counter() - started)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """CLI 인자 파싱"""
+    parser = argparse.ArgumentParser(description="캡처된 트래픽 재현 도구")
+    parser.add_argument("capture", help="TrafficCaptureMiddleware가 기록한 JSONL 파일")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--target", default="http://localhost:8000", help="대상 서버 주소")
+    target.add_argument("--in-process", action="store_true",
+                        help="네트워크 없이 app.main.app에 직접 재현")
+    parser.add_argument("--speed", type=float, default=1.0, help="재현 배속")
+    parser.add_argument("--timeout", type=float, default=30.0, help="요청 타임아웃 (초)")
+    parser.add_argument("--baseline", default=None,
+                        help="비교할 기준 JSON (미지정 시 캡처 당시 처리 시간과 비교)")
+    parser.add_argument("--save-baseline", default=None, help="이번 결과를 기준 JSON으로 저장")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    records = load_capture(args.capture)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    else:
+        baseline = captured_baseline(records)
+
+    current = asyncio.run(run(args, records))
+    print(compare(current, baseline))
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
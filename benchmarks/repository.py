@@ -0,0 +1,148 @@
+"""
+Repository 호출 오버헤드 측정 도구
+레거시 `db.query()` 방식과 미리 구성한 2.0 statement 방식의 CRUD 호출당 시간 비교
+
+두 방식 모두 같은 SQLite 인메모리 DB를 사용하므로 차이는 쿼리 구성/컴파일,
+commit 후 재조회 등 Python 측 오버헤드에서 발생합니다.
+
+사용 예:
+    python -m benchmarks.repository
+    python -m benchmarks.repository --iterations 5000
+"""
+import argparse
+import time
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.config import Settings
+from app.database import Base, create_db_engine
+from app.metrics import metrics
+from app.models.memo import Memo
+from app.repositories.memo_repository import memo_repository
+from app.schemas.memo import MemoCreate, MemoUpdate
+
+
+class LegacyMemoRepository:
+    """비교 기준: 호출마다 Query 객체를 새로 만드는 1.x 스타일 구현"""
+
+    def create_memo(self, db: Session, memo_data: MemoCreate) -> Memo:
+        db_memo = Memo(title=memo_data.title, content=memo_data.content)
+        db.add(db_memo)
+        db.commit()
+        db.refresh(db_memo)
+        return db_memo
+
+    def get_memo_by_id(self, db: Session, memo_id: int) -> Optional[Memo]:
+        return db.query(Memo).filter(Memo.id == memo_id).first()
+
+    def get_memos(self, db: Session, skip: int = 0, limit: int = 100):
+        total = db.query(func.count(Memo.id)).scalar()
+        memos = (
+            db.query(Memo)
+            .order_by(Memo.updated_at.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        return memos, total
+
+    def update_memo(self, db: Session, memo_id: int, memo_data: MemoUpdate) -> Optional[Memo]:
+        db_memo = self.get_memo_by_id(db, memo_id)
+        if not db_memo:
+            return None
+        for field, value in memo_data.model_dump(exclude_unset=True).items():
+            setattr(db_memo, field, value)
+        db.commit()
+        db.refresh(db_memo)
+        return db_memo
+
+    def delete_memo(self, db: Session, memo_id: int) -> bool:
+        db_memo = self.get_memo_by_id(db, memo_id)
+        if not db_memo:
+            return False
+        db.delete(db_memo)
+        db.commit()
+        return True
+
+
+def measure(repository, session: Session, iterations: int) -> Dict[str, float]:
+    """
+    CRUD 작업별 호출당 평균 시간 측정
+
+    Args:
+        repository: 측정할 Repository 구현
+        session: 데이터베이스 세션
+        iterations: 작업별 반복 횟수
+
+    Returns:
+        Dict[str, float]: 작업별 호출당 시간 (마이크로초)
+    """
+    ids: List[int] = []
+
+    def create(i: int) -> None:
+        memo = repository.create_memo(session, MemoCreate(title=f"bench {i}", content="x" * 100))
+        ids.append(memo.id)
+
+    operations: Dict[str, Callable[[int], object]] = {
+        "create": create,
+        "get_by_id": lambda i: repository.get_memo_by_id(session, ids[i % len(ids)]),
+        "list": lambda i: repository.get_memos(session, skip=i % 50, limit=20),
+        "update": lambda i: repository.update_memo(
+            session, ids[i % len(ids)], MemoUpdate(title=f"updated {i}")
+        ),
+        "delete": lambda i: repository.delete_memo(session, ids[i]),
+    }
+
+    results = {}
+    for name, operation in operations.items():
+        started = time.perf_counter()
+        for i in range(iterations):
+            operation(i)
+        results[name] = (time.perf_counter() - started) / iterations * 1_000_000
+    return results
+
+
+def run(iterations: int) -> Dict[str, Dict[str, float]]:
+    """두 구현을 각자의 세션 설정으로 측정"""
+    config = Settings(DATABASE_URL="sqlite://", DEBUG=False)
+    implementations = {
+        # 기존 SessionLocal 설정 (commit 시 객체 만료)
+        "legacy": (LegacyMemoRepository(), {"expire_on_commit": True}),
+        "statement": (memo_repository, {"expire_on_commit": False}),
+    }
+
+    results = {}
+    for label, (repository, session_options) in implementations.items():
+        engine = create_db_engine(config)
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine, autoflush=False, **session_options)()
+        try:
+            # 첫 컴파일 비용은 제외
+            measure(repository, session, 10)
+            metrics.reset()
+            results[label] = measure(repository, session, iterations)
+            results[label]["cache_hit_ratio"] = metrics.snapshot()["sql_compiled_cache_hit_ratio"]
+        finally:
+            session.close()
+            engine.dispose()
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Repository 호출 오버헤드 비교")
+    parser.add_argument("--iterations", type=int, default=2000, help="작업별 반복 횟수")
+    args = parser.parse_args(argv)
+
+    results = run(args.iterations)
+    legacy, current = results["legacy"], results["statement"]
+    print(f"{'operation':<12} {'legacy us':>12} {'statement us':>14} {'change':>9}")
+    for name in ("create", "get_by_id", "list", "update", "delete"):
+        change = (current[name] - legacy[name]) / legacy[name] * 100
+        print(f"{name:<12} {legacy[name]:>12.1f} {current[name]:>14.1f} {change:>+8.1f}%")
+    print(f"{'cache hit':<12} {legacy['cache_hit_ratio']:>12.2%} {current['cache_hit_ratio']:>14.2%}")
+
+
+if __name__ == "__main__":
+    main()
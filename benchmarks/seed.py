@@ -0,0 +1,294 @@
+"""
+대량 메모 데이터 생성 도구
+목록/조회 벤치마크용 합성 메모를 API를 거치지 않고 데이터베이스나 NDJSON 파일에 직접 적재
+
+제목/본문 길이는 분포(fixed, uniform, lognormal)로 지정하며, 본문은 한글과 영문 단어를
+섞은 말뭉치에서 임의 구간을 잘라 만듭니다. PostgreSQL은 COPY, SQLite는 executemany로
+batch 단위 적재하고, --seed가 같으면 같은 데이터를 생성합니다.
+
+사용 예:
+    python -m benchmarks.seed --rows 10000000
+    python -m benchmarks.seed --rows 100000 --database-url sqlite:///./bench.db --create-tables
+    python -m benchmarks.seed --rows 1000000 --content-length lognormal:400:1.0 --ndjson memos.ndjson
+"""
+import argparse
+import io
+import json
+import math
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+
+from app.config import Settings, get_settings
+from app.database import Base, create_db_engine
+from app.models.memo import Memo
+from app.schemas.memo import MemoCreate
+
+
+# 한글 음절 조합용 자모 (초성 19, 중성 21, 종성 28 중 자주 쓰는 일부)
+CHOSEONG = [0, 2, 3, 5, 6, 7, 9, 11, 12, 14, 15, 16, 17, 18]
+JUNGSEONG = [0, 4, 8, 13, 18, 20, 1, 6, 12, 17]
+JONGSEONG = [0, 0, 0, 4, 8, 16, 21, 1, 17]
+ENGLISH_WORDS = (
+    "the memo note task meeting project review plan draft idea list todo update release "
+    "api server database query cache index deploy test bug fix design budget report"
+).split()
+# 말뭉치 크기 (문자 수, 행마다 이 중 임의 구간을 잘라 사용)
+CORPUS_SIZE = 1 << 20
+# API 스키마의 최대 길이 (이보다 긴 행은 응답 검증에 실패하므로 생성하지 않음)
+MAX_TITLE_LENGTH = MemoCreate.model_fields["title"].metadata[-1].max_length
+MAX_CONTENT_LENGTH = MemoCreate.model_fields["content"].metadata[-1].max_length
+
+Row = Tuple[str, Optional[str], datetime, datetime]
+
+
+def parse_distribution(value: str) -> Callable[[random.Random], int]:
+    """
+    길이 분포 설정 파싱
+
+    Args:
+        value: "fixed:N", "uniform:MIN:MAX" 또는 "lognormal:MEDIAN:SIGMA[:MAX]"
+
+    Returns:
+        Callable[[random.Random], int]: 난수 생성기를 받아 길이를 반환하는 함수
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    kind, *args = value.split(":")
+    if kind == "fixed" and len(args) == 1:
+        length = int(args[0])
+        return lambda rng: length
+    if kind == "uniform" and len(args) == 2:
+        low, high = int(args[0]), int(args[1])
+        return lambda rng: rng.randint(low, high)
+    if kind == "lognormal" and len(args) in (2, 3):
+        mu, sigma = math.log(float(args[0])), float(args[1])
+        cap = int(args[2]) if len(args) == 3 else CORPUS_SIZE
+        return lambda rng: max(1, min(cap, int(rng.lognormvariate(mu, sigma))))
+    raise ValueError(f"Invalid length distribution: {value}")
+
+
+def korean_word(rng: random.Random) -> str:
+    """임의의 한글 단어 (1~4음절)"""
+    return "".join(
+        chr(0xAC00 + (rng.choice(CHOSEONG) * 21 + rng.choice(JUNGSEONG)) * 28 + rng.choice(JONGSEONG))
+        for _ in range(rng.randint(1, 4))
+    )
+
+
+def build_corpus(rng: random.Random, korean_ratio: float) -> str:
+    """한글/영문 단어를 섞은 말뭉치 생성 (문장 사이에 줄바꿈 포함)"""
+    vocabulary = [korean_word(rng) for _ in range(2000)]
+    parts: List[str] = []
+    size = 0
+    while size < CORPUS_SIZE:
+        word = rng.choice(vocabulary) if rng.random() < korean_ratio else rng.choice(ENGLISH_WORDS)
+        separator = "\n" if rng.random() < 0.05 else " "
+        parts.append(word + separator)
+        size += len(word) + 1
+    return "".join(parts)[:CORPUS_SIZE]
+
+
+def generate_rows(
+    count: int,
+    title_length: Callable[[random.Random], int],
+    content_length: Callable[[random.Random], int],
+    null_content: float = 0.05,
+    korean_ratio: float = 0.7,
+    days: int = 365,
+    seed: int = 0
+) -> Iterator[Row]:
+    """
+    합성 메모 행 생성
+
+    Args:
+        count: 생성할 행 수
+        title_length: 제목 길이 분포 (최대 MAX_TITLE_LENGTH자로 제한)
+        content_length: 본문 길이 분포 (최대 MAX_CONTENT_LENGTH자로 제한)
+        null_content: 본문이 없는 메모 비율
+        korean_ratio: 말뭉치에서 한글 단어 비율
+        days: 생성 시각을 분포시킬 기간 (현재 시각 이전 일수)
+        seed: 난수 시드
+
+    Yields:
+        Row: (제목, 본문, 생성 시각, 수정 시각)
+    """
+    rng = random.Random(seed)
+    corpus = build_corpus(rng, korean_ratio)
+    corpus_size = len(corpus)
+    span = days * 86400
+    now = datetime.utcnow()
+    start = now - timedelta(seconds=span)
+    # 행마다 여러 번 호출하므로 randrange() 대신 random()으로 정수 구간 선택
+    random_value = rng.random
+
+    def text(length: int) -> str:
+        offset = int(random_value() * (corpus_size - length)) if length < corpus_size else 0
+        return corpus[offset:offset + length].strip() or "메모"
+
+    for _ in range(count):
+        created_at = start + timedelta(seconds=random_value() * span)
+        # 절반은 생성 후 수정되지 않고, 나머지는 생성 이후 임의 시각에 수정
+        updated_at = created_at
+        if random_value() < 0.5:
+            updated_at += (now - created_at) * random_value()
+        content = None if random_value() < null_content else text(min(MAX_CONTENT_LENGTH, content_length(rng)))
+        yield text(min(MAX_TITLE_LENGTH, title_length(rng))), content, created_at, updated_at
+
+
+def batches(rows: Iterator[Row], size: int) -> Iterator[List[Row]]:
+    """행을 size개씩 묶음"""
+    batch: List[Row] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class Progress:
+    """적재 진행 상황 출력 (표준 에러)"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+
+    def __call__(self, count: int) -> None:
+        elapsed = time.perf_counter() - self.started
+        print(f"\r{count:,} rows, {count / elapsed:,.0f} rows/s", end="", file=sys.stderr, flush=True)
+
+
+def _copy_escape(value: Optional[str]) -> str:
+    """COPY text 형식 이스케이프"""
+    if value is None:
+        return "\\N"
+    return value.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def load_postgresql(engine: Engine, rows: Iterator[Row], batch_size: int, progress: Progress) -> int:
+    """COPY FROM STDIN으로 batch 단위 적재 (batch마다 커밋)"""
+    loaded = 0
+    connection = engine.raw_connection()
+    try:
+        for batch in batches(rows, batch_size):
+            buffer = io.StringIO()
+            buffer.writelines(
+                f"{_copy_escape(title)}\t{_copy_escape(content)}\t{created_at.isoformat(' ')}\t{updated_at.isoformat(' ')}\n"
+                for title, content, created_at, updated_at in batch
+            )
+            buffer.seek(0)
+            with connection.cursor() as cursor:
+                cursor.copy_expert("COPY memos (title, content, created_at, updated_at) FROM STDIN", buffer)
+            connection.commit()
+            loaded += len(batch)
+            progress(loaded)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE memos")
+        connection.commit()
+    finally:
+        connection.close()
+    return loaded
+
+
+def load_sqlite(engine: Engine, rows: Iterator[Row], batch_size: int, progress: Progress) -> int:
+    """executemany로 batch 단위 적재 (적재 중에는 fsync 생략)"""
+    statement = str(insert(Memo.__table__).compile(
+        engine, column_keys=["title", "content", "created_at", "updated_at"]
+    ))
+    loaded = 0
+    connection = engine.raw_connection()
+    try:
+        connection.execute("PRAGMA synchronous=OFF")
+        for batch in batches(rows, batch_size):
+            # SQLAlchemy의 SQLite DateTime 저장 형식과 같게 마이크로초까지 기록
+            connection.executemany(statement, [
+                (title, content, created_at.isoformat(" ", "microseconds"), updated_at.isoformat(" ", "microseconds"))
+                for title, content, created_at, updated_at in batch
+            ])
+            connection.commit()
+            loaded += len(batch)
+            progress(loaded)
+    finally:
+        connection.close()
+    return loaded
+
+
+def write_ndjson(path: str, rows: Iterator[Row], progress: Progress) -> int:
+    """NDJSON 파일로 기록 ("-"이면 표준 출력)"""
+    output = sys.stdout if path == "-" else open(path, "w", encoding="utf-8")
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    written = 0
+    try:
+        for title, content, created_at, updated_at in rows:
+            output.write(encode({
+                "title": title,
+                "content": content,
+                "created_at": created_at.isoformat(),
+                "updated_at": updated_at.isoformat(),
+            }))
+            output.write("\n")
+            written += 1
+            if written % 100000 == 0:
+                progress(written)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return written
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """CLI 인자 파싱"""
+    parser = argparse.ArgumentParser(description="합성 메모 대량 생성/적재 도구")
+    parser.add_argument("--rows", type=int, default=100000, help="생성할 메모 수")
+    parser.add_argument("--title-length", default="uniform:5:60", help="제목 길이 분포")
+    parser.add_argument("--content-length", default="lognormal:300:1.2", help="본문 길이 분포")
+    parser.add_argument("--null-content", type=float, default=0.05, help="본문이 없는 메모 비율")
+    parser.add_argument("--korean-ratio", type=float, default=0.7, help="한글 단어 비율")
+    parser.add_argument("--days", type=int, default=365, help="생성 시각을 분포시킬 기간 (일)")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--batch-size", type=int, default=50000, help="batch당 적재할 행 수")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--database-url", default=None, help="적재할 데이터베이스 (미지정 시 DATABASE_URL)")
+    target.add_argument("--ndjson", default=None, help="데이터베이스 대신 기록할 NDJSON 파일 (-는 표준 출력)")
+    parser.add_argument("--create-tables", action="store_true", help="테이블이 없으면 생성 (마이그레이션 없이 사용할 때)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    rows = generate_rows(
+        args.rows,
+        parse_distribution(args.title_length),
+        parse_distribution(args.content_length),
+        null_content=args.null_content,
+        korean_ratio=args.korean_ratio,
+        days=args.days,
+        seed=args.seed
+    )
+
+    progress = Progress()
+    if args.ndjson:
+        count = write_ndjson(args.ndjson, rows, progress)
+    else:
+        config = get_settings() if args.database_url is None else Settings(DATABASE_URL=args.database_url)
+        engine = create_db_engine(config.model_copy(update={"SQL_LOG_ENABLED": False}))
+        if args.create_tables:
+            Base.metadata.create_all(bind=engine)
+        loader = load_postgresql if engine.dialect.name == "postgresql" else load_sqlite
+        try:
+            count = loader(engine, rows, args.batch_size, progress)
+        finally:
+            engine.dispose()
+    elapsed = time.perf_counter() - progress.started
+    print(f"\n{count:,} rows in {elapsed:.1f}s ({count / elapsed:,.0f} rows/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+콜드 스타트 측정 도구
+app.main import 시간, create_app() 시간, lifespan 시작 시간, 첫 요청 지연 시간 측정
+
+각 측정은 새 인터프리터에서 실행하여 모듈 캐시의 영향을 받지 않습니다.
+
+사용 예:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --top 20 --runs 5
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+
+# 새 인터프리터에서 실행할 측정 스크립트
+PROBE = r"""
+import asyncio, json, time
+
+t0 = time.perf_counter()
+import app.main
+t1 = time.perf_counter()
+
+from app.config import Settings
+config = Settings(DATABASE_URL={database_url!r}, DEBUG=False, ACCESS_LOG_ENABLED=False)
+application = app.main.create_app(config)
+t2 = time.perf_counter()
+
+import httpx
+
+async def first_request():
+    async with application.router.lifespan_context(application):
+        t3 = time.perf_counter()
+        transport = httpx.ASGITransport(app=application)
+        async with httpx.AsyncClient(transport=transport, base_url="http://startup") as client:
+            await client.get("/health")
+        return t3, time.perf_counter()
+
+t3, t4 = asyncio.run(first_request())
+print(json.dumps({{
+    "import_ms": (t1 - t0) * 1000,
+    "create_app_ms": (t2 - t1) * 1000,
+    "lifespan_startup_ms": (t3 - t2) * 1000,
+    "first_request_ms": (t4 - t3) * 1000,
+}}))
+"""
+
+
+def measure_phases(database_url: str) -> Dict[str, float]:
+    """새 인터프리터에서 단계별 시작 시간 측정"""
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(database_url=database_url)],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={k: v for k, v in os.environ.items() if k != "DATABASE_URL"}
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def import_profile(module: str = "app.main") -> List[Tuple[int, int, str]]:
+    """
+    python -X importtime 결과 파싱
+
+    Returns:
+        List[Tuple[int, int, str]]: (self 마이크로초, 누적 마이크로초, 모듈명) 목록
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={k: v for k, v in os.environ.items() if k != "DATABASE_URL"}
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="콜드 스타트 측정")
+    parser.add_argument("--runs", type=int, default=3, help="측정 반복 횟수 (중앙값 출력)")
+    parser.add_argument("--top", type=int, default=15, help="누적 import 시간 상위 모듈 수")
+    parser.add_argument("--database-url", default="sqlite://",
+                        help="lifespan 측정에 사용할 DB URL")
+    args = parser.parse_args(argv)
+
+    runs = [measure_phases(args.database_url) for _ in range(args.runs)]
+    print(f"cold start (median of {args.runs} runs)")
+    for phase in runs[0]:
+        values = sorted(run[phase] for run in runs)
+        print(f"    {phase:<22} {values[len(values) // 2]:>10.1f} ms")
+
+    rows = import_profile()
+    print()
+    print(f"top {args.top} imports by cumulative time")
+    for self_us, cumulative_us, name in sorted(rows, key=lambda row: -row[1])[:args.top]:
+        print(f"    {name:<40} {cumulative_us / 1000:>10.1f} ms (self {self_us / 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
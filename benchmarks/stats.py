@@ -0,0 +1,78 @@
+"""
+벤치마크 통계 유틸리티
+지연 시간 분포 요약 (백분위수, 처리량)
+"""
+from typing import Dict, List, Sequence
+
+
+# 리포트에 포함할 백분위수
+PERCENTILES = (50.0, 95.0, 99.0, 99.9)
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """
+    정렬된 값 목록에서 백분위수 계산 (nearest-rank 방식)
+    
+    Args:
+        sorted_values: 오름차순 정렬된 값 목록
+        q: 백분위 (0~100)
+        
+    Returns:
+        float: 백분위수 값 (값이 없으면 0.0)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100))  # ceil(n * q / 100)
+    return sorted_values[min(int(rank), len(sorted_values)) - 1]
+
+
+def percentile_label(q: float) -> str:
+    """백분위 라벨 생성 (예: 99.9 -> 'p99.9', 50.0 -> 'p50')"""
+    return f"p{q:g}"
+
+
+def summarize(latencies_ms: List[float], elapsed_seconds: float) -> Dict[str, float]:
+    """
+    지연 시간 목록 요약
+    
+    Args:
+        latencies_ms: 요청별 지연 시간 (밀리초)
+        elapsed_seconds: 전체 측정 시간 (초)
+        
+    Returns:
+        Dict[str, float]: 요청 수, 처리량, 평균/최대 및 백분위수
+    """
+    values = sorted(latencies_ms)
+    count = len(values)
+    summary = {
+        "count": count,
+        "throughput_rps": count / elapsed_seconds if elapsed_seconds > 0 else 0.0,
+        "mean_ms": sum(values) / count if count else 0.0,
+        "max_ms": values[-1] if values else 0.0,
+    }
+    for q in PERCENTILES:
+        summary[f"{percentile_label(q)}_ms"] = percentile(values, q)
+    return summary
+
+
+def format_table(rows: Dict[str, Dict[str, float]]) -> str:
+    """
+    요약 결과를 사람이 읽기 쉬운 표 형태로 변환
+    
+    Args:
+        rows: 이름별 summarize() 결과
+        
+    Returns:
+        str: 표 문자열
+    """
+    columns = ["count", "throughput_rps", "mean_ms"]
+    columns += [f"{percentile_label(q)}_ms" for q in PERCENTILES]
+    columns.append("max_ms")
+    
+    name_width = max([len(name) for name in rows] + [4])
+    header = "name".ljust(name_width) + "".join(f"{col:>16}" for col in columns)
+    lines = [header, "-" * len(header)]
+    for name, summary in rows.items():
+        cells = "".join(f"{summary.get(col, 0.0):>16.2f}" for col in columns)
+        lines.append(name.ljust(name_width) + cells)
+    return "\n".join(lines)
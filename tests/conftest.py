@@ -4,20 +4,22 @@ pytest 설정 및 공통 fixture
 """
 import pytest
 from typing import Generator
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 
-from app.database import Base
+from app.config import Settings
+from app.database import Base, create_db_engine
 from app.models.memo import Memo
-from app.main import app
+from app.main import create_app
 from app.api.deps import get_db_session
 
 
 # 테스트용 인메모리 SQLite 데이터베이스
 TEST_DATABASE_URL = "sqlite:///:memory:"
 
+# 테스트용 애플리케이션 (환경 변수의 DATABASE_URL 없이 생성)
+test_app = create_app(Settings(DATABASE_URL=TEST_DATABASE_URL, DEBUG=False, DB_WARMUP_ENABLED=False))
+
 
 @pytest.fixture(scope="function")
 def db_session() -> Generator[Session, None, None]:
@@ -25,18 +27,16 @@ def db_session() -> Generator[Session, None, None]:
     테스트용 데이터베이스 세션 fixture
     각 테스트 함수마다 새로운 DB 세션 생성 및 정리
     """
-    # 인메모리 SQLite 엔진 생성
-    engine = create_engine(
-        TEST_DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
+    # 인메모리 SQLite 엔진 생성 (애플리케이션과 같은 이벤트 훅 사용, 단일 커넥션 공유)
+    engine = create_db_engine(Settings(DATABASE_URL=TEST_DATABASE_URL, DEBUG=False))
     
     # 테이블 생성
     Base.metadata.create_all(bind=engine)
     
-    # 세션 생성
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    # 세션 생성 (애플리케이션 SessionLocal과 같은 설정)
+    TestingSessionLocal = sessionmaker(
+        autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+    )
     session = TestingSessionLocal()
     
     try:
@@ -77,7 +77,13 @@ def create_test_memo(db_session: Session):
 
 
 @pytest.fixture
-def client(db_session: Session):
+def app():
+    """테스트용 FastAPI 애플리케이션 fixture"""
+    return test_app
+
+
+@pytest.fixture
+def client(app, db_session: Session):
     """
     FastAPI TestClient fixture
     DB 의존성을 테스트 DB 세션으로 오버라이드
@@ -0,0 +1,45 @@
+"""
+요청당 메모리 할당 예산 테스트
+엔드포인트와 limit별 최대/유지 할당이 allocation_budgets.json의 예산 이내인지 확인
+
+예산은 python -m benchmarks.allocations --write-budgets로 갱신합니다.
+"""
+import asyncio
+import os
+import sys
+
+import pytest
+
+from benchmarks.allocations import ENDPOINTS, LIMITS, load_budgets, measure_endpoints
+
+
+BUDGETS_PATH = os.path.join(os.path.dirname(__file__), "allocation_budgets.json")
+BUDGETS = load_budgets(BUDGETS_PATH)
+
+
+@pytest.fixture(scope="module")
+def allocations():
+    """모든 엔드포인트와 limit 조합의 측정 결과 (모듈에서 한 번 측정)"""
+    if sys.gettrace() is not None:
+        pytest.skip("커버리지/디버거 추적 중에는 할당량이 달라 측정하지 않음")
+    return asyncio.run(measure_endpoints(list(ENDPOINTS), list(LIMITS)))
+
+
+class TestAllocationBudgets:
+    """요청당 메모리 할당 예산 테스트"""
+    
+    def test_every_endpoint_and_limit_has_budget(self):
+        """측정 대상 조합마다 예산이 기록되어 있음"""
+        assert set(BUDGETS) == {f"{name}@{limit}" for name in ENDPOINTS for limit in LIMITS}
+    
+    @pytest.mark.parametrize("key", sorted(BUDGETS))
+    def test_allocations_within_budget(self, allocations, key):
+        """최대 할당과 요청 후 유지된 메모리가 예산 이내"""
+        measured, budget = allocations[key], BUDGETS[key]
+        
+        assert measured["peak_kib"] <= budget["peak_kib"], (
+            f"{key} peak {measured['peak_kib']:.1f} KiB > {budget['peak_kib']:.1f} KiB"
+        )
+        assert measured["retained_kib"] <= budget["retained_kib"], (
+            f"{key} retained {measured['retained_kib']:.1f} KiB > {budget['retained_kib']:.1f} KiB"
+        )
@@ -0,0 +1,116 @@
+"""
+배치 API 통합 테스트
+작업별 상태 코드, atomic 롤백, 부분 실패 처리 및 커밋 후 캐시 갱신 테스트
+"""
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.cache import memo_fragments
+from app.events import get_broker
+from app.models.memo import Memo
+
+
+class TestBatchAPI:
+    """배치 API 통합 테스트"""
+    
+    def test_mixed_operations(self, client: TestClient, create_test_memo):
+        """여러 종류의 작업을 순서대로 실행하고 작업별 상태 코드 반환"""
+        # Given
+        memo = create_test_memo(title="원본")
+        operations = [
+            {"op": "get", "memo_id": memo.id},
+            {"op": "update", "memo_id": memo.id, "data": {"title": "수정"}},
+            {"op": "create", "data": {"title": "새 메모"}},
+            {"op": "get", "memo_id": memo.id},
+            {"op": "delete", "memo_id": memo.id},
+        ]
+        
+        # When
+        response = client.post("/api/v1/batch", json={"operations": operations})
+        
+        # Then
+        assert response.status_code == 200
+        data = response.json()
+        assert data["committed"] is True
+        assert [result["status"] for result in data["results"]] == [200, 200, 201, 200, 204]
+        assert data["results"][0]["body"]["title"] == "원본"
+        assert data["results"][3]["body"]["title"] == "수정"
+        assert client.get(f"/api/v1/memos/{memo.id}").status_code == 404
+    
+    def test_partial_failure_rolls_back_only_failed_operation(
+        self, client: TestClient, db_session: Session
+    ):
+        """atomic이 아니면 실패한 작업만 롤백되고 나머지는 커밋"""
+        # Given
+        operations = [
+            {"op": "create", "data": {"title": "첫 번째"}},
+            {"op": "update", "memo_id": 999, "data": {"title": "없음"}},
+            {"op": "create", "data": {"title": ""}},
+            {"op": "create", "data": {"title": "두 번째"}},
+        ]
+        
+        # When
+        response = client.post("/api/v1/batch", json={"operations": operations})
+        
+        # Then
+        data = response.json()
+        assert data["committed"] is True
+        assert [result["status"] for result in data["results"]] == [201, 404, 422, 201]
+        assert db_session.scalar(select(func.count(Memo.id))) == 2
+    
+    def test_atomic_failure_rolls_back_everything(
+        self, client: TestClient, db_session: Session, create_test_memo
+    ):
+        """atomic이면 하나라도 실패 시 전체 롤백, 남은 작업은 실행하지 않음"""
+        # Given
+        memo_id = create_test_memo(title="원본").id
+        subscription, _ = get_broker().subscribe()
+        operations = [
+            {"op": "update", "memo_id": memo_id, "data": {"title": "수정"}},
+            {"op": "delete", "memo_id": 999},
+            {"op": "create", "data": {"title": "실행 안 됨"}},
+        ]
+        
+        # When
+        response = client.post("/api/v1/batch", json={"operations": operations, "atomic": True})
+        
+        # Then
+        data = response.json()
+        assert data["committed"] is False
+        assert [result["status"] for result in data["results"]] == [200, 404, 424]
+        assert client.get(f"/api/v1/memos/{memo_id}").json()["title"] == "원본"
+        assert db_session.scalar(select(func.count(Memo.id))) == 1
+        assert subscription.queue.empty()
+    
+    def test_fragments_cached_only_after_commit(self, client: TestClient):
+        """롤백된 배치에서 생성/수정한 메모의 JSON 조각은 캐시에 남지 않고, 커밋된 배치의 조각만 저장"""
+        # Given
+        memo_fragments.clear()
+        failing = [
+            {"op": "create", "data": {"title": "롤백됨"}},
+            {"op": "delete", "memo_id": 999},
+        ]
+        
+        # When
+        rolled_back = client.post("/api/v1/batch", json={"operations": failing, "atomic": True}).json()
+        rolled_back_size = memo_fragments.size
+        committed = client.post(
+            "/api/v1/batch",
+            json={"operations": [{"op": "create", "data": {"title": "커밋됨"}}], "atomic": True}
+        ).json()
+        
+        # Then
+        assert rolled_back["committed"] is False
+        assert rolled_back_size == 0
+        assert committed["committed"] is True
+        assert memo_fragments.size == 1
+        memo_fragments.clear()
+    
+    def test_invalid_operation(self, client: TestClient):
+        """필수 값이 없는 작업은 요청 전체를 422로 거부"""
+        # When
+        response = client.post("/api/v1/batch", json={"operations": [{"op": "get"}]})
+        
+        # Then
+        assert response.status_code == 422
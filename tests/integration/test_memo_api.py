@@ -2,11 +2,17 @@
 메모 API 통합 테스트
 API 엔드포인트 E2E 테스트
 """
+from datetime import datetime, timedelta
+
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
-from app.models.memo import Memo
+from app.metrics import metrics
+from app.models.memo import Memo, MemoTombstone
+from app.services.memo_service import SYNC_TOMBSTONE_RETENTION
+from app.services.sync_token import UPSERT, SyncCursor, encode_sync_token
 
 
 class TestMemoAPI:
@@ -299,3 +305,195 @@ class TestMemoAPI:
         # 6. 삭제 확인
         final_get_response = client.get(f"/api/v1/memos/{memo_id}")
         assert final_get_response.status_code == 404
+
+
+class TestMemoLookupAPI:
+    """메모 다건 조회 API 통합 테스트"""
+    
+    def test_get_memos_by_ids_preserves_order(self, client: TestClient, create_test_memo):
+        """ids 쿼리로 요청한 순서대로 조회하고 없는 ID는 missing_ids로 반환"""
+        # Given
+        first, second, third = (create_test_memo(title=f"메모 {i}").id for i in range(3))
+        
+        # When
+        response = client.get("/api/v1/memos", params={"ids": f"{third},999,{first},{third}"})
+        
+        # Then
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data["items"]] == [third, first]
+        assert data["missing_ids"] == [999]
+        assert "total" not in data
+    
+    def test_lookup_with_post_body(self, client: TestClient, create_test_memo):
+        """긴 ID 목록은 POST 본문으로 조회"""
+        # Given
+        memo_ids = [create_test_memo(title=f"메모 {i}").id for i in range(3)]
+        
+        # When
+        response = client.post("/api/v1/memos/lookup", json={"ids": memo_ids[::-1]})
+        
+        # Then
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == memo_ids[::-1]
+        assert response.json()["missing_ids"] == []
+    
+    def test_invalid_ids(self, client: TestClient):
+        """정수가 아닌 ID는 422 반환"""
+        # When
+        response = client.get("/api/v1/memos", params={"ids": "1,abc"})
+        
+        # Then
+        assert response.status_code == 422
+
+
+class TestMemoListCacheAPI:
+    """메모 목록 페이지 캐시 통합 테스트"""
+    
+    def test_repeated_list_served_from_cache(self, client: TestClient, create_test_memo):
+        """같은 페이지를 다시 조회하면 캐시에서 응답"""
+        # Given
+        create_test_memo(title="메모 1")
+        client.get("/api/v1/memos")
+        hits = metrics.get("list_cache_hits")
+        
+        # When
+        response = client.get("/api/v1/memos")
+        
+        # Then
+        assert response.status_code == 200
+        assert response.json()["total"] == 1
+        assert metrics.get("list_cache_hits") == hits + 1
+    
+    def test_writes_invalidate_cached_pages(self, client: TestClient, sample_memo_data):
+        """생성/수정/삭제 후에는 캐시된 목록 대신 변경된 목록을 조회"""
+        # Given
+        assert client.get("/api/v1/memos").json()["total"] == 0
+        
+        # When / Then
+        memo_id = client.post("/api/v1/memos", json=sample_memo_data).json()["id"]
+        assert client.get("/api/v1/memos").json()["total"] == 1
+        
+        client.put(f"/api/v1/memos/{memo_id}", json={"title": "수정된 제목"})
+        assert client.get("/api/v1/memos").json()["items"][0]["title"] == "수정된 제목"
+        
+        client.post("/api/v1/batch", json={"operations": [{"op": "delete", "memo_id": memo_id}]})
+        assert client.get("/api/v1/memos").json()["total"] == 0
+
+
+class TestMemoChangesAPI:
+    """메모 변경분 동기화 API 통합 테스트"""
+    
+    @staticmethod
+    def backdate(db_session: Session, minutes: int) -> None:
+        """기존 변경 시각을 과거로 이동 (동기화 안전 구간 밖으로)"""
+        past = datetime.utcnow() - timedelta(minutes=minutes)
+        db_session.execute(update(Memo).values(updated_at=past))
+        db_session.execute(update(MemoTombstone).values(deleted_at=past))
+        db_session.commit()
+    
+    def test_initial_sync_paginates_by_keyset(self, client: TestClient, create_test_memo):
+        """토큰 없이 조회하면 처음부터 keyset 페이지 단위로 전달"""
+        # Given
+        memo_ids = [create_test_memo(title=f"메모 {i}").id for i in range(5)]
+        
+        # When
+        seen, token, pages = [], None, 0
+        while True:
+            params = {"limit": 2, **({"since": token} if token else {})}
+            data = client.get("/api/v1/memos/changes", params=params).json()
+            seen += [change["memo_id"] for change in data["changes"]]
+            token, pages = data["next_token"], pages + 1
+            if not data["has_more"]:
+                break
+        
+        # Then
+        assert pages == 3
+        assert sorted(seen) == sorted(memo_ids)
+    
+    def test_sync_returns_only_changes_and_tombstones(
+        self, client: TestClient, db_session: Session, create_test_memo
+    ):
+        """토큰 이후 수정된 메모와 삭제 기록만 전달"""
+        # Given
+        kept, edited, removed = (create_test_memo(title=f"메모 {i}") for i in range(3))
+        self.backdate(db_session, minutes=10)
+        token = client.get("/api/v1/memos/changes").json()["next_token"]
+        
+        # When
+        client.put(f"/api/v1/memos/{edited.id}", json={"title": "수정"})
+        client.delete(f"/api/v1/memos/{removed.id}")
+        response = client.get("/api/v1/memos/changes", params={"since": token})
+        
+        # Then
+        assert response.status_code == 200
+        changes = response.json()["changes"]
+        assert [(change["type"], change["memo_id"]) for change in changes] == [
+            ("upsert", edited.id), ("delete", removed.id)
+        ]
+        assert changes[0]["memo"]["title"] == "수정"
+        assert changes[1]["memo"] is None
+        assert kept.id not in {change["memo_id"] for change in changes}
+    
+    def test_token_does_not_skip_recent_changes(self, client: TestClient, create_test_memo):
+        """최근 변경은 안전 구간 동안 다음 동기화에서 다시 전달 (커밋 지연 대비)"""
+        # Given
+        memo = create_test_memo()
+        token = client.get("/api/v1/memos/changes").json()["next_token"]
+        
+        # When
+        response = client.get("/api/v1/memos/changes", params={"since": token})
+        
+        # Then
+        assert [change["memo_id"] for change in response.json()["changes"]] == [memo.id]
+    
+    def test_paginated_sync_restarts_before_recent_changes(self, client: TestClient, create_test_memo):
+        """여러 페이지로 받은 경우에도 다음 동기화는 안전 구간 안의 변경부터 다시 전달"""
+        # Given
+        memo_ids = [create_test_memo(title=f"메모 {i}").id for i in range(5)]
+        token, has_more = None, True
+        while has_more:
+            params = {"limit": 2, **({"since": token} if token else {})}
+            data = client.get("/api/v1/memos/changes", params=params).json()
+            token, has_more = data["next_token"], data["has_more"]
+        
+        # When
+        response = client.get("/api/v1/memos/changes", params={"since": token})
+        
+        # Then
+        assert sorted(change["memo_id"] for change in response.json()["changes"]) == sorted(memo_ids)
+    
+    def test_expired_token_requires_resync(self, client: TestClient):
+        """삭제 기록 보관 기간보다 오래된 토큰은 410 반환"""
+        # Given
+        old = SyncCursor(datetime.utcnow() - SYNC_TOMBSTONE_RETENTION - timedelta(days=1), 0, UPSERT)
+        
+        # When
+        response = client.get("/api/v1/memos/changes", params={"since": encode_sync_token(old)})
+        
+        # Then
+        assert response.status_code == 410
+    
+    def test_delete_prunes_expired_tombstones(
+        self, client: TestClient, db_session: Session, create_test_memo
+    ):
+        """메모를 삭제하면 보관 기간이 지난 삭제 기록을 정리"""
+        # Given
+        expired, removed = create_test_memo(), create_test_memo()
+        client.delete(f"/api/v1/memos/{expired.id}")
+        self.backdate(db_session, minutes=int(SYNC_TOMBSTONE_RETENTION.total_seconds() // 60) + 1)
+        
+        # When
+        client.delete(f"/api/v1/memos/{removed.id}")
+        
+        # Then
+        db_session.expire_all()
+        assert [tombstone.memo_id for tombstone in db_session.query(MemoTombstone)] == [removed.id]
+    
+    def test_invalid_token(self, client: TestClient):
+        """형식이 잘못된 토큰은 400 반환"""
+        # When
+        response = client.get("/api/v1/memos/changes", params={"since": "not-a-token"})
+        
+        # Then
+        assert response.status_code == 400
@@ -0,0 +1,57 @@
+"""
+애플리케이션 팩토리 유닛 테스트
+설정별 앱 생성 및 lazy 엔진 초기화 테스트
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app import database
+from app.config import Settings
+from app.main import create_app
+
+
+@pytest.fixture
+def no_engine():
+    """전역 엔진이 없는 상태로 시작하고 테스트 후 정리 (다른 테스트가 만든 엔진에 영향받지 않도록)"""
+    database.dispose_engine()
+    yield
+    database.dispose_engine()
+
+
+class TestAppFactory:
+    """create_app() 테스트"""
+    
+    def test_create_app_uses_given_settings(self):
+        """전달된 설정으로 앱 생성"""
+        # Given
+        config = Settings(DATABASE_URL="sqlite://", APP_NAME="Factory Memo API")
+        
+        # When
+        with TestClient(create_app(config)) as client:
+            response = client.get("/")
+        
+        # Then
+        assert response.json()["app_name"] == "Factory Memo API"
+    
+    def test_engine_created_in_lifespan(self, no_engine):
+        """엔진은 앱 생성 시점이 아니라 lifespan 시작 시 생성되고 종료 시 해제"""
+        # Given
+        app = create_app(Settings(DATABASE_URL="sqlite://"))
+        assert not database.is_engine_initialized()
+        
+        # When & Then
+        with TestClient(app):
+            assert database.is_engine_initialized()
+        assert not database.is_engine_initialized()
+    
+    def test_docs_disabled(self):
+        """DOCS_ENABLED=False이면 OpenAPI 문서 비활성화"""
+        # Given
+        app = create_app(Settings(DATABASE_URL="sqlite://", DOCS_ENABLED=False))
+        
+        # When
+        with TestClient(app) as client:
+            response = client.get("/openapi.json")
+        
+        # Then
+        assert response.status_code == 404
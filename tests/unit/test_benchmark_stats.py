@@ -0,0 +1,68 @@
+"""
+벤치마크 통계 및 부하 생성기 유닛 테스트
+백분위수 요약과 open-loop 부하의 드롭 집계 테스트
+"""
+import asyncio
+import random
+
+from benchmarks.asgi_load import build_report, run_open_loop
+from benchmarks.stats import percentile, summarize
+
+
+class TestSummarize:
+    """지연 시간 요약 테스트"""
+    
+    def test_percentiles_on_known_distribution(self):
+        """1~100ms 균등 분포의 nearest-rank 백분위수, 평균, 최대, 처리량"""
+        # Given: 정렬되지 않은 1~100
+        latencies = [float(value) for value in range(100, 0, -1)]
+        
+        # When
+        summary = summarize(latencies, elapsed_seconds=2.0)
+        
+        # Then
+        assert summary["count"] == 100
+        assert summary["throughput_rps"] == 50.0
+        assert summary["mean_ms"] == 50.5
+        assert summary["max_ms"] == 100.0
+        assert (summary["p50_ms"], summary["p95_ms"], summary["p99_ms"], summary["p99.9_ms"]) == (
+            50.0, 95.0, 99.0, 100.0
+        )
+    
+    def test_small_and_empty_samples(self):
+        """표본이 적으면 상위 백분위수는 최댓값, 비어 있으면 0"""
+        assert percentile([10.0, 20.0, 30.0], 99.0) == 30.0
+        assert percentile([10.0, 20.0, 30.0], 50.0) == 20.0
+        
+        summary = summarize([], elapsed_seconds=0.0)
+        assert summary["count"] == 0
+        assert summary["throughput_rps"] == 0.0
+        assert summary["p99_ms"] == 0.0
+
+
+class TestOpenLoop:
+    """고정 도착률 부하 테스트"""
+    
+    async def test_requests_over_in_flight_limit_are_dropped(self):
+        """처리 중인 요청이 상한에 이르면 이후 도착은 드롭으로 집계하고 지연 시간은 예정 도착 시각부터 측정"""
+        # Given: 첫 요청이 측정 시간보다 오래 걸리고 동시 처리 상한은 1
+        random.seed(0)
+        calls = 0
+        
+        async def slow_task(client, state):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.2)
+            return "slow", True
+        
+        # When
+        result = await run_open_loop(None, [(slow_task, 1)], rate=200, duration=0.1, max_in_flight=1)
+        report = build_report(result)
+        
+        # Then: 도착한 요청은 실행되거나 드롭되며, 실행된 요청은 첫 요청뿐
+        assert calls == 1
+        assert result.dropped > 0
+        assert len(result.latencies_ms["slow"]) == 1
+        assert result.latencies_ms["slow"][0] >= 200
+        assert report["TOTAL"]["dropped"] == result.dropped
+        assert report["TOTAL"]["count"] == 1
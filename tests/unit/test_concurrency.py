@@ -0,0 +1,187 @@
+"""
+스레드풀 동시성 유닛 테스트
+DB 작업용 limiter 크기 결정, 동시 실행 제한, 기본 limiter와의 분리 및 조회 합치기 테스트
+"""
+import asyncio
+import contextvars
+import threading
+
+import anyio
+
+from app.concurrency import SingleFlight, db_threadpool_size, init_limiters, run_in_db_threadpool
+from app.config import Settings
+from app.deadline import check_deadline, remaining, reset_deadline, set_deadline
+from app.exceptions.memo_exceptions import MemoNotFoundException
+from app.exceptions.request_exceptions import DeadlineExceededException
+from app.metrics import metrics
+
+
+def make_settings(**overrides) -> Settings:
+    """테스트용 설정 생성"""
+    return Settings(DATABASE_URL="sqlite://", DEBUG=False, **overrides)
+
+
+class TestThreadpoolSizing:
+    """DB 작업용 스레드 수 테스트"""
+    
+    def test_defaults_to_connection_pool_capacity(self):
+        """기본값은 DB_POOL_SIZE + DB_MAX_OVERFLOW"""
+        assert db_threadpool_size(make_settings(DB_POOL_SIZE=5, DB_MAX_OVERFLOW=10)) == 15
+    
+    def test_explicit_size(self):
+        """DB_THREADPOOL_SIZE 지정 시 해당 값 사용"""
+        assert db_threadpool_size(make_settings(DB_THREADPOOL_SIZE=8)) == 8
+
+
+class TestDbThreadpool:
+    """DB 작업용 limiter 테스트"""
+    
+    async def test_limits_concurrency_and_exposes_queue_depth(self):
+        """limiter 크기를 넘는 작업은 대기열에서 기다리며 대기 수가 메트릭으로 노출됨"""
+        # Given
+        init_limiters(make_settings(DB_THREADPOOL_SIZE=2))
+        release = threading.Event()
+        lock = threading.Lock()
+        running = []
+        peak = []
+        
+        def blocking_query() -> None:
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            release.wait(5)
+            with lock:
+                running.pop()
+        
+        # When
+        async with anyio.create_task_group() as tg:
+            for _ in range(5):
+                tg.start_soon(run_in_db_threadpool, blocking_query)
+            await anyio.sleep(0.1)
+            snapshot = metrics.snapshot()
+            # DB 작업이 밀려 있어도 기본 limiter의 작업은 바로 실행됨
+            health = await anyio.to_thread.run_sync(lambda: "healthy")
+            release.set()
+        
+        # Then
+        assert max(peak) == 2
+        assert snapshot["db_threadpool_in_use"] == 2
+        assert snapshot["db_threadpool_queue_depth"] == 3
+        assert health == "healthy"
+
+
+class TestSingleFlight:
+    """조회 합치기 테스트"""
+    
+    async def test_concurrent_async_calls_share_one_execution(self):
+        """동시에 들어온 같은 키의 비동기 호출은 한 번만 실행되고 예외도 공유"""
+        # Given
+        flight = SingleFlight("test_async")
+        executions = []
+        
+        async def missing_memo() -> None:
+            executions.append(1)
+            await anyio.sleep(0.01)
+            raise MemoNotFoundException(1)
+        
+        # When
+        results = await asyncio.gather(
+            *(flight.do_async(("get_memo", 1), missing_memo) for _ in range(5)),
+            return_exceptions=True
+        )
+        
+        # Then
+        assert len(executions) == 1
+        assert all(isinstance(result, MemoNotFoundException) for result in results)
+        assert metrics.get("singleflight_test_async_coalesced") == 4
+    
+    async def test_bypass_when_key_table_full(self):
+        """추적 중인 키가 max_keys개이면 합치지 않고 바로 실행"""
+        # Given
+        flight = SingleFlight("test_bounded", max_keys=0)
+        
+        async def query() -> int:
+            return 1
+        
+        # When
+        results = await asyncio.gather(*(flight.do_async("key", query) for _ in range(3)))
+        
+        # Then
+        assert results == [1, 1, 1]
+        assert metrics.get("singleflight_test_bounded_bypassed") == 3
+    
+    async def test_shared_call_runs_in_fresh_context(self):
+        """공유 호출은 요청의 컨텍스트 변수를 물려받지 않고 deadline만 적용"""
+        # Given
+        flight = SingleFlight("test_context")
+        request_span = contextvars.ContextVar("request_span", default=None)
+        request_span.set("leader-span")
+        seen = []
+        
+        async def query() -> None:
+            seen.append((request_span.get(), remaining()))
+        
+        # When
+        token = set_deadline(5)
+        try:
+            await flight.do_async("key", query)
+        finally:
+            reset_deadline(token)
+        
+        # Then
+        span, left = seen[0]
+        assert span is None
+        assert 0 < left <= 5
+    
+    async def test_follower_retries_after_leader_deadline(self):
+        """먼저 들어온 요청의 deadline으로 실패하면 시간이 남은 요청은 다시 실행"""
+        # Given
+        flight = SingleFlight("test_deadline")
+        executions = []
+        
+        async def query() -> str:
+            executions.append(remaining())
+            await anyio.sleep(0.05)
+            check_deadline()
+            return "result"
+        
+        async def call(budget: float):
+            token = set_deadline(budget)
+            try:
+                return await flight.do_async("key", query)
+            finally:
+                reset_deadline(token)
+        
+        # When
+        leader, follower = await asyncio.gather(call(0.01), call(5), return_exceptions=True)
+        
+        # Then
+        assert isinstance(leader, DeadlineExceededException)
+        assert follower == "result"
+        assert len(executions) == 2
+    
+    async def test_invalidate_starts_new_call(self):
+        """invalidate() 이후 들어온 호출은 진행 중인 호출과 합치지 않음"""
+        # Given
+        flight = SingleFlight("test_invalidate")
+        release = asyncio.Event()
+        versions = iter(["before-commit", "after-commit"])
+        
+        async def query() -> str:
+            version = next(versions)
+            await release.wait()
+            return version
+        
+        first = asyncio.ensure_future(flight.do_async("key", query))
+        await asyncio.sleep(0)
+        
+        # When
+        flight.invalidate()
+        second = asyncio.ensure_future(flight.do_async("key", query))
+        await asyncio.sleep(0)
+        release.set()
+        
+        # Then
+        assert await first == "before-commit"
+        assert await second == "after-commit"
+        assert flight.in_flight == 0
@@ -0,0 +1,131 @@
+"""
+데이터베이스 수명 주기 유닛 테스트
+커넥션 풀 워밍업, 준비 상태 전환, 워밍업 제한 시간 및 종료 시 드레인 테스트
+"""
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+from app.config import Settings
+from app.database import Base, create_db_engine, drain_pool, warm_up_pool
+from app.exceptions.request_exceptions import DeadlineExceededException
+from app.main import create_app
+from app.repositories.memo_repository import memo_repository
+
+
+class TestDatabaseLifecycle:
+    """풀 워밍업 및 드레인 테스트"""
+    
+    def test_warm_up_opens_pool_connections(self, tmp_path):
+        """워밍업 후 지정한 수의 커넥션이 풀에 유지됨"""
+        # Given
+        engine = create_engine(f"sqlite:///{tmp_path / 'warmup.db'}", pool_size=3)
+        Base.metadata.create_all(bind=engine)
+        engine.dispose()
+        
+        # When
+        size = warm_up_pool(engine, 3, memo_repository.prepare_statements)
+        
+        # Then
+        assert size == 3
+        assert engine.pool.checkedin() == 3
+        assert engine.pool.checkedout() == 0
+        engine.dispose()
+    
+    def test_drain_pool_times_out_when_connection_held(self, tmp_path):
+        """반납되지 않은 커넥션이 있으면 제한 시간 후 False 반환"""
+        # Given
+        engine = create_engine(f"sqlite:///{tmp_path / 'drain.db'}")
+        connection = engine.connect()
+        
+        # When & Then
+        assert drain_pool(engine, timeout=0.1) is False
+        connection.close()
+        assert drain_pool(engine, timeout=0.1) is True
+        engine.dispose()
+    
+    def test_readiness_after_warm_up(self, tmp_path):
+        """워밍업이 끝나면 readiness 엔드포인트가 200 반환"""
+        # Given
+        config = Settings(DATABASE_URL=f"sqlite:///{tmp_path / 'ready.db'}", DB_POOL_SIZE=2)
+        
+        # When
+        with TestClient(create_app(config)) as client:
+            deadline = time.monotonic() + 5
+            response = client.get("/health/ready")
+            while response.status_code != 200 and time.monotonic() < deadline:
+                time.sleep(0.01)
+                response = client.get("/health/ready")
+        
+        # Then
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
+    
+    def test_not_ready_without_lifespan(self):
+        """lifespan 시작 전에는 준비되지 않은 상태 (503)"""
+        # Given
+        client = TestClient(create_app(Settings(DATABASE_URL="sqlite://")))
+        
+        # When
+        response = client.get("/health/ready")
+        
+        # Then
+        assert response.status_code == 503
+
+
+class TestWarmUpShutdown:
+    """느린 DB에서의 워밍업 종료 및 제한 시간 테스트"""
+    
+    def test_shutdown_waits_for_warm_up_thread(self, tmp_path):
+        """종료 시 진행 중인 워밍업 스레드가 커넥션을 반납한 뒤 풀을 정리"""
+        # Given
+        app = create_app(Settings(
+            DATABASE_URL=f"sqlite:///{tmp_path / 'warmup.db'}",
+            DB_POOL_SIZE=2,
+            DB_FAULTS="latency=0.2"
+        ))
+        
+        # When
+        started = time.perf_counter()
+        with TestClient(app):
+            pass
+        elapsed = time.perf_counter() - started
+        
+        # Then: 워밍업(커넥션 2개 x 0.2초)이 끝날 때까지 기다린 뒤 종료
+        assert elapsed >= 0.2
+        assert app.state.ready is False
+    
+    def test_warm_up_stops_at_timeout(self, tmp_path):
+        """DB_WARMUP_TIMEOUT을 넘기면 남은 커넥션을 열지 않고 준비 상태로 전환"""
+        # Given: 전체 워밍업은 커넥션 5개와 hot statement 2개 x 0.2초 = 1.4초
+        app = create_app(Settings(
+            DATABASE_URL=f"sqlite:///{tmp_path / 'warmup.db'}",
+            DB_POOL_SIZE=5,
+            DB_WARMUP_TIMEOUT=0.3,
+            DB_FAULTS="latency=0.2"
+        ))
+        
+        # When
+        with TestClient(app):
+            started = time.perf_counter()
+            while not app.state.ready and time.perf_counter() - started < 5:
+                time.sleep(0.01)
+            elapsed = time.perf_counter() - started
+            
+            # Then: 제한 시간 뒤 실행 중이던 statement 하나까지만 기다림
+            assert app.state.ready is True
+            assert elapsed < 0.8
+    
+    def test_warm_up_pool_returns_connections_on_timeout(self, tmp_path):
+        """warm_up_pool이 제한 시간을 넘기면 열어 둔 커넥션을 반납하고 DeadlineExceededException 발생"""
+        # Given
+        config = Settings(DATABASE_URL=f"sqlite:///{tmp_path / 'warmup.db'}", DB_FAULTS="latency=0.1")
+        engine = create_db_engine(config)
+        
+        # When & Then
+        with pytest.raises(DeadlineExceededException):
+            warm_up_pool(engine, 5, timeout=0.15)
+        assert engine.pool.checkedout() == 0
+        engine.dispose()
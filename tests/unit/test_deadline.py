@@ -0,0 +1,244 @@
+"""
+요청 deadline 유닛 테스트
+시간 예산 결정, 504 응답, statement_timeout 전파 및 쿼리 취소 변환 테스트
+"""
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app import database
+from app.api.deps import get_db_session
+from app.config import Settings
+from app.main import create_app
+from app.deadline import parse_route_timeouts, remaining, reset_deadline, set_deadline
+from app.exceptions.request_exceptions import DeadlineExceededException
+from app.metrics import metrics
+from app.middleware import DeadlineMiddleware
+
+
+def make_app(default_timeout: float, route_timeouts: str = "") -> FastAPI:
+    """느린 엔드포인트를 가진 테스트용 애플리케이션"""
+    app = FastAPI()
+    
+    @app.get("/slow")
+    async def slow(seconds: float = 1.0):
+        await asyncio.sleep(seconds)
+        return {"status": "done"}
+    
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for _ in range(3):
+                await asyncio.sleep(0.05)
+                yield b"chunk"
+        return StreamingResponse(chunks())
+    
+    app.add_middleware(
+        DeadlineMiddleware,
+        default_timeout=default_timeout,
+        route_timeouts=parse_route_timeouts(route_timeouts)
+    )
+    return app
+
+
+class TestDeadlineMiddleware:
+    """deadline 미들웨어 테스트"""
+    
+    def test_slow_request_returns_504(self):
+        """시간 예산 안에 응답을 시작하지 못하면 504 응답"""
+        # Given
+        client = TestClient(make_app(default_timeout=0.05))
+        exceeded = metrics.get("request_deadline_exceeded")
+        
+        # When
+        response = client.get("/slow")
+        
+        # Then
+        assert response.status_code == 504
+        assert metrics.get("request_deadline_exceeded") == exceeded + 1
+        assert client.get("/slow", params={"seconds": 0}).status_code == 200
+    
+    def test_header_can_only_shorten_budget(self):
+        """X-Request-Timeout 헤더는 예산을 줄일 때만 적용"""
+        # Given
+        client = TestClient(make_app(default_timeout=0.2))
+        
+        # When / Then
+        assert client.get("/slow", params={"seconds": 0.1}, headers={"X-Request-Timeout": "0.02"}).status_code == 504
+        assert client.get("/slow", params={"seconds": 0.1}, headers={"X-Request-Timeout": "60"}).status_code == 200
+    
+    def test_route_timeouts(self):
+        """라우트별 예산이 기본값보다 우선하고 0이면 deadline 없음"""
+        # Given
+        client = TestClient(make_app(default_timeout=0.01, route_timeouts="GET /slow=0"))
+        
+        # When
+        response = client.get("/slow", params={"seconds": 0.05})
+        
+        # Then
+        assert response.status_code == 200
+    
+    def test_streaming_body_not_cut_after_response_start(self):
+        """응답을 시작한 뒤에는 deadline이 지나도 본문 전송을 계속"""
+        # Given
+        client = TestClient(make_app(default_timeout=0.02))
+        
+        # When
+        response = client.get("/stream")
+        
+        # Then
+        assert response.status_code == 200
+        assert response.content == b"chunk" * 3
+    
+    def test_parse_route_timeouts(self):
+        """ROUTE_TIMEOUTS 파싱"""
+        assert parse_route_timeouts("get /api/v1/memos=2, POST /api/v1/batch=10") == {
+            "GET /api/v1/memos": 2.0,
+            "POST /api/v1/batch": 10.0,
+        }
+
+
+class TestStatementTimeout:
+    """DB 계층의 deadline 적용 테스트"""
+    
+    def test_set_local_statement_timeout_on_postgresql(self):
+        """PostgreSQL 트랜잭션 시작 시 남은 시간을 statement_timeout으로 설정"""
+        # Given
+        executed = []
+        connection = SimpleNamespace(
+            dialect=SimpleNamespace(name="postgresql"),
+            exec_driver_sql=executed.append
+        )
+        token = set_deadline(2.0)
+        
+        # When
+        database._apply_statement_timeout(None, None, connection)
+        reset_deadline(token)
+        
+        # Then
+        assert len(executed) == 1
+        assert executed[0].startswith("SET LOCAL statement_timeout = ")
+        assert 1900 <= int(executed[0].rsplit(" ", 1)[1]) <= 2000
+        assert remaining() is None
+    
+    def test_query_after_deadline_is_not_executed(self, db_session, create_test_memo):
+        """deadline이 지난 요청은 쿼리를 실행하지 않음"""
+        # Given
+        memo = create_test_memo()
+        token = set_deadline(0)
+        
+        # When / Then
+        try:
+            with pytest.raises(DeadlineExceededException):
+                db_session.get(type(memo), memo.id, populate_existing=True)
+        finally:
+            reset_deadline(token)
+    
+    def test_canceled_query_translated(self):
+        """statement_timeout으로 취소된 쿼리는 DeadlineExceededException으로 변환"""
+        # Given
+        error = Exception("canceling statement due to statement timeout")
+        error.pgcode = database.QUERY_CANCELED
+        context = SimpleNamespace(original_exception=error)
+        token = set_deadline(1.0)
+        timeouts = metrics.get("db_statement_timeouts")
+        
+        # When / Then
+        try:
+            with pytest.raises(DeadlineExceededException):
+                database._translate_statement_timeout(context)
+        finally:
+            reset_deadline(token)
+        assert metrics.get("db_statement_timeouts") == timeouts + 1
+    
+    def test_api_returns_504_when_budget_exhausted(self, client):
+        """시간 예산을 모두 쓴 API 요청은 504 응답"""
+        # When
+        response = client.get("/api/v1/memos", headers={"X-Request-Timeout": "0.000001"})
+        
+        # Then
+        assert response.status_code == 504
+
+
+@pytest.fixture
+def slow_database_app(tmp_path):
+    """쿼리마다 0.5초 지연되는 SQLite 파일 DB와 0.1초 deadline을 사용하는 애플리케이션"""
+    config = Settings(
+        DATABASE_URL=f"sqlite:///{tmp_path / 'slow.db'}",
+        DB_WARMUP_ENABLED=False,
+        REQUEST_TIMEOUT=0.1,
+        DB_FAULTS="latency=0.5"
+    )
+    setup_engine = database.create_db_engine(config.model_copy(update={"DB_FAULTS": ""}))
+    database.Base.metadata.create_all(bind=setup_engine)
+    setup_engine.dispose()
+    engine = database.create_db_engine(config)
+    session_factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    
+    def get_session():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            database.release_session(db)
+    
+    app = create_app(config)
+    app.dependency_overrides[get_db_session] = get_session
+    yield app
+    # 응답 후에도 실행 중인 DB 스레드가 세션을 닫을 때까지 대기
+    database.drain_pool(engine, 5.0)
+    engine.dispose()
+
+
+class TestDeadlineWithSlowDatabase:
+    """DB 작업용 스레드를 기다리는 요청의 deadline 테스트"""
+    
+    @pytest.mark.parametrize("method, path, body", [
+        ("POST", "/api/v1/memos", {"title": "느린 DB"}),
+        ("PUT", "/api/v1/memos/1", {"title": "느린 DB"}),
+        ("DELETE", "/api/v1/memos/1", None),
+        ("POST", "/api/v1/memos/lookup", {"ids": [1, 2]}),
+        ("GET", "/api/v1/memos/changes", None),
+    ])
+    def test_request_waiting_on_db_thread_returns_504_on_time(self, slow_database_app, method, path, body):
+        """쿼리가 끝나기를 기다리지 않고 시간 예산 안에 504 응답"""
+        with TestClient(slow_database_app) as client:
+            # When
+            started = time.perf_counter()
+            response = client.request(method, path, json=body)
+            elapsed = time.perf_counter() - started
+        
+        # Then
+        assert response.status_code == 504
+        assert elapsed < 0.4
+    
+    def test_pool_checkout_wait_bounded_by_deadline(self, tmp_path):
+        """커넥션 대기는 pool_timeout이 아니라 남은 시간까지만 기다리고 504로 변환"""
+        # Given: 커넥션 1개를 다른 곳에서 점유
+        engine = database.create_db_engine(Settings(
+            DATABASE_URL=f"sqlite:///{tmp_path / 'pool.db'}",
+            DB_POOL_SIZE=1,
+            DB_MAX_OVERFLOW=0,
+            DB_POOL_TIMEOUT=30
+        ))
+        held = engine.connect()
+        token = set_deadline(0.1)
+        
+        # When
+        started = time.perf_counter()
+        try:
+            with pytest.raises(DeadlineExceededException):
+                engine.connect()
+        finally:
+            reset_deadline(token)
+            held.close()
+            engine.dispose()
+        
+        # Then
+        assert time.perf_counter() - started < 1.0
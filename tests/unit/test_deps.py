@@ -0,0 +1,61 @@
+"""
+API 의존성 유닛 테스트
+세션의 지연 커넥션 획득 및 서비스 호출 직후 커넥션 반납 테스트
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api.deps import run_with_session
+from app.database import Base
+from app.exceptions.memo_exceptions import MemoNotFoundException
+from app.services.memo_service import memo_service
+
+
+@pytest.fixture
+def pooled_session_factory(tmp_path):
+    """커넥션 풀 상태를 확인할 수 있는 파일 기반 세션 팩토리"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'deps.db'}", pool_size=1, max_overflow=0)
+    Base.metadata.create_all(bind=engine)
+    yield engine, sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    engine.dispose()
+
+
+class TestRunWithSession:
+    """run_with_session 테스트"""
+    
+    def test_session_checks_out_connection_lazily(self, pooled_session_factory):
+        """세션을 만들기만 하면 커넥션을 점유하지 않음"""
+        # Given
+        engine, session_factory = pooled_session_factory
+        
+        # When
+        db = session_factory()
+        
+        # Then
+        assert engine.pool.checkedout() == 0
+        db.close()
+    
+    def test_connection_released_after_service_call(self, pooled_session_factory):
+        """서비스 반환 직후 커넥션이 풀에 반납되고 결과는 그대로 사용 가능"""
+        # Given
+        engine, session_factory = pooled_session_factory
+        db = session_factory()
+        
+        # When
+        result = run_with_session(db, memo_service.get_memos, 0, 10)
+        
+        # Then
+        assert engine.pool.checkedout() == 0
+        assert result.total == 0
+    
+    def test_connection_released_when_service_raises(self, pooled_session_factory):
+        """서비스에서 예외가 발생해도 커넥션 반납"""
+        # Given
+        engine, session_factory = pooled_session_factory
+        db = session_factory()
+        
+        # When / Then
+        with pytest.raises(MemoNotFoundException):
+            run_with_session(db, memo_service.get_memo, 999)
+        assert engine.pool.checkedout() == 0
@@ -0,0 +1,218 @@
+"""
+메모 변경 이벤트 유닛 테스트
+프로세스 내 브로커 전달, Last-Event-ID 재전송, 백프레셔 및 SSE 스트림 테스트
+"""
+import asyncio
+import json
+import threading
+
+import pytest
+
+from app.events import InMemoryBroker, event_stream, get_broker, parse_last_event_id
+from app.events import broker as broker_module
+from app.schemas.memo import MemoCreate
+from app.services.memo_service import memo_service
+
+
+class TestInMemoryBroker:
+    """프로세스 내 브로커 테스트"""
+    
+    async def test_publish_from_worker_thread(self):
+        """다른 스레드에서 발행한 이벤트가 구독자에게 전달됨"""
+        # Given
+        broker = InMemoryBroker()
+        await broker.start()
+        subscription, _ = broker.subscribe()
+        
+        # When
+        thread = threading.Thread(target=broker.publish, args=("created", 1, {"title": "메모"}))
+        thread.start()
+        thread.join()
+        event = await asyncio.wait_for(subscription.queue.get(), 1)
+        
+        # Then
+        assert (event.id, event.type, event.memo_id, event.data) == (1, "created", 1, {"title": "메모"})
+        await broker.stop()
+    
+    async def test_resume_from_last_event_id(self):
+        """재접속 시 Last-Event-ID 이후 이벤트만 재전송"""
+        # Given
+        broker = InMemoryBroker()
+        await broker.start()
+        for memo_id in range(1, 4):
+            broker.publish("created", memo_id)
+        
+        # When
+        subscription, complete = broker.subscribe(last_event_id=1)
+        await asyncio.sleep(0)
+        
+        # Then
+        assert complete is True
+        assert subscription.queue.qsize() == 2
+        assert [subscription.queue.get_nowait().id for _ in range(2)] == [2, 3]
+        await broker.stop()
+    
+    async def test_resume_beyond_replay_buffer(self):
+        """재전송 버퍼에서 밀려난 이벤트가 있으면 완전 복구 불가로 표시"""
+        # Given
+        broker = InMemoryBroker(replay_buffer_size=2)
+        await broker.start()
+        for memo_id in range(1, 6):
+            broker.publish("updated", memo_id)
+        
+        # When
+        subscription, complete = broker.subscribe(last_event_id=1)
+        
+        # Then
+        assert complete is False
+        assert subscription.queue.qsize() == 2
+        await broker.stop()
+    
+    async def test_resume_on_fresh_broker_is_incomplete(self):
+        """이벤트를 받은 적 없는 브로커(재시작/다른 워커)에 Last-Event-ID로 재접속하면 완전 복구 불가로 표시"""
+        # Given
+        broker = InMemoryBroker()
+        await broker.start()
+        
+        # When
+        _, complete = broker.subscribe(last_event_id=500)
+        _, complete_from_start = broker.subscribe(last_event_id=0)
+        
+        # Then
+        assert complete is False
+        assert complete_from_start is True
+        await broker.stop()
+    
+    async def test_slow_subscriber_overflows(self):
+        """구독 큐가 가득 차면 더 쌓지 않고 overflowed 표시"""
+        # Given
+        broker = InMemoryBroker(subscriber_queue_size=2)
+        await broker.start()
+        subscription, _ = broker.subscribe()
+        
+        # When
+        for memo_id in range(1, 5):
+            broker.publish("created", memo_id)
+        await asyncio.sleep(0)
+        
+        # Then
+        assert subscription.overflowed is True
+        assert subscription.queue.qsize() == 2
+        await broker.stop()
+
+
+class TestEventStream:
+    """SSE 스트림 테스트"""
+    
+    async def test_stream_sends_events_and_heartbeat(self):
+        """재전송 이벤트 전송 후 이벤트가 없으면 heartbeat 전송"""
+        # Given
+        broker = InMemoryBroker()
+        await broker.start()
+        broker.publish("deleted", 7)
+        stream = event_stream(broker, last_event_id=0, heartbeat_interval=0.01)
+        
+        # When
+        retry = await stream.__anext__()
+        message = await stream.__anext__()
+        heartbeat = await stream.__anext__()
+        await stream.aclose()
+        
+        # Then
+        assert retry.startswith("retry:")
+        assert message.startswith("id: 1\nevent: deleted\n")
+        assert json.loads(message.split("data: ")[1]) == {"memo_id": 7, "data": None}
+        assert heartbeat == ": heartbeat\n\n"
+        assert broker.subscriber_count == 0
+        await broker.stop()
+    
+    async def test_stream_ends_after_overflow(self):
+        """큐가 넘친 구독은 남은 이벤트를 보낸 뒤 종료 (클라이언트 재접속 유도)"""
+        # Given
+        broker = InMemoryBroker(subscriber_queue_size=1)
+        await broker.start()
+        stream = event_stream(broker, last_event_id=None, heartbeat_interval=1)
+        await stream.__anext__()
+        broker.publish("created", 1)
+        broker.publish("created", 2)
+        await asyncio.sleep(0)
+        
+        # When
+        messages = [message async for message in stream]
+        
+        # Then
+        assert len(messages) == 1
+        assert messages[0].startswith("id: 1\n")
+        await broker.stop()
+    
+    async def test_stream_resets_when_broker_missed_events(self):
+        """새로 시작한 브로커에 Last-Event-ID로 재접속하면 reset 이벤트 전송"""
+        # Given
+        broker = InMemoryBroker()
+        await broker.start()
+        stream = event_stream(broker, last_event_id=500, heartbeat_interval=1)
+        
+        # When
+        await stream.__anext__()
+        message = await stream.__anext__()
+        await stream.aclose()
+        
+        # Then
+        assert message.startswith("event: reset\n")
+        await broker.stop()
+    
+    def test_parse_last_event_id(self):
+        """Last-Event-ID 헤더 파싱"""
+        assert parse_last_event_id("42") == 42
+        assert parse_last_event_id("abc") is None
+        assert parse_last_event_id(None) is None
+
+
+class TestMemoEventPublishing:
+    """메모 API의 이벤트 발행 테스트"""
+    
+    def test_crud_publishes_events(self, client, sample_memo_data):
+        """생성/수정/삭제 시 변경 이벤트 발행"""
+        # Given
+        broker = get_broker()
+        memo_id = client.post("/api/v1/memos", json=sample_memo_data).json()["id"]
+        
+        # When
+        client.put(f"/api/v1/memos/{memo_id}", json={"title": "수정"})
+        client.delete(f"/api/v1/memos/{memo_id}")
+        subscription, _ = broker.subscribe(last_event_id=0)
+        
+        # Then
+        events = [subscription.queue.get_nowait() for _ in range(subscription.queue.qsize())]
+        assert [(event.type, event.memo_id) for event in events] == [
+            ("created", memo_id), ("updated", memo_id), ("deleted", memo_id)
+        ]
+        assert events[1].data["title"] == "수정"
+    
+    def test_transactional_broker_publishes_before_commit(self, db_session, sample_memo_data, monkeypatch):
+        """트랜잭션에 참여하는 브로커는 커밋 전에 쓰기 세션에서 발행하고, 발행이 실패하면 쓰기도 롤백"""
+        # Given
+        published = []
+        
+        class TransactionalBroker(InMemoryBroker):
+            def publish_in_transaction(self, db, event_type, memo_id, data=None):
+                if event_type == "deleted":
+                    raise RuntimeError("notify failed")
+                published.append((event_type, db.in_transaction()))
+                return True
+        
+        monkeypatch.setattr(broker_module, "_broker", TransactionalBroker())
+        
+        # When
+        memo = memo_service.create_memo(db_session, MemoCreate(**sample_memo_data))
+        with pytest.raises(RuntimeError):
+            memo_service.delete_memo(db_session, memo.id)
+        
+        # Then
+        assert published == [("created", True)]
+        assert memo_service.get_memo(db_session, memo.id).id == memo.id
+    
+    def test_stream_route_is_not_memo_id(self, app):
+        """/memos/stream 경로가 /memos/{memo_id}보다 먼저 등록됨"""
+        paths = [route.path for route in app.routes]
+        assert paths.index("/api/v1/memos/stream") < paths.index("/api/v1/memos/{memo_id}")
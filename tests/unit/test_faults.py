@@ -0,0 +1,171 @@
+"""
+DB 장애 주입 유닛 테스트
+장애 설정 파싱, 지연/오류 주입, 풀 고갈 시 503 응답 및 장애 주입 부하 측정 테스트
+"""
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from app.api.deps import get_db_session
+from app.config import Settings
+from app.database import Base, create_db_engine
+from app.faults import FaultSpec, parse_faults
+from app.main import create_app
+from benchmarks.faults import run_with_faults
+
+
+@pytest.fixture
+def faulty_app(tmp_path):
+    """설정의 DB_FAULTS를 적용한 SQLite 파일 엔진을 사용하는 애플리케이션 생성 함수"""
+    engines = []
+    
+    def make(faults: str, **options):
+        config = Settings(
+            DATABASE_URL=f"sqlite:///{tmp_path / 'faults.db'}",
+            DB_WARMUP_ENABLED=False,
+            DB_FAULTS=faults,
+            **options
+        )
+        Base.metadata.create_all(bind=create_db_engine(config.model_copy(update={"DB_FAULTS": ""})))
+        engine = create_db_engine(config)
+        engines.append(engine)
+        session_factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+        
+        def get_session():
+            db = session_factory()
+            try:
+                yield db
+            finally:
+                db.close()
+        
+        app = create_app(config)
+        app.dependency_overrides[get_db_session] = get_session
+        return app
+    
+    yield make
+    for engine in engines:
+        engine.dispose()
+
+
+class TestFaultSpec:
+    """장애 설정 파싱 테스트"""
+    
+    def test_parse(self):
+        """이름=값 목록을 파싱하고 비어 있으면 장애 주입 안 함"""
+        assert parse_faults("latency=0.05, jitter=0.01,error_rate=0.5") == FaultSpec(
+            latency=0.05, jitter=0.01, error_rate=0.5
+        )
+        assert parse_faults("") is None
+    
+    def test_invalid_values_are_rejected(self):
+        """알 수 없는 이름, 음수, 1을 넘는 오류 비율은 거부"""
+        for value in ("slowness=1", "latency=-1", "error_rate=2", "latency=fast"):
+            with pytest.raises(ValueError):
+                parse_faults(value)
+
+
+class TestFaultInjection:
+    """엔진 장애 주입 테스트"""
+    
+    def test_latency_is_added_to_each_statement(self):
+        """statement마다 latency만큼 지연"""
+        # Given
+        engine = create_db_engine(Settings(DATABASE_URL="sqlite://", DB_FAULTS="latency=0.05"))
+        
+        # When
+        started = time.perf_counter()
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 1"))
+        elapsed = time.perf_counter() - started
+        engine.dispose()
+        
+        # Then
+        assert elapsed >= 0.1
+    
+    def test_connection_errors_return_503(self, faulty_app):
+        """주입된 연결 오류는 500이 아니라 재시도 가능한 503으로 응답"""
+        with TestClient(faulty_app("error_rate=1")) as client:
+            response = client.get("/api/v1/memos/1")
+        
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+        assert response.json()["detail"] == "Database unavailable"
+    
+    def test_other_operational_errors_return_500(self, tmp_path):
+        """연결 오류가 아닌 OperationalError(테이블 없음 등)는 재시도를 유도하지 않고 500으로 응답"""
+        # Given: 마이그레이션하지 않은 DB
+        app = create_app(Settings(
+            DATABASE_URL=f"sqlite:///{tmp_path / 'empty.db'}",
+            DB_WARMUP_ENABLED=False
+        ))
+        
+        # When
+        with TestClient(app, raise_server_exceptions=False) as client:
+            response = client.get("/api/v1/memos/1")
+        
+        # Then
+        assert response.status_code == 500
+        assert "Retry-After" not in response.headers
+    
+    def test_pool_exhaustion_returns_503(self, faulty_app):
+        """커넥션을 DB_POOL_TIMEOUT 안에 얻지 못한 요청은 503으로 차단"""
+        # Given: 커넥션 1개를 느린 쿼리가 점유하고 DB 스레드는 풀보다 많음
+        app = faulty_app(
+            "latency=0.3",
+            DB_POOL_SIZE=1,
+            DB_MAX_OVERFLOW=0,
+            DB_POOL_TIMEOUT=0.05,
+            DB_THREADPOOL_SIZE=4
+        )
+        
+        # When
+        async def concurrent_requests():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await asyncio.gather(*(client.get(f"/api/v1/memos/{i}") for i in range(1, 5)))
+        
+        with TestClient(app) as client:
+            responses = client.portal.call(concurrent_requests)
+        
+        # Then
+        statuses = sorted(response.status_code for response in responses)
+        assert statuses[0] == 404
+        assert 503 in statuses
+
+
+class TestFaultHarness:
+    """장애 주입 부하 측정 테스트"""
+    
+    def test_report_counts_timeouts_and_shedding(self):
+        """느린 DB에서 deadline 초과(504)와 풀 대기 초과(503)를 작업별로 집계"""
+        # When
+        report = asyncio.run(run_with_faults(
+            "latency=0.2",
+            rate=40,
+            duration=0.5,
+            rows=50,
+            pool_size=1,
+            pool_timeout=0.05,
+            threads=4,
+            request_timeout=0.15
+        ))
+        
+        # Then
+        total = report["TOTAL"]
+        assert total["count"] == total["ok"] + total["timeout"] + total["shed"] + total["error"]
+        assert total["shed"] > 0
+        assert total["timeout"] > 0
+        assert total["p99_ms"] >= 150
+        assert set(report) >= {"list", "detail", "TOTAL"}
+    
+    def test_no_faults_baseline(self):
+        """장애가 없으면 모든 요청 성공"""
+        report = asyncio.run(run_with_faults("", rate=50, duration=0.3, rows=50))
+        
+        assert report["TOTAL"]["ok"] == report["TOTAL"]["count"]
@@ -0,0 +1,90 @@
+"""
+메모 JSON 조각 캐시 유닛 테스트
+조각 재사용, updated_at 기준 무효화 및 목록 응답 조립 테스트
+"""
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.cache import MemoFragmentCache
+from app.metrics import metrics
+from app.schemas.memo import MemoListResponse, MemoLookupResponse, MemoResponse
+
+
+def make_memo(memo_id: int = 1, title: str = "메모", updated_at: datetime = None) -> MemoResponse:
+    """테스트용 메모 응답"""
+    now = datetime(2024, 1, 1, 12, 0, 0, 123456)
+    return MemoResponse(
+        id=memo_id,
+        title=title,
+        content="내용 \"따옴표\"\n줄바꿈",
+        created_at=now,
+        updated_at=updated_at or now
+    )
+
+
+class TestMemoFragmentCache:
+    """메모 JSON 조각 캐시 테스트"""
+    
+    def test_repeated_encode_reuses_fragment(self):
+        """같은 (id, updated_at)의 메모는 다시 직렬화하지 않음"""
+        # Given
+        cache = MemoFragmentCache()
+        memo = make_memo()
+        first = cache.encode(memo)
+        hits = metrics.get("memo_fragment_cache_hits")
+        
+        # When
+        second = cache.encode(make_memo())
+        
+        # Then
+        assert second is first
+        assert metrics.get("memo_fragment_cache_hits") == hits + 1
+    
+    def test_changed_memo_is_reencoded(self):
+        """updated_at이 다르면 캐시된 조각을 사용하지 않음"""
+        # Given
+        cache = MemoFragmentCache()
+        memo = make_memo()
+        cache.encode(memo)
+        
+        # When
+        updated = make_memo(title="수정", updated_at=memo.updated_at + timedelta(seconds=1))
+        fragment = cache.encode(updated)
+        
+        # Then
+        assert "수정".encode() in fragment
+        assert fragment == updated.model_dump_json().encode()
+        assert cache.size == 1
+    
+    def test_list_response_matches_default_serialization(self):
+        """조각을 이어 붙인 응답은 FastAPI 기본 직렬화 결과와 같음"""
+        # Given
+        cache = MemoFragmentCache()
+        memos = [make_memo(memo_id) for memo_id in range(1, 4)]
+        cache.encode(memos[0])
+        responses = [
+            MemoListResponse(items=memos, total=3, skip=0, limit=100),
+            MemoListResponse(items=[], total=0, skip=0, limit=100),
+            MemoLookupResponse(items=memos, missing_ids=[999]),
+        ]
+        
+        # When / Then
+        for response in responses:
+            expected = JSONResponse(jsonable_encoder(response)).body
+            assert cache.encode_response(response) == expected
+    
+    def test_eviction_and_discard(self):
+        """max_entries를 넘으면 오래된 조각부터 제거하고, 삭제된 메모의 조각은 제거"""
+        # Given
+        cache = MemoFragmentCache(max_entries=2)
+        
+        # When
+        for memo_id in range(1, 4):
+            cache.put(make_memo(memo_id))
+        cache.discard(3)
+        
+        # Then
+        assert cache.size == 1
+        assert cache.bytes == len(make_memo(2).model_dump_json().encode())
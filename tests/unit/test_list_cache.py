@@ -0,0 +1,113 @@
+"""
+목록 페이지 캐시 유닛 테스트
+세대 기반 무효화, 조회 도중 쓰기 처리 및 LRU 제거 테스트
+"""
+from datetime import datetime
+
+from app.cache import ListPageCache
+from app.schemas.memo import MemoListResponse, MemoResponse
+
+
+def make_page(skip: int = 0, count: int = 1) -> MemoListResponse:
+    """테스트용 목록 응답"""
+    now = datetime.utcnow()
+    items = [
+        MemoResponse(id=skip + i + 1, title=f"메모 {i}", content="내용", created_at=now, updated_at=now)
+        for i in range(count)
+    ]
+    return MemoListResponse(items=items, total=count, skip=skip, limit=count)
+
+
+class TestListPageCache:
+    """세대 기반 목록 페이지 캐시 테스트"""
+    
+    def test_get_returns_page_of_current_generation(self):
+        """저장한 세대가 현재 세대이면 조회됨"""
+        # Given
+        cache = ListPageCache()
+        page = make_page()
+        
+        # When
+        cache.put(("page", 0, 1), page, cache.generation)
+        
+        # Then
+        assert cache.get(("page", 0, 1)) is page
+        assert cache.get(("page", 1, 1)) is None
+    
+    def test_invalidate_makes_all_pages_unreachable(self):
+        """무효화하면 이전 세대의 모든 페이지가 조회되지 않음"""
+        # Given
+        cache = ListPageCache()
+        for skip in range(3):
+            cache.put(("page", skip, 1), make_page(skip), cache.generation)
+        
+        # When
+        cache.invalidate()
+        
+        # Then
+        assert all(cache.get(("page", skip, 1)) is None for skip in range(3))
+    
+    def test_put_after_concurrent_write_is_ignored(self):
+        """조회 도중 쓰기가 끝나면 조회 결과를 저장하지 않음"""
+        # Given
+        cache = ListPageCache()
+        generation = cache.generation
+        
+        # When
+        cache.invalidate()
+        cache.put(("page", 0, 1), make_page(), generation)
+        
+        # Then
+        assert cache.get(("page", 0, 1)) is None
+        assert cache.size == 0
+    
+    def test_stale_pages_reclaimed_on_put(self):
+        """지난 세대 페이지는 다음 저장 시 회수"""
+        # Given
+        cache = ListPageCache()
+        cache.put(("page", 0, 1), make_page(), cache.generation)
+        cache.invalidate()
+        
+        # When
+        cache.put(("page", 1, 1), make_page(1), cache.generation)
+        
+        # Then
+        assert cache.size == 1
+        assert cache.get(("page", 1, 1)) is not None
+    
+    def test_evicts_least_recently_used_over_limits(self):
+        """개수나 크기 한도를 넘으면 가장 오래 사용하지 않은 페이지부터 제거"""
+        # Given
+        cache = ListPageCache(max_entries=2)
+        cache.put(("page", 0, 1), make_page(0), cache.generation)
+        cache.put(("page", 1, 1), make_page(1), cache.generation)
+        cache.get(("page", 0, 1))
+        
+        # When
+        cache.put(("page", 2, 1), make_page(2), cache.generation)
+        
+        # Then
+        assert cache.get(("page", 1, 1)) is None
+        assert cache.get(("page", 0, 1)) is not None
+        
+        # Given
+        small = ListPageCache(max_bytes=cache.bytes // 2 + 1)
+        
+        # When
+        small.put(("page", 0, 1), make_page(0), small.generation)
+        small.put(("page", 1, 1), make_page(1), small.generation)
+        
+        # Then
+        assert small.size == 1
+        assert small.bytes <= small.max_bytes
+    
+    def test_disabled_when_max_entries_is_zero(self):
+        """max_entries가 0이면 저장하지 않음"""
+        # Given
+        cache = ListPageCache(max_entries=0)
+        
+        # When
+        cache.put(("page", 0, 1), make_page(), cache.generation)
+        
+        # Then
+        assert cache.get(("page", 0, 1)) is None
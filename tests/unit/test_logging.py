@@ -0,0 +1,153 @@
+"""
+로깅 유닛 테스트
+큐 핸들러 비블로킹, 로거별 샘플링, SQL 로그 속도 제한 및 접근 로그 테스트
+"""
+import json
+import logging
+import queue
+import sys
+
+from sqlalchemy import text
+
+from app.config import Settings
+from app.database import create_db_engine, track_queries
+from app.logging_config import (
+    JsonFormatter,
+    NonBlockingQueueHandler,
+    RateLimitFilter,
+    SamplingFilter,
+    configure_logging,
+    parse_sampling,
+    shutdown_logging,
+)
+from app.metrics import metrics
+
+
+def make_record(name: str = "app", level: int = logging.INFO, **fields) -> logging.LogRecord:
+    """테스트용 로그 레코드"""
+    record = logging.LogRecord(name, level, __file__, 1, "message %s", ("arg",), None)
+    if fields:
+        record.fields = fields
+    return record
+
+
+class TestLoggingPipeline:
+    """큐 기반 로깅 파이프라인 테스트"""
+    
+    def test_full_queue_drops_without_blocking(self):
+        """큐가 가득 차면 블로킹하지 않고 레코드를 버림"""
+        # Given
+        handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+        dropped = metrics.get("log_records_dropped")
+        
+        # When
+        for _ in range(3):
+            handler.handle(make_record())
+        
+        # Then
+        assert handler.queue.qsize() == 1
+        assert metrics.get("log_records_dropped") == dropped + 2
+    
+    def test_sampling_by_logger_prefix(self):
+        """로거 접두사별 비율로 샘플링하고 WARNING 이상은 항상 통과"""
+        # Given
+        sampling = SamplingFilter(parse_sampling("app.access=0, app.sql=1"))
+        
+        # Then
+        assert sampling.filter(make_record("app.access")) is False
+        assert sampling.filter(make_record("app.access.slow")) is False
+        assert sampling.filter(make_record("app.access", logging.WARNING)) is True
+        assert sampling.filter(make_record("app.sql")) is True
+        assert sampling.filter(make_record("app.events")) is True
+    
+    def test_rate_limit(self):
+        """초당 허용 수를 넘는 레코드는 버림"""
+        # Given
+        rate_limit = RateLimitFilter(per_second=2)
+        
+        # When
+        passed = [rate_limit.filter(make_record("app.sql")) for _ in range(5)]
+        
+        # Then
+        assert passed == [True, True, False, False, False]
+    
+    def test_json_format_includes_fields(self):
+        """JSON 로그에 extra fields 포함"""
+        # When
+        entry = json.loads(JsonFormatter().format(make_record("app.access", route="/api/v1/memos")))
+        
+        # Then
+        assert entry["logger"] == "app.access"
+        assert entry["message"] == "message arg"
+        assert entry["route"] == "/api/v1/memos"
+    
+    
+    def test_queued_exception_keeps_traceback_field(self):
+        """큐를 거친 예외 로그도 메시지와 별도의 exc_info 필드로 traceback 출력"""
+        # Given
+        handler = NonBlockingQueueHandler(queue.Queue())
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord("app", logging.ERROR, __file__, 1, "failed %s", ("arg",), sys.exc_info())
+        
+        # When
+        handler.handle(record)
+        entry = json.loads(JsonFormatter().format(handler.queue.get_nowait()))
+        
+        # Then
+        assert entry["message"] == "failed arg"
+        assert "ValueError: boom" in entry["exc_info"]
+    
+    def test_third_party_loggers_default_to_warning(self):
+        """LOG_LEVEL은 app.* 로거에만 적용되고 라이브러리 로거는 THIRD_PARTY_LOG_LEVEL을 따름"""
+        # When
+        configure_logging(Settings(DATABASE_URL="sqlite://", LOG_LEVEL="DEBUG"))
+        try:
+            app_enabled = logging.getLogger("app.events").isEnabledFor(logging.DEBUG)
+            httpx_enabled = logging.getLogger("httpx").isEnabledFor(logging.INFO)
+        finally:
+            shutdown_logging()
+        
+        # Then
+        assert app_enabled
+        assert not httpx_enabled
+
+
+class TestRequestLogging:
+    """SQL 로그 채널 및 접근 로그 테스트"""
+    
+    def test_sql_channel_records_duration(self, caplog):
+        """SQL은 echo 대신 app.sql 채널에 실행 시간과 함께 기록되고 요청별 DB 시간에 합산"""
+        # Given
+        engine = create_db_engine(Settings(DATABASE_URL="sqlite://", DEBUG=True))
+        stats = track_queries()
+        
+        # When
+        with caplog.at_level(logging.INFO, logger="app.sql"):
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        
+        # Then
+        assert not engine.echo
+        record = next(record for record in caplog.records if record.name == "app.sql")
+        assert record.getMessage() == "SELECT 1"
+        assert record.fields["duration_ms"] >= 0
+        assert stats.count == 1
+        engine.dispose()
+    
+    def test_access_log(self, client, create_test_memo, caplog):
+        """요청마다 라우트 템플릿, 상태 코드, 지연 시간 및 DB 시간 기록"""
+        # Given
+        memo = create_test_memo()
+        
+        # When
+        with caplog.at_level(logging.INFO, logger="app.access"):
+            client.get(f"/api/v1/memos/{memo.id}")
+        
+        # Then
+        fields = next(record.fields for record in caplog.records if record.name == "app.access")
+        assert fields["route"] == "/api/v1/memos/{memo_id}"
+        assert fields["status"] == 200
+        assert fields["db_queries"] >= 1
+        assert fields["duration_ms"] >= fields["db_ms"]
@@ -5,7 +5,7 @@
 import pytest
 from sqlalchemy.orm import Session
 
-from app.repositories.memo_repository import memo_repository
+from app.repositories.memo_repository import MemoRow, memo_repository
 from app.schemas.memo import MemoCreate, MemoUpdate
 from app.models.memo import Memo
 
@@ -105,6 +105,38 @@ class TestMemoRepository:
         assert total == 5
         # skip=2, limit=2이므로 2개의 메모가 반환되어야 함
     
+    def test_get_memo_rows(self, db_session: Session, create_test_memo):
+        """읽기 전용 메모 목록 조회 테스트 (identity map에 등록되지 않음)"""
+        # Given
+        for i in range(3):
+            create_test_memo(title=f"메모 {i+1}", content=f"내용 {i+1}")
+        db_session.expunge_all()
+        
+        # When
+        rows, total = memo_repository.get_memo_rows(db_session, skip=0, limit=2)
+        
+        # Then
+        assert total == 3
+        assert len(rows) == 2
+        assert all(isinstance(row, MemoRow) for row in rows)
+        assert rows[0].updated_at >= rows[1].updated_at
+        assert len(db_session.identity_map) == 0
+    
+    def test_get_memo_row_by_id(self, db_session: Session, create_test_memo):
+        """읽기 전용 단건 조회 테스트"""
+        # Given
+        test_memo = create_test_memo(title="테스트 메모", content="테스트 내용")
+        
+        # When
+        row = memo_repository.get_memo_row_by_id(db_session, test_memo.id)
+        missing = memo_repository.get_memo_row_by_id(db_session, 999)
+        
+        # Then
+        assert row == MemoRow(
+            test_memo.id, "테스트 메모", "테스트 내용", test_memo.created_at, test_memo.updated_at
+        )
+        assert missing is None
+    
     def test_update_memo(self, db_session: Session, create_test_memo):
         """메모 수정 테스트"""
         # Given
@@ -0,0 +1,44 @@
+"""
+메트릭 유닛 테스트
+SQL 컴파일 캐시 적중률 집계 및 /metrics 엔드포인트 테스트
+"""
+from sqlalchemy.orm import sessionmaker
+
+from app.config import Settings
+from app.database import Base, create_db_engine
+from app.metrics import metrics
+from app.repositories.memo_repository import memo_repository
+
+
+class TestStatementCacheMetrics:
+    """컴파일 캐시 메트릭 테스트"""
+    
+    def test_repeated_queries_hit_compiled_cache(self):
+        """같은 조회를 반복하면 두 번째부터 컴파일 캐시에 적중"""
+        # Given
+        engine = create_db_engine(Settings(DATABASE_URL="sqlite://", DEBUG=False))
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        memo_repository.get_memo_by_id(session, 1)
+        metrics.reset()
+        
+        # When
+        for memo_id in range(2, 12):
+            memo_repository.get_memo_by_id(session, memo_id)
+        
+        # Then
+        snapshot = metrics.snapshot()
+        assert snapshot["sql_compiled_cache_cache_hit"] == 10
+        assert snapshot.get("sql_compiled_cache_cache_miss", 0) == 0
+        assert snapshot["sql_compiled_cache_hit_ratio"] == 1.0
+        session.close()
+        engine.dispose()
+    
+    def test_metrics_endpoint(self, client):
+        """/metrics 엔드포인트는 캐시 적중률 게이지를 포함"""
+        # When
+        response = client.get("/metrics")
+        
+        # Then
+        assert response.status_code == 200
+        assert "sql_compiled_cache_hit_ratio" in response.json()
@@ -0,0 +1,193 @@
+"""
+무중단 마이그레이션 도우미 유닛 테스트
+재개 가능한 배치 backfill과 CREATE INDEX CONCURRENTLY 생성 테스트
+"""
+import io
+
+import pytest
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import create_engine, event, inspect, select, text
+
+from app.migrations import (
+    backfill_in_batches,
+    create_index_concurrently,
+    drop_index_concurrently,
+    migration_checkpoints,
+    run_backfill,
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """id가 듬성듬성한 메모 100건이 있는 SQLite 파일 엔진"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrations.db'}")
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE memos (id INTEGER PRIMARY KEY, title VARCHAR(200), title_length INTEGER)"
+        ))
+        connection.execute(
+            text("INSERT INTO memos (id, title) VALUES (:id, :title)"),
+            [{"id": i * 7, "title": "메모" * (i % 5 + 1)} for i in range(1, 101)]
+        )
+    yield engine
+    engine.dispose()
+
+
+class TestBackfill:
+    """배치 backfill 테스트"""
+    
+    def test_updates_all_rows_in_batches(self, engine):
+        """키 범위를 batch_size행씩 나눠 모든 행을 갱신하고 완료를 기록"""
+        # Given
+        batches = []
+        
+        # When
+        with engine.connect() as connection:
+            updated = backfill_in_batches(
+                connection, "title_length", "memos", "title_length = length(title)",
+                where="title_length IS NULL", batch_size=30, pause=0,
+                progress=lambda last_id, end_id: batches.append(last_id)
+            )
+            checkpoint = connection.execute(select(migration_checkpoints)).one()
+            missing = connection.execute(text("SELECT count(*) FROM memos WHERE title_length IS NULL")).scalar()
+        
+        # Then: 듬성듬성한 id(7의 배수)에서도 배치당 30행씩 4번
+        assert updated == 100
+        assert batches == [210, 420, 630, 700]
+        assert missing == 0
+        assert checkpoint.rows_updated == 100
+        assert checkpoint.completed_at is not None
+    
+    def test_resumes_from_checkpoint_after_failure(self, engine):
+        """중간에 실패해도 커밋된 배치는 남고 다시 실행하면 다음 범위부터 진행"""
+        # Given: 두 번째 배치 후 실패
+        def fail_after_two_batches(last_id, end_id):
+            if last_id >= 420:
+                raise RuntimeError("interrupted")
+        
+        with engine.connect() as connection:
+            with pytest.raises(RuntimeError):
+                backfill_in_batches(
+                    connection, "title_length", "memos", "title_length = length(title)",
+                    batch_size=30, pause=0, progress=fail_after_two_batches
+                )
+        
+        # When
+        with engine.connect() as connection:
+            updated = backfill_in_batches(
+                connection, "title_length", "memos", "title_length = length(title)",
+                batch_size=30, pause=0
+            )
+            again = backfill_in_batches(
+                connection, "title_length", "memos", "title_length = length(title)",
+                batch_size=30, pause=0
+            )
+            missing = connection.execute(text("SELECT count(*) FROM memos WHERE title_length IS NULL")).scalar()
+        
+        # Then: 남은 40행만 갱신하고 완료된 backfill은 건너뜀
+        assert updated == 40
+        assert again == 0
+        assert missing == 0
+    
+    def test_slow_batches_shrink_batch_size(self, engine):
+        """배치가 max_batch_seconds보다 오래 걸리면 배치 크기를 줄임"""
+        batches = []
+        
+        with engine.connect() as connection:
+            backfill_in_batches(
+                connection, "title_length", "memos", "title_length = length(title)",
+                batch_size=40, pause=0, max_batch_seconds=0, min_batch_size=10,
+                progress=lambda last_id, end_id: batches.append(last_id)
+            )
+        
+        # 40 → 20 → 10 → 10 ...
+        assert batches[:3] == [280, 420, 490]
+    
+    def test_run_backfill_in_migration(self, engine):
+        """마이그레이션 안에서는 autocommit 블록에서 배치마다 커밋"""
+        with engine.connect() as connection:
+            context = MigrationContext.configure(connection)
+            with context.begin_transaction(), Operations.context(context):
+                updated = run_backfill("title_length", "memos", "title_length = length(title)", pause=0)
+        
+        with engine.connect() as connection:
+            missing = connection.execute(text("SELECT count(*) FROM memos WHERE title_length IS NULL")).scalar()
+        assert updated == 100
+        assert missing == 0
+    
+    
+    def test_batch_and_checkpoint_commit_together_in_migration(self, engine):
+        """마이그레이션 안에서도 체크포인트 기록이 실패하면 그 배치의 UPDATE도 롤백"""
+        # Given: 두 번째 배치의 체크포인트 기록에서 실패
+        checkpoints = []
+        
+        def fail_second_checkpoint(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("UPDATE migration_checkpoints") and "last_id" in statement:
+                checkpoints.append(statement)
+                if len(checkpoints) == 2:
+                    raise RuntimeError("interrupted")
+        
+        event.listen(engine, "before_cursor_execute", fail_second_checkpoint)
+        with engine.connect() as connection:
+            context = MigrationContext.configure(connection)
+            with pytest.raises(RuntimeError), context.begin_transaction(), Operations.context(context):
+                run_backfill("title_length", "memos", "title_length = length(title)", batch_size=30, pause=0)
+        event.remove(engine, "before_cursor_execute", fail_second_checkpoint)
+        
+        with engine.connect() as connection:
+            updated_after_failure = connection.execute(
+                text("SELECT count(*) FROM memos WHERE title_length IS NOT NULL")
+            ).scalar()
+        
+        # When
+        with engine.connect() as connection:
+            context = MigrationContext.configure(connection)
+            with context.begin_transaction(), Operations.context(context):
+                run_backfill("title_length", "memos", "title_length = length(title)", batch_size=30, pause=0)
+            checkpoint = connection.execute(select(migration_checkpoints)).one()
+        
+        # Then: 첫 배치만 남고, 다시 실행한 뒤 기록된 갱신 수는 실제 행 수와 같음
+        assert updated_after_failure == 30
+        assert checkpoint.rows_updated == 100
+
+
+class TestConcurrentIndex:
+    """인덱스 생성/삭제 테스트"""
+    
+    def test_postgresql_builds_index_concurrently_outside_transaction(self):
+        """PostgreSQL에서는 트랜잭션을 커밋한 뒤 CREATE INDEX CONCURRENTLY 실행"""
+        # Given
+        buffer = io.StringIO()
+        context = MigrationContext.configure(
+            dialect_name="postgresql", opts={"as_sql": True, "output_buffer": buffer}
+        )
+        
+        # When
+        with Operations.context(context):
+            create_index_concurrently("ix_memos_title_length", "memos", ["title_length"], lock_timeout="5s")
+            drop_index_concurrently("ix_memos_title_length", "memos")
+        sql = buffer.getvalue()
+        
+        # Then
+        assert "COMMIT;" in sql
+        assert "SET lock_timeout = '5s'" in sql
+        assert "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_memos_title_length ON memos (title_length)" in sql
+        assert "DROP INDEX CONCURRENTLY IF EXISTS ix_memos_title_length" in sql
+    
+    def test_other_databases_create_plain_index(self, engine):
+        """PostgreSQL이 아니면 일반 인덱스 생성"""
+        with engine.begin() as connection:
+            with Operations.context(MigrationContext.configure(connection)):
+                create_index_concurrently("ix_memos_title_length", "memos", ["title_length"])
+        
+        assert "ix_memos_title_length" in {index["name"] for index in inspect(engine).get_indexes("memos")}
+    
+    def test_backfill_rejects_offline_mode(self):
+        """offline(--sql) 모드에서는 backfill을 SQL 스크립트로 만들 수 없음"""
+        context = MigrationContext.configure(
+            dialect_name="postgresql", opts={"as_sql": True, "output_buffer": io.StringIO()}
+        )
+        
+        with Operations.context(context), pytest.raises(RuntimeError):
+            run_backfill("title_length", "memos", "title_length = length(title)")
@@ -0,0 +1,132 @@
+"""
+요청 프로파일러 유닛 테스트
+토큰 서명, 요청 스레드 샘플링, 출력 형식 및 프로파일링 미들웨어/관리자 API 테스트
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_db_session
+from app.config import Settings
+from app.main import create_app
+from app.profiling import Profile, Sampler, sign_token, to_collapsed, to_speedscope, verify_token
+
+
+def busy_handler(seconds: float) -> None:
+    """샘플링 대상 함수 (지정한 시간 동안 CPU 사용)"""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+class TestProfileToken:
+    """프로파일 요청 토큰 테스트"""
+    
+    def test_signed_token_is_verified(self):
+        """같은 키로 서명한 토큰만 유효"""
+        token = sign_token("secret")
+        
+        assert verify_token("secret", token)
+        assert not verify_token("other", token)
+        assert not verify_token("", token)
+    
+    def test_expired_or_malformed_token_is_rejected(self):
+        """만료되었거나 형식이 잘못된 토큰은 거부"""
+        assert not verify_token("secret", sign_token("secret", ttl=-10))
+        assert not verify_token("secret", "garbage")
+
+
+class TestSampler:
+    """샘플링 스레드 테스트"""
+    
+    def test_samples_only_threads_running_the_request(self):
+        """요청 작업을 실행 중인 스레드의 스택만 수집"""
+        # Given
+        profile = Profile(asyncio.new_event_loop(), None, threading.get_ident())
+        sampler = Sampler(interval=0.001)
+        other = threading.Thread(target=busy_handler, args=(0.1,))
+        
+        # When
+        sampler.start(profile)
+        other.start()
+        worker = threading.Thread(target=profile.wrap(busy_handler), args=(0.1,))
+        worker.start()
+        worker.join()
+        other.join()
+        sampler.stop(profile)
+        
+        # Then
+        assert any("busy_handler" in stack[-1] for stack in profile.stacks)
+        # 모든 샘플은 profile.wrap()으로 감싼 스레드에서 수집됨
+        assert all(any("app/profiling.py" in frame for frame in stack) for stack in profile.stacks)
+        assert not profile.threads
+    
+    def test_output_formats(self):
+        """collapsed stack과 speedscope 형식으로 변환"""
+        # Given
+        stacks = {"main;handler;query": 3, "main;handler": 1}
+        
+        # When
+        collapsed = to_collapsed(stacks)
+        speedscope = to_speedscope("GET /memos", stacks, interval_ms=5.0)
+        
+        # Then
+        assert collapsed == "main;handler;query 3\nmain;handler 1\n"
+        frames = [frame["name"] for frame in speedscope["shared"]["frames"]]
+        assert frames == ["main", "handler", "query"]
+        assert speedscope["profiles"][0]["samples"] == [[0, 1, 2], [0, 1]]
+        assert speedscope["profiles"][0]["endValue"] == 20.0
+
+
+class TestProfilingMiddleware:
+    """프로파일링 미들웨어 및 관리자 API 테스트"""
+    
+    @pytest.fixture
+    def profiled_client(self, tmp_path, db_session):
+        config = Settings(
+            DATABASE_URL="sqlite://",
+            DB_WARMUP_ENABLED=False,
+            PROFILER_ENABLED=True,
+            PROFILER_SECRET="secret",
+            PROFILER_DIR=str(tmp_path),
+            PROFILER_INTERVAL_MS=1.0
+        )
+        app = create_app(config)
+        app.dependency_overrides[get_db_session] = lambda: db_session
+        with TestClient(app) as client:
+            yield client
+    
+    def test_signed_request_is_profiled_and_downloadable(self, profiled_client):
+        """서명된 헤더를 보낸 요청은 프로파일 ID를 받고 관리자 API에서 내려받음"""
+        # Given
+        headers = {"X-Profile-Token": sign_token("secret")}
+        
+        # When
+        response = profiled_client.get("/api/v1/memos", headers=headers)
+        profile_id = response.headers["X-Profile-Id"]
+        listed = profiled_client.get("/admin/profiles", headers=headers)
+        speedscope = profiled_client.get(f"/admin/profiles/{profile_id}", headers=headers)
+        collapsed = profiled_client.get(f"/admin/profiles/{profile_id}?format=collapsed", headers=headers)
+        
+        # Then
+        assert response.status_code == 200
+        assert [profile["id"] for profile in listed.json()] == [profile_id]
+        assert listed.json()[0]["route"] == "/api/v1/memos"
+        assert speedscope.json()["profiles"][0]["type"] == "sampled"
+        assert collapsed.headers["content-type"].startswith("text/plain")
+    
+    def test_unsigned_request_is_not_profiled(self, profiled_client):
+        """토큰이 없거나 잘못되면 프로파일링하지 않고 관리자 API는 403"""
+        response = profiled_client.get("/api/v1/memos", headers={"X-Profile-Token": sign_token("wrong")})
+        
+        assert "X-Profile-Id" not in response.headers
+        assert profiled_client.get("/admin/profiles").status_code == 403
+    
+    def test_disabled_profiler_registers_nothing(self):
+        """비활성화 시 관리자 API도 등록되지 않음"""
+        app = create_app(Settings(DATABASE_URL="sqlite://", DB_WARMUP_ENABLED=False))
+        
+        assert not any(getattr(route, "path", "").startswith("/admin") for route in app.routes)
@@ -0,0 +1,67 @@
+"""
+프로덕션 서버 실행기 유닛 테스트
+워커 수 산정, uvicorn 옵션, 시작 로그 및 fork 후 풀 재생성 테스트
+"""
+import logging
+
+import uvicorn
+
+from app import database, server
+from app.config import Settings
+from app.server import available_cpus, server_options, worker_count
+
+
+def make_settings(**overrides) -> Settings:
+    """테스트용 설정 생성"""
+    return Settings(DATABASE_URL="sqlite://", **overrides)
+
+
+class TestServer:
+    """서버 실행기 테스트"""
+    
+    def test_worker_count_defaults_to_available_cpus(self):
+        """WEB_CONCURRENCY 미설정 시 CPU 수만큼 워커 실행"""
+        assert worker_count(make_settings()) == available_cpus()
+    
+    def test_worker_count_from_settings(self):
+        """WEB_CONCURRENCY 설정값 사용"""
+        assert worker_count(make_settings(WEB_CONCURRENCY=3)) == 3
+    
+    def test_server_options(self):
+        """keep-alive, backlog 및 이벤트 루프 옵션 테스트"""
+        # When
+        options = server_options(make_settings(SERVER_KEEPALIVE_TIMEOUT=15, SERVER_BACKLOG=4096))
+        
+        # Then
+        assert options["timeout_keep_alive"] == 15
+        assert options["backlog"] == 4096
+        assert options["loop"] in ("uvloop", "asyncio")
+        assert options["http"] in ("httptools", "h11")
+        assert options["reload"] is False
+    
+    def test_run_logs_startup_message(self, monkeypatch, caplog):
+        """시작 메시지는 print 대신 app.server 로거로 기록 (로그 형식/레벨 설정을 따름)"""
+        # Given
+        monkeypatch.setattr(server, "get_settings", lambda: make_settings(WEB_CONCURRENCY=2))
+        monkeypatch.setattr(uvicorn, "run", lambda *args, **kwargs: None)
+        
+        # When
+        with caplog.at_level(logging.INFO, logger="app.server"):
+            server.run()
+        
+        # Then
+        record = next(record for record in caplog.records if record.name == "app.server")
+        assert record.levelno == logging.INFO
+        assert record.getMessage().startswith("Starting 2 workers")
+    
+    def test_dispose_engine_after_fork_replaces_pool(self):
+        """fork 후 부모의 커넥션 풀을 버리고 새 풀 사용"""
+        # Given
+        old_pool = database.init_engine(make_settings()).pool
+        
+        # When
+        database.dispose_engine_after_fork()
+        
+        # Then
+        assert database.get_engine().pool is not old_pool
+        database.dispose_engine()
@@ -0,0 +1,271 @@
+"""
+샤딩 유닛 테스트
+샤드 맵 파싱, 슬롯 기반 ID 라우팅, scatter-gather 조회 병합, 슬롯 재분배 및 앱 lifespan 적용 테스트
+"""
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, func, insert, select
+
+from app import database
+from app.config import Settings
+from app.database import Base
+from app.main import create_app
+from app.models.memo import Memo
+from app.repositories.memo_repository import memo_repository
+from app.repositories.sharded_memo_repository import ShardedMemoRepository
+from app.schemas.memo import MemoCreate, MemoUpdate
+from app.services.memo_service import MemoService, memo_service
+from app.sharding.rebalance import move_slots
+from app.sharding.session import (
+    create_shard_engines,
+    ensure_slot_sequences,
+    request_engines,
+    sharded_sessionmaker,
+)
+from app.sharding.shard_map import ShardMap, load_shard_map, parse_slot_ranges
+
+
+SLOT_COUNT = 8
+
+
+@pytest.fixture
+def shards(tmp_path):
+    """SQLite 파일 3개를 샤드로 사용하는 (샤드 맵, 엔진) (샤드 2는 처음에 슬롯 없음)"""
+    urls = [f"sqlite:///{tmp_path / f'shard{index}.db'}" for index in range(3)]
+    shard_map = ShardMap(urls, SLOT_COUNT, parse_slot_ranges("0-3=0,4-7=1", SLOT_COUNT))
+    engines = create_shard_engines(Settings(DATABASE_URL=urls[0], DEBUG=False), shard_map)
+    for engine in engines.values():
+        Base.metadata.create_all(bind=engine)
+    ensure_slot_sequences(shard_map, engines)
+    yield shard_map, engines
+    for engine in engines.values():
+        engine.dispose()
+
+
+@pytest.fixture
+def sharded(shards):
+    """샤딩된 Repository를 사용하는 (서비스, 세션, 샤드 맵, 엔진)"""
+    shard_map, engines = shards
+    service = MemoService()
+    service.repository = ShardedMemoRepository(shard_map)
+    session = sharded_sessionmaker(shard_map, engines)()
+    try:
+        yield service, session, shard_map, engines
+    finally:
+        session.close()
+
+
+def count_memos(engine) -> int:
+    """샤드에 저장된 메모 수"""
+    with engine.connect() as connection:
+        return connection.scalar(select(func.count()).select_from(Memo.__table__))
+
+
+class TestShardMap:
+    """샤드 맵 테스트"""
+    
+    def test_parse_and_format_round_trip(self):
+        """SHARD_MAP 설정을 파싱한 뒤 다시 같은 형식으로 변환"""
+        # Given
+        shard_map = ShardMap(["a", "b"], SLOT_COUNT, parse_slot_ranges("0-5=0,6=1,7=1", SLOT_COUNT))
+        
+        # When
+        setting = shard_map.to_setting()
+        
+        # Then
+        assert setting == "0-5=0,6-7=1"
+        assert shard_map.shard_for_id(shard_map.make_id(3, 6)) == "1"
+        assert shard_map.slots_of("1") == [6, 7]
+    
+    def test_default_assignment_is_slot_modulo_shard_count(self):
+        """SHARD_MAP이 비어 있으면 slot % 샤드 수로 배정"""
+        # Given
+        config = Settings(DATABASE_URL="sqlite://", SHARD_DATABASE_URLS="sqlite://, sqlite://", SHARD_SLOTS=4)
+        
+        # When
+        shard_map = load_shard_map(config)
+        
+        # Then
+        assert shard_map.assignments == [0, 1, 0, 1]
+    
+    def test_sharding_is_disabled_without_urls(self):
+        """SHARD_DATABASE_URLS가 없으면 샤드 맵 없음"""
+        assert load_shard_map(Settings(DATABASE_URL="sqlite://")) is None
+    
+    def test_invalid_ranges_are_rejected(self):
+        """범위를 벗어난 슬롯이나 샤드 번호는 거부"""
+        with pytest.raises(ValueError):
+            parse_slot_ranges("0-8=0", SLOT_COUNT)
+        with pytest.raises(ValueError):
+            ShardMap(["a"], SLOT_COUNT, {0: 1})
+
+
+class TestShardedMemoRepository:
+    """샤딩된 메모 저장소 테스트"""
+    
+    def test_created_memo_is_stored_on_shard_of_its_slot(self, sharded):
+        """생성한 메모는 ID의 슬롯이 속한 샤드에만 저장됨"""
+        # Given
+        service, session, shard_map, engines = sharded
+        
+        # When
+        memos = [service.create_memo(session, MemoCreate(title=f"메모 {i}")) for i in range(20)]
+        
+        # Then
+        assert len({memo.id for memo in memos}) == 20
+        for shard_id, engine in engines.items():
+            expected = [memo for memo in memos if shard_map.shard_for_id(memo.id) == shard_id]
+            assert count_memos(engine) == len(expected)
+        assert count_memos(engines["2"]) == 0
+    
+    def test_single_memo_operations_route_by_id(self, sharded):
+        """조회, 수정, 삭제는 ID의 샤드에서 수행"""
+        # Given
+        service, session, _, _ = sharded
+        memo = service.create_memo(session, MemoCreate(title="원본"))
+        
+        # When
+        updated = service.update_memo(session, memo.id, MemoUpdate(title="수정"))
+        fetched = service.get_memo(session, memo.id)
+        service.delete_memo(session, memo.id)
+        
+        # Then
+        assert updated.title == "수정"
+        assert fetched.title == "수정"
+        assert service.repository.get_memo_row_by_id(session, memo.id) is None
+    
+    def test_list_merges_shards_in_update_order(self, sharded):
+        """목록은 모든 샤드의 메모를 최근 수정 순으로 병합하고 전체 수는 합계"""
+        # Given
+        service, session, _, _ = sharded
+        created = [service.create_memo(session, MemoCreate(title=f"메모 {i}")) for i in range(12)]
+        newest_first = [memo.id for memo in reversed(created)]
+        
+        # When
+        first = service.get_memos(session, skip=0, limit=5)
+        second = service.get_memos(session, skip=5, limit=5)
+        
+        # Then
+        assert first.total == 12
+        assert [memo.id for memo in first.items + second.items] == newest_first[:10]
+    
+    def test_lookup_by_ids_spans_shards(self, sharded):
+        """여러 ID 조회는 샤드별로 나누어 조회한 뒤 요청 순서로 반환"""
+        # Given
+        service, session, _, _ = sharded
+        ids = [service.create_memo(session, MemoCreate(title=f"메모 {i}")).id for i in range(10)]
+        
+        # When
+        result = service.get_memos_by_ids(session, ids[::-1])
+        
+        # Then
+        assert [memo.id for memo in result.items] == ids[::-1]
+    
+    def test_changes_merge_upserts_and_deletes_across_shards(self, sharded):
+        """변경분 동기화는 샤드별 변경을 시각 순서로 병합하며 페이지 경계에서 누락하지 않음"""
+        # Given
+        service, session, _, _ = sharded
+        ids = [service.create_memo(session, MemoCreate(title=f"메모 {i}")).id for i in range(9)]
+        service.delete_memo(session, ids[0])
+        
+        # When
+        seen = []
+        token = None
+        while True:
+            page = service.get_changes(session, since=token, limit=4)
+            seen.extend((change.type, change.memo_id) for change in page.changes)
+            token = page.next_token
+            if not page.has_more:
+                break
+        
+        # Then
+        assert seen == [("upsert", memo_id) for memo_id in ids[1:]] + [("delete", ids[0])]
+
+
+class TestSlotSequences:
+    """슬롯별 ID 발급 행 테스트"""
+    
+    def test_sequences_advance_past_rows_inserted_outside_allocation(self, shards):
+        """allocate_id()를 거치지 않고 추가된 행이 있으면 다시 시작할 때 발급 번호를 그 뒤로 올림"""
+        # Given
+        shard_map, engines = shards
+        repository = ShardedMemoRepository(shard_map)
+        existing_id = shard_map.make_id(41, 2)
+        with engines["0"].begin() as connection:
+            connection.execute(insert(Memo.__table__).values(id=existing_id, title="샤딩 없이 추가"))
+        
+        # When
+        ensure_slot_sequences(shard_map, engines)
+        session = sharded_sessionmaker(shard_map, engines)()
+        try:
+            allocated = repository.allocate_id(session, 2)
+        finally:
+            session.close()
+        
+        # Then
+        assert allocated == shard_map.make_id(42, 2)
+
+
+class TestInitSharding:
+    """init_sharding() 및 애플리케이션 lifespan 테스트"""
+    
+    def test_app_uses_shards_and_restores_single_database(self, tmp_path):
+        """샤딩 설정으로 시작한 앱은 샤드에 저장하고, 종료 후에는 단일 DB 세션과 Repository로 복원"""
+        # Given
+        urls = [f"sqlite:///{tmp_path / f'app_shard{index}.db'}" for index in range(2)]
+        for url in urls:
+            engine = create_engine(url)
+            Base.metadata.create_all(bind=engine)
+            engine.dispose()
+        config = Settings(
+            DATABASE_URL=urls[0],
+            DEBUG=False,
+            SHARD_DATABASE_URLS=",".join(urls),
+            SHARD_SLOTS=SLOT_COUNT
+        )
+        
+        # When
+        with TestClient(create_app(config)) as client:
+            created = [client.post("/api/v1/memos", json={"title": f"메모 {i}"}).json()["id"] for i in range(10)]
+            listed = client.get("/api/v1/memos", params={"limit": 100}).json()
+            sharded_repository = memo_service.repository
+            engines = request_engines()
+            shard_counts = [count_memos(engine) for engine in engines]
+        
+        # Then
+        assert isinstance(sharded_repository, ShardedMemoRepository)
+        assert len(engines) == 2
+        assert sum(shard_counts) == 10
+        assert listed["total"] == 10
+        assert {memo["id"] for memo in listed["items"]} == set(created)
+        assert memo_service.repository is memo_repository
+        assert database._session_factory is database.SessionLocal
+
+
+class TestRebalance:
+    """슬롯 재분배 테스트"""
+    
+    def test_moved_slots_are_served_from_new_shard(self, sharded):
+        """슬롯을 새 샤드로 옮기면 기존 ID로 조회되고 새 메모도 새 샤드에 저장됨"""
+        # Given
+        service, session, shard_map, engines = sharded
+        memos = [service.create_memo(session, MemoCreate(title=f"메모 {i}")) for i in range(30)]
+        session.close()
+        moved = [slot for slot in range(4, 8)]
+        moved_ids = {memo.id for memo in memos if shard_map.slot_for_id(memo.id) in moved}
+        
+        # When
+        new_map = move_slots(shard_map, engines, moved, 2, batch_size=3, delete_source=True)
+        service.repository = ShardedMemoRepository(new_map)
+        new_session = sharded_sessionmaker(new_map, engines)()
+        
+        # Then
+        assert new_map.to_setting() == "0-3=0,4-7=2"
+        assert count_memos(engines["1"]) == 0
+        assert count_memos(engines["2"]) == len(moved_ids)
+        assert service.get_memos(new_session, skip=0, limit=100).total == 30
+        assert {memo.id for memo in service.get_memos_by_ids(new_session, sorted(moved_ids)).items} == moved_ids
+        for _ in range(20):
+            memo = service.create_memo(new_session, MemoCreate(title="새 메모"))
+            assert memo.id not in {existing.id for existing in memos}
+        new_session.close()
@@ -0,0 +1,196 @@
+"""
+분산 추적 유닛 테스트
+traceparent 전파, 계층별 span 구조, head sampling, OTLP 변환 및 batch 처리기 테스트
+"""
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_db_session
+from app.config import Settings
+from app.main import create_app
+from app.tracing import (
+    CLIENT,
+    SERVER,
+    STATUS_ERROR,
+    BatchSpanProcessor,
+    Span,
+    SpanExporter,
+    force_flush,
+    memory_exporter,
+    parse_traceparent,
+    to_otlp,
+)
+
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+def traced_app(db_session, sample_rate: float = 1.0):
+    """메모리 exporter로 span을 수집하는 애플리케이션"""
+    config = Settings(
+        DATABASE_URL="sqlite://",
+        DB_WARMUP_ENABLED=False,
+        TRACING_ENABLED=True,
+        TRACE_EXPORTER="memory",
+        TRACE_SAMPLE_RATE=sample_rate
+    )
+    app = create_app(config)
+    app.dependency_overrides[get_db_session] = lambda: db_session
+    return app
+
+
+@pytest.fixture
+def traced_client(db_session):
+    """모든 요청을 샘플링하는 클라이언트"""
+    memory_exporter.clear()
+    with TestClient(traced_app(db_session)) as client:
+        yield client
+    memory_exporter.clear()
+
+
+def finished_spans():
+    """내보낸 span 목록 (대기 중인 span을 먼저 내보냄)"""
+    assert force_flush()
+    return memory_exporter.get_finished_spans()
+
+
+class TestTraceparent:
+    """W3C traceparent 파싱 테스트"""
+    
+    def test_valid_header_is_parsed(self):
+        """trace ID, 상위 span ID, 샘플링 플래그 추출"""
+        assert parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-01") == (TRACE_ID, PARENT_ID, True)
+        assert parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-00") == (TRACE_ID, PARENT_ID, False)
+    
+    def test_invalid_header_is_ignored(self):
+        """형식이 잘못되었거나 ID가 0이면 무시"""
+        assert parse_traceparent("garbage") is None
+        assert parse_traceparent(f"ff-{TRACE_ID}-{PARENT_ID}-01") is None
+        assert parse_traceparent(f"00-{'0' * 32}-{PARENT_ID}-01") is None
+        assert parse_traceparent(f"00-{TRACE_ID}-xyz-01") is None
+
+
+class TestTracingMiddleware:
+    """추적 미들웨어 및 계층별 span 테스트"""
+    
+    def test_spans_follow_api_service_repository_sql_hierarchy(self, traced_client, sample_memo_data):
+        """요청 span 아래에 서비스, Repository, SQL span이 차례로 연결되고 상위 trace를 이어 감"""
+        # When
+        response = traced_client.post(
+            "/api/v1/memos",
+            json=sample_memo_data,
+            headers={"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01"}
+        )
+        spans = finished_spans()
+        
+        # Then
+        assert response.status_code == 201
+        by_name = {span.name: span for span in spans}
+        server = by_name["POST /api/v1/memos"]
+        service = by_name["MemoService.create_memo"]
+        repository = by_name["MemoRepository.create_memo"]
+        insert = by_name["INSERT"]
+        assert {span.trace_id for span in spans} == {TRACE_ID}
+        assert server.kind == SERVER
+        assert server.parent_id == PARENT_ID
+        assert server.attributes["http.status_code"] == 201
+        assert service.parent_id == server.span_id
+        assert repository.parent_id == service.span_id
+        assert insert.parent_id == repository.span_id
+        assert insert.kind == CLIENT
+        assert insert.attributes["db.system"] == "sqlite"
+        assert insert.attributes["db.statement"].startswith("INSERT INTO memos")
+    
+    def test_unsampled_parent_records_nothing(self, traced_client, sample_memo_data):
+        """상위 서비스가 샘플링하지 않은 trace는 span을 만들지 않음"""
+        traced_client.post(
+            "/api/v1/memos",
+            json=sample_memo_data,
+            headers={"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-00"}
+        )
+        
+        assert finished_spans() == []
+    
+    def test_sample_rate_applies_to_new_traces(self, db_session, sample_memo_data):
+        """traceparent가 없으면 TRACE_SAMPLE_RATE로 샘플링 (0이면 기록하지 않음)"""
+        memory_exporter.clear()
+        with TestClient(traced_app(db_session, sample_rate=0.0)) as client:
+            client.post("/api/v1/memos", json=sample_memo_data)
+            
+            assert finished_spans() == []
+    
+    def test_client_error_is_not_span_error(self, traced_client):
+        """span 이름은 라우트 템플릿이며 4xx 응답은 오류로 표시하지 않음 (5xx 또는 예외만 오류)"""
+        traced_client.get("/api/v1/memos/999999")
+        
+        (server,) = [span for span in finished_spans() if span.kind == SERVER]
+        assert server.name == "GET /api/v1/memos/{memo_id}"
+        assert server.attributes["http.status_code"] == 404
+        assert server.status != STATUS_ERROR
+
+
+class TestOTLPExport:
+    """OTLP/JSON 변환 테스트"""
+    
+    def test_spans_are_grouped_under_service_resource(self):
+        """resource의 service.name과 span 필드를 OTLP/JSON 형식으로 변환"""
+        # Given
+        span = Span("SELECT", TRACE_ID, PARENT_ID, True, CLIENT, {"db.system": "postgresql", "rows": 3})
+        span.end()
+        
+        # When
+        payload = to_otlp([span], "memo-api")
+        
+        # Then
+        resource_spans = payload["resourceSpans"][0]
+        assert resource_spans["resource"]["attributes"][0]["value"] == {"stringValue": "memo-api"}
+        exported = resource_spans["scopeSpans"][0]["spans"][0]
+        assert exported["traceId"] == TRACE_ID
+        assert exported["parentSpanId"] == PARENT_ID
+        assert exported["kind"] == CLIENT
+        assert {"key": "rows", "value": {"intValue": "3"}} in exported["attributes"]
+
+
+class BlockingExporter(SpanExporter):
+    """released가 설정될 때까지 내보내기를 멈추는 exporter"""
+    
+    def __init__(self):
+        self.exporting = threading.Event()
+        self.released = threading.Event()
+    
+    def export(self, spans):
+        self.exporting.set()
+        self.released.wait(5)
+
+
+class TestBatchSpanProcessor:
+    """batch span 처리기 테스트"""
+    
+    def test_exporter_must_implement_export(self):
+        """export를 구현하지 않은 exporter는 생성할 수 없음"""
+        with pytest.raises(TypeError):
+            SpanExporter()
+    
+    def test_flush_and_shutdown_respect_timeout_when_queue_is_full(self):
+        """내보내기가 멈춰 큐가 가득 차도 force_flush/shutdown은 timeout 안에 반환"""
+        # Given: 내보내기 스레드가 멈춘 동안 큐(크기 1)가 가득 참
+        exporter = BlockingExporter()
+        processor = BatchSpanProcessor(exporter, max_queue_size=1, batch_size=1, interval=60)
+        processor.on_end(Span("first", TRACE_ID, None, True, SERVER))
+        assert exporter.exporting.wait(5)
+        processor.on_end(Span("second", TRACE_ID, None, True, SERVER))
+        
+        # When
+        started = time.perf_counter()
+        flushed = processor.force_flush(timeout=0.1)
+        processor.shutdown(timeout=0.1)
+        elapsed = time.perf_counter() - started
+        
+        # Then
+        assert flushed is False
+        assert elapsed < 1.0
+        exporter.released.set()
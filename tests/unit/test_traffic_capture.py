@@ -0,0 +1,132 @@
+"""
+트래픽 캡처 미들웨어 유닛 테스트
+샘플링, JSONL 레코드 기록 및 재현 결과 집계 테스트
+"""
+import asyncio
+import json
+
+import httpx
+from fastapi.testclient import TestClient
+
+from app.middleware import TrafficCaptureMiddleware, TrafficCaptureWriter
+from benchmarks.replay import captured_baseline, compare, replay, summarize_routes
+
+
+class TestTrafficCapture:
+    """트래픽 캡처 미들웨어 테스트"""
+    
+    def test_records_route_params_and_body_size(self, app, client: TestClient, tmp_path, create_test_memo):
+        """라우트 템플릿, 파라미터, 본문 크기 기록 테스트"""
+        # Given
+        path = tmp_path / "traffic.jsonl"
+        writer = TrafficCaptureWriter(str(path))
+        capture_client = TestClient(TrafficCaptureMiddleware(app, writer=writer, sample_rate=1.0))
+        memo = create_test_memo()
+        body = {"title": "캡처 메모", "content": "내용"}
+        
+        # When
+        capture_client.get("/api/v1/memos?skip=1&limit=5")
+        capture_client.put(f"/api/v1/memos/{memo.id}", json=body)
+        writer.close()
+        
+        # Then
+        records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert len(records) == 2
+        
+        list_record, update_record = records
+        assert list_record["method"] == "GET"
+        assert list_record["route"] == "/api/v1/memos"
+        assert list_record["query"] == {"skip": "1", "limit": "5"}
+        assert list_record["status"] == 200
+        assert list_record["duration_ms"] >= 0
+        
+        assert update_record["route"] == "/api/v1/memos/{memo_id}"
+        assert update_record["path_params"] == {"memo_id": str(memo.id)}
+        assert update_record["body_size"] == len(json.dumps(body).encode())
+    
+    def test_sample_rate_zero_records_nothing(self, app, client: TestClient, tmp_path):
+        """샘플링 비율 0이면 기록하지 않음"""
+        # Given
+        path = tmp_path / "traffic.jsonl"
+        writer = TrafficCaptureWriter(str(path))
+        capture_client = TestClient(TrafficCaptureMiddleware(app, writer=writer, sample_rate=0.0))
+        
+        # When
+        capture_client.get("/health")
+        writer.close()
+        
+        # Then
+        assert path.read_text(encoding="utf-8") == ""
+
+
+
+class TestReplay:
+    """트래픽 재현 도구 테스트"""
+    
+    def test_counts_errors_per_route(self):
+        """5xx 응답과 응답을 받지 못한 요청을 라우트별 오류로 집계"""
+        # Given
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/down":
+                raise httpx.ConnectError("connection refused", request=request)
+            return httpx.Response(500 if request.url.path == "/fail" else 200)
+        
+        records = [
+            {"ts": 0.0, "method": "GET", "path": path, "duration_ms": 1.0, "status": 200}
+            for path in ("/ok", "/fail", "/fail", "/down")
+        ]
+        
+        async def run():
+            transport = httpx.MockTransport(handler)
+            async with httpx.AsyncClient(transport=transport, base_url="http://replay") as client:
+                return await replay(client, records, speed=1000)
+        
+        # When
+        summary = summarize_routes(asyncio.run(run()), 1.0)
+        
+        # Then
+        assert summary["GET /ok"]["errors"] == 0
+        assert summary["GET /fail"]["errors"] == 2
+        assert summary["GET /fail"]["requests"] == 2
+        assert summary["GET /down"]["errors"] == 1
+        assert summary["GET /down"]["count"] == 0
+    
+    def test_builds_bodies_for_non_memo_routes(self, app, client, create_test_memo):
+        """배치/여러 메모 조회는 라우트에 맞는 본문으로 재현하고, 본문 형식을 모르는 라우트는 건너뜀"""
+        # Given: client fixture가 테스트 세션을 주입
+        create_test_memo()
+        records = [
+            {"ts": 0.0, "method": "POST", "route": route, "path": route, "body_size": size}
+            for route, size in (("/api/v1/batch", 200), ("/api/v1/memos/lookup", 50), ("/api/v1/unknown", 20))
+        ]
+        
+        async def run():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://replay") as replay_client:
+                return await replay(replay_client, records, speed=1000)
+        
+        # When
+        results = asyncio.run(run())
+        
+        # Then
+        assert results["POST /api/v1/batch"].statuses == {200: 1}
+        assert results["POST /api/v1/memos/lookup"].statuses == {200: 1}
+        assert results["POST /api/v1/unknown"].skipped == 1
+        assert summarize_routes(results, 1.0)["POST /api/v1/unknown"]["requests"] == 0
+    
+    def test_compare_includes_baseline_errors(self):
+        """캡처 당시 상태 코드로 기준 오류 수를 만들어 현재 결과와 비교"""
+        # Given
+        records = [
+            {"ts": 0.0, "method": "GET", "path": "/a", "duration_ms": 10.0, "status": 200},
+            {"ts": 1.0, "method": "GET", "path": "/a", "duration_ms": 20.0, "status": 503},
+        ]
+        baseline = captured_baseline(records)
+        
+        # When
+        report = compare(baseline, baseline)
+        
+        # Then
+        assert baseline["GET /a"]["errors"] == 1
+        assert "errors=1" in report
+        assert "50.0% -> 50.0%" in report